@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Script para compilar os ícones SVG em um recurso Qt.
+
+Gera ``resources/icons.qrc`` com todos os SVGs de ``resources/icons`` (criados
+por ``create_icons.py`` e ``create_all_icons.py``) e o compila com
+``pyside6-rcc`` em ``gui/icons_rc.py``. Quando esse módulo existe, o
+``IconProvider`` passa a ler os ícones do recurso embutido em vez do disco.
+
+Uso:
+    python create_all_icons.py
+    python create_icons.py
+    python build_icon_resources.py
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+ICONS_DIR = Path("resources") / "icons"
+QRC_PATH = Path("resources") / "icons.qrc"
+OUTPUT_PATH = Path("gui") / "icons_rc.py"
+
+
+def write_qrc(icons_dir: Path = ICONS_DIR, qrc_path: Path = QRC_PATH) -> int:
+    """
+    Escreve o arquivo .qrc listando todos os ícones SVG.
+
+    Args:
+        icons_dir: Diretório com os arquivos SVG
+        qrc_path: Caminho do arquivo .qrc a ser gerado
+
+    Returns:
+        int: Número de ícones incluídos
+    """
+    icons = sorted(p for p in icons_dir.glob("*.svg") if p.is_file())
+
+    lines = ["<RCC>", '  <qresource prefix="/icons">']
+    for icon in icons:
+        # Caminho relativo ao .qrc, com alias igual ao nome do arquivo
+        relative = os.path.relpath(icon, qrc_path.parent).replace(os.sep, "/")
+        lines.append(f'    <file alias="{escape(icon.name)}">{escape(relative)}</file>')
+    lines.extend(["  </qresource>", "</RCC>", ""])
+
+    qrc_path.write_text("\n".join(lines), encoding="utf-8")
+    return len(icons)
+
+
+def compile_qrc(qrc_path: Path = QRC_PATH, output_path: Path = OUTPUT_PATH) -> bool:
+    """
+    Compila o .qrc em um módulo Python com pyside6-rcc.
+
+    Args:
+        qrc_path: Arquivo .qrc de entrada
+        output_path: Módulo Python de saída
+
+    Returns:
+        bool: True se a compilação foi bem-sucedida
+    """
+    rcc = shutil.which("pyside6-rcc")
+    if rcc is None:
+        print("pyside6-rcc não encontrado. Instale o PySide6 para compilar.")
+        return False
+
+    result = subprocess.run(
+        [rcc, str(qrc_path), "-o", str(output_path)],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        print(f"Erro ao compilar recursos: {result.stderr.strip()}")
+        return False
+    return True
+
+
+if __name__ == "__main__":
+    if not ICONS_DIR.exists():
+        print(f"Diretório de ícones não encontrado: {ICONS_DIR}")
+        sys.exit(1)
+
+    count = write_qrc()
+    print(f"{QRC_PATH} gerado com {count} ícones.")
+
+    if compile_qrc():
+        print(f"Recurso compilado: {OUTPUT_PATH}")
+    else:
+        sys.exit(1)
@@ -32,7 +32,7 @@ class CommentRepository:
             comment.timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
         # Executar inserção
-        self.db.execute(
+        self.db.execute_query(
             """
             INSERT INTO video_comments (
                 id, video_edit_id, user_id, timestamp, comment, is_resolved, created_at
@@ -75,19 +75,81 @@ class CommentRepository:
             (video_edit_id,),
         )
 
-        comments = []
-        for row in results:
-            comment = Comment(
-                id=row["id"],
-                text=row["comment"],
-                author=row.get("user_name", row["user_id"]),
-                timestamp=row["created_at"],
-                video_timestamp=row["timestamp"],
-                is_resolved=bool(row["is_resolved"]),
+        return [self._row_to_comment(row) for row in results]
+
+    def iter_comments_by_editing(self, video_edit_id, batch_size=500):
+        """
+        Percorre os comentários de uma edição em lotes, na ordem do vídeo
+
+        Cada lote é uma consulta própria que continua a partir do último
+        comentário lido (posição no vídeo e ID), então a conexão compartilhada
+        não fica presa a um cursor aberto durante toda a exportação e só um
+        lote por vez fica em memória.
+
+        Parâmetros:
+        - video_edit_id: ID da edição de vídeo
+        - batch_size: número de comentários por consulta
+
+        Retorna:
+        - Gerador de objetos Comment
+        """
+        last = None
+        while True:
+            if last is None:
+                after, parameters = "", (video_edit_id, batch_size)
+            else:
+                after = "AND (c.timestamp > ? OR (c.timestamp = ? AND c.id > ?))"
+                parameters = (video_edit_id, last[0], last[0], last[1], batch_size)
+
+            rows = self.db.fetch_all(
+                f"""
+                SELECT c.*, u.name AS user_name
+                FROM video_comments c
+                LEFT JOIN team_members u ON c.user_id = u.id
+                WHERE c.video_edit_id = ? {after}
+                ORDER BY c.timestamp ASC, c.id ASC
+                LIMIT ?
+                """,
+                parameters,
             )
-            comments.append(comment)
+            for row in rows:
+                yield self._row_to_comment(row)
+
+            if len(rows) < batch_size:
+                return
+            last = (rows[-1]["timestamp"], rows[-1]["id"])
+
+    def count_comments_by_editing(self, video_edit_id):
+        """
+        Conta os comentários de uma edição de vídeo
+
+        Parâmetros:
+        - video_edit_id: ID da edição de vídeo
 
-        return comments
+        Retorna:
+        - Tupla (total de comentários, comentários resolvidos)
+        """
+        row = self.db.fetch_one(
+            """
+            SELECT COUNT(*), COALESCE(SUM(is_resolved), 0)
+            FROM video_comments
+            WHERE video_edit_id = ?
+            """,
+            (video_edit_id,),
+        )
+        return (row[0], row[1]) if row else (0, 0)
+
+    @staticmethod
+    def _row_to_comment(row):
+        """Converte uma linha de video_comments (com user_name) em Comment"""
+        return Comment(
+            id=row["id"],
+            text=row["comment"],
+            author=row["user_name"] or row["user_id"],
+            timestamp=row["created_at"],
+            video_timestamp=row["timestamp"],
+            is_resolved=bool(row["is_resolved"]),
+        )
 
     def resolve_comment(self, comment_id):
         """
@@ -108,7 +170,7 @@ class CommentRepository:
             return False
 
         # Executar atualização
-        self.db.execute(
+        self.db.execute_query(
             "UPDATE video_comments SET is_resolved = ? WHERE id = ?", (1, comment_id)
         )
 
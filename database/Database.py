@@ -238,6 +238,8 @@ class Database:
             event_id INTEGER,
             folder_path TEXT,
             size INTEGER,
+            content_hash TEXT,
+            mime_type TEXT,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             FOREIGN KEY (event_id) REFERENCES events(id)
@@ -245,6 +247,19 @@ class Database:
         """
         )
 
+        # Índices usados na ordenação paginada das tabelas da interface
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_events_date ON events(date)")
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_team_members_name ON team_members(name)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_clients_company ON clients(company)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_deliverables_deadline "
+            "ON deliverables(deadline)"
+        )
+
         self.connection.commit()
 
     def execute_query(self, query, parameters=()):
@@ -268,3 +283,85 @@ class Database:
         """Insere dados e retorna o ID do novo registro"""
         cursor = self.execute_query(query, parameters)
         return cursor.lastrowid
+
+    def fetch_page(
+        self,
+        query,
+        parameters=(),
+        order_by=None,
+        descending=False,
+        limit=100,
+        offset=0,
+        after=None,
+    ):
+        """
+        Executa uma consulta paginada, com a ordenação feita pelo SQLite
+
+        Com ``after`` a página continua a partir da última linha já lida
+        (paginação por chave: coluna de ordenação e id), em vez de pular
+        ``offset`` linhas; o custo de cada página não cresce com a posição.
+
+        Args:
+            query: Consulta SELECT sem ORDER BY/LIMIT; deve retornar a coluna id
+            parameters: Parâmetros da consulta
+            order_by: Coluna de ordenação; deve vir de uma lista fixa de
+                colunas do repositório, nunca de texto do usuário
+            descending: Ordenação decrescente
+            limit: Quantidade máxima de linhas
+            offset: Quantidade de linhas a pular (ignorado com ``after``)
+            after: Última linha da página anterior (com order_by e id)
+
+        Returns:
+            list: Linhas da página (sqlite3.Row)
+        """
+        direction = "DESC" if descending else "ASC"
+        if order_by:
+            # O id desempata a ordenação para que as páginas não se sobreponham
+            order_clause = f"ORDER BY {order_by} {direction}, id {direction}"
+        else:
+            order_clause = f"ORDER BY id {direction}"
+
+        parameters = tuple(parameters)
+        if after is None:
+            paged_query = f"SELECT * FROM ({query}) {order_clause} LIMIT ? OFFSET ?"
+            return self.fetch_all(paged_query, parameters + (limit, offset))
+
+        where_clause, keyset_parameters = self._keyset_condition(
+            order_by, descending, after
+        )
+        paged_query = (
+            f"SELECT * FROM ({query}) WHERE {where_clause} {order_clause} LIMIT ?"
+        )
+        return self.fetch_all(paged_query, parameters + keyset_parameters + (limit,))
+
+    @staticmethod
+    def _keyset_condition(order_by, descending, after):
+        """
+        Condição das linhas posteriores a ``after`` na ordem de fetch_page
+
+        O SQLite põe os NULL no início da ordem crescente e no fim da
+        decrescente; a condição segue a mesma regra.
+        """
+        comparison = "<" if descending else ">"
+        last_id = after["id"]
+        if not order_by:
+            return f"id {comparison} ?", (last_id,)
+
+        value = after[order_by]
+        if value is None:
+            if descending:
+                return f"{order_by} IS NULL AND id < ?", (last_id,)
+            condition = f"(({order_by} IS NULL AND id > ?) OR {order_by} IS NOT NULL)"
+            return condition, (last_id,)
+
+        condition = (
+            f"({order_by} {comparison} ? OR ({order_by} = ? AND id {comparison} ?))"
+        )
+        if descending:
+            condition = f"({condition} OR {order_by} IS NULL)"
+        return condition, (value, value, last_id)
+
+    def count(self, query, parameters=()):
+        """Retorna a quantidade de linhas de uma consulta"""
+        row = self.fetch_one(f"SELECT COUNT(*) FROM ({query})", parameters)
+        return row[0] if row else 0
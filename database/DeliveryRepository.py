@@ -0,0 +1,117 @@
+import sqlite3
+
+from .Database import Database
+from utils.logger import get_logger
+
+
+class DeliveryRepository:
+    """Operações CRUD para entregas (deliverables)"""
+
+    # Colunas aceitas na ordenação paginada (chave da interface -> coluna SQL)
+    SORT_COLUMNS = {
+        "title": "title",
+        "deadline": "deadline",
+        "status": "status",
+        "progress": "progress",
+    }
+
+    def __init__(self):
+        """Inicializa o repositório de entregas com conexão ao banco de dados."""
+        self.db = Database()
+        self.logger = get_logger("delivery_repository")
+
+    def create(self, delivery_data):
+        """
+        Cria uma nova entrega
+
+        Args:
+            delivery_data: Dicionário com os dados da entrega
+                {title, event_id, client_id, deadline, status, progress}
+
+        Returns:
+            int: ID da entrega criada
+
+        Raises:
+            sqlite3.Error: Em caso de erro no banco de dados
+        """
+        try:
+            query = """
+            INSERT INTO deliverables (title, event_id, client_id, deadline, status, progress)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """
+
+            params = (
+                delivery_data.get("title"),
+                delivery_data.get("event_id"),
+                delivery_data.get("client_id"),
+                delivery_data.get("deadline"),
+                delivery_data.get("status"),
+                delivery_data.get("progress", 0),
+            )
+
+            return self.db.insert(query, params)
+        except sqlite3.Error as e:
+            self.logger.error(f"Erro ao criar entrega: {e}")
+            raise
+
+    def get_by_id(self, delivery_id):
+        """
+        Busca uma entrega pelo ID
+
+        Args:
+            delivery_id: ID da entrega
+
+        Returns:
+            dict: Dados da entrega ou None se não encontrada
+        """
+        try:
+            result = self.db.fetch_one(
+                "SELECT * FROM deliverables WHERE id = ?", (delivery_id,)
+            )
+            return dict(result) if result else None
+        except sqlite3.Error as e:
+            self.logger.error(f"Erro ao buscar entrega {delivery_id}: {e}")
+            return None
+
+    def count(self):
+        """
+        Conta as entregas cadastradas
+
+        Returns:
+            int: Quantidade de entregas
+        """
+        try:
+            return self.db.count("SELECT id FROM deliverables")
+        except sqlite3.Error as e:
+            self.logger.error(f"Erro ao contar entregas: {e}")
+            return 0
+
+    def get_page(
+        self, offset=0, limit=100, order_by="deadline", descending=False, after=None
+    ):
+        """
+        Busca uma página de entregas, ordenada pelo banco de dados
+
+        Args:
+            offset: Quantidade de entregas a pular
+            limit: Quantidade máxima de entregas
+            order_by: Chave de SORT_COLUMNS usada na ordenação
+            descending: Ordenação decrescente
+            after: Última linha já carregada (continua a partir dela)
+
+        Returns:
+            list: Lista de dicionários com dados das entregas
+        """
+        try:
+            results = self.db.fetch_page(
+                "SELECT * FROM deliverables",
+                order_by=self.SORT_COLUMNS.get(order_by, "deadline"),
+                descending=descending,
+                limit=limit,
+                offset=offset,
+                after=after,
+            )
+            return [dict(row) for row in results]
+        except sqlite3.Error as e:
+            self.logger.error(f"Erro ao buscar página de entregas: {e}")
+            return []
@@ -8,6 +8,22 @@ from utils.logger import get_logger
 class EventRepository:
     """Operações CRUD para eventos"""
 
+    # Colunas aceitas na ordenação paginada (chave da interface -> coluna SQL)
+    SORT_COLUMNS = {
+        "name": "name",
+        "date": "date",
+        "location": "location",
+        "client": "client",
+        "status": "status",
+    }
+
+    # Eventos com o nome do cliente, como exibidos na tabela de eventos
+    TABLE_QUERY = """
+    SELECT e.*, c.company AS client
+    FROM events e
+    LEFT JOIN clients c ON c.id = e.client_id
+    """
+
     def __init__(self):
         """Inicializa o repositório de eventos com conexão ao banco de dados."""
         self.db = Database()
@@ -246,3 +262,65 @@ class EventRepository:
             events.append(dict(row))
 
         return events
+
+    def count(self):
+        """
+        Conta os eventos cadastrados
+
+        Returns:
+            int: Quantidade de eventos
+        """
+        try:
+            return self.db.count("SELECT id FROM events")
+        except sqlite3.Error as e:
+            self.logger.error(f"Erro ao contar eventos: {e}")
+            return 0
+
+    def get_page(
+        self, offset=0, limit=100, order_by="date", descending=True, after=None
+    ):
+        """
+        Busca uma página de eventos, ordenada pelo banco de dados
+
+        Args:
+            offset: Quantidade de eventos a pular
+            limit: Quantidade máxima de eventos
+            order_by: Chave de SORT_COLUMNS usada na ordenação
+            descending: Ordenação decrescente
+            after: Última linha já carregada (continua a partir dela)
+
+        Returns:
+            list: Lista de dicionários com dados dos eventos e o nome do cliente
+        """
+        try:
+            results = self.db.fetch_page(
+                self.TABLE_QUERY,
+                order_by=self.SORT_COLUMNS.get(order_by, "date"),
+                descending=descending,
+                limit=limit,
+                offset=offset,
+                after=after,
+            )
+            return [dict(row) for row in results]
+        except sqlite3.Error as e:
+            self.logger.error(f"Erro ao buscar página de eventos: {e}")
+            return []
+
+    def get_table_row(self, event_id):
+        """
+        Busca um evento no mesmo formato de get_page
+
+        Args:
+            event_id: ID do evento
+
+        Returns:
+            dict: Dados do evento ou None se não encontrado
+        """
+        try:
+            result = self.db.fetch_one(
+                f"{self.TABLE_QUERY} WHERE e.id = ?", (event_id,)
+            )
+            return dict(result) if result else None
+        except sqlite3.Error as e:
+            self.logger.error(f"Erro ao buscar evento {event_id}: {e}")
+            return None
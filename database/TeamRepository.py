@@ -6,6 +6,20 @@ from .Database import Database
 class TeamRepository:
     """Operações CRUD para membros da equipe e clientes"""
 
+    # Colunas aceitas na ordenação paginada (chave da interface -> coluna SQL)
+    MEMBER_SORT_COLUMNS = {
+        "name": "name",
+        "role": "role",
+        "email": "email",
+        "contact": "contact",
+    }
+    CLIENT_SORT_COLUMNS = {
+        "company": "company",
+        "contact_person": "contact_person",
+        "email": "email",
+        "phone": "phone",
+    }
+
     def __init__(self):
         self.db = Database()
 
@@ -69,6 +83,41 @@ class TeamRepository:
 
         return members
 
+    def count_members(self):
+        """
+        Conta os membros da equipe
+
+        Returns:
+            int: Quantidade de membros
+        """
+        return self.db.count("SELECT id FROM team_members")
+
+    def get_members_page(
+        self, offset=0, limit=100, order_by="name", descending=False, after=None
+    ):
+        """
+        Busca uma página de membros da equipe, ordenada pelo banco de dados
+
+        Args:
+            offset: Quantidade de membros a pular
+            limit: Quantidade máxima de membros
+            order_by: Chave de MEMBER_SORT_COLUMNS usada na ordenação
+            descending: Ordenação decrescente
+            after: Última linha já carregada (continua a partir dela)
+
+        Returns:
+            list: Lista de dicionários com dados dos membros
+        """
+        results = self.db.fetch_page(
+            "SELECT * FROM team_members",
+            order_by=self.MEMBER_SORT_COLUMNS.get(order_by, "name"),
+            descending=descending,
+            limit=limit,
+            offset=offset,
+            after=after,
+        )
+        return [dict(row) for row in results]
+
     def update_member(self, member_id, member_data):
         """
         Atualiza um membro da equipe existente
@@ -252,6 +301,41 @@ class TeamRepository:
 
         return clients
 
+    def count_clients(self):
+        """
+        Conta os clientes
+
+        Returns:
+            int: Quantidade de clientes
+        """
+        return self.db.count("SELECT id FROM clients")
+
+    def get_clients_page(
+        self, offset=0, limit=100, order_by="company", descending=False, after=None
+    ):
+        """
+        Busca uma página de clientes, ordenada pelo banco de dados
+
+        Args:
+            offset: Quantidade de clientes a pular
+            limit: Quantidade máxima de clientes
+            order_by: Chave de CLIENT_SORT_COLUMNS usada na ordenação
+            descending: Ordenação decrescente
+            after: Última linha já carregada (continua a partir dela)
+
+        Returns:
+            list: Lista de dicionários com dados dos clientes
+        """
+        results = self.db.fetch_page(
+            "SELECT * FROM clients",
+            order_by=self.CLIENT_SORT_COLUMNS.get(order_by, "company"),
+            descending=descending,
+            limit=limit,
+            offset=offset,
+            after=after,
+        )
+        return [dict(row) for row in results]
+
     def update_client(self, client_id, client_data):
         """
         Atualiza um cliente existente
@@ -3,7 +3,9 @@ import uuid
 from datetime import datetime
 
 from .Database import Database
+from utils.critical_path import DependencyGraph
 from utils.logger import get_logger
+from utils.timeline_scheduler import schedule_notification
 
 
 class TimelineRepository:
@@ -13,6 +15,8 @@ class TimelineRepository:
         """Inicializa o repositório da timeline com conexão ao banco de dados."""
         self.db = Database()
         self.logger = get_logger("timeline_repository")
+        # Grafos de dependência já calculados, por evento
+        self._dependency_graphs = {}
 
     def generate_uuid(self):
         """
@@ -71,6 +75,7 @@ class TimelineRepository:
             )
 
             self.db.insert(query, params)
+            self._dependency_graphs.pop(timeline_data.get("event_id"), None)
             return item_id
         except sqlite3.Error as e:
             self.logger.error(f"Erro ao criar item na timeline: {e}")
@@ -199,6 +204,7 @@ class TimelineRepository:
             """
 
             self.db.execute_query(query, tuple(params))
+            self._update_dependency_graph(item_id, update_data)
             return True
         except sqlite3.Error as e:
             self.logger.error(f"Erro ao atualizar item da timeline: {e}")
@@ -217,11 +223,101 @@ class TimelineRepository:
         try:
             query = "DELETE FROM timeline_items WHERE id = ?"
             self.db.execute_query(query, (item_id,))
+            self._discard_dependency_graph(item_id)
             return True
         except sqlite3.Error as e:
             self.logger.error(f"Erro ao excluir item da timeline: {e}")
             return False
 
+    def get_dependency_graph(self, event_id, items=None, refresh=False):
+        """
+        Retorna o grafo de dependências (caminho crítico) de um evento
+
+        O grafo é montado com uma única consulta e mantido em memória; as
+        alterações de horário feitas por ``update`` são aplicadas a ele de
+        forma incremental.
+
+        Args:
+            event_id: ID do evento
+            items: Itens já carregados (ex.: de get_by_event), evitando a consulta
+            refresh: Se True, descarta o grafo em memória e recalcula
+
+        Returns:
+            DependencyGraph: Grafo calculado (vazio em caso de erro)
+        """
+        graph = self._dependency_graphs.get(event_id)
+        if graph is not None and not refresh and items is None:
+            return graph
+
+        if items is None:
+            try:
+                query = """
+                SELECT id, start_time, end_time, dependencies
+                FROM timeline_items
+                WHERE event_id = ?
+                """
+                items = [dict(row) for row in self.db.fetch_all(query, (event_id,))]
+            except sqlite3.Error as e:
+                self.logger.error(f"Erro ao carregar dependências da timeline: {e}")
+                return DependencyGraph()
+
+        graph = DependencyGraph(items)
+        if graph.cycles:
+            self.logger.warning(
+                f"Dependências circulares na timeline do evento {event_id}: "
+                f"{len(graph.cycles)} itens"
+            )
+        if graph.missing:
+            self.logger.warning(
+                f"Dependências inexistentes na timeline do evento {event_id}: "
+                f"{', '.join(sorted(graph.missing))}"
+            )
+
+        self._dependency_graphs[event_id] = graph
+        return graph
+
+    def get_critical_path(self, event_id):
+        """
+        Calcula o caminho crítico de um evento
+
+        Args:
+            event_id: ID do evento
+
+        Returns:
+            dict: {critical_path: lista de IDs em ordem, critical_ids: conjunto
+                   de itens sem folga, schedule: cronograma por ID}
+        """
+        graph = self.get_dependency_graph(event_id)
+        return {
+            "critical_path": graph.critical_path(),
+            "critical_ids": graph.critical_ids(),
+            "schedule": graph.results(),
+        }
+
+    def _update_dependency_graph(self, item_id, update_data):
+        """Aplica a alteração de um item ao grafo em memória, se houver"""
+        if "dependencies" in update_data:
+            self._discard_dependency_graph(item_id)
+            return
+
+        if "start_time" not in update_data and "end_time" not in update_data:
+            return
+
+        for graph in self._dependency_graphs.values():
+            if item_id in graph:
+                graph.update_item(
+                    item_id,
+                    update_data.get("start_time"),
+                    update_data.get("end_time"),
+                )
+                break
+
+    def _discard_dependency_graph(self, item_id):
+        """Descarta o grafo em memória do evento que contém o item"""
+        for event_id, graph in list(self._dependency_graphs.items()):
+            if item_id in graph:
+                del self._dependency_graphs[event_id]
+
     def create_milestone(self, milestone_data):
         """
         Cria um novo marco na timeline
@@ -328,6 +424,12 @@ class TimelineRepository:
             )
 
             self.db.insert(query, params)
+
+            # Entra direto no heap do agendador, se a notificação vencer logo
+            schedule_notification(
+                str(self.db.db_path),
+                dict(notification_data, id=notification_id),
+            )
             return notification_id
         except sqlite3.Error as e:
             self.logger.error(f"Erro ao criar notificação: {e}")
@@ -44,6 +44,10 @@ CREATE TABLE IF NOT EXISTS timeline_notifications (
     FOREIGN KEY (timeline_item_id) REFERENCES timeline_items(id)
 );
 
+-- Índice usado pelo agendador para carregar as próximas notificações a enviar
+CREATE INDEX IF NOT EXISTS idx_timeline_notifications_due
+    ON timeline_notifications (sent, notification_time);
+
 -- Tabela para armazenar histórico de alterações na timeline
 CREATE TABLE IF NOT EXISTS timeline_history (
     id TEXT PRIMARY KEY,
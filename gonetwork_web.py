@@ -3,6 +3,8 @@ import pandas as pd
 from datetime import datetime
 import sqlite3
 import os
+import sys
+import importlib.util
 import uuid
 import json
 from PIL import Image
@@ -54,6 +56,34 @@ def get_db_connection():
         st.error(f"Erro de conexão com o banco de dados: {e}")
         return None
 
+# Motor analítico dos relatórios (DuckDB). O módulo é carregado pelo caminho
+# porque o pacote gonetwork_web/ tem o mesmo nome deste arquivo.
+def load_analytics():
+    module = sys.modules.get("gonetwork_analytics")
+    if module is None:
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "gonetwork_web", "utils", "analytics.py")
+        spec = importlib.util.spec_from_file_location("gonetwork_analytics", path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules["gonetwork_analytics"] = module
+        spec.loader.exec_module(module)
+    return module
+
+# Conexão de leitura para os relatórios: DuckDB se disponível, senão SQLite
+def get_reports_connection():
+    try:
+        analytics = load_analytics()
+        settings = config.get("analytics", {})
+        engine = analytics.get_engine(
+            config.get("db_path", "database/gonetwork.db"),
+            settings.get("mode", "attach"),
+            settings.get("snapshot_interval", analytics.SNAPSHOT_INTERVAL)
+        )
+        if engine is not None:
+            return engine.connect()
+    except Exception as e:
+        print(f"Motor analítico indisponível, usando SQLite: {e}")
+    return get_db_connection()
+
 # Função para inicializar o banco de dados
 def initialize_database():
     conn = get_db_connection()
@@ -1011,7 +1041,7 @@ def reports_page():
     if report_type == "Status de Eventos":
         render_section_title("Relatório de Status de Eventos")
         
-        conn = get_db_connection()
+        conn = get_reports_connection()
         if conn:
             try:
                 cursor = conn.cursor()
@@ -1055,7 +1085,7 @@ def reports_page():
     elif report_type == "Status de Vídeos":
         render_section_title("Relatório de Status de Vídeos")
         
-        conn = get_db_connection()
+        conn = get_reports_connection()
         if conn:
             try:
                 cursor = conn.cursor()
@@ -1100,7 +1130,7 @@ def reports_page():
     elif report_type == "Eventos por Cliente":
         render_section_title("Relatório de Eventos por Cliente")
         
-        conn = get_db_connection()
+        conn = get_reports_connection()
         if conn:
             try:
                 cursor = conn.cursor()
@@ -1146,13 +1176,13 @@ def reports_page():
     elif report_type == "Produtividade":
         render_section_title("Relatório de Produtividade")
         
-        conn = get_db_connection()
+        conn = get_reports_connection()
         if conn:
             try:
                 cursor = conn.cursor()
                 cursor.execute("""
                     SELECT 
-                        strftime('%Y-%m', e.date) as month,
+                        substr(e.date, 1, 7) as month,
                         COUNT(DISTINCT e.id) as event_count,
                         COUNT(DISTINCT v.id) as video_count,
                         SUM(CASE WHEN v.status = 'Concluído' THEN 1 ELSE 0 END) as completed_videos
@@ -0,0 +1,191 @@
+"""
+Benchmark dos relatórios com 10 mil e 100 mil entregas.
+
+Cria um banco temporário com um ano de entregas e compara, para os relatórios
+de entregas e de edições, o caminho antigo (lista de dicionários, contagens em
+laços Python e formatação linha a linha) com a camada de dados
+``utils.report_data`` (DataFrames tipados e agregação no SQLite). Com o
+pacote ``duckdb`` instalado, mede também a camada de dados no motor analítico
+(``utils.analytics``, banco anexado somente leitura).
+
+Uso:
+    python benchmark_relatorios.py [quantidade ...]
+"""
+
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+# O pacote utils da versão web (e não o da raiz do projeto)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from utils.analytics import AnalyticsEngine, duckdb  # noqa: E402
+from utils.formatters import formatar_data_iso, formatar_status  # noqa: E402
+from utils.report_data import (  # noqa: E402
+    ENTREGAS_QUERY,
+    date_labels,
+    deliverables_report,
+    edits_report,
+    ensure_report_indexes,
+    status_labels,
+)
+
+STATUSES = ["pending", "em_andamento", "completed", "concluído", "atrasado"]
+START = datetime(2024, 1, 1)
+
+
+def create_database(path, deliverables):
+    """Cria um banco com clientes, eventos, membros e entregas aleatórias"""
+    random.seed(42)
+    conn = sqlite3.connect(path)
+    conn.executescript(
+        """
+        CREATE TABLE clients (id TEXT PRIMARY KEY, company TEXT);
+        CREATE TABLE events (
+            id TEXT PRIMARY KEY, client_id TEXT, name TEXT, description TEXT,
+            date TEXT, location TEXT, status TEXT, created_at TEXT,
+            updated_at TEXT
+        );
+        CREATE TABLE team_members (
+            id TEXT PRIMARY KEY, name TEXT, role TEXT, email TEXT
+        );
+        CREATE TABLE deliverables (
+            id TEXT PRIMARY KEY, title TEXT, description TEXT, event_id TEXT,
+            client_id TEXT, responsible_id TEXT, deadline TEXT, status TEXT,
+            progress INTEGER, created_at TEXT, updated_at TEXT
+        );
+        """
+    )
+    conn.executemany(
+        "INSERT INTO clients VALUES (?, ?)",
+        [(f"c{i}", f"Cliente {i}") for i in range(50)],
+    )
+    conn.executemany(
+        "INSERT INTO events (id, client_id, name, date, status) VALUES (?, ?, ?, ?, ?)",
+        [
+            (
+                f"e{i}",
+                f"c{i % 50}",
+                f"Evento {i}",
+                (START + timedelta(days=i % 365)).isoformat(),
+                random.choice(STATUSES),
+            )
+            for i in range(500)
+        ],
+    )
+    conn.executemany(
+        "INSERT INTO team_members (id, name, role) VALUES (?, ?, ?)",
+        [(f"m{i}", f"Editor {i}", "editor") for i in range(30)],
+    )
+
+    rows = []
+    for i in range(deliverables):
+        created = START + timedelta(minutes=random.randrange(365 * 24 * 60))
+        rows.append(
+            (
+                f"d{i}",
+                f"Vídeo {i}" if i % 2 else f"Entrega {i}",
+                "Descrição",
+                f"e{i % 500}",
+                f"c{i % 50}",
+                f"m{i % 30}",
+                (created + timedelta(days=7)).isoformat(),
+                random.choice(STATUSES),
+                random.randrange(101),
+                created.isoformat(),
+                (created + timedelta(days=1)).isoformat(),
+            )
+        )
+    conn.executemany(
+        "INSERT INTO deliverables VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+    )
+    conn.commit()
+    return conn
+
+
+def legacy_deliverables(conn, start, end):
+    """Relatório de entregas como era feito antes (listas de dicionários)"""
+    conn.row_factory = sqlite3.Row
+    cursor = conn.execute(ENTREGAS_QUERY, (start, end, start, end))
+    entregas = [dict(row) for row in cursor.fetchall()]
+    conn.row_factory = None
+
+    status_counts = {}
+    for entrega in entregas:
+        status = entrega.get("status", "Desconhecido")
+        status_counts[status] = status_counts.get(status, 0) + 1
+    progresso = sum(float(e["progress"] or 0) for e in entregas) / len(entregas)
+
+    df = pd.DataFrame(entregas)
+    df["deadline"] = df["deadline"].apply(formatar_data_iso)
+    df["status"] = df["status"].apply(formatar_status)
+    return df, status_counts, progresso
+
+
+def current_deliverables(conn, start, end):
+    """Relatório de entregas pela camada de dados"""
+    dados = deliverables_report(conn, start, end)
+    entregas = dados["entregas"]
+    return entregas.assign(
+        deadline=date_labels(entregas["deadline"]),
+        status=status_labels(entregas["status"]),
+    )
+
+
+def measure(function, *args, repeat=3):
+    """Menor tempo (ms) entre ``repeat`` execuções"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function(*args)
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def run(deliverables):
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "bench.db")
+        conn = create_database(path, deliverables)
+        ensure_report_indexes(conn)
+        start = START.isoformat()
+        end = (START + timedelta(days=366)).isoformat()
+
+        results = [
+            ("entregas (antigo)", measure(legacy_deliverables, conn, start, end)),
+            ("entregas (atual)", measure(current_deliverables, conn, start, end)),
+            ("edições (atual)", measure(edits_report, conn, start, end)),
+        ]
+        conn.close()
+
+        if duckdb is not None:
+            try:
+                analytics = AnalyticsEngine(path).connect()
+            except (duckdb.Error, OSError) as e:
+                # Ex.: extensão sqlite do DuckDB não instalada e sem rede
+                print(f"DuckDB indisponível, medindo só o SQLite: {e}")
+            else:
+                results += [
+                    (
+                        "entregas (duckdb)",
+                        measure(current_deliverables, analytics, start, end),
+                    ),
+                    ("edições (duckdb)", measure(edits_report, analytics, start, end)),
+                ]
+                analytics.close()
+
+    count = f"{deliverables:,}".replace(",", ".")
+    print(f"\n{count} entregas, período de um ano")
+    for name, elapsed in results:
+        print(f"  {name:<20} {elapsed:10.1f} ms")
+
+
+if __name__ == "__main__":
+    sizes = [int(value) for value in sys.argv[1:]] or [10_000, 100_000]
+    for size in sizes:
+        run(size)
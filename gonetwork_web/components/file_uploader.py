@@ -1,18 +1,24 @@
 import os
-import random
-import string
-from datetime import datetime
 
 import streamlit as st
 
+from utils.blob_store import BlobStore, ensure_schema
+from utils.database import Database
 
-def handle_uploaded_file(uploaded_file, folder_path=None):
+
+def handle_uploaded_file(uploaded_file, folder_path=None, event_id=None):
     """
     Manipula o upload de um arquivo e o salva no diretório especificado.
 
+    O arquivo é gravado em blocos, com o hash calculado durante a gravação, e
+    guardado pelo conteúdo (ver ``utils/blob_store.py``): enviar de novo um
+    arquivo já existente não ocupa mais espaço em disco. O upload é registrado
+    na tabela ``assets`` com hash, tamanho e tipo MIME.
+
     Args:
         uploaded_file: O arquivo carregado pelo usuário via st.file_uploader
         folder_path: O diretório onde o arquivo deve ser salvo
+        event_id: ID do evento ao qual o arquivo pertence (opcional)
 
     Returns:
         str: O caminho para o arquivo salvo, ou None se houver falha
@@ -20,42 +26,61 @@ def handle_uploaded_file(uploaded_file, folder_path=None):
     if not uploaded_file:
         return None
 
-    if folder_path is None:
-        # Caminho padrão para uploads
-        folder_path = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-            "data",
-            "uploads",
-        )
-
-    # Garantir que o diretório exista
-    os.makedirs(folder_path, exist_ok=True)
-
-    # Gerar um nome de arquivo único baseado em timestamp e string aleatória
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    random_string = "".join(random.choices(string.ascii_lowercase + string.digits, k=5))
-    file_extension = os.path.splitext(uploaded_file.name)[1]
-
-    # Criar o novo nome de arquivo
-    safe_filename = f"{timestamp}_{random_string}{file_extension}"
-    file_path = os.path.join(folder_path, safe_filename)
+    store = BlobStore(folder_path)
+    conn = Database.connect()
+    if not conn:
+        return None
 
+    blob = None
     try:
-        # Salvar o arquivo
-        with open(file_path, "wb") as f:
-            f.write(uploaded_file.getbuffer())
+        ensure_schema(conn)
+        # A referência ao blob e o asset são gravados na mesma transação
+        blob = store.store(
+            conn,
+            uploaded_file,
+            uploaded_file.name,
+            getattr(uploaded_file, "type", None),
+            commit=False,
+        )
+        mime_type = blob["mime_type"]
+        conn.execute(
+            """
+            INSERT INTO assets (name, path, type, event_id, folder_path, size,
+                                content_hash, mime_type)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                uploaded_file.name,
+                blob["path"],
+                mime_type.split("/")[0] if mime_type else None,
+                event_id,
+                os.path.dirname(blob["path"]),
+                blob["size"],
+                blob["hash"],
+                mime_type,
+            ),
+        )
+        conn.commit()
 
         # Retornar o caminho relativo para armazenar no banco de dados
-        return os.path.join("data", "uploads", safe_filename)
+        return blob["path"]
     except Exception as e:
+        if blob is not None:
+            store.discard(conn, blob)
         st.error(f"Erro ao salvar arquivo: {e}")
         return None
+    finally:
+        conn.close()
 
 
 def generate_thumbnail(file_path, size=(100, 100)):
     """
     Gera uma miniatura para um arquivo de imagem
 
+    A miniatura vem do cache em disco (``data/thumbnails``), endereçado pelo
+    conteúdo do arquivo: a imagem original só é decodificada (já em escala
+    reduzida) na primeira vez.
+
     Args:
         file_path: Caminho para o arquivo de imagem
         size: Tamanho da miniatura (largura, altura)
@@ -66,17 +91,14 @@ def generate_thumbnail(file_path, size=(100, 100)):
     try:
         from PIL import Image
 
-        # Verificar se o caminho é válido
-        if not os.path.exists(file_path):
-            base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            file_path = os.path.join(base_dir, file_path)
+        from utils.thumbnails import get_thumbnail
 
-        if not os.path.exists(file_path):
+        thumbnail_path = get_thumbnail(file_path, tuple(size))
+        if thumbnail_path is None:
             return None
 
-        # Abrir a imagem e criar miniatura
-        image = Image.open(file_path)
-        image.thumbnail(size)
-        return image
+        with Image.open(thumbnail_path) as image:
+            image.load()
+            return image
     except Exception as e:
         return None
@@ -30,15 +30,16 @@ def render_sidebar():
     if "user_name" in st.session_state:
         st.sidebar.markdown(f"**Usuário:** {st.session_state.user_name}")
 
-    # Exibir notificações não lidas, se houver
-    unread_notifications = Notifications.get_all(include_read=False)
-    if unread_notifications:
+    # Exibir o número de notificações não lidas, se houver (contador do banco,
+    # sem listar as notificações a cada reexecução)
+    unread_count = Notifications.unread_count()
+    if unread_count:
         with st.sidebar.container():
             col1, col2 = st.sidebar.columns([4, 1])
             with col1:
                 st.markdown("### 📬 Notificações")
             with col2:
-                st.markdown(f"### {len(unread_notifications)}")
+                st.markdown(f"### {unread_count}")
 
             if st.sidebar.button("Ver notificações", key="btn_notifications"):
                 st.session_state.show_notifications = True
@@ -1,13 +1,77 @@
-import io
+import pickle
+import sqlite3
+import time
 from datetime import datetime, timedelta
 
 import pandas as pd
-import plotly.express as px
+import plotly.io as pio
 import streamlit as st
 
+from config import load_config
 from utils.database import Database
-from utils.formatters import formatar_data_hora, formatar_data_iso, formatar_status
-from utils.reports import generate_csv_download_link, generate_excel_download_link
+from utils.formatters import formatar_data_iso
+from utils.report_data import (
+    CLIENTES_QUERY,
+    EDICOES_QUERY,
+    ENTREGAS_MEMBRO_QUERY,
+    ENTREGAS_QUERY,
+    EQUIPE_QUERY,
+    EVENTOS_QUERY,
+    date_labels,
+    status_labels,
+)
+from utils.report_jobs import DONE, FAILED, POLL_INTERVAL, get_queue
+from utils.reports import export_download_buttons
+
+
+def fila_relatorios():
+    """Fila de relatórios em segundo plano (única no servidor)"""
+    return get_queue(Database.get_db_path(), load_config().get("analytics", {}))
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _resultado(chave):
+    # A chave inclui a versão dos dados: o conteúdo de uma chave nunca muda
+    resultado = fila_relatorios().load_result(chave)
+    figuras = {
+        nome: pio.from_json(figura) for nome, figura in resultado["figuras"].items()
+    }
+    return resultado["dados"], figuras
+
+
+def carregar_relatorio(nome, *parametros):
+    """
+    Carrega os dados e as figuras de um relatório calculado em segundo plano.
+
+    Enquanto o relatório é calculado, mostra o resultado anterior do mesmo
+    pedido, se houver; senão, mostra um aviso e reexecuta a página a cada
+    ``POLL_INTERVAL`` segundos. Os pedidos iguais de outras sessões usam a
+    mesma tarefa e o mesmo resultado.
+
+    Returns:
+        tuple: Dados do relatório (ou None em caso de erro) e dicionário de
+        figuras
+    """
+    try:
+        tarefa = fila_relatorios().submit(nome, parametros)
+        if tarefa["status"] == DONE:
+            return _resultado(tarefa["key"])
+        if tarefa["previous_key"] and tarefa["status"] != FAILED:
+            # Dados alterados desde o último cálculo (ex.: edições em
+            # andamento): não espera pela versão nova
+            st.caption("🔄 Atualizando o relatório com os dados mais recentes...")
+            return _resultado(tarefa["previous_key"])
+    except (sqlite3.Error, OSError, pickle.UnpicklingError) as e:
+        st.error(f"Erro ao carregar relatório: {e}")
+        return None, {}
+
+    if tarefa["status"] == FAILED:
+        st.error(f"Erro ao carregar relatório: {tarefa['error']}")
+        return None, {}
+
+    st.info("⏳ Gerando o relatório em segundo plano...")
+    time.sleep(POLL_INTERVAL)
+    st.rerun()
 
 
 def show():
@@ -53,6 +117,18 @@ def show():
             data_final + timedelta(days=1)
         ).isoformat()  # Incluir o dia final completo
 
+        # O relatório continua na tela nas reexecuções seguintes (filtros e
+        # botões de exportação)
+        st.session_state.relatorio_atual = (
+            relatorio_tipo,
+            data_inicial_iso,
+            data_final_iso,
+        )
+
+    relatorio_atual = st.session_state.get("relatorio_atual")
+    if relatorio_atual and relatorio_atual[0] == relatorio_tipo:
+        _, data_inicial_iso, data_final_iso = relatorio_atual
+
         # Gerar o relatório com base no tipo selecionado
         if relatorio_tipo == "Resumo de Eventos":
             gerar_relatorio_eventos(data_inicial_iso, data_final_iso)
@@ -71,59 +147,45 @@ def gerar_relatorio_eventos(data_inicial, data_final):
     st.subheader("Resumo de Eventos")
 
     # Obter dados do banco de dados
-    eventos = Database.execute_query(
-        """
-        SELECT e.id, e.name, e.description, e.date, e.location, e.status,
-               e.created_at, e.updated_at, c.company as client_name
-        FROM events e
-        LEFT JOIN clients c ON e.client_id = c.id
-        WHERE e.date BETWEEN ? AND ?
-        ORDER BY e.date DESC
-        """,
-        (data_inicial, data_final),
-    )
+    dados, figuras = carregar_relatorio("eventos", data_inicial, data_final)
 
-    if not eventos:
+    if not dados or not dados["total"]:
         st.info(
             f"Nenhum evento encontrado no período de {formatar_data_iso(data_inicial)} a {formatar_data_iso(data_final)}"
         )
         return
 
-    # Mostrar resumo estatístico
-    total_eventos = len(eventos)
-    status_counts = {}
-    clientes = set()
-
-    for evento in eventos:
-        status = evento.get("status", "Desconhecido")
-        status_counts[status] = status_counts.get(status, 0) + 1
-        clientes.add(evento.get("client_name", "Desconhecido"))
-
+    # Mostrar resumo estatístico (calculado no banco)
     col1, col2, col3 = st.columns(3)
     with col1:
-        st.metric("Total de Eventos", total_eventos)
+        st.metric("Total de Eventos", dados["total"])
     with col2:
-        st.metric("Clientes Atendidos", len(clientes))
+        st.metric("Clientes Atendidos", dados["clientes"])
     with col3:
-        status_concluidos = status_counts.get("completed", 0) + status_counts.get(
-            "concluído", 0
-        )
-        st.metric("Eventos Concluídos", status_concluidos)
+        st.metric("Eventos Concluídos", dados["concluidos"])
 
-    # Criar gráfico de status
-    status_df = pd.DataFrame(
-        {"Status": list(status_counts.keys()), "Contagem": list(status_counts.values())}
-    )
+    # Gráfico de status
+    st.plotly_chart(figuras["status"], use_container_width=True)
+
+    # Mostrar tabela de eventos
+    st.dataframe(tabela_eventos(dados["eventos"]), use_container_width=True)
 
-    fig = px.pie(
-        status_df, values="Contagem", names="Status", title="Eventos por Status"
+    # Arquivos para download
+    export_download_buttons(
+        "eventos",
+        EVENTOS_QUERY,
+        (data_inicial, data_final),
+        tabela_eventos,
+        f"eventos_{data_inicial[:10]}_{data_final[:10]}",
     )
-    st.plotly_chart(fig, use_container_width=True)
 
-    # Mostrar tabela de eventos
-    eventos_df = pd.DataFrame(eventos)
-    eventos_df["date"] = eventos_df["date"].apply(formatar_data_iso)
-    eventos_df["status"] = eventos_df["status"].apply(formatar_status)
+
+def tabela_eventos(eventos_df):
+    """Formata as linhas de eventos para exibição e exportação."""
+    eventos_df = eventos_df.assign(
+        date=date_labels(eventos_df["date"]),
+        status=status_labels(eventos_df["status"]),
+    )
 
     # Renomear colunas
     eventos_df = eventos_df.rename(
@@ -139,26 +201,7 @@ def gerar_relatorio_eventos(data_inicial, data_final):
 
     # Selecionar e reordenar colunas
     colunas = ["Nome", "Descrição", "Data", "Local", "Status", "Cliente"]
-    eventos_df = eventos_df[colunas]
-
-    st.dataframe(eventos_df, use_container_width=True)
-
-    # Links para download
-    col1, col2 = st.columns(2)
-    with col1:
-        st.markdown(
-            generate_csv_download_link(
-                eventos_df, f"eventos_{data_inicial[:10]}_{data_final[:10]}.csv"
-            ),
-            unsafe_allow_html=True,
-        )
-    with col2:
-        st.markdown(
-            generate_excel_download_link(
-                eventos_df, f"eventos_{data_inicial[:10]}_{data_final[:10]}.xlsx"
-            ),
-            unsafe_allow_html=True,
-        )
+    return eventos_df[colunas]
 
 
 def gerar_relatorio_entregas(data_inicial, data_final):
@@ -166,64 +209,45 @@ def gerar_relatorio_entregas(data_inicial, data_final):
     st.subheader("Entregas por Status")
 
     # Obter dados do banco de dados
-    entregas = Database.execute_query(
-        """
-        SELECT d.id, d.title, d.description, d.deadline, d.status, d.progress,
-               d.created_at, d.updated_at,
-               e.name as event_name, c.company as client_name
-        FROM deliverables d
-        LEFT JOIN events e ON d.event_id = e.id
-        LEFT JOIN clients c ON d.client_id = c.id
-        WHERE d.created_at BETWEEN ? AND ? OR d.updated_at BETWEEN ? AND ?
-        ORDER BY d.deadline
-        """,
-        (data_inicial, data_final, data_inicial, data_final),
-    )
+    dados, figuras = carregar_relatorio("entregas", data_inicial, data_final)
 
-    if not entregas:
+    if not dados or not dados["total"]:
         st.info(
             f"Nenhuma entrega encontrada no período de {formatar_data_iso(data_inicial)} a {formatar_data_iso(data_final)}"
         )
         return
 
-    # Mostrar resumo estatístico
-    total_entregas = len(entregas)
-    status_counts = {}
-
-    for entrega in entregas:
-        status = entrega.get("status", "Desconhecido")
-        status_counts[status] = status_counts.get(status, 0) + 1
-
-    # Calcular média de progresso
-    progresso_medio = (
-        sum(float(e["progress"] or 0) for e in entregas) / total_entregas
-        if total_entregas > 0
-        else 0
-    )
-
+    # Mostrar resumo estatístico (contagens e média calculadas no banco)
     col1, col2, col3 = st.columns(3)
     with col1:
-        st.metric("Total de Entregas", total_entregas)
+        st.metric("Total de Entregas", dados["total"])
     with col2:
-        st.metric("Progresso Médio", f"{progresso_medio:.1f}%")
+        st.metric("Progresso Médio", f"{dados['progresso_medio']:.1f}%")
     with col3:
-        entregas_concluidas = status_counts.get("completed", 0) + status_counts.get(
-            "concluído", 0
-        )
-        st.metric("Entregas Concluídas", entregas_concluidas)
+        st.metric("Entregas Concluídas", dados["concluidas"])
 
     # Gráfico de status
-    status_df = pd.DataFrame(
-        {"Status": list(status_counts.keys()), "Contagem": list(status_counts.values())}
+    st.plotly_chart(figuras["status"], use_container_width=True)
+
+    # Mostrar tabela de entregas
+    st.dataframe(tabela_entregas(dados["entregas"]), use_container_width=True)
+
+    # Arquivos para download
+    export_download_buttons(
+        "entregas",
+        ENTREGAS_QUERY,
+        (data_inicial, data_final, data_inicial, data_final),
+        tabela_entregas,
+        f"entregas_{data_inicial[:10]}_{data_final[:10]}",
     )
 
-    fig = px.bar(status_df, x="Status", y="Contagem", title="Entregas por Status")
-    st.plotly_chart(fig, use_container_width=True)
 
-    # Mostrar tabela de entregas
-    entregas_df = pd.DataFrame(entregas)
-    entregas_df["deadline"] = entregas_df["deadline"].apply(formatar_data_iso)
-    entregas_df["status"] = entregas_df["status"].apply(formatar_status)
+def tabela_entregas(entregas_df):
+    """Formata as linhas de entregas para exibição e exportação."""
+    entregas_df = entregas_df.assign(
+        deadline=date_labels(entregas_df["deadline"]),
+        status=status_labels(entregas_df["status"]),
+    )
 
     # Renomear colunas
     entregas_df = entregas_df.rename(
@@ -248,26 +272,7 @@ def gerar_relatorio_entregas(data_inicial, data_final):
         "Evento",
         "Cliente",
     ]
-    entregas_df = entregas_df[colunas]
-
-    st.dataframe(entregas_df, use_container_width=True)
-
-    # Links para download
-    col1, col2 = st.columns(2)
-    with col1:
-        st.markdown(
-            generate_csv_download_link(
-                entregas_df, f"entregas_{data_inicial[:10]}_{data_final[:10]}.csv"
-            ),
-            unsafe_allow_html=True,
-        )
-    with col2:
-        st.markdown(
-            generate_excel_download_link(
-                entregas_df, f"entregas_{data_inicial[:10]}_{data_final[:10]}.xlsx"
-            ),
-            unsafe_allow_html=True,
-        )
+    return entregas_df[colunas]
 
 
 def gerar_relatorio_equipe(data_inicial, data_final):
@@ -275,134 +280,72 @@ def gerar_relatorio_equipe(data_inicial, data_final):
     st.subheader("Performance da Equipe")
 
     # Obter dados do banco de dados
-    membros_equipe = Database.execute_query(
-        """
-        SELECT tm.id, tm.name, tm.role, tm.email,
-               (SELECT COUNT(*) FROM event_team_members etm WHERE etm.member_id = tm.id) as total_events,
-               (SELECT COUNT(*) FROM deliverables d WHERE d.responsible_id = tm.id) as total_deliveries
-        FROM team_members tm
-        ORDER BY tm.name
-        """
-    )
+    membros_equipe, figuras = carregar_relatorio("equipe")
 
-    if not membros_equipe:
+    if membros_equipe is None or membros_equipe.empty:
         st.info("Nenhum membro da equipe encontrado.")
         return
 
     # Selecionar membro específico (opcional)
-    todos_membros = ["Todos"] + [m["name"] for m in membros_equipe]
+    todos_membros = ["Todos"] + membros_equipe["name"].tolist()
     membro_selecionado = st.selectbox("Filtrar por membro da equipe:", todos_membros)
 
     if membro_selecionado != "Todos":
         # Filtrar para o membro específico
-        membro_id = next(
-            (m["id"] for m in membros_equipe if m["name"] == membro_selecionado), None
-        )
+        membro = membros_equipe[membros_equipe["name"] == membro_selecionado].iloc[0]
+        membro_id = membro["id"]
 
         if membro_id:
             # Carregar entregas desse membro
-            entregas_membro = Database.execute_query(
-                """
-                SELECT d.id, d.title, d.deadline, d.status, d.progress,
-                       e.name as event_name
-                FROM deliverables d
-                LEFT JOIN events e ON d.event_id = e.id
-                WHERE d.responsible_id = ? AND (d.created_at BETWEEN ? AND ? OR d.updated_at BETWEEN ? AND ?)
-                ORDER BY d.deadline
-                """,
-                (membro_id, data_inicial, data_final, data_inicial, data_final),
+            parametros = (
+                membro_id,
+                data_inicial,
+                data_final,
+                data_inicial,
+                data_final,
+            )
+            dados, figuras_membro = carregar_relatorio(
+                "entregas_membro", membro_id, data_inicial, data_final
             )
 
             # Exibir estatísticas individuais
-            if entregas_membro:
-                total_entregas = len(entregas_membro)
-
-                # Contar por status
-                status_counts = {}
-                for e in entregas_membro:
-                    status = e.get("status", "Desconhecido")
-                    status_counts[status] = status_counts.get(status, 0) + 1
+            if dados and dados["total"]:
+                total_entregas = dados["total"]
+                concluidas = dados["concluidas"]
 
                 col1, col2, col3 = st.columns(3)
                 with col1:
                     st.metric("Total de Entregas", total_entregas)
                 with col2:
-                    concluidas = status_counts.get("completed", 0) + status_counts.get(
-                        "concluído", 0
-                    )
                     st.metric("Entregas Concluídas", concluidas)
-                    if total_entregas > 0:
-                        st.metric(
-                            "Taxa de Conclusão",
-                            f"{(concluidas/total_entregas)*100:.1f}%",
-                        )
+                    st.metric(
+                        "Taxa de Conclusão",
+                        f"{(concluidas/total_entregas)*100:.1f}%",
+                    )
                 with col3:
                     st.metric(
-                        "Função",
-                        next(
-                            (
-                                m["role"]
-                                for m in membros_equipe
-                                if m["name"] == membro_selecionado
-                            ),
-                            "",
-                        ),
+                        "Função", membro["role"] if pd.notna(membro["role"]) else ""
                     )
 
                 # Gráfico de status
-                if status_counts:
-                    status_df = pd.DataFrame(
-                        {
-                            "Status": list(status_counts.keys()),
-                            "Contagem": list(status_counts.values()),
-                        }
-                    )
-                    fig = px.pie(
-                        status_df,
-                        values="Contagem",
-                        names="Status",
-                        title=f"Entregas de {membro_selecionado} por Status",
-                    )
-                    st.plotly_chart(fig, use_container_width=True)
+                fig = figuras_membro["status"]
+                fig.update_layout(title=f"Entregas de {membro_selecionado} por Status")
+                st.plotly_chart(fig, use_container_width=True)
 
                 # Tabela de entregas
-                entregas_df = pd.DataFrame(entregas_membro)
-                entregas_df["deadline"] = entregas_df["deadline"].apply(
-                    formatar_data_iso
+                st.dataframe(
+                    tabela_entregas_membro(dados["entregas"]),
+                    use_container_width=True,
                 )
-                entregas_df["status"] = entregas_df["status"].apply(formatar_status)
-
-                # Renomear colunas
-                entregas_df = entregas_df.rename(
-                    columns={
-                        "title": "Título",
-                        "deadline": "Prazo",
-                        "status": "Status",
-                        "progress": "Progresso (%)",
-                        "event_name": "Evento",
-                    }
-                )
-
-                st.dataframe(entregas_df, use_container_width=True)
 
-                # Links para download
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.markdown(
-                        generate_csv_download_link(
-                            entregas_df,
-                            f"entregas_{membro_selecionado}_{data_inicial[:10]}_{data_final[:10]}.csv",
-                        ),
-                        unsafe_allow_html=True,
-                    )
-                with col2:
-                    st.markdown(
-                        generate_excel_download_link(
-                            entregas_df,
-                            f"entregas_{membro_selecionado}_{data_inicial[:10]}_{data_final[:10]}.xlsx",
-                        ),
-                        unsafe_allow_html=True,
-                    )
+                # Arquivos para download
+                export_download_buttons(
+                    "entregas_membro",
+                    ENTREGAS_MEMBRO_QUERY,
+                    parametros,
+                    tabela_entregas_membro,
+                    f"entregas_{membro_selecionado}_{data_inicial[:10]}_{data_final[:10]}",
+                )
             else:
                 st.info(
                     f"Nenhuma entrega encontrada para {membro_selecionado} no período selecionado."
@@ -410,54 +353,61 @@ def gerar_relatorio_equipe(data_inicial, data_final):
 
     else:
         # Mostrar estatísticas de toda a equipe
-        equipe_df = pd.DataFrame(membros_equipe)
-
-        # Renomear colunas
-        equipe_df = equipe_df.rename(
-            columns={
-                "name": "Nome",
-                "role": "Função",
-                "email": "Email",
-                "total_events": "Eventos",
-                "total_deliveries": "Entregas",
-            }
-        )
-
-        # Selecionar colunas relevantes
-        equipe_df = equipe_df[["Nome", "Função", "Email", "Eventos", "Entregas"]]
+        equipe_df = tabela_equipe(membros_equipe)
 
         # Exibir resumo da equipe
         st.metric("Total de Membros", len(equipe_df))
 
         # Gráfico de eventos/entregas por membro
-        fig = px.bar(
-            equipe_df,
-            x="Nome",
-            y=["Eventos", "Entregas"],
-            title="Participação da Equipe",
-            barmode="group",
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(figuras["participacao"], use_container_width=True)
 
         # Tabela completa
         st.dataframe(equipe_df, use_container_width=True)
 
-        # Links para download
-        col1, col2 = st.columns(2)
-        with col1:
-            st.markdown(
-                generate_csv_download_link(
-                    equipe_df, f"equipe_{data_inicial[:10]}_{data_final[:10]}.csv"
-                ),
-                unsafe_allow_html=True,
-            )
-        with col2:
-            st.markdown(
-                generate_excel_download_link(
-                    equipe_df, f"equipe_{data_inicial[:10]}_{data_final[:10]}.xlsx"
-                ),
-                unsafe_allow_html=True,
-            )
+        # Arquivos para download
+        export_download_buttons(
+            "equipe",
+            EQUIPE_QUERY,
+            (),
+            tabela_equipe,
+            f"equipe_{data_inicial[:10]}_{data_final[:10]}",
+        )
+
+
+def tabela_entregas_membro(entregas_df):
+    """Formata as entregas de um membro para exibição e exportação."""
+    entregas_df = entregas_df.assign(
+        deadline=date_labels(entregas_df["deadline"]),
+        status=status_labels(entregas_df["status"]),
+    )
+
+    # Renomear colunas
+    return entregas_df.rename(
+        columns={
+            "title": "Título",
+            "deadline": "Prazo",
+            "status": "Status",
+            "progress": "Progresso (%)",
+            "event_name": "Evento",
+        }
+    )
+
+
+def tabela_equipe(equipe_df):
+    """Formata os membros da equipe para exibição e exportação."""
+    # Renomear colunas
+    equipe_df = equipe_df.rename(
+        columns={
+            "name": "Nome",
+            "role": "Função",
+            "email": "Email",
+            "total_events": "Eventos",
+            "total_deliveries": "Entregas",
+        }
+    )
+
+    # Selecionar colunas relevantes
+    return equipe_df[["Nome", "Função", "Email", "Eventos", "Entregas"]]
 
 
 def gerar_relatorio_edicoes(data_inicial, data_final):
@@ -465,61 +415,46 @@ def gerar_relatorio_edicoes(data_inicial, data_final):
     st.subheader("Histórico de Edições")
 
     # Obter dados do banco de dados - adaptando para as edições de vídeo
-    edicoes = Database.execute_query(
-        """
-        SELECT d.id, d.title, d.description, d.deadline, d.status, d.progress,
-               d.created_at, d.updated_at,
-               e.name as event_name, c.company as client_name,
-               tm.name as editor_name
-        FROM deliverables d
-        LEFT JOIN events e ON d.event_id = e.id
-        LEFT JOIN clients c ON d.client_id = c.id
-        LEFT JOIN team_members tm ON d.responsible_id = tm.id
-        WHERE (d.title LIKE '%vídeo%' OR d.title LIKE '%video%')
-        AND (d.created_at BETWEEN ? AND ? OR d.updated_at BETWEEN ? AND ?)
-        ORDER BY d.updated_at DESC
-        """,
-        (data_inicial, data_final, data_inicial, data_final),
-    )
+    dados, figuras = carregar_relatorio("edicoes", data_inicial, data_final)
 
-    if not edicoes:
+    if not dados or not dados["total"]:
         st.info(
             f"Nenhuma edição de vídeo encontrada no período de {formatar_data_iso(data_inicial)} a {formatar_data_iso(data_final)}"
         )
         return
 
-    # Resumo estatístico
-    total_edicoes = len(edicoes)
-    editores = set([e["editor_name"] for e in edicoes if e["editor_name"]])
-    clientes = set([e["client_name"] for e in edicoes if e["client_name"]])
-
+    # Resumo estatístico (calculado no banco)
     col1, col2, col3 = st.columns(3)
     with col1:
-        st.metric("Total de Edições", total_edicoes)
+        st.metric("Total de Edições", dados["total"])
     with col2:
-        st.metric("Editores", len(editores))
+        st.metric("Editores", dados["total_editores"])
     with col3:
-        st.metric("Clientes", len(clientes))
+        st.metric("Clientes", dados["total_clientes"])
 
-    # Agrupar por editor
-    editor_counts = {}
-    for edicao in edicoes:
-        editor = edicao.get("editor_name", "Não atribuído")
-        editor_counts[editor] = editor_counts.get(editor, 0) + 1
+    # Gráfico de editores (edições agrupadas por editor no banco)
+    st.plotly_chart(figuras["editores"], use_container_width=True)
+
+    # Tabela de edições
+    st.dataframe(tabela_edicoes(dados["edicoes"]), use_container_width=True)
 
-    # Gráfico de editores
-    editor_df = pd.DataFrame(
-        {"Editor": list(editor_counts.keys()), "Edições": list(editor_counts.values())}
+    # Arquivos para download
+    export_download_buttons(
+        "edicoes",
+        EDICOES_QUERY,
+        (data_inicial, data_final, data_inicial, data_final),
+        tabela_edicoes,
+        f"edicoes_{data_inicial[:10]}_{data_final[:10]}",
     )
 
-    fig = px.bar(editor_df, x="Editor", y="Edições", title="Edições por Editor")
-    st.plotly_chart(fig, use_container_width=True)
 
-    # Tabela de edições
-    edicoes_df = pd.DataFrame(edicoes)
-    edicoes_df["deadline"] = edicoes_df["deadline"].apply(formatar_data_iso)
-    edicoes_df["updated_at"] = edicoes_df["updated_at"].apply(formatar_data_hora)
-    edicoes_df["status"] = edicoes_df["status"].apply(formatar_status)
+def tabela_edicoes(edicoes_df):
+    """Formata as edições para exibição e exportação."""
+    edicoes_df = edicoes_df.assign(
+        deadline=date_labels(edicoes_df["deadline"]),
+        updated_at=date_labels(edicoes_df["updated_at"], "%d/%m/%Y %H:%M"),
+        status=status_labels(edicoes_df["status"]),
+    )
 
     # Renomear colunas
     edicoes_df = edicoes_df.rename(
@@ -547,26 +482,7 @@ def gerar_relatorio_edicoes(data_inicial, data_final):
         "Editor",
         "Última Atualização",
     ]
-    edicoes_df = edicoes_df[colunas]
-
-    st.dataframe(edicoes_df, use_container_width=True)
-
-    # Links para download
-    col1, col2 = st.columns(2)
-    with col1:
-        st.markdown(
-            generate_csv_download_link(
-                edicoes_df, f"edicoes_{data_inicial[:10]}_{data_final[:10]}.csv"
-            ),
-            unsafe_allow_html=True,
-        )
-    with col2:
-        st.markdown(
-            generate_excel_download_link(
-                edicoes_df, f"edicoes_{data_inicial[:10]}_{data_final[:10]}.xlsx"
-            ),
-            unsafe_allow_html=True,
-        )
+    return edicoes_df[colunas]
 
 
 def gerar_relatorio_clientes(data_inicial, data_final):
@@ -574,28 +490,15 @@ def gerar_relatorio_clientes(data_inicial, data_final):
     st.subheader("Clientes e Projetos")
 
     # Obter dados do banco de dados
-    clientes = Database.execute_query(
-        """
-        SELECT c.id, c.company, c.contact_name, c.email, c.phone,
-               COUNT(DISTINCT e.id) as total_events,
-               COUNT(DISTINCT d.id) as total_deliverables
-        FROM clients c
-        LEFT JOIN events e ON c.id = e.client_id AND e.date BETWEEN ? AND ?
-        LEFT JOIN deliverables d ON (c.id = d.client_id OR e.id = d.event_id) AND
-                                    (d.created_at BETWEEN ? AND ? OR d.updated_at BETWEEN ? AND ?)
-        GROUP BY c.id
-        ORDER BY c.company
-        """,
-        (data_inicial, data_final, data_inicial, data_final, data_inicial, data_final),
-    )
+    dados, figuras = carregar_relatorio("clientes", data_inicial, data_final)
 
-    if not clientes:
+    if not dados or not dados["total"]:
         st.info("Nenhum cliente encontrado.")
         return
 
     # Resumo estatístico
-    total_clientes = len(clientes)
-    clientes_ativos = sum(1 for c in clientes if c["total_events"] > 0)
+    total_clientes = dados["total"]
+    clientes_ativos = dados["ativos"]
 
     col1, col2, col3 = st.columns(3)
     with col1:
@@ -603,29 +506,37 @@ def gerar_relatorio_clientes(data_inicial, data_final):
     with col2:
         st.metric("Clientes Ativos no Período", clientes_ativos)
     with col3:
-        if total_clientes > 0:
-            st.metric(
-                "Taxa de Clientes Ativos",
-                f"{(clientes_ativos/total_clientes)*100:.1f}%",
-            )
-
-    # Gráfico de projetos por cliente
-    clientes_projetos = [
-        (c["company"], c["total_events"]) for c in clientes if c["total_events"] > 0
-    ]
-    if clientes_projetos:
-        clientes_projetos.sort(key=lambda x: x[1], reverse=True)
-        clientes_projetos = clientes_projetos[:10]  # Top 10
-
-        clientes_df = pd.DataFrame(clientes_projetos, columns=["Cliente", "Projetos"])
-        fig = px.bar(
-            clientes_df, x="Cliente", y="Projetos", title="Top Clientes por Projetos"
+        st.metric(
+            "Taxa de Clientes Ativos",
+            f"{(clientes_ativos/total_clientes)*100:.1f}%",
         )
-        st.plotly_chart(fig, use_container_width=True)
+
+    # Gráfico de projetos por cliente (top 10)
+    if "ranking" in figuras:
+        st.plotly_chart(figuras["ranking"], use_container_width=True)
 
     # Tabela de clientes
-    clientes_df = pd.DataFrame(clientes)
+    st.dataframe(tabela_clientes(dados["clientes"]), use_container_width=True)
+
+    # Arquivos para download
+    export_download_buttons(
+        "clientes",
+        CLIENTES_QUERY,
+        (
+            data_inicial,
+            data_final,
+            data_inicial,
+            data_final,
+            data_inicial,
+            data_final,
+        ),
+        tabela_clientes,
+        f"clientes_{data_inicial[:10]}_{data_final[:10]}",
+    )
+
 
+def tabela_clientes(clientes_df):
+    """Formata os clientes para exibição e exportação."""
     # Renomear colunas
     clientes_df = clientes_df.rename(
         columns={
@@ -640,23 +551,4 @@ def gerar_relatorio_clientes(data_inicial, data_final):
 
     # Selecionar colunas
     colunas = ["Empresa", "Contato", "Email", "Telefone", "Projetos", "Entregas"]
-    clientes_df = clientes_df[colunas]
-
-    st.dataframe(clientes_df, use_container_width=True)
-
-    # Links para download
-    col1, col2 = st.columns(2)
-    with col1:
-        st.markdown(
-            generate_csv_download_link(
-                clientes_df, f"clientes_{data_inicial[:10]}_{data_final[:10]}.csv"
-            ),
-            unsafe_allow_html=True,
-        )
-    with col2:
-        st.markdown(
-            generate_excel_download_link(
-                clientes_df, f"clientes_{data_inicial[:10]}_{data_final[:10]}.xlsx"
-            ),
-            unsafe_allow_html=True,
-        )
+    return clientes_df[colunas]
@@ -5,10 +5,46 @@ import plotly.express as px
 import plotly.graph_objects as go
 import streamlit as st
 
+from utils.critical_path import DependencyGraph
 from utils.database import Database
+from utils.figure_cache import memoize_figure
 from utils.formatters import calcular_duracao, formatar_data_hora, formatar_status
 
 
+@memoize_figure
+def grafico_timeline(df, destacar_critico=False):
+    """Gráfico de Gantt dos itens da timeline, hachurando o caminho crítico."""
+    extra_args = {}
+    if destacar_critico:
+        extra_args = {
+            "pattern_shape": "critico",
+            "pattern_shape_map": {"Sim": "x", "Não": ""},
+        }
+
+    fig = px.timeline(
+        df,
+        x_start="start_time",
+        x_end="end_time",
+        y="title",
+        color="status_fmt",
+        hover_name="description",
+        hover_data={
+            "start_time": False,  # remove das informações de hover
+            "end_time": False,  # remove das informações de hover
+            "responsible": True,  # adiciona ao hover
+            "duration": True,  # adiciona ao hover
+            "status_fmt": False,  # remove das informações de hover
+            **({"folga": True, "critico": False} if destacar_critico else {}),
+        },
+        title="Cronograma do Evento",
+        **extra_args,
+    )
+
+    # Personalizar layout
+    fig.update_layout(xaxis_title="Data/Hora", yaxis_title="Atividade", height=500)
+    return fig
+
+
 def show():
     """Renderiza a página da timeline."""
     st.title("🗓️ Timeline")
@@ -52,7 +88,8 @@ def show():
     timeline_items = Database.execute_query(
         """
         SELECT ti.id, ti.title, ti.description, ti.start_time, ti.end_time,
-               ti.status, ti.priority, ti.task_type, tm.name as responsible
+               ti.status, ti.priority, ti.task_type, ti.dependencies,
+               tm.name as responsible
         FROM timeline_items ti
         LEFT JOIN team_members tm ON ti.responsible_id = tm.id
         WHERE ti.event_id = ?
@@ -102,31 +139,36 @@ def show():
             # Adicionar formatação de status
             df["status_fmt"] = df["status"].apply(formatar_status)
 
-            # Criar gráfico de Gantt
-            fig = px.timeline(
-                df,
-                x_start="start_time",
-                x_end="end_time",
-                y="title",
-                color="status_fmt",
-                hover_name="description",
-                hover_data={
-                    "start_time": False,  # remove das informações de hover
-                    "end_time": False,  # remove das informações de hover
-                    "responsible": True,  # adiciona ao hover
-                    "duration": True,  # adiciona ao hover
-                    "status_fmt": False,  # remove das informações de hover
-                },
-                title="Cronograma do Evento",
-            )
+            # Caminho crítico a partir das dependências entre os itens
+            grafo = DependencyGraph(timeline_items)
+            destacar_critico = grafo.dependency_count > 0
+            if destacar_critico:
+                criticos = grafo.critical_ids()
+                df["critico"] = (
+                    df["id"].astype(str).isin(criticos).map({True: "Sim", False: "Não"})
+                )
+                df["folga"] = df["id"].apply(
+                    lambda item_id: _formatar_folga(grafo.slack(item_id))
+                )
 
-            # Personalizar layout
-            fig.update_layout(
-                xaxis_title="Data/Hora", yaxis_title="Atividade", height=500
-            )
+            # Gráfico de Gantt (reaproveitado enquanto os itens não mudam)
+            fig = grafico_timeline(df, destacar_critico)
 
             st.plotly_chart(fig, use_container_width=True)
 
+            if destacar_critico:
+                titulos = {str(i["id"]): i["title"] for i in timeline_items}
+                caminho = [titulos.get(i, i) for i in grafo.critical_path()]
+                st.caption(
+                    f"Caminho crítico ({len(criticos)} itens sem folga, hachurados): "
+                    + " → ".join(caminho)
+                )
+                if grafo.cycles:
+                    st.warning(
+                        "Há dependências circulares entre itens da timeline; "
+                        "elas foram ignoradas no cálculo do caminho crítico."
+                    )
+
         with tab2:
             # Exibir em formato de tabela
             df_display = pd.DataFrame(timeline_items)
@@ -437,6 +479,14 @@ def show_timeline_item_form(evento_id, item_data=None):
                     st.error("Erro ao criar o item.")
 
 
+def _formatar_folga(segundos):
+    """Formata a folga (em segundos) de um item da timeline"""
+    if segundos is None:
+        return "-"
+    minutos = int(segundos // 60)
+    return f"{minutos // 60}h{minutos % 60:02d}"
+
+
 def delete_timeline_item(item_id):
     """Exclui um item da timeline."""
     return Database.execute_write_query(
@@ -0,0 +1,285 @@
+"""
+Motor analítico embutido (DuckDB) para os relatórios.
+
+Os relatórios fazem varreduras e agregações sobre o banco transacional. Rodar
+essas consultas no DuckDB, dentro do próprio processo, tira o trabalho da
+conexão SQLite usada pelas gravações interativas. Há dois modos:
+
+- ``attach``: o ``gonetwork.db`` é anexado somente leitura pela extensão
+  ``sqlite`` do DuckDB e as consultas leem o arquivo direto (dados sempre
+  atuais, sem bloquear as gravações);
+- ``snapshot``: a cada ``snapshot_interval`` segundos as tabelas são copiadas
+  para arquivos Parquet e as consultas leem essas cópias colunares, sem tocar
+  no SQLite entre uma cópia e outra.
+
+As consultas dos relatórios usam SQL comum aos dois bancos (parâmetros ``?``).
+``AnalyticsConnection`` imita a parte da conexão ``sqlite3`` usada pelas
+páginas: ``execute``/``cursor``, ``fetchone``/``fetchall``/``fetchmany`` com
+linhas acessíveis por posição ou por nome, ``commit`` e ``close``.
+
+Sem o pacote ``duckdb``, ou se o banco não puder ser anexado, ``get_engine``
+devolve None e os relatórios continuam no SQLite. O módulo não depende do
+Streamlit nem do pacote ``utils``, para poder ser carregado também pelo
+``gonetwork_web.py`` da raiz.
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+import time
+
+try:
+    import duckdb
+except ImportError:
+    duckdb = None
+
+# Modos do motor analítico ("sqlite" desativa o DuckDB)
+MODES = ("attach", "snapshot")
+# Intervalo (s) entre as cópias Parquet do modo snapshot
+SNAPSHOT_INTERVAL = 300
+SNAPSHOT_DIR = os.path.join(tempfile.gettempdir(), "gonetwork_snapshots")
+
+# Nome do banco SQLite anexado no DuckDB
+ALIAS = "gonetwork"
+
+# Erros das consultas no DuckDB (e da gravação das cópias Parquet, feita ao
+# abrir o cursor), para o fallback no SQLite
+ANALYTICS_ERRORS = (duckdb.Error, OSError) if duckdb is not None else ()
+
+
+def _literal(value):
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def _identifier(name):
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _attach(database, db_path):
+    """Anexa o banco SQLite, somente leitura, à conexão DuckDB"""
+    database.execute("INSTALL sqlite")
+    database.execute("LOAD sqlite")
+    database.execute(f"ATTACH {_literal(db_path)} AS {ALIAS} (TYPE SQLITE, READ_ONLY)")
+
+
+class Row(tuple):
+    """Linha acessível por posição ou pelo nome da coluna (como ``sqlite3.Row``)"""
+
+    def __new__(cls, values, columns):
+        row = super().__new__(cls, values)
+        row._columns = columns
+        return row
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            key = self._columns[key]
+        return super().__getitem__(key)
+
+    def keys(self):
+        return list(self._columns)
+
+
+class AnalyticsCursor:
+    """Cursor DuckDB com a interface de leitura do ``sqlite3.Cursor``"""
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+        self._columns = {}
+
+    @property
+    def description(self):
+        return self._cursor.description
+
+    def execute(self, query, params=()):
+        self._cursor.execute(query, list(params))
+        self._columns = {
+            column[0]: index
+            for index, column in enumerate(self._cursor.description or ())
+        }
+        return self
+
+    def fetchone(self):
+        row = self._cursor.fetchone()
+        return None if row is None else Row(row, self._columns)
+
+    def fetchmany(self, size=1):
+        return [Row(row, self._columns) for row in self._cursor.fetchmany(size)]
+
+    def fetchall(self):
+        return [Row(row, self._columns) for row in self._cursor.fetchall()]
+
+    def df(self):
+        """Resultado da última consulta como DataFrame"""
+        return self._cursor.df()
+
+    def close(self):
+        self._cursor.close()
+
+
+class AnalyticsConnection:
+    """Conexão de leitura com o motor analítico"""
+
+    def __init__(self, engine):
+        self._engine = engine
+        self._cursors = []
+
+    def cursor(self):
+        cursor = AnalyticsCursor(self._engine.new_cursor())
+        self._cursors.append(cursor)
+        return cursor
+
+    def execute(self, query, params=()):
+        return self.cursor().execute(query, params)
+
+    def read_frame(self, query, params=()):
+        """Executa a consulta e devolve o resultado como DataFrame"""
+        cursor = self.execute(query, params)
+        try:
+            return cursor.df()
+        finally:
+            cursor.close()
+            self._cursors.remove(cursor)
+
+    def commit(self):
+        """Nada a gravar: o motor analítico é somente leitura"""
+
+    def close(self):
+        for cursor in self._cursors:
+            cursor.close()
+        self._cursors = []
+
+
+class AnalyticsEngine:
+    """DuckDB em processo sobre o banco SQLite (anexado ou em cópias Parquet)"""
+
+    def __init__(
+        self,
+        db_path,
+        mode="attach",
+        snapshot_interval=SNAPSHOT_INTERVAL,
+        snapshot_dir=None,
+    ):
+        """
+        Args:
+            db_path: Caminho do banco SQLite
+            mode: attach ou snapshot
+            snapshot_interval: Segundos entre as cópias Parquet (snapshot)
+            snapshot_dir: Diretório das cópias (padrão: um por banco, no
+                diretório temporário)
+        """
+        if duckdb is None:
+            raise RuntimeError("O pacote duckdb não está instalado")
+        if mode not in MODES:
+            raise ValueError(f"Modo do motor analítico inválido: {mode}")
+        if not os.path.exists(db_path):
+            raise FileNotFoundError(f"Banco de dados não encontrado: {db_path}")
+
+        self.db_path = os.path.abspath(db_path)
+        self.mode = mode
+        self.snapshot_interval = snapshot_interval
+        self.snapshot_dir = snapshot_dir or os.path.join(
+            SNAPSHOT_DIR, hashlib.sha256(self.db_path.encode("utf-8")).hexdigest()
+        )
+        self._lock = threading.Lock()
+        self._snapshot_at = 0.0
+
+        # Banco DuckDB em memória; cada consulta usa um cursor próprio
+        self._database = duckdb.connect()
+        if mode == "attach":
+            _attach(self._database, self.db_path)
+        else:
+            self.refresh_snapshot(force=True)
+
+    def new_cursor(self):
+        """Cursor DuckDB para uma consulta (seguro entre threads)"""
+        if self.mode == "snapshot":
+            self.refresh_snapshot()
+        cursor = self._database.cursor()
+        if self.mode == "attach":
+            # O banco padrão não é herdado pelos cursores
+            cursor.execute(f"USE {ALIAS}")
+        return cursor
+
+    def connect(self):
+        """Conexão de leitura no formato esperado pelos relatórios"""
+        return AnalyticsConnection(self)
+
+    def refresh_snapshot(self, force=False, not_before=None):
+        """
+        Copia as tabelas do SQLite para Parquet se a cópia atual venceu.
+
+        Com ``not_before`` (instante, em segundos), uma cópia feita antes dele
+        também é refeita: quem chama garante dados pelo menos desse instante.
+
+        Cada tabela é gravada em um arquivo temporário próprio de quem grava
+        (o diretório é compartilhado pelos processos que usam o mesmo banco)
+        e renomeada para ``<tabela>.parquet`` ao final; a view de mesmo nome
+        no DuckDB passa a ler o arquivo novo.
+        """
+        with self._lock:
+            if (
+                not force
+                and time.time() - self._snapshot_at < self.snapshot_interval
+                and (not_before is None or self._snapshot_at >= not_before)
+            ):
+                return
+
+            os.makedirs(self.snapshot_dir, exist_ok=True)
+            source = duckdb.connect()
+            try:
+                _attach(source, self.db_path)
+                tables = source.execute(
+                    "SELECT table_name FROM information_schema.tables "
+                    "WHERE table_catalog = ?",
+                    [ALIAS],
+                ).fetchall()
+                for (table,) in tables:
+                    path = os.path.join(self.snapshot_dir, f"{table}.parquet")
+                    fd, temporary = tempfile.mkstemp(
+                        dir=self.snapshot_dir, prefix=f"{table}.", suffix=".part"
+                    )
+                    os.close(fd)
+                    try:
+                        source.execute(
+                            f"COPY (SELECT * FROM {ALIAS}.{_identifier(table)}) "
+                            f"TO {_literal(temporary)} (FORMAT PARQUET)"
+                        )
+                        os.replace(temporary, path)
+                    except BaseException:
+                        if os.path.exists(temporary):
+                            os.remove(temporary)
+                        raise
+                    self._database.execute(
+                        f"CREATE OR REPLACE VIEW {_identifier(table)} AS "
+                        f"SELECT * FROM read_parquet({_literal(path)})"
+                    )
+            finally:
+                source.close()
+            self._snapshot_at = time.time()
+
+
+_engines = {}
+_engines_lock = threading.Lock()
+
+
+def get_engine(db_path, mode="attach", snapshot_interval=SNAPSHOT_INTERVAL):
+    """
+    Motor analítico do banco (um por caminho e modo, criado no primeiro uso).
+
+    Returns:
+        AnalyticsEngine, ou None se o modo for "sqlite", o DuckDB não estiver
+        instalado ou o banco não existir ou não puder ser anexado
+    """
+    if duckdb is None or mode == "sqlite" or not os.path.exists(db_path):
+        return None
+
+    key = (os.path.abspath(db_path), mode)
+    with _engines_lock:
+        if key not in _engines:
+            try:
+                _engines[key] = AnalyticsEngine(db_path, mode, snapshot_interval)
+            except (duckdb.Error, OSError) as e:
+                print(f"Motor analítico indisponível, usando SQLite: {e}")
+                _engines[key] = None
+        return _engines[key]
@@ -0,0 +1,248 @@
+"""
+Armazenamento de uploads endereçado pelo conteúdo.
+
+O arquivo enviado é copiado em blocos para um arquivo temporário enquanto o
+hash SHA-256 é calculado, sem manter o upload inteiro em memória. Ao final o
+conteúdo é guardado em ``objects/<aa>/<bb>/<hash><ext>``: se um arquivo com o
+mesmo hash já existe, o temporário é descartado e o novo upload vira só mais
+uma referência (uma linha em ``assets``) ao mesmo blob.
+
+A tabela ``blobs`` conta as referências de cada conteúdo; ``release`` decrementa
+a contagem e remove o arquivo quando ela chega a zero. Hash, tamanho e tipo
+MIME de cada upload ficam registrados em ``assets``. Com ``commit=False``,
+``store`` deixa a transação aberta para que a linha em ``assets`` seja gravada
+junto com a referência; se ela falhar, ``discard`` desfaz as duas.
+"""
+
+import hashlib
+import mimetypes
+import os
+import tempfile
+
+# Tamanho dos blocos copiados do upload para o disco
+CHUNK_SIZE = 8 * 1024 * 1024
+
+_WEB_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_ROOT = os.path.join(_WEB_DIR, "data", "uploads")
+
+# Colunas acrescentadas a ``assets`` em bancos criados antes do armazenamento
+# por conteúdo
+_ASSET_COLUMNS = {"content_hash": "TEXT", "mime_type": "TEXT"}
+
+
+def ensure_schema(conn):
+    """Cria a tabela de blobs e as colunas de conteúdo em ``assets``"""
+    cursor = conn.cursor()
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS blobs (
+            hash TEXT PRIMARY KEY,
+            path TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            mime_type TEXT,
+            ref_count INTEGER NOT NULL DEFAULT 0,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """
+    )
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS assets (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            path TEXT NOT NULL,
+            type TEXT,
+            event_id INTEGER,
+            folder_path TEXT,
+            size INTEGER,
+            content_hash TEXT,
+            mime_type TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (event_id) REFERENCES events(id)
+        )
+        """
+    )
+
+    existing = {row[1] for row in cursor.execute("PRAGMA table_info(assets)")}
+    for column, column_type in _ASSET_COLUMNS.items():
+        if column not in existing:
+            cursor.execute(f"ALTER TABLE assets ADD COLUMN {column} {column_type}")
+
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_assets_content_hash ON assets(content_hash)"
+    )
+    conn.commit()
+
+
+class BlobStore:
+    """Guarda uploads pelo conteúdo, com contagem de referências"""
+
+    def __init__(self, root=None):
+        """
+        Args:
+            root: Diretório dos uploads (padrão: data/uploads da versão web)
+        """
+        self.root = os.path.abspath(root or DEFAULT_ROOT)
+        self.objects_dir = os.path.join(self.root, "objects")
+        self.tmp_dir = os.path.join(self.root, "tmp")
+
+    def object_path(self, digest, extension=""):
+        """Caminho absoluto do blob de um conteúdo"""
+        return os.path.join(
+            self.objects_dir, digest[:2], digest[2:4], f"{digest}{extension.lower()}"
+        )
+
+    def relative_path(self, path):
+        """Caminho para gravar no banco (relativo à versão web quando possível)"""
+        if os.path.commonpath([path, _WEB_DIR]) == _WEB_DIR:
+            return os.path.relpath(path, _WEB_DIR)
+        return path
+
+    def absolute_path(self, path):
+        """Resolve um caminho gravado no banco"""
+        return path if os.path.isabs(path) else os.path.join(_WEB_DIR, path)
+
+    def write_stream(self, source, chunk_size=CHUNK_SIZE):
+        """
+        Copia ``source`` em blocos para um arquivo temporário, calculando o hash.
+
+        Args:
+            source: Objeto com ``read(n)`` (ex.: UploadedFile do Streamlit)
+
+        Returns:
+            tuple: (caminho temporário, hash SHA-256, tamanho em bytes)
+        """
+        if hasattr(source, "seek"):
+            source.seek(0)
+
+        os.makedirs(self.tmp_dir, exist_ok=True)
+        digest = hashlib.sha256()
+        size = 0
+        fd, temporary = tempfile.mkstemp(dir=self.tmp_dir, suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as target:
+                for block in iter(lambda: source.read(chunk_size), b""):
+                    digest.update(block)
+                    target.write(block)
+                    size += len(block)
+        except BaseException:
+            os.remove(temporary)
+            raise
+        return temporary, digest.hexdigest(), size
+
+    def store(self, conn, source, name, mime_type=None, commit=True):
+        """
+        Guarda o conteúdo de ``source`` e registra mais uma referência a ele.
+
+        Args:
+            conn: Conexão SQLite (com ``ensure_schema`` já aplicado)
+            source: Objeto com ``read(n)``
+            name: Nome original do arquivo (define extensão e tipo MIME)
+            mime_type: Tipo MIME informado pelo navegador, se houver
+            commit: Se False, a transação fica aberta para quem chamou gravar
+                o asset nela e confirmar (ou chamar ``discard``)
+
+        Returns:
+            dict: hash, size, mime_type, path (relativo) e duplicate (True se o
+            conteúdo já estava guardado)
+        """
+        mime_type = mime_type or mimetypes.guess_type(name)[0]
+        temporary, digest, size = self.write_stream(source)
+
+        moved = None
+        try:
+            # O upload já está em disco: o banco só fica bloqueado daqui até a
+            # confirmação, e nenhum outro upload referencia o blob nesse meio
+            if not conn.in_transaction:
+                conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT path FROM blobs WHERE hash = ?", (digest,)
+            ).fetchone()
+            duplicate = row is not None and os.path.exists(self.absolute_path(row[0]))
+
+            if duplicate:
+                # Conteúdo já guardado: o upload vira só uma referência
+                os.remove(temporary)
+                path = row[0]
+                conn.execute(
+                    "UPDATE blobs SET ref_count = ref_count + 1 WHERE hash = ?",
+                    (digest,),
+                )
+            else:
+                target = self.object_path(digest, os.path.splitext(name)[1])
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                os.replace(temporary, target)
+                moved, temporary = target, None
+                path = self.relative_path(target)
+                conn.execute(
+                    """
+                    INSERT INTO blobs (hash, path, size, mime_type, ref_count)
+                    VALUES (?, ?, ?, ?, 1)
+                    ON CONFLICT(hash) DO UPDATE SET
+                        path = excluded.path, ref_count = ref_count + 1
+                    """,
+                    (digest, path, size, mime_type),
+                )
+            if commit:
+                conn.commit()
+        except BaseException:
+            # Também erros de disco (OSError): a transação aberta acima e os
+            # arquivos gravados não podem ficar para trás
+            conn.rollback()
+            for leftover in (temporary, moved):
+                if leftover is not None and os.path.exists(leftover):
+                    os.remove(leftover)
+            raise
+
+        return {
+            "hash": digest,
+            "size": size,
+            "mime_type": mime_type,
+            "path": path,
+            "duplicate": duplicate,
+        }
+
+    def discard(self, conn, blob):
+        """
+        Desfaz um ``store(commit=False)`` ainda não confirmado.
+
+        Args:
+            conn: Conexão com a transação aberta por ``store``
+            blob: Dicionário retornado por ``store``
+        """
+        conn.rollback()
+        if not blob["duplicate"]:
+            try:
+                os.remove(self.absolute_path(blob["path"]))
+            except OSError:
+                pass
+
+    def release(self, conn, digest):
+        """
+        Remove uma referência ao conteúdo; apaga o blob na última.
+
+        Returns:
+            bool: True se o arquivo do blob foi removido
+        """
+        row = conn.execute(
+            "SELECT path, ref_count FROM blobs WHERE hash = ?", (digest,)
+        ).fetchone()
+        if row is None:
+            return False
+
+        path, ref_count = row
+        if ref_count > 1:
+            conn.execute(
+                "UPDATE blobs SET ref_count = ref_count - 1 WHERE hash = ?", (digest,)
+            )
+            conn.commit()
+            return False
+
+        conn.execute("DELETE FROM blobs WHERE hash = ?", (digest,))
+        conn.commit()
+        try:
+            os.remove(self.absolute_path(path))
+        except OSError:
+            pass
+        return True
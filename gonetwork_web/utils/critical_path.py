@@ -0,0 +1,35 @@
+"""
+Acesso ao motor de caminho crítico na versão web.
+
+O pacote ``utils`` da versão web encobre o ``utils`` da raiz do projeto, então
+o módulo ``utils/critical_path.py`` da raiz (que só usa a biblioteca padrão) é
+carregado diretamente pelo caminho do arquivo. Assim a interface desktop e a
+web usam exatamente o mesmo cálculo.
+"""
+
+import importlib.util
+import os
+import sys
+
+_MODULE_NAME = "gonetwork_critical_path"
+_MODULE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "utils",
+    "critical_path.py",
+)
+
+
+def _load_module():
+    module = sys.modules.get(_MODULE_NAME)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(_MODULE_NAME, _MODULE_PATH)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[_MODULE_NAME] = module
+        spec.loader.exec_module(module)
+    return module
+
+
+_critical_path = _load_module()
+
+DependencyGraph = _critical_path.DependencyGraph
+parse_dependencies = _critical_path.parse_dependencies
@@ -0,0 +1,241 @@
+"""
+Exportação de relatórios para arquivos (CSV, XLSX e Parquet).
+
+Os dados são lidos do banco em blocos (``fetchmany``) e cada bloco é gravado
+no arquivo antes do próximo ser lido, sem montar a tabela inteira em memória
+nem codificá-la em base64 na página:
+
+- CSV: blocos anexados com ``DataFrame.to_csv``;
+- XLSX: ``xlsxwriter`` em modo ``constant_memory``, que grava cada linha no
+  disco assim que a próxima começa;
+- Parquet: um ``ParquetWriter`` do ``pyarrow`` (se instalado), um grupo de
+  linhas por bloco.
+
+O arquivo pronto fica em um diretório temporário com o nome derivado do hash
+dos parâmetros (relatório, consulta, parâmetros e formato). Um novo pedido com
+os mesmos parâmetros reaproveita o arquivo enquanto ele tiver menos de
+``EXPORT_TTL`` segundos, o mesmo prazo do cache das consultas.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+# Linhas lidas do banco e gravadas por vez
+CHUNK_SIZE = 5000
+# Validade (s) de um arquivo exportado
+EXPORT_TTL = 300
+
+EXPORT_DIR = os.path.join(tempfile.gettempdir(), "gonetwork_exports")
+
+# Formato -> (extensão, tipo MIME, rótulo)
+FORMATS = {
+    "csv": (".csv", "text/csv", "CSV"),
+    "xlsx": (
+        ".xlsx",
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        "Excel",
+    ),
+    "parquet": (".parquet", "application/vnd.apache.parquet", "Parquet"),
+}
+
+
+def available_formats():
+    """Formatos de exportação disponíveis (Parquet depende do pyarrow)"""
+    return [fmt for fmt in FORMATS if fmt != "parquet" or pq is not None]
+
+
+def export_key(name, query, params, fmt):
+    """Hash que identifica uma exportação pelos seus parâmetros"""
+    payload = json.dumps([name, query, list(params), fmt], default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def iter_query_chunks(conn, query, params=(), chunk_size=CHUNK_SIZE, transform=None):
+    """
+    Executa a consulta e devolve o resultado em blocos.
+
+    Args:
+        conn: Conexão SQLite
+        query: Consulta SQL
+        params: Parâmetros da consulta
+        chunk_size: Linhas por bloco
+        transform: Função aplicada a cada bloco (DataFrame -> DataFrame)
+
+    Yields:
+        DataFrame: Bloco com até ``chunk_size`` linhas. Uma consulta sem
+        resultados gera um único bloco vazio, com as colunas de
+        ``cursor.description``, para que o cabeçalho seja gravado.
+    """
+    cursor = conn.execute(query, params)
+    columns = [column[0] for column in cursor.description]
+    rows = cursor.fetchmany(chunk_size)
+    while True:
+        chunk = pd.DataFrame.from_records([tuple(row) for row in rows], columns=columns)
+        yield transform(chunk) if transform else chunk
+        rows = cursor.fetchmany(chunk_size)
+        if not rows:
+            break
+
+
+def _write_csv(chunks, path):
+    header = True
+    with open(path, "w", encoding="utf-8-sig", newline="") as file:
+        for chunk in chunks:
+            chunk.to_csv(file, index=False, header=header)
+            header = False
+
+
+def _excel_value(value):
+    if value is None or (isinstance(value, float) and value != value):
+        return None
+    if isinstance(value, pd.Timestamp):
+        return value.to_pydatetime().replace(tzinfo=None)
+    return value
+
+
+def _write_xlsx(chunks, path):
+    import xlsxwriter
+
+    workbook = xlsxwriter.Workbook(
+        path,
+        {"constant_memory": True, "default_date_format": "dd/mm/yyyy hh:mm"},
+    )
+    try:
+        worksheet = workbook.add_worksheet("Dados")
+        header_format = workbook.add_format({"bold": True})
+        row_number = 0
+        for chunk in chunks:
+            if row_number == 0:
+                worksheet.write_row(0, 0, list(chunk.columns), header_format)
+                row_number = 1
+            for row in chunk.itertuples(index=False, name=None):
+                worksheet.write_row(row_number, 0, [_excel_value(v) for v in row])
+                row_number += 1
+    finally:
+        workbook.close()
+
+
+def _write_parquet(chunks, path):
+    if pq is None:
+        raise ValueError("O pacote pyarrow não está instalado")
+
+    writer = None
+    try:
+        for chunk in chunks:
+            # Texto como string mesmo quando o bloco só tem valores nulos
+            for column in chunk.columns[chunk.dtypes == object]:
+                chunk[column] = chunk[column].astype("string")
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema)
+            else:
+                table = table.cast(writer.schema)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+    if writer is None:
+        # Consulta sem resultados: arquivo válido sem linhas
+        pq.write_table(pa.table({}), path)
+
+
+_WRITERS = {"csv": _write_csv, "xlsx": _write_xlsx, "parquet": _write_parquet}
+
+
+def export_path(name, query, params, fmt):
+    """Caminho do arquivo de uma exportação (existente ou não)"""
+    extension = FORMATS[fmt][0]
+    return os.path.join(
+        EXPORT_DIR, f"{export_key(name, query, params, fmt)}{extension}"
+    )
+
+
+def cached_export(name, query, params, fmt):
+    """Caminho de uma exportação ainda válida, ou None"""
+    path = export_path(name, query, params, fmt)
+    try:
+        if time.time() - os.path.getmtime(path) < EXPORT_TTL:
+            return path
+    except OSError:
+        pass
+    return None
+
+
+def prune_exports(max_age=EXPORT_TTL):
+    """Remove os arquivos exportados vencidos"""
+    try:
+        entries = list(os.scandir(EXPORT_DIR))
+    except OSError:
+        return
+    limit = time.time() - max_age
+    for entry in entries:
+        try:
+            if entry.is_file() and entry.stat().st_mtime < limit:
+                os.remove(entry.path)
+        except OSError:
+            pass
+
+
+def export_query(
+    connect,
+    name,
+    query,
+    params=(),
+    fmt="csv",
+    transform=None,
+    chunk_size=CHUNK_SIZE,
+):
+    """
+    Exporta o resultado de uma consulta para um arquivo, em blocos.
+
+    Args:
+        connect: Função que abre uma conexão SQLite (ex.: ``Database.connect``)
+        name: Nome do relatório (entra no hash da exportação)
+        query: Consulta SQL
+        params: Parâmetros da consulta
+        fmt: csv, xlsx ou parquet
+        transform: Função aplicada a cada bloco antes da gravação
+        chunk_size: Linhas lidas por vez
+
+    Returns:
+        str: Caminho do arquivo (reaproveitado se ainda for válido)
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Formato de exportação não suportado: {fmt}")
+
+    path = cached_export(name, query, params, fmt)
+    if path is not None:
+        return path
+
+    prune_exports()
+    os.makedirs(EXPORT_DIR, exist_ok=True)
+    path = export_path(name, query, params, fmt)
+
+    conn = connect()
+    if conn is None:
+        raise RuntimeError("Não foi possível conectar ao banco de dados")
+
+    fd, temporary = tempfile.mkstemp(dir=EXPORT_DIR, suffix=".part")
+    os.close(fd)
+    try:
+        chunks = iter_query_chunks(conn, query, params, chunk_size, transform)
+        _WRITERS[fmt](chunks, temporary)
+        os.replace(temporary, path)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+    finally:
+        conn.close()
+    return path
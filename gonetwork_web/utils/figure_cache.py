@@ -0,0 +1,155 @@
+"""
+Cache das figuras do Plotly entre as reexecuções do Streamlit.
+
+Montar uma figura (``px.timeline``, ``px.bar``...) envolve agrupar os dados,
+gerar os traces e validar o layout, e isso era refeito a cada interação, mesmo
+quando só um widget sem relação com o gráfico mudava. Com ``memoize_figure``
+a figura é guardada em JSON, sob uma impressão digital barata das entradas:
+
+- DataFrames e Series entram pelo ``pd.util.hash_pandas_object`` (vetorizado)
+  junto com os nomes e tipos das colunas;
+- os demais argumentos (opções do gráfico) entram pelo JSON.
+
+O cache fica no módulo, então é compartilhado pelas sessões que mostram os
+mesmos dados, e descarta as figuras menos usadas quando o total passa de
+``MAX_BYTES``.
+"""
+
+import functools
+import hashlib
+import json
+import sys
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+import plotly.io as pio
+
+# Memória máxima (bytes) ocupada pelas figuras em JSON
+MAX_BYTES = 64 * 1024 * 1024
+
+
+def _update_digest(digest, value):
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        if isinstance(value, pd.DataFrame):
+            schema = [
+                (str(column), str(dtype)) for column, dtype in value.dtypes.items()
+            ]
+        else:
+            schema = [(str(value.name), str(value.dtype))]
+        digest.update(repr((type(value).__name__, schema, len(value))).encode("utf-8"))
+        try:
+            hashes = pd.util.hash_pandas_object(value, index=True)
+            digest.update(hashes.to_numpy().tobytes())
+        except TypeError:
+            # Células não hasheáveis (listas, dicionários)
+            digest.update(value.to_json(date_format="iso").encode("utf-8"))
+    elif isinstance(value, (list, tuple)):
+        digest.update(f"{type(value).__name__}:{len(value)}".encode("utf-8"))
+        for item in value:
+            _update_digest(digest, item)
+    elif isinstance(value, dict):
+        digest.update(f"dict:{len(value)}".encode("utf-8"))
+        for key, item in value.items():
+            _update_digest(digest, key)
+            _update_digest(digest, item)
+    else:
+        digest.update(json.dumps(value, default=str).encode("utf-8"))
+
+
+def fingerprint(*values):
+    """Impressão digital (hash) dos dados e opções de uma figura"""
+    digest = hashlib.blake2b(digest_size=16)
+    for value in values:
+        _update_digest(digest, value)
+    return digest.hexdigest()
+
+
+class FigureCache:
+    """Figuras em JSON, com descarte das menos usadas acima de ``max_bytes``"""
+
+    def __init__(self, max_bytes=MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._figures = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """JSON da figura, ou None se não estiver no cache"""
+        with self._lock:
+            figure_json = self._figures.get(key)
+            if figure_json is None:
+                self.misses += 1
+            else:
+                self._figures.move_to_end(key)
+                self.hits += 1
+            return figure_json
+
+    def put(self, key, figure_json):
+        """Guarda o JSON de uma figura, descartando as menos usadas"""
+        size = sys.getsizeof(figure_json)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._figures.pop(key, None)
+            if previous is not None:
+                self._size -= sys.getsizeof(previous)
+            self._figures[key] = figure_json
+            self._size += size
+            while self._size > self.max_bytes:
+                _, evicted = self._figures.popitem(last=False)
+                self._size -= sys.getsizeof(evicted)
+
+    def get_figure(self, key, build):
+        """
+        Figura do cache ou, se ausente, montada por ``build()`` e guardada.
+
+        Returns:
+            Figura do Plotly (uma cópia nova a cada chamada), ou None se
+            ``build`` não gerou figura
+        """
+        figure_json = self.get(key)
+        if figure_json is not None:
+            return pio.from_json(figure_json)
+
+        figure = build()
+        if figure is not None:
+            self.put(key, figure.to_json())
+        return figure
+
+    @property
+    def size(self):
+        """Bytes ocupados pelas figuras guardadas"""
+        return self._size
+
+    def clear(self):
+        with self._lock:
+            self._figures.clear()
+            self._size = 0
+
+
+_cache = FigureCache()
+
+
+def get_figure_cache():
+    """Cache de figuras do servidor (compartilhado entre as sessões)"""
+    return _cache
+
+
+def memoize_figure(function):
+    """
+    Decorador para funções que montam figuras do Plotly.
+
+    A figura é reaproveitada sempre que a função é chamada com dados e opções
+    iguais (mesma impressão digital).
+    """
+    name = f"{function.__module__}.{function.__qualname__}"
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        key = fingerprint(name, args, sorted(kwargs.items()))
+        return _cache.get_figure(key, lambda: function(*args, **kwargs))
+
+    return wrapper
@@ -0,0 +1,265 @@
+"""
+Catálogo persistente dos arquivos dos diretórios de upload.
+
+Em vez de listar o diretório e chamar ``os.stat``/``mimetypes`` para cada
+arquivo a cada renderização, os arquivos ficam na tabela ``file_catalog``
+(extensão, tipo, MIME, tamanho e datas), com índices por diretório + extensão e
+diretório + tipo. A listagem é uma consulta SQL.
+
+O catálogo é mantido por uma varredura incremental com ``os.scandir``: só os
+arquivos com tamanho ou data de modificação diferentes são regravados, e os
+que sumiram são removidos. A varredura de um diretório é pulada enquanto a
+data de modificação dele não muda (arquivos criados, removidos ou renomeados)
+e a última varredura é recente (alterações no conteúdo de arquivos
+existentes).
+
+Com ``recursive=True`` os subdiretórios também são varridos — é o caso dos
+uploads, guardados em ``objects/<aa>/<bb>/`` (ver ``utils/blob_store.py``).
+Cada subdiretório tem o seu próprio atalho: os inalterados não são listados,
+e os seus subdiretórios vêm dos já registrados em ``file_catalog_scans``.
+Arquivos ``.part`` (gravações em andamento) são ignorados.
+"""
+
+import mimetypes
+import os
+import time
+
+# Intervalo (s) em que uma varredura com o diretório inalterado é pulada
+SCAN_INTERVAL = 30
+# Sufixo dos arquivos ainda sendo gravados
+PARTIAL_SUFFIX = ".part"
+
+
+def ensure_schema(conn):
+    """Cria as tabelas e os índices do catálogo"""
+    cursor = conn.cursor()
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS file_catalog (
+            path TEXT PRIMARY KEY,
+            directory TEXT NOT NULL,
+            name TEXT NOT NULL,
+            extension TEXT,
+            type TEXT,
+            mime_type TEXT,
+            size INTEGER NOT NULL,
+            mtime_ns INTEGER NOT NULL,
+            ctime REAL
+        )
+        """
+    )
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS file_catalog_scans (
+            directory TEXT PRIMARY KEY,
+            mtime_ns INTEGER NOT NULL,
+            scanned_at REAL NOT NULL
+        )
+        """
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_file_catalog_directory "
+        "ON file_catalog(directory)"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_file_catalog_extension "
+        "ON file_catalog(directory, extension)"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_file_catalog_type "
+        "ON file_catalog(directory, type)"
+    )
+    conn.commit()
+
+
+def _catalog_row(directory, entry):
+    stat = entry.stat()
+    extension = os.path.splitext(entry.name)[1].lower()
+    mime_type, _ = mimetypes.guess_type(entry.name)
+    return (
+        entry.path,
+        directory,
+        entry.name,
+        extension,
+        mime_type.split("/")[0] if mime_type else "unknown",
+        mime_type,
+        stat.st_size,
+        stat.st_mtime_ns,
+        stat.st_ctime,
+    )
+
+
+class FileCatalog:
+    """Mantém e consulta o catálogo de arquivos"""
+
+    def __init__(self, conn):
+        """
+        Args:
+            conn: Conexão SQLite (``row_factory`` é respeitada nas consultas)
+        """
+        self.conn = conn
+        ensure_schema(conn)
+
+    def _states(self, directory, recursive):
+        """Última varredura do diretório (e dos subdiretórios, se recursivo)"""
+        query = (
+            "SELECT directory, mtime_ns, scanned_at FROM file_catalog_scans "
+            "WHERE directory = ?"
+        )
+        parameters = [directory]
+        if recursive:
+            prefix = os.path.join(directory, "")
+            query += " OR substr(directory, 1, ?) = ?"
+            parameters.extend([len(prefix), prefix])
+        return {
+            row[0]: (row[1], row[2]) for row in self.conn.execute(query, parameters)
+        }
+
+    def _scan_directory(self, directory, changed, removed):
+        """Compara um diretório com o catálogo; retorna os subdiretórios"""
+        known = {
+            row[0]: (row[1], row[2])
+            for row in self.conn.execute(
+                "SELECT name, size, mtime_ns FROM file_catalog WHERE directory = ?",
+                (directory,),
+            )
+        }
+
+        subdirectories = []
+        seen = set()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirectories.append(entry.path)
+                    continue
+                if not entry.is_file() or entry.name.endswith(PARTIAL_SUFFIX):
+                    continue
+                seen.add(entry.name)
+                stat = entry.stat()
+                if known.get(entry.name) != (stat.st_size, stat.st_mtime_ns):
+                    changed.append(_catalog_row(directory, entry))
+
+        removed.extend(os.path.join(directory, name) for name in known.keys() - seen)
+        return subdirectories
+
+    def scan(self, directory, force=False, recursive=False):
+        """
+        Sincroniza o catálogo com o conteúdo do diretório.
+
+        Args:
+            directory: Diretório a varrer
+            force: Varre mesmo que o diretório pareça inalterado
+            recursive: Varre também os subdiretórios (senão, apenas os
+                arquivos do primeiro nível)
+
+        Returns:
+            tuple: (arquivos novos ou alterados, arquivos removidos)
+        """
+        directory = os.path.abspath(directory)
+        states = self._states(directory, recursive)
+        now = time.time()
+
+        children = {}
+        for known_directory in states:
+            if known_directory != directory:
+                parent = os.path.dirname(known_directory)
+                children.setdefault(parent, []).append(known_directory)
+
+        changed, removed, scanned = [], [], []
+        visited = set()
+        pending = [directory]
+        while pending:
+            current = pending.pop()
+            try:
+                dir_mtime = os.stat(current).st_mtime_ns
+            except FileNotFoundError:
+                if current == directory:
+                    raise
+                continue
+            visited.add(current)
+
+            state = states.get(current)
+            if (
+                not force
+                and state is not None
+                and state[0] == dir_mtime
+                and now - state[1] < SCAN_INTERVAL
+            ):
+                # Inalterado: os subdiretórios são os da última varredura
+                if recursive:
+                    pending.extend(children.get(current, ()))
+                continue
+
+            subdirectories = self._scan_directory(current, changed, removed)
+            if recursive:
+                pending.extend(subdirectories)
+            scanned.append((current, dir_mtime, now))
+
+        # Subdiretórios que deixaram de existir
+        gone = [(path,) for path in states.keys() - visited] if recursive else []
+
+        with self.conn:
+            self.conn.executemany(
+                """
+                INSERT OR REPLACE INTO file_catalog
+                    (path, directory, name, extension, type, mime_type, size,
+                     mtime_ns, ctime)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                changed,
+            )
+            self.conn.executemany(
+                "DELETE FROM file_catalog WHERE path = ?",
+                [(path,) for path in removed],
+            )
+            for (path,) in gone:
+                removed.extend(
+                    row[0]
+                    for row in self.conn.execute(
+                        "SELECT path FROM file_catalog WHERE directory = ?", (path,)
+                    )
+                )
+            self.conn.executemany("DELETE FROM file_catalog WHERE directory = ?", gone)
+            self.conn.executemany(
+                "DELETE FROM file_catalog_scans WHERE directory = ?", gone
+            )
+            self.conn.executemany(
+                """
+                INSERT OR REPLACE INTO file_catalog_scans
+                    (directory, mtime_ns, scanned_at)
+                VALUES (?, ?, ?)
+                """,
+                scanned,
+            )
+        return len(changed), len(removed)
+
+    def list(self, directory, extensions=None, file_type=None, recursive=False):
+        """
+        Lista os arquivos catalogados de um diretório, ordenados pelo nome.
+
+        Args:
+            directory: Diretório
+            extensions: Extensões aceitas (ex.: ['.jpg', '.png'])
+            file_type: Tipo principal do MIME (ex.: 'image', 'video')
+            recursive: Inclui os arquivos dos subdiretórios
+
+        Returns:
+            list: Linhas de ``file_catalog``
+        """
+        directory = os.path.abspath(directory)
+        query = "SELECT * FROM file_catalog WHERE (directory = ?"
+        parameters = [directory]
+        if recursive:
+            prefix = os.path.join(directory, "")
+            query += " OR substr(directory, 1, ?) = ?"
+            parameters.extend([len(prefix), prefix])
+        query += ")"
+        if extensions:
+            extensions = [ext.lower() for ext in extensions]
+            query += f" AND extension IN ({', '.join('?' * len(extensions))})"
+            parameters.extend(extensions)
+        if file_type:
+            query += " AND type = ?"
+            parameters.append(file_type)
+        query += " ORDER BY name"
+        return self.conn.execute(query, parameters).fetchall()
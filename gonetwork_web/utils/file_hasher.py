@@ -0,0 +1,242 @@
+"""
+Hash de arquivos com cache no banco e processamento paralelo.
+
+- Arquivos grandes são lidos com ``mmap`` e os demais em blocos de 4 MB
+  (``readinto`` em um buffer reutilizado), em vez de blocos de 64 KB.
+- ``hash_files`` distribui os arquivos por um pool de threads; ``hashlib`` e
+  ``zlib`` liberam o GIL durante o cálculo, então as threads rodam em paralelo.
+- Além de md5/sha1/sha256 há o algoritmo ``"fast"``, não criptográfico, para
+  detectar alterações: xxHash (XXH3-64) quando o pacote ``xxhash`` está
+  instalado, ou CRC32 da biblioteca padrão.
+- Os resultados ficam na tabela ``file_hashes``, identificados por caminho,
+  inode, tamanho e data de modificação; um arquivo inalterado não é relido.
+"""
+
+import hashlib
+import mmap
+import os
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+BUFFER_SIZE = 4 * 1024 * 1024
+# A partir deste tamanho o arquivo é mapeado em memória em vez de lido
+MMAP_THRESHOLD = 64 * 1024 * 1024
+# Caminhos por consulta ao buscar hashes em cache
+_LOOKUP_BATCH = 500
+
+FAST_ALGORITHM = "xxh3_64" if xxhash is not None else "crc32"
+
+
+class _Crc32:
+    """Interface de hashlib para o CRC32 do zlib"""
+
+    def __init__(self):
+        self.value = 0
+
+    def update(self, data):
+        self.value = zlib.crc32(data, self.value)
+
+    def hexdigest(self):
+        return f"{self.value:08x}"
+
+
+def resolve_algorithm(algorithm):
+    """Nome real do algoritmo (``"fast"`` depende do que está instalado)"""
+    algorithm = algorithm.lower()
+    if algorithm == "fast":
+        return FAST_ALGORITHM
+    if algorithm not in ("md5", "sha1", "sha256", "xxh3_64", "crc32"):
+        raise ValueError(f"Algoritmo de hash não suportado: {algorithm}")
+    return algorithm
+
+
+def _new_hasher(algorithm):
+    if algorithm == "crc32":
+        return _Crc32()
+    if algorithm == "xxh3_64":
+        if xxhash is None:
+            raise ValueError("O pacote xxhash não está instalado")
+        return xxhash.xxh3_64()
+    return hashlib.new(algorithm)
+
+
+def hash_file(path, algorithm="sha256", buffer_size=BUFFER_SIZE):
+    """
+    Calcula o hash de um arquivo, sem cache.
+
+    Args:
+        path: Caminho do arquivo
+        algorithm: md5, sha1, sha256 ou fast
+        buffer_size: Tamanho do buffer de leitura
+
+    Returns:
+        str: Hash em formato hexadecimal
+    """
+    hasher = _new_hasher(resolve_algorithm(algorithm))
+    with open(path, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        if size >= MMAP_THRESHOLD:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                hasher.update(mapped)
+        else:
+            buffer = bytearray(buffer_size)
+            view = memoryview(buffer)
+            while True:
+                read = file.readinto(buffer)
+                if not read:
+                    break
+                hasher.update(view[:read])
+    return hasher.hexdigest()
+
+
+def ensure_schema(conn):
+    """Cria a tabela de hashes em cache"""
+    cursor = conn.cursor()
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS file_hashes (
+            path TEXT NOT NULL,
+            algorithm TEXT NOT NULL,
+            inode INTEGER NOT NULL,
+            size INTEGER NOT NULL,
+            mtime_ns INTEGER NOT NULL,
+            digest TEXT NOT NULL,
+            hashed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (path, algorithm)
+        )
+        """
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_file_hashes_digest "
+        "ON file_hashes(algorithm, digest)"
+    )
+    conn.commit()
+
+
+def _stat_key(stat):
+    return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+class FileHasher:
+    """Calcula hashes de arquivos reaproveitando os já calculados"""
+
+    def __init__(self, conn, max_workers=None):
+        """
+        Args:
+            conn: Conexão SQLite usada para o cache (só na thread que chama)
+            max_workers: Número de threads de cálculo (padrão do executor)
+        """
+        self.conn = conn
+        self.max_workers = max_workers
+        ensure_schema(conn)
+
+    def _cached(self, paths, algorithm):
+        """Hashes em cache: caminho -> ((inode, tamanho, mtime), hash)"""
+        cached = {}
+        for start in range(0, len(paths), _LOOKUP_BATCH):
+            batch = paths[start : start + _LOOKUP_BATCH]
+            rows = self.conn.execute(
+                f"""
+                SELECT path, inode, size, mtime_ns, digest FROM file_hashes
+                WHERE algorithm = ? AND path IN ({', '.join('?' * len(batch))})
+                """,
+                [algorithm, *batch],
+            )
+            for path, inode, size, mtime_ns, digest in rows:
+                cached[path] = ((inode, size, mtime_ns), digest)
+        return cached
+
+    def hash_files(self, paths, algorithm="sha256"):
+        """
+        Calcula os hashes de vários arquivos.
+
+        Só os arquivos novos ou alterados desde o último cálculo são lidos, em
+        paralelo; os resultados são gravados no cache.
+
+        Returns:
+            dict: Caminho -> hash (None para arquivos inexistentes/ilegíveis)
+        """
+        algorithm = resolve_algorithm(algorithm)
+        paths = [os.path.abspath(path) for path in paths]
+
+        stats = {}
+        for path in paths:
+            try:
+                stats[path] = _stat_key(os.stat(path))
+            except OSError:
+                pass
+
+        cached = self._cached(list(stats), algorithm)
+        results = {path: None for path in paths}
+        missing = []
+        for path, key in stats.items():
+            entry = cached.get(path)
+            if entry is not None and entry[0] == key:
+                results[path] = entry[1]
+            else:
+                missing.append(path)
+
+        if not missing:
+            return results
+
+        def compute(path):
+            try:
+                return hash_file(path, algorithm)
+            except OSError:
+                return None
+
+        if len(missing) == 1:
+            digests = [compute(missing[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                digests = list(executor.map(compute, missing))
+
+        rows = []
+        for path, digest in zip(missing, digests):
+            results[path] = digest
+            if digest is not None:
+                rows.append((path, algorithm, *stats[path], digest))
+
+        with self.conn:
+            self.conn.executemany(
+                """
+                INSERT OR REPLACE INTO file_hashes
+                    (path, algorithm, inode, size, mtime_ns, digest)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+        return results
+
+    def hash_file(self, path, algorithm="sha256"):
+        """Hash de um arquivo (do cache, se o arquivo não mudou)"""
+        return self.hash_files([path], algorithm)[os.path.abspath(path)]
+
+    def find_duplicates(self, paths, algorithm="sha256"):
+        """
+        Agrupa arquivos com o mesmo conteúdo.
+
+        Só arquivos com tamanhos iguais podem ser duplicados, então apenas
+        esses chegam a ter o hash calculado.
+
+        Returns:
+            list: Listas de caminhos com conteúdo idêntico
+        """
+        by_size = {}
+        for path in paths:
+            try:
+                by_size.setdefault(os.path.getsize(path), []).append(path)
+            except OSError:
+                pass
+
+        candidates = [p for group in by_size.values() if len(group) > 1 for p in group]
+        by_digest = {}
+        for path, digest in self.hash_files(candidates, algorithm).items():
+            if digest is not None:
+                by_digest.setdefault(digest, []).append(path)
+        return [group for group in by_digest.values() if len(group) > 1]
@@ -1,10 +1,13 @@
 import os
 import shutil
 import mimetypes
-import hashlib
 from datetime import datetime
 import streamlit as st
 
+from utils.database import Database
+from utils.file_catalog import FileCatalog
+from utils.file_hasher import FileHasher
+
 
 class FileManager:
     """
@@ -26,14 +29,31 @@ class FileManager:
         thumbs_path = os.path.join(base_path, "data", "thumbnails")
         os.makedirs(thumbs_path, exist_ok=True)
         return thumbs_path
+
+    @staticmethod
+    def get_thumbnail(file_path, size=(120, 120)):
+        """
+        Retorna o caminho da miniatura de uma imagem (em get_thumbnails_path)
+
+        Args:
+            file_path: Caminho do arquivo (relativo ou absoluto)
+            size: Tamanho máximo da miniatura (largura, altura)
+
+        Returns:
+            str: Caminho da miniatura, ou None se o arquivo não for uma imagem
+        """
+        from utils.thumbnails import get_thumbnail
+
+        return get_thumbnail(file_path, tuple(size))
     
     @staticmethod
-    def get_file_info(file_path):
+    def get_file_info(file_path, include_hash=False):
         """
         Obtém informações sobre um arquivo
         
         Args:
             file_path: Caminho do arquivo
+            include_hash: Inclui o hash MD5 (do cache, se o arquivo não mudou)
             
         Returns:
             dict: Informações do arquivo
@@ -58,10 +78,7 @@ class FileManager:
             mime_type, _ = mimetypes.guess_type(abs_file_path)
             file_type = mime_type.split('/')[0] if mime_type else "unknown"
             
-            # Calcular o hash MD5 do arquivo (opcional, pode ser lento para arquivos grandes)
-            # md5_hash = FileManager.calculate_file_hash(abs_file_path)
-            
-            return {
+            info = {
                 "name": file_name,
                 "path": file_path,  # Caminho relativo para armazenamento
                 "abs_path": abs_file_path,  # Caminho absoluto para operações
@@ -71,46 +88,86 @@ class FileManager:
                 "extension": file_ext,
                 "type": file_type,
                 "mime": mime_type,
-                # "md5": md5_hash
             }
+
+            # Hash MD5 (opcional; calculado uma vez e reaproveitado do cache)
+            if include_hash:
+                info["md5"] = FileManager.calculate_file_hash(abs_file_path)
+
+            return info
         except Exception as e:
             st.error(f"Erro ao obter informações do arquivo: {e}")
             return None
     
     @staticmethod
-    def calculate_file_hash(file_path, algorithm='md5', buffer_size=65536):
+    def calculate_file_hash(file_path, algorithm='md5'):
         """
         Calcula o hash de um arquivo
-        
+
+        O resultado fica em cache no banco (ver ``utils/file_hasher.py``) e só
+        é recalculado quando o arquivo muda.
+
         Args:
             file_path: Caminho do arquivo
-            algorithm: Algoritmo de hash (md5, sha1, sha256)
-            buffer_size: Tamanho do buffer para leitura
-            
+            algorithm: Algoritmo de hash (md5, sha1, sha256 ou fast, não
+                criptográfico, para detectar alterações)
+
         Returns:
             str: Hash do arquivo em formato hexadecimal
         """
+        hashes = FileManager.calculate_file_hashes([file_path], algorithm)
+        return next(iter(hashes.values()), None)
+
+    @staticmethod
+    def calculate_file_hashes(file_paths, algorithm='md5'):
+        """
+        Calcula os hashes de vários arquivos em paralelo, com cache
+
+        Args:
+            file_paths: Caminhos dos arquivos
+            algorithm: Algoritmo de hash (md5, sha1, sha256 ou fast)
+
+        Returns:
+            dict: Caminho absoluto -> hash (None se o arquivo não puder ser lido)
+        """
+        conn = Database.connect()
+        if not conn:
+            return {}
+
         try:
-            if algorithm == 'md5':
-                hash_obj = hashlib.md5()
-            elif algorithm == 'sha1':
-                hash_obj = hashlib.sha1()
-            elif algorithm == 'sha256':
-                hash_obj = hashlib.sha256()
-            else:
-                raise ValueError(f"Algoritmo de hash não suportado: {algorithm}")
-                
-            with open(file_path, 'rb') as f:
-                while True:
-                    data = f.read(buffer_size)
-                    if not data:
-                        break
-                    hash_obj.update(data)
-                    
-            return hash_obj.hexdigest()
+            return FileHasher(conn).hash_files(file_paths, algorithm)
         except Exception as e:
             st.error(f"Erro ao calcular hash do arquivo: {e}")
-            return None
+            return {}
+        finally:
+            conn.close()
+
+    @staticmethod
+    def find_duplicates(directory_path=None, algorithm='sha256'):
+        """
+        Encontra arquivos com conteúdo idêntico em um diretório
+
+        Args:
+            directory_path: Caminho do diretório (padrão: uploads)
+            algorithm: Algoritmo de hash usado na comparação
+
+        Returns:
+            list: Grupos (listas de caminhos absolutos) de arquivos duplicados
+        """
+        files = FileManager.list_files(directory_path)
+        conn = Database.connect()
+        if not conn:
+            return []
+
+        try:
+            return FileHasher(conn).find_duplicates(
+                [info["abs_path"] for info in files], algorithm
+            )
+        except Exception as e:
+            st.error(f"Erro ao procurar arquivos duplicados: {e}")
+            return []
+        finally:
+            conn.close()
             
     @staticmethod
     def delete_file(file_path):
@@ -140,41 +197,73 @@ class FileManager:
             return False
     
     @staticmethod
-    def list_files(directory_path=None, filter_ext=None):
+    def list_files(directory_path=None, filter_ext=None, file_type=None):
         """
-        Lista arquivos em um diretório
-        
+        Lista arquivos em um diretório e nos seus subdiretórios
+
+        A listagem vem do catálogo de arquivos no banco (ver
+        ``utils/file_catalog.py``), atualizado de forma incremental: só os
+        arquivos novos, alterados ou removidos desde a última varredura são
+        processados. A varredura é recursiva porque os uploads ficam em
+        ``objects/<aa>/<bb>/`` (ver ``utils/blob_store.py``).
+
         Args:
             directory_path: Caminho do diretório
             filter_ext: Lista de extensões para filtrar (ex: ['.jpg', '.png'])
-            
+            file_type: Tipo de arquivo para filtrar (ex: 'image', 'video')
+
         Returns:
             list: Lista de informações de arquivos
         """
         if directory_path is None:
             directory_path = FileManager.get_file_uploads_path()
-            
+
+        conn = Database.connect()
+        if not conn:
+            return []
+
         try:
-            files_list = []
-            for file_name in os.listdir(directory_path):
-                file_path = os.path.join(directory_path, file_name)
-                
-                # Pular diretórios
-                if os.path.isdir(file_path):
-                    continue
-                    
-                # Aplicar filtro por extensão, se especificado
-                if filter_ext and os.path.splitext(file_name)[1].lower() not in filter_ext:
-                    continue
-                
-                # Obter informações do arquivo
-                rel_path = os.path.join("data", "uploads", file_name)
-                file_info = FileManager.get_file_info(rel_path)
-                
-                if file_info:
-                    files_list.append(file_info)
-                    
+            catalog = FileCatalog(conn)
+            catalog.scan(directory_path, recursive=True)
+            files_list = [
+                FileManager._catalog_info(row)
+                for row in catalog.list(
+                    directory_path, filter_ext, file_type, recursive=True
+                )
+            ]
+
+            # Miniaturas das imagens geradas em segundo plano
+            from utils.thumbnails import prefetch_thumbnails
+
+            prefetch_thumbnails(
+                [info["abs_path"] for info in files_list if info["type"] == "image"]
+            )
+
             return files_list
         except Exception as e:
             st.error(f"Erro ao listar arquivos: {e}")
             return []
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _catalog_info(row):
+        """Converte uma linha do catálogo no formato de get_file_info"""
+        base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        abs_file_path = row["path"]
+        if os.path.commonpath([abs_file_path, base_path]) == base_path:
+            file_path = os.path.relpath(abs_file_path, base_path)
+        else:
+            file_path = abs_file_path
+
+        return {
+            "name": row["name"],
+            "path": file_path,  # Caminho relativo para armazenamento
+            "abs_path": abs_file_path,  # Caminho absoluto para operações
+            "size": row["size"],
+            "modified": datetime.fromtimestamp(row["mtime_ns"] / 1e9).isoformat(),
+            "created": datetime.fromtimestamp(row["ctime"]).isoformat(),
+            "extension": row["extension"],
+            "type": row["type"],
+            "mime": row["mime_type"],
+        }
@@ -1,12 +1,57 @@
-from datetime import datetime
+"""
+Notificações da versão web.
+
+As notificações ficam no banco (``utils/notifications.py`` da raiz do
+projeto, o mesmo usado pela interface desktop), e não mais em
+``st.session_state``: sobrevivem ao fim da sessão e são vistas por todos os
+usuários a que se destinam. O pacote ``utils`` da versão web encobre o
+``utils`` da raiz, então o módulo é carregado pelo caminho do arquivo.
+
+Sem ``user_id``, os métodos usam o usuário logado na sessão.
+"""
+
+import importlib.util
+import os
+import sys
 
 import streamlit as st
 
+from utils.database import Database
+
+_MODULE_NAME = "gonetwork_notifications"
+_MODULE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "utils",
+    "notifications.py",
+)
+
+
+def _load_module():
+    module = sys.modules.get(_MODULE_NAME)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(_MODULE_NAME, _MODULE_PATH)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[_MODULE_NAME] = module
+        spec.loader.exec_module(module)
+    return module
+
+
+_notifications = _load_module()
+
+
+def get_store():
+    """Retorna o repositório de notificações do banco da aplicação"""
+    return _notifications.get_notification_store(Database.get_db_path())
+
+
+def _user(user_id):
+    return st.session_state.get("user_id") if user_id is None else user_id
+
 
 class Notifications:
     """
     Gerencia notificações para os usuários na aplicação.
-    Armazena notificações no estado da sessão e permite exibí-las de forma consistente.
+    Guarda as notificações no banco e permite exibí-las de forma consistente.
     """
 
     @staticmethod
@@ -19,66 +64,25 @@ class Notifications:
             type: Tipo de notificação (info, success, warning, error)
             expiry_minutes: Tempo em minutos até a expiração
             user_id: ID do usuário destinatário (None = todos os usuários)
+
+        Returns:
+            int: ID da notificação
         """
-        if "notifications" not in st.session_state:
-            st.session_state.notifications = []
-
-        # Criar notificação com timestamp
-        notification = {
-            "id": len(st.session_state.notifications) + 1,
-            "message": message,
-            "type": type,
-            "timestamp": datetime.now(),
-            "expiry": datetime.now().timestamp() + (expiry_minutes * 60),
-            "read": False,
-            "user_id": user_id,
-        }
-
-        # Adicionar à lista de notificações
-        st.session_state.notifications.append(notification)
+        return get_store().add(message, type, expiry_minutes, user_id)
 
     @staticmethod
     def get_all(include_read=False, user_id=None):
         """
-        Retorna todas as notificações ativas
+        Retorna as notificações ativas do usuário
 
         Args:
             include_read: Se deve incluir notificações já lidas
-            user_id: ID do usuário para filtrar notificações (None = todas)
+            user_id: ID do usuário (None = usuário da sessão)
 
         Returns:
             list: Lista de notificações
         """
-        if "notifications" not in st.session_state:
-            st.session_state.notifications = []
-
-        # Filtrar notificações expiradas
-        now = datetime.now().timestamp()
-        active_notifications = [
-            n for n in st.session_state.notifications if n["expiry"] > now
-        ]
-
-        # Filtrar por status de leitura se necessário
-        if not include_read:
-            active_notifications = [n for n in active_notifications if not n["read"]]
-
-        # Filtrar por usuário se especificado
-        if user_id is not None:
-            active_notifications = [
-                n
-                for n in active_notifications
-                if n.get("user_id") is None or n.get("user_id") == user_id
-            ]
-
-        # Atualizar a lista de notificações ativas no estado da sessão
-        st.session_state.notifications = active_notifications
-
-        # Atualizar contador de notificações não lidas
-        st.session_state.notification_count = len(
-            [n for n in active_notifications if not n["read"]]
-        )
-
-        return active_notifications
+        return get_store().get_all(_user(user_id), include_read)
 
     @staticmethod
     def get_unread_notifications(user_id=None):
@@ -86,7 +90,7 @@ class Notifications:
         Retorna apenas as notificações não lidas de um usuário específico
 
         Args:
-            user_id: ID do usuário (None = todas as notificações do sistema)
+            user_id: ID do usuário (None = usuário da sessão)
 
         Returns:
             list: Lista de notificações não lidas
@@ -94,29 +98,35 @@ class Notifications:
         return Notifications.get_all(include_read=False, user_id=user_id)
 
     @staticmethod
-    def mark_as_read(notification_id):
+    def unread_count(user_id=None):
+        """
+        Número de notificações não lidas (contador mantido no banco, O(1))
+
+        Args:
+            user_id: ID do usuário (None = usuário da sessão)
+
+        Returns:
+            int: Número de notificações não lidas
+        """
+        count = get_store().unread_count(_user(user_id))
+        st.session_state.notification_count = count
+        return count
+
+    @staticmethod
+    def mark_as_read(notification_id, user_id=None):
         """
         Marca uma notificação como lida
 
         Args:
             notification_id: ID da notificação
+            user_id: ID do usuário (None = usuário da sessão)
         """
-        if "notifications" not in st.session_state:
-            return
-
-        for i, notification in enumerate(st.session_state.notifications):
-            if notification["id"] == notification_id:
-                st.session_state.notifications[i]["read"] = True
-                break
+        get_store().mark_as_read(notification_id, _user(user_id))
 
     @staticmethod
-    def mark_all_as_read():
-        """Marca todas as notificações como lidas"""
-        if "notifications" not in st.session_state:
-            return
-
-        for i, _ in enumerate(st.session_state.notifications):
-            st.session_state.notifications[i]["read"] = True
+    def mark_all_as_read(user_id=None):
+        """Marca todas as notificações do usuário como lidas"""
+        get_store().mark_all_as_read(_user(user_id))
 
     @staticmethod
     def display_notifications():
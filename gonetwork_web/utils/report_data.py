@@ -0,0 +1,391 @@
+"""
+Camada de dados dos relatórios.
+
+As consultas dos relatórios ficam aqui, junto com o carregamento tipado:
+
+- ``read_frame`` lê com ``pd.read_sql_query`` e já devolve status como
+  ``category``, datas como ``datetime64`` e números como ``float``;
+- contagens, médias e totais são calculados pelo SQLite (``GROUP BY`` e
+  funções de janela), em vez de laços sobre listas de dicionários;
+- a formatação para exibição (``status_labels``, ``date_labels``) é aplicada
+  às categorias ou à coluna inteira, não linha a linha.
+
+As funções recebem a conexão e não dependem do Streamlit; o cache fica na
+página de relatórios. A conexão pode ser ``sqlite3`` ou a do motor analítico
+(``utils.analytics``): as consultas usam apenas SQL aceito pelo SQLite e pelo
+DuckDB. ``benchmark_relatorios.py`` mede os relatórios com 10
+mil e 100 mil entregas.
+"""
+
+import sqlite3
+
+import pandas as pd
+
+from utils.formatters import formatar_status
+
+# Status considerados concluídos nos indicadores
+COMPLETED_STATUSES = ("completed", "concluído", "concluido")
+
+EVENTOS_QUERY = """
+        SELECT e.id, e.name, e.description, e.date, e.location, e.status,
+               e.created_at, e.updated_at, c.company as client_name
+        FROM events e
+        LEFT JOIN clients c ON e.client_id = c.id
+        WHERE e.date BETWEEN ? AND ?
+        ORDER BY e.date DESC
+        """
+
+ENTREGAS_QUERY = """
+        SELECT d.id, d.title, d.description, d.deadline, d.status, d.progress,
+               d.created_at, d.updated_at,
+               e.name as event_name, c.company as client_name
+        FROM deliverables d
+        LEFT JOIN events e ON d.event_id = e.id
+        LEFT JOIN clients c ON d.client_id = c.id
+        WHERE d.created_at BETWEEN ? AND ? OR d.updated_at BETWEEN ? AND ?
+        ORDER BY d.deadline, d.id
+        """
+
+EQUIPE_QUERY = """
+        SELECT tm.id, tm.name, tm.role, tm.email,
+               (SELECT COUNT(*) FROM event_team_members etm WHERE etm.member_id = tm.id) as total_events,
+               (SELECT COUNT(*) FROM deliverables d WHERE d.responsible_id = tm.id) as total_deliveries
+        FROM team_members tm
+        ORDER BY tm.name
+        """
+
+ENTREGAS_MEMBRO_QUERY = """
+                SELECT d.id, d.title, d.deadline, d.status, d.progress,
+                       e.name as event_name
+                FROM deliverables d
+                LEFT JOIN events e ON d.event_id = e.id
+                WHERE d.responsible_id = ? AND (d.created_at BETWEEN ? AND ? OR d.updated_at BETWEEN ? AND ?)
+                ORDER BY d.deadline, d.id
+                """
+
+EDICOES_QUERY = """
+        SELECT d.id, d.title, d.description, d.deadline, d.status, d.progress,
+               d.created_at, d.updated_at,
+               e.name as event_name, c.company as client_name,
+               tm.name as editor_name
+        FROM deliverables d
+        LEFT JOIN events e ON d.event_id = e.id
+        LEFT JOIN clients c ON d.client_id = c.id
+        LEFT JOIN team_members tm ON d.responsible_id = tm.id
+        WHERE (LOWER(d.title) LIKE '%vídeo%' OR LOWER(d.title) LIKE '%video%')
+        AND (d.created_at BETWEEN ? AND ? OR d.updated_at BETWEEN ? AND ?)
+        ORDER BY d.updated_at DESC, d.id
+        """
+
+CLIENTES_QUERY = """
+        SELECT c.id, c.company, c.contact_name, c.email, c.phone,
+               COUNT(DISTINCT e.id) as total_events,
+               COUNT(DISTINCT d.id) as total_deliverables
+        FROM clients c
+        LEFT JOIN events e ON c.id = e.client_id AND e.date BETWEEN ? AND ?
+        LEFT JOIN deliverables d ON (c.id = d.client_id OR e.id = d.event_id) AND
+                                    (d.created_at BETWEEN ? AND ? OR d.updated_at BETWEEN ? AND ?)
+        GROUP BY c.id, c.company, c.contact_name, c.email, c.phone
+        ORDER BY c.company
+        """
+
+# Índices usados pelos filtros de período (criados se as tabelas existirem)
+REPORT_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_events_date ON events(date)",
+    "CREATE INDEX IF NOT EXISTS idx_deliverables_created_at "
+    "ON deliverables(created_at)",
+    "CREATE INDEX IF NOT EXISTS idx_deliverables_updated_at "
+    "ON deliverables(updated_at)",
+    "CREATE INDEX IF NOT EXISTS idx_deliverables_responsible "
+    "ON deliverables(responsible_id)",
+)
+
+_COMPLETED_SQL = ", ".join(f"'{status}'" for status in COMPLETED_STATUSES)
+
+_ENTREGAS_FILTER = """
+        FROM deliverables d
+        WHERE d.created_at BETWEEN ? AND ? OR d.updated_at BETWEEN ? AND ?
+"""
+
+_EDICOES_FILTER = """
+        FROM deliverables d
+        LEFT JOIN clients c ON d.client_id = c.id
+        LEFT JOIN team_members tm ON d.responsible_id = tm.id
+        WHERE (LOWER(d.title) LIKE '%vídeo%' OR LOWER(d.title) LIKE '%video%')
+        AND (d.created_at BETWEEN ? AND ? OR d.updated_at BETWEEN ? AND ?)
+"""
+
+
+def ensure_report_indexes(conn):
+    """Cria os índices dos filtros de período nas tabelas existentes"""
+    for statement in REPORT_INDEXES:
+        try:
+            conn.execute(statement)
+        except sqlite3.OperationalError:
+            # Tabela ausente neste banco
+            pass
+    conn.commit()
+
+
+def read_frame(conn, query, params=(), dates=(), categories=("status",), numeric=()):
+    """
+    Executa uma consulta e devolve um DataFrame tipado.
+
+    Args:
+        conn: Conexão SQLite ou ``AnalyticsConnection``
+        query: Consulta SQL
+        params: Parâmetros da consulta
+        dates: Colunas convertidas para datetime (valores inválidos viram NaT)
+        categories: Colunas convertidas para ``category``
+        numeric: Colunas convertidas para número (inválidos viram NaN)
+
+    Returns:
+        DataFrame: Resultado da consulta
+    """
+    if hasattr(conn, "read_frame"):
+        # Motor analítico: o DuckDB já devolve o DataFrame
+        frame = conn.read_frame(query, params)
+        for column in dates:
+            if column in frame.columns:
+                frame[column] = pd.to_datetime(
+                    frame[column], errors="coerce", format="ISO8601"
+                )
+    else:
+        frame = pd.read_sql_query(
+            query,
+            conn,
+            params=tuple(params),
+            parse_dates={
+                column: {"errors": "coerce", "format": "ISO8601"} for column in dates
+            },
+        )
+    for column in categories:
+        if column in frame.columns:
+            frame[column] = frame[column].astype("category")
+    for column in numeric:
+        if column in frame.columns:
+            frame[column] = pd.to_numeric(frame[column], errors="coerce")
+    return frame
+
+
+def status_labels(series):
+    """Rótulos de exibição dos status (formatados uma vez por categoria)"""
+    series = series.astype("category")
+    labels = {status: formatar_status(status) for status in series.cat.categories}
+    return series.map(labels).astype(object)
+
+
+def date_labels(series, date_format="%Y-%m-%d"):
+    """Formata uma coluna de datas (texto ISO ou datetime) para exibição"""
+    parsed = pd.to_datetime(series, errors="coerce", format="ISO8601")
+    return parsed.dt.strftime(date_format).where(parsed.notna(), series)
+
+
+def events_report(conn, start, end):
+    """
+    Dados do resumo de eventos.
+
+    Returns:
+        dict: eventos (DataFrame), status (Status/Contagem), total, clientes e
+        concluidos
+    """
+    eventos = read_frame(
+        conn,
+        EVENTOS_QUERY,
+        (start, end),
+        dates=("date", "created_at", "updated_at"),
+    )
+    status = read_frame(
+        conn,
+        """
+        SELECT COALESCE(status, 'Desconhecido') AS status, COUNT(*) AS contagem
+        FROM events
+        WHERE date BETWEEN ? AND ?
+        GROUP BY 1
+        ORDER BY contagem DESC, 1
+        """,
+        (start, end),
+    )
+    totals = conn.execute(
+        f"""
+        SELECT COUNT(*),
+               COUNT(DISTINCT COALESCE(c.company, '')),
+               COALESCE(SUM(e.status IN ({_COMPLETED_SQL})), 0)
+        FROM events e
+        LEFT JOIN clients c ON e.client_id = c.id
+        WHERE e.date BETWEEN ? AND ?
+        """,
+        (start, end),
+    ).fetchone()
+    return {
+        "eventos": eventos,
+        "status": status.rename(columns={"status": "Status", "contagem": "Contagem"}),
+        "total": totals[0],
+        "clientes": totals[1],
+        "concluidos": totals[2],
+    }
+
+
+def deliverables_report(conn, start, end):
+    """
+    Dados das entregas por status.
+
+    Returns:
+        dict: entregas (DataFrame), status (Status/Contagem/Percentual), total,
+        progresso_medio e concluidas
+    """
+    params = (start, end, start, end)
+    entregas = read_frame(
+        conn,
+        ENTREGAS_QUERY,
+        params,
+        dates=("deadline", "created_at", "updated_at"),
+        numeric=("progress",),
+    )
+    status = read_frame(
+        conn,
+        f"""
+        SELECT COALESCE(d.status, 'Desconhecido') AS status,
+               COUNT(*) AS contagem,
+               ROUND(100.0 * COUNT(*) / SUM(COUNT(*)) OVER (), 1) AS percentual
+        {_ENTREGAS_FILTER}
+        GROUP BY 1
+        ORDER BY contagem DESC, 1
+        """,
+        params,
+    )
+    totals = conn.execute(
+        f"""
+        SELECT COUNT(*),
+               COALESCE(AVG(COALESCE(CAST(d.progress AS REAL), 0)), 0),
+               COALESCE(SUM(d.status IN ({_COMPLETED_SQL})), 0)
+        {_ENTREGAS_FILTER}
+        """,
+        params,
+    ).fetchone()
+    return {
+        "entregas": entregas,
+        "status": status.rename(
+            columns={
+                "status": "Status",
+                "contagem": "Contagem",
+                "percentual": "Percentual",
+            }
+        ),
+        "total": totals[0],
+        "progresso_medio": totals[1],
+        "concluidas": totals[2],
+    }
+
+
+def team_report(conn):
+    """Membros da equipe com o total de eventos e de entregas de cada um"""
+    return read_frame(
+        conn,
+        EQUIPE_QUERY,
+        categories=("role",),
+        numeric=("total_events", "total_deliveries"),
+    )
+
+
+def member_report(conn, member_id, start, end):
+    """
+    Entregas de um membro no período.
+
+    Returns:
+        dict: entregas (DataFrame), status (Status/Contagem), total e
+        concluidas
+    """
+    entregas = read_frame(
+        conn,
+        ENTREGAS_MEMBRO_QUERY,
+        (member_id, start, end, start, end),
+        dates=("deadline",),
+        numeric=("progress",),
+    )
+    status = (
+        entregas["status"]
+        .value_counts(sort=True, dropna=False)
+        .rename_axis("Status")
+        .reset_index(name="Contagem")
+    )
+    completed = entregas["status"].isin(COMPLETED_STATUSES)
+    return {
+        "entregas": entregas,
+        "status": status[status["Contagem"] > 0],
+        "total": len(entregas),
+        "concluidas": int(completed.sum()),
+    }
+
+
+def edits_report(conn, start, end):
+    """
+    Dados do histórico de edições de vídeo.
+
+    Returns:
+        dict: edicoes (DataFrame), editores (Editor/Edições), total,
+        total_editores e total_clientes
+    """
+    params = (start, end, start, end)
+    edicoes = read_frame(
+        conn,
+        EDICOES_QUERY,
+        params,
+        dates=("deadline", "created_at", "updated_at"),
+        numeric=("progress",),
+    )
+    editores = read_frame(
+        conn,
+        f"""
+        SELECT COALESCE(tm.name, 'Não atribuído') AS Editor,
+               COUNT(*) AS "Edições"
+        {_EDICOES_FILTER}
+        GROUP BY 1
+        ORDER BY 2 DESC, 1
+        """,
+        params,
+        categories=("Editor",),
+    )
+    totals = conn.execute(
+        f"""
+        SELECT COUNT(*), COUNT(DISTINCT tm.name), COUNT(DISTINCT c.company)
+        {_EDICOES_FILTER}
+        """,
+        params,
+    ).fetchone()
+    return {
+        "edicoes": edicoes,
+        "editores": editores,
+        "total": totals[0],
+        "total_editores": totals[1],
+        "total_clientes": totals[2],
+    }
+
+
+def clients_report(conn, start, end, top=10):
+    """
+    Dados de clientes e projetos.
+
+    Returns:
+        dict: clientes (DataFrame), ranking (Cliente/Projetos dos ``top``
+        clientes com mais projetos), total e ativos
+    """
+    clientes = read_frame(
+        conn,
+        CLIENTES_QUERY,
+        (start, end, start, end, start, end),
+        categories=(),
+        numeric=("total_events", "total_deliverables"),
+    )
+    active = clientes["total_events"] > 0
+    ranking = (
+        clientes.loc[active, ["company", "total_events"]]
+        .nlargest(top, "total_events")
+        .rename(columns={"company": "Cliente", "total_events": "Projetos"})
+    )
+    return {
+        "clientes": clientes,
+        "ranking": ranking,
+        "total": len(clientes),
+        "ativos": int(active.sum()),
+    }
@@ -0,0 +1,525 @@
+"""
+Fila de relatórios em segundo plano, com cache dos resultados em disco.
+
+Os relatórios são calculados em um pool de processos, fora da execução do
+script do Streamlit. Cada pedido vira uma tarefa na tabela ``report_jobs`` de
+um banco SQLite próprio (``data/report_jobs/jobs.db``), identificada pelo hash
+do nome do relatório, dos parâmetros e da versão dos dados (tamanho e data de
+modificação do banco e do seu WAL; no modo ``snapshot`` do motor analítico, o
+período de ``snapshot_interval`` segundos da cópia Parquet lida):
+
+- pedidos iguais, de qualquer sessão, caem na mesma tarefa e são calculados
+  uma vez só;
+- o resultado (dados e figuras em JSON) é gravado com ``pickle`` em
+  ``results/<hash>.pkl`` e reaproveitado enquanto os dados não mudarem;
+- tarefas que estavam na fila ou em andamento quando o servidor parou voltam
+  para o pool na inicialização seguinte.
+
+As páginas chamam ``submit`` a cada execução do script e, enquanto a tarefa
+não termina, reexecutam a página a cada ``POLL_INTERVAL`` segundos. Se os
+dados mudaram desde o último cálculo, ``submit`` informa também o resultado
+concluído mais recente do mesmo pedido (``previous_key``), exibido enquanto a
+versão nova é calculada. A fila supõe um único servidor por diretório de
+tarefas.
+"""
+
+import hashlib
+import json
+import multiprocessing
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import plotly.express as px
+
+from utils.analytics import ANALYTICS_ERRORS, SNAPSHOT_INTERVAL, get_engine
+from utils.report_data import (
+    clients_report,
+    deliverables_report,
+    edits_report,
+    ensure_report_indexes,
+    events_report,
+    member_report,
+    team_report,
+)
+
+JOBS_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "report_jobs"
+)
+# Processos calculando relatórios ao mesmo tempo
+MAX_WORKERS = 2
+# Intervalo (s) entre as consultas da página a uma tarefa pendente
+POLL_INTERVAL = 1.0
+# Validade (s) dos resultados e das tarefas guardadas
+RESULT_TTL = 24 * 60 * 60
+# Tempo (s) até uma tarefa que falhou poder ser refeita
+RETRY_AFTER = 60
+
+# Situações de uma tarefa
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS report_jobs (
+        key TEXT PRIMARY KEY,
+        report TEXT NOT NULL,
+        params TEXT NOT NULL,
+        data_version TEXT NOT NULL,
+        status TEXT NOT NULL,
+        owner TEXT,
+        error TEXT,
+        created_at REAL NOT NULL,
+        started_at REAL,
+        finished_at REAL
+    )
+"""
+
+_REQUEST_INDEX = """
+    CREATE INDEX IF NOT EXISTS idx_report_jobs_request
+        ON report_jobs (report, params, status, finished_at)
+"""
+
+# Prefixo da versão dos dados no modo snapshot
+SNAPSHOT_VERSION = "snapshot:"
+
+
+def _figuras_eventos(dados):
+    return {
+        "status": px.pie(
+            dados["status"],
+            values="Contagem",
+            names="Status",
+            title="Eventos por Status",
+        )
+    }
+
+
+def _figuras_entregas(dados):
+    return {
+        "status": px.bar(
+            dados["status"],
+            x="Status",
+            y="Contagem",
+            hover_data=["Percentual"],
+            title="Entregas por Status",
+        )
+    }
+
+
+def _figuras_equipe(membros):
+    equipe = membros.rename(
+        columns={
+            "name": "Nome",
+            "total_events": "Eventos",
+            "total_deliveries": "Entregas",
+        }
+    )
+    return {
+        "participacao": px.bar(
+            equipe,
+            x="Nome",
+            y=["Eventos", "Entregas"],
+            title="Participação da Equipe",
+            barmode="group",
+        )
+    }
+
+
+def _figuras_entregas_membro(dados):
+    # O título com o nome do membro é definido na página
+    return {
+        "status": px.pie(dados["status"], values="Contagem", names="Status"),
+    }
+
+
+def _figuras_edicoes(dados):
+    return {
+        "editores": px.bar(
+            dados["editores"], x="Editor", y="Edições", title="Edições por Editor"
+        )
+    }
+
+
+def _figuras_clientes(dados):
+    if dados["ranking"].empty:
+        return {}
+    return {
+        "ranking": px.bar(
+            dados["ranking"],
+            x="Cliente",
+            y="Projetos",
+            title="Top Clientes por Projetos",
+        )
+    }
+
+
+# Relatório -> (função da camada de dados, função das figuras)
+REPORTS = {
+    "eventos": (events_report, _figuras_eventos),
+    "entregas": (deliverables_report, _figuras_entregas),
+    "equipe": (team_report, _figuras_equipe),
+    "entregas_membro": (member_report, _figuras_entregas_membro),
+    "edicoes": (edits_report, _figuras_edicoes),
+    "clientes": (clients_report, _figuras_clientes),
+}
+
+
+def data_version(db_path, analytics=None):
+    """
+    Versão dos dados: tamanho e modificação do banco e do seu WAL.
+
+    No modo ``snapshot`` os relatórios leem a cópia Parquet, que pode estar
+    até ``snapshot_interval`` segundos atrás do banco; a versão é então o
+    início do período atual, e ``run_report`` refaz a cópia se ela for
+    anterior a ele.
+    """
+    analytics = analytics or {}
+    interval = analytics.get("snapshot_interval", SNAPSHOT_INTERVAL)
+    if analytics.get("mode") == "snapshot" and interval > 0:
+        return f"{SNAPSHOT_VERSION}{int(time.time() // interval * interval)}"
+
+    parts = []
+    for path in (db_path, f"{db_path}-wal"):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            parts.append("-")
+        else:
+            parts.append(f"{stat.st_size}:{stat.st_mtime_ns}")
+    return "/".join(parts)
+
+
+def job_key(report, params, version):
+    """Hash que identifica uma tarefa pelo relatório, parâmetros e dados"""
+    payload = json.dumps([report, list(params), version], default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def run_report(report, params, db_path, analytics=None, version=None):
+    """
+    Calcula os dados de um relatório.
+
+    Usa o motor analítico configurado (``analytics``: mode e
+    snapshot_interval) e cai para o SQLite se ele não estiver disponível ou a
+    consulta falhar no DuckDB. ``version`` é a versão dos dados da tarefa
+    (``data_version``): no modo snapshot, a cópia é refeita se for anterior.
+    """
+    data_function = REPORTS[report][0]
+    analytics = analytics or {}
+    engine = get_engine(
+        db_path,
+        analytics.get("mode", "attach"),
+        analytics.get("snapshot_interval", SNAPSHOT_INTERVAL),
+    )
+    if engine is not None:
+        conn = engine.connect()
+        try:
+            if engine.mode == "snapshot" and str(version).startswith(SNAPSHOT_VERSION):
+                engine.refresh_snapshot(
+                    not_before=float(version[len(SNAPSHOT_VERSION) :])
+                )
+            return data_function(conn, *params)
+        except ANALYTICS_ERRORS as e:
+            # Ex.: coluna com tipos misturados que o DuckDB não converte
+            print(f"Relatório '{report}' falhou no DuckDB, usando SQLite: {e}")
+        finally:
+            conn.close()
+
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    try:
+        ensure_report_indexes(conn)
+        return data_function(conn, *params)
+    finally:
+        conn.close()
+
+
+def _connect_jobs(jobs_db):
+    conn = sqlite3.connect(jobs_db, timeout=30)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def _update_job(jobs_db, key, **fields):
+    assignments = ", ".join(f"{name} = ?" for name in fields)
+    conn = _connect_jobs(jobs_db)
+    try:
+        conn.execute(
+            f"UPDATE report_jobs SET {assignments} WHERE key = ?",
+            (*fields.values(), key),
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def _run_job(jobs_db, key, report, params, version, db_path, analytics, result_path):
+    """Calcula uma tarefa no processo filho e grava o resultado em disco"""
+    _update_job(jobs_db, key, status=RUNNING, started_at=time.time())
+    try:
+        dados = run_report(report, params, db_path, analytics, version)
+        figuras = {
+            name: figure.to_json() for name, figure in REPORTS[report][1](dados).items()
+        }
+        temporary = f"{result_path}.part"
+        with open(temporary, "wb") as file:
+            pickle.dump(
+                {"dados": dados, "figuras": figuras},
+                file,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(temporary, result_path)
+    except Exception as e:
+        _update_job(jobs_db, key, status=FAILED, error=str(e), finished_at=time.time())
+    else:
+        _update_job(jobs_db, key, status=DONE, error=None, finished_at=time.time())
+
+
+class ReportQueue:
+    """Fila de relatórios calculados em um pool de processos"""
+
+    def __init__(self, db_path, analytics=None, directory=JOBS_DIR, max_workers=None):
+        """
+        Args:
+            db_path: Caminho do banco de dados dos relatórios
+            analytics: Configuração do motor analítico (mode, snapshot_interval)
+            directory: Diretório do banco de tarefas e dos resultados
+            max_workers: Processos do pool (padrão: ``MAX_WORKERS``)
+        """
+        self.db_path = os.path.abspath(db_path)
+        self.analytics = dict(analytics or {})
+        self.directory = directory
+        self.jobs_db = os.path.join(directory, "jobs.db")
+        self.results_dir = os.path.join(directory, "results")
+        self.max_workers = max_workers or MAX_WORKERS
+        # Identifica as tarefas enviadas ao pool por esta instância
+        self.owner = uuid.uuid4().hex
+        self._lock = threading.RLock()
+        self._executor = None
+        self._futures = {}
+
+        os.makedirs(self.results_dir, exist_ok=True)
+        conn = _connect_jobs(self.jobs_db)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_SCHEMA)
+            conn.execute(_REQUEST_INDEX)
+            conn.commit()
+        finally:
+            conn.close()
+        self.resume()
+
+    def result_path(self, key):
+        """Arquivo do resultado de uma tarefa"""
+        return os.path.join(self.results_dir, f"{key}.pkl")
+
+    def submit(self, report, params=()):
+        """
+        Pede um relatório, reaproveitando a tarefa de um pedido igual.
+
+        Returns:
+            dict: Linha da tarefa (key, status, error, ...) e ``previous_key``:
+            se a tarefa ainda não terminou, a chave do resultado concluído mais
+            recente do mesmo relatório e parâmetros (ou None)
+        """
+        if report not in REPORTS:
+            raise ValueError(f"Relatório desconhecido: {report}")
+
+        params = list(params)
+        params_json = json.dumps(params, default=str)
+        version = data_version(self.db_path, self.analytics)
+        key = job_key(report, params, version)
+        previous_key = None
+        with self._lock:
+            conn = _connect_jobs(self.jobs_db)
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                job = conn.execute(
+                    "SELECT * FROM report_jobs WHERE key = ?", (key,)
+                ).fetchone()
+                enqueue = job is None or self._needs_run(job)
+                if enqueue:
+                    conn.execute(
+                        """
+                        INSERT OR REPLACE INTO report_jobs
+                            (key, report, params, data_version, status, owner,
+                             created_at)
+                        VALUES (?, ?, ?, ?, ?, ?, ?)
+                        """,
+                        (
+                            key,
+                            report,
+                            params_json,
+                            version,
+                            QUEUED,
+                            self.owner,
+                            time.time(),
+                        ),
+                    )
+                    job = conn.execute(
+                        "SELECT * FROM report_jobs WHERE key = ?", (key,)
+                    ).fetchone()
+                conn.commit()
+                if job["status"] != DONE:
+                    previous_key = self._latest_result(conn, report, params_json)
+            finally:
+                conn.close()
+
+            if enqueue:
+                self._dispatch(key, report, params, version)
+                self.prune()
+        return {**dict(job), "previous_key": previous_key}
+
+    def _latest_result(self, conn, report, params_json):
+        """Chave do resultado concluído mais recente de um pedido, se houver"""
+        rows = conn.execute(
+            """
+            SELECT key FROM report_jobs
+            WHERE report = ? AND params = ? AND status = ?
+            ORDER BY finished_at DESC
+            LIMIT 5
+            """,
+            (report, params_json, DONE),
+        )
+        for (key,) in rows:
+            if os.path.exists(self.result_path(key)):
+                return key
+        return None
+
+    def _needs_run(self, job):
+        status = job["status"]
+        if status == DONE:
+            return not os.path.exists(self.result_path(job["key"]))
+        if status == FAILED:
+            return time.time() - (job["finished_at"] or 0) > RETRY_AFTER
+        # Na fila ou em andamento em um pool que não existe mais
+        return job["owner"] != self.owner
+
+    def load_result(self, key):
+        """Resultado de uma tarefa concluída: {"dados": ..., "figuras": ...}"""
+        with open(self.result_path(key), "rb") as file:
+            return pickle.load(file)
+
+    def resume(self):
+        """Envia ao pool as tarefas pendentes de uma execução anterior"""
+        conn = _connect_jobs(self.jobs_db)
+        try:
+            jobs = conn.execute(
+                "SELECT key, report, params, data_version FROM report_jobs "
+                "WHERE status IN (?, ?) AND owner IS NOT ?",
+                (QUEUED, RUNNING, self.owner),
+            ).fetchall()
+            conn.executemany(
+                "UPDATE report_jobs SET status = ?, owner = ? WHERE key = ?",
+                [(QUEUED, self.owner, job["key"]) for job in jobs],
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+        with self._lock:
+            for job in jobs:
+                self._dispatch(
+                    job["key"],
+                    job["report"],
+                    json.loads(job["params"]),
+                    job["data_version"],
+                )
+
+    def prune(self, max_age=RESULT_TTL):
+        """Remove resultados e tarefas mais antigos que ``max_age`` segundos"""
+        limit = time.time() - max_age
+        try:
+            entries = list(os.scandir(self.results_dir))
+        except OSError:
+            entries = []
+        for entry in entries:
+            try:
+                if entry.is_file() and entry.stat().st_mtime < limit:
+                    os.remove(entry.path)
+            except OSError:
+                pass
+
+        conn = _connect_jobs(self.jobs_db)
+        try:
+            conn.execute(
+                "DELETE FROM report_jobs WHERE status IN (?, ?) AND created_at < ?",
+                (DONE, FAILED, limit),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _dispatch(self, key, report, params, version):
+        if key in self._futures:
+            return
+        args = (
+            self.jobs_db,
+            key,
+            report,
+            params,
+            version,
+            self.db_path,
+            self.analytics,
+            self.result_path(key),
+        )
+        try:
+            future = self._get_executor().submit(_run_job, *args)
+        except BrokenProcessPool:
+            # Um processo do pool morreu: recria o pool
+            self._executor = None
+            future = self._get_executor().submit(_run_job, *args)
+        self._futures[key] = future
+        future.add_done_callback(lambda done, key=key: self._finished(key, done))
+
+    def _finished(self, key, future):
+        with self._lock:
+            self._futures.pop(key, None)
+        error = future.exception()
+        if error is None:
+            return
+
+        # Falha do próprio pool (processo encerrado, erro de pickle...)
+        if isinstance(error, BrokenProcessPool):
+            with self._lock:
+                self._executor = None
+        _update_job(
+            self.jobs_db, key, status=FAILED, error=str(error), finished_at=time.time()
+        )
+
+    def _get_executor(self):
+        if self._executor is None:
+            # "spawn": o servidor do Streamlit tem várias threads
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    def shutdown(self):
+        """Encerra o pool (as tarefas em andamento são concluídas)"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+_queues = {}
+_queues_lock = threading.Lock()
+
+
+def get_queue(db_path, analytics=None, directory=JOBS_DIR):
+    """Retorna a fila de relatórios (única por diretório de tarefas)"""
+    directory = os.path.abspath(directory)
+    with _queues_lock:
+        queue = _queues.get(directory)
+        if queue is None:
+            queue = _queues[directory] = ReportQueue(db_path, analytics, directory)
+        return queue
@@ -1,13 +1,24 @@
 import base64
 import io
+import sqlite3
 from datetime import datetime
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 import streamlit as st
 
+from utils.database import Database
+from utils.exports import FORMATS, available_formats, cached_export, export_query
+from utils.figure_cache import memoize_figure
+
+# Acima deste número de tarefas a timeline agrupa tarefas consecutivas
+MAX_TIMELINE_BARS = 500
+# Altura máxima (px) do gráfico de timeline
+MAX_TIMELINE_HEIGHT = 3000
+
 
 def generate_csv_download_link(df, filename="dados_gonetwork.csv"):
     """
@@ -42,17 +53,93 @@ def generate_excel_download_link(df, filename="dados_gonetwork.xlsx"):
     buffer = io.BytesIO()
     with pd.ExcelWriter(buffer, engine="xlsxwriter") as writer:
         df.to_excel(writer, index=False, sheet_name="Dados")
-        writer.save()
 
     b64 = base64.b64encode(buffer.getvalue()).decode()
     href = f'<a href="data:application/vnd.openxmlformats-officedocument.spreadsheetml.sheet;base64,{b64}" download="{filename}">Download Excel</a>'
     return href
 
 
+def export_download_buttons(
+    name, query, params=(), transform=None, filename="dados_gonetwork", formats=None
+):
+    """
+    Exibe botões de download do resultado de uma consulta.
+
+    O arquivo só é gerado quando o usuário pede ("Preparar ..."), lendo a
+    consulta em blocos (``utils.exports``). Enquanto a exportação com os mesmos
+    parâmetros estiver no cache, o botão de download aparece direto.
+
+    Args:
+        name: Nome do relatório (identifica a exportação no cache)
+        query: Consulta SQL
+        params: Parâmetros da consulta
+        transform: Função aplicada a cada bloco (DataFrame -> DataFrame)
+        filename: Nome do arquivo baixado, sem extensão
+        formats: Formatos oferecidos (padrão: todos os disponíveis)
+    """
+    formats = formats or available_formats()
+    for column, fmt in zip(st.columns(len(formats)), formats):
+        extension, mime, label = FORMATS[fmt]
+        key = f"export_{name}_{fmt}_{filename}"
+        with column:
+            path = cached_export(name, query, params, fmt)
+            if path is None:
+                if not st.button(
+                    f"Preparar {label}", key=f"{key}_prepare", use_container_width=True
+                ):
+                    continue
+                try:
+                    with st.spinner(f"Gerando arquivo {label}..."):
+                        path = export_query(
+                            Database.connect, name, query, params, fmt, transform
+                        )
+                except (
+                    sqlite3.Error,
+                    ImportError,
+                    OSError,
+                    RuntimeError,
+                    ValueError,
+                ) as e:
+                    st.error(f"Erro ao exportar {label}: {e}")
+                    continue
+
+            try:
+                file = _open_export(path, name, query, params, fmt, transform)
+            except (sqlite3.Error, ImportError, OSError, RuntimeError, ValueError) as e:
+                st.error(f"Erro ao exportar {label}: {e}")
+                continue
+
+            with file:
+                st.download_button(
+                    f"Download {label}",
+                    file,
+                    file_name=f"{filename}{extension}",
+                    mime=mime,
+                    key=f"{key}_download",
+                    use_container_width=True,
+                )
+
+
+def _open_export(path, name, query, params, fmt, transform):
+    """
+    Abre o arquivo exportado; se ``prune_exports`` o removeu depois da
+    consulta ao cache, gera a exportação de novo.
+    """
+    try:
+        return open(path, "rb")
+    except FileNotFoundError:
+        path = export_query(Database.connect, name, query, params, fmt, transform)
+        return open(path, "rb")
+
+
+@memoize_figure
 def generate_status_chart(data, title="Status dos Projetos"):
     """
     Gera um gráfico de barras ou pizza para dados de status
 
+    A figura é reaproveitada (``utils.figure_cache``) enquanto os dados e o
+    título forem os mesmos.
+
     Args:
         data: Dicionário com contagens {status: quantidade}
         title: Título do gráfico
@@ -81,18 +168,70 @@ def generate_status_chart(data, title="Status dos Projetos"):
     return fig
 
 
+def _aggregate_timeline(df, start_col, end_col, task_col, person_col, max_bars):
+    """
+    Agrupa tarefas consecutivas (por início) em barras únicas.
+
+    Cada responsável tem suas tarefas divididas em blocos do mesmo tamanho; o
+    bloco vira uma barra do primeiro início ao último término, com o nome da
+    primeira tarefa e o número de tarefas agrupadas.
+    """
+    df = df.sort_values(start_col, kind="stable")
+    bucket_size = -(-len(df) // max_bars)
+    if person_col:
+        position = (
+            df.groupby(person_col, sort=False, dropna=False).cumcount().to_numpy()
+        )
+        keys = [person_col, "_bloco"]
+    else:
+        position = np.arange(len(df))
+        keys = ["_bloco"]
+
+    grouped = df.assign(_bloco=position // bucket_size).groupby(
+        keys, sort=False, dropna=False
+    )
+    aggregated = grouped.agg(
+        **{
+            start_col: (start_col, "min"),
+            end_col: (end_col, "max"),
+            task_col: (task_col, "first"),
+            "_tarefas": (task_col, "size"),
+        }
+    ).reset_index()
+
+    extra = aggregated["_tarefas"] - 1
+    aggregated[task_col] = aggregated[task_col].astype(str) + np.where(
+        extra > 0, " (+" + extra.astype(str) + " tarefas)", ""
+    )
+    return aggregated.sort_values(start_col, kind="stable")
+
+
+@memoize_figure
 def generate_timeline_graph(
-    df, start_col="start", end_col="end", task_col="task", person_col=None
+    df,
+    start_col="start",
+    end_col="end",
+    task_col="task",
+    person_col=None,
+    max_bars=MAX_TIMELINE_BARS,
 ):
     """
     Gera um gráfico de timeline para tarefas
 
+    As barras são desenhadas com um trace por cor (responsável), com as
+    durações calculadas de uma vez para a coluna inteira. Acima de
+    ``max_bars`` tarefas, as tarefas consecutivas de cada responsável são
+    agrupadas no servidor, para que o gráfico não cresça com os dados. A
+    figura é reaproveitada (``utils.figure_cache``) enquanto os dados e as
+    opções forem os mesmos.
+
     Args:
         df: DataFrame com dados de timeline
         start_col: Nome da coluna com data/hora de início
         end_col: Nome da coluna com data/hora de término
         task_col: Nome da coluna com descrição da tarefa
         person_col: Nome da coluna com responsável (opcional)
+        max_bars: Número máximo de barras antes do agrupamento
 
     Returns:
         fig: Figura do Plotly
@@ -111,58 +250,72 @@ def generate_timeline_graph(
         )
         return fig
 
+    if person_col not in df.columns:
+        person_col = None
+    columns = [start_col, end_col, task_col] + ([person_col] if person_col else [])
+    df = df[columns].copy()
+
     # Converter para datetime se necessário
     for col in [start_col, end_col]:
-        if df[col].dtype != "datetime64[ns]":
+        if not pd.api.types.is_datetime64_any_dtype(df[col]):
             try:
                 df[col] = pd.to_datetime(df[col])
-            except:
+            except (ValueError, TypeError):
                 st.warning(
                     f"Não foi possível converter a coluna {col} para formato de data/hora"
                 )
                 return None
 
-    # Criar cores por pessoa se a coluna de pessoa existir
-    if person_col and person_col in df.columns:
-        colors = px.colors.qualitative.Plotly
-        persons = df[person_col].unique()
-        color_map = {p: colors[i % len(colors)] for i, p in enumerate(persons)}
-    else:
-        color_map = None
+    if len(df) > max_bars:
+        df = _aggregate_timeline(df, start_col, end_col, task_col, person_col, max_bars)
+    df = df.reset_index(drop=True)
+
+    # Duração em milissegundos (eixo de datas do Plotly), posição de cada barra
+    # e texto de hover, para todas as tarefas de uma vez
+    duration = (df[end_col] - df[start_col]).dt.total_seconds().to_numpy() * 1000
+    positions = np.arange(len(df))
+    hover_text = df[task_col].astype(str)
+    if person_col:
+        hover_text = hover_text + "<br>Responsável: " + df[person_col].astype(str)
 
     fig = go.Figure()
 
-    for i, row in df.iterrows():
-        if person_col and color_map:
-            color = color_map.get(row[person_col], "gray")
-            hover_text = f"{row[task_col]}<br>Responsável: {row[person_col]}"
-        else:
-            color = "blue"
-            hover_text = row[task_col]
+    # Um trace por cor: por responsável, se houver a coluna
+    if person_col:
+        colors = px.colors.qualitative.Plotly
+        groups = df.groupby(person_col, sort=False, dropna=False).indices.items()
+        color_of = {
+            person: colors[i % len(colors)] for i, (person, _) in enumerate(groups)
+        }
+    else:
+        groups = [("Atividades", positions)]
+        color_of = {"Atividades": "blue"}
 
+    for person, rows in groups:
         fig.add_trace(
             go.Bar(
-                x=[row[end_col] - row[start_col]],
-                y=[i],
+                x=duration[rows],
+                y=positions[rows],
                 orientation="h",
-                marker_color=color,
-                base=row[start_col],
-                hovertext=hover_text,
+                marker_color=color_of[person],
+                base=df[start_col].to_numpy()[rows],
+                hovertext=hover_text.to_numpy()[rows],
                 hoverinfo="text",
-                name=row[task_col],
+                name=str(person),
+                showlegend=person_col is not None,
             )
         )
 
     fig.update_layout(
         title="Cronograma de Atividades",
-        xaxis=dict(title="Data/Hora", tickformat="%d/%m/%Y %H:%M"),
+        xaxis=dict(type="date", title="Data/Hora", tickformat="%d/%m/%Y %H:%M"),
         yaxis=dict(
             title="Atividade",
             ticktext=df[task_col],
-            tickvals=list(range(len(df))),
+            tickvals=positions,
             autorange="reversed",
         ),
-        height=400 + (20 * len(df)),
+        height=min(400 + (20 * len(df)), MAX_TIMELINE_HEIGHT),
         plot_bgcolor="rgba(0,0,0,0.05)",
         barmode="overlay",
     )
@@ -0,0 +1,72 @@
+"""
+Acesso ao cache de miniaturas na versão web.
+
+O pacote ``utils`` da versão web encobre o ``utils`` da raiz do projeto, então
+o módulo ``utils/thumbnails.py`` da raiz é carregado diretamente pelo caminho
+do arquivo. A interface desktop e a web geram as miniaturas do mesmo jeito.
+
+O serviço fica em ``sys.modules`` e sobrevive às reexecuções dos scripts do
+Streamlit: o índice em disco e os hashes já calculados não são refeitos a cada
+interação. Na web a geração em segundo plano usa threads, já que o módulo
+carregado pelo caminho não pode ser importado por processos filhos.
+"""
+
+import importlib.util
+import os
+import sys
+
+_MODULE_NAME = "gonetwork_thumbnails"
+_MODULE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "utils",
+    "thumbnails.py",
+)
+_WEB_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _load_module():
+    module = sys.modules.get(_MODULE_NAME)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(_MODULE_NAME, _MODULE_PATH)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[_MODULE_NAME] = module
+        spec.loader.exec_module(module)
+    return module
+
+
+_thumbnails = _load_module()
+
+DEFAULT_SIZE = _thumbnails.DEFAULT_SIZE
+is_image = _thumbnails.is_image
+
+
+def get_service():
+    """Retorna o serviço de miniaturas da versão web (data/thumbnails)"""
+    return _thumbnails.get_thumbnail_service(
+        os.path.join(_WEB_DIR, "data", "thumbnails"), use_processes=False
+    )
+
+
+def resolve_path(file_path):
+    """Resolve caminhos relativos ao diretório da versão web"""
+    if os.path.isabs(file_path) or os.path.exists(file_path):
+        return file_path
+    return os.path.join(_WEB_DIR, file_path)
+
+
+def get_thumbnail(file_path, size=DEFAULT_SIZE):
+    """
+    Retorna o caminho da miniatura de uma imagem, gerando-a se necessário.
+
+    Returns:
+        str: Caminho da miniatura, ou None se não houver miniatura
+    """
+    path = resolve_path(file_path)
+    if not is_image(path) or not os.path.exists(path):
+        return None
+    return get_service().get(path, size)
+
+
+def prefetch_thumbnails(file_paths, size=DEFAULT_SIZE):
+    """Agenda em segundo plano as miniaturas de vários arquivos"""
+    return get_service().prefetch([resolve_path(path) for path in file_paths], size)
@@ -3,7 +3,7 @@ import os
 import sys
 
 from PySide6.QtCore import QPoint, QSize, Qt, Signal, Slot
-from PySide6.QtGui import QIcon, QPixmap
+from PySide6.QtGui import QPixmap
 from PySide6.QtWidgets import (
     QApplication,
     QHBoxLayout,
@@ -16,7 +16,8 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-import gui.themes.dracula as style
+from gui.themes.theme_compiler import set_style_property
+from gui.utils.icon_provider import get_icon
 from gui.widgets.assets_widget import AssetsWidget
 from gui.widgets.briefing_widget import BriefingWidget
 from gui.widgets.dashboard_widget import DashboardWidget
@@ -43,7 +44,7 @@ class MainWindow(QMainWindow):
 
     def setup_ui(self):
         self.setWindowTitle("GoNetwork AI")
-        self.setWindowIcon(QIcon("./resources/icons/logo.svg"))
+        self.setWindowIcon(get_icon("logo"))
         self.resize(1200, 800)
         self.setWindowFlags(Qt.FramelessWindowHint)
         self.setAttribute(Qt.WA_TranslucentBackground)
@@ -57,15 +58,6 @@ class MainWindow(QMainWindow):
 
         self.container = QWidget()
         self.container.setObjectName("container")
-        self.container.setStyleSheet(
-            f"""
-            #container {{
-                background-color: {style.background_color};
-                border-radius: 10px;
-                border: 1px solid {style.comment_color};
-            }}
-        """
-        )
 
         self.container_layout = QVBoxLayout(self.container)
         self.container_layout.setContentsMargins(0, 0, 0, 0)
@@ -83,16 +75,6 @@ class MainWindow(QMainWindow):
 
         self.sidebar = QWidget()
         self.sidebar.setObjectName("sidebar")
-        self.sidebar.setStyleSheet(
-            f"""
-            #sidebar {{
-                background-color: {style.background_color};
-                border-right: 1px solid {style.current_line_color};
-                border-top-left-radius: 10px;
-                border-bottom-left-radius: 10px;
-            }}
-        """
-        )
         self.sidebar.setFixedWidth(200)
 
         self.sidebar_layout = QVBoxLayout(self.sidebar)
@@ -100,24 +82,16 @@ class MainWindow(QMainWindow):
         self.sidebar_layout.setSpacing(5)
 
         self.logo_label = QLabel("GoNetwork AI")
+        self.logo_label.setObjectName("logoLabel")
         self.logo_label.setAlignment(Qt.AlignCenter)
-        self.logo_label.setStyleSheet(
-            f"""
-            color: {style.purple_color};
-            font-size: 20px;
-            font-weight: bold;
-            margin-bottom: 20px;
-            padding: 10px;
-        """
-        )
 
         self.menu_buttons = []
 
         def add_button(text, icon, index):
             btn = QPushButton(f"  {text}")
-            btn.setIcon(QIcon(icon))
+            btn.setIcon(get_icon(icon))
             btn.setIconSize(QSize(20, 20))
-            btn.setStyleSheet(style.menu_button_style)
+            btn.setProperty("menu", True)
             btn.setFixedHeight(40)
             btn.clicked.connect(lambda: self.show_page(index))
             self.menu_buttons.append(btn)
@@ -137,9 +111,9 @@ class MainWindow(QMainWindow):
         self.sidebar_layout.addStretch()
 
         logout_btn = QPushButton("  Sair")
-        logout_btn.setIcon(QIcon("./resources/icons/logout.svg"))
+        logout_btn.setIcon(get_icon("logout"))
         logout_btn.setIconSize(QSize(20, 20))
-        logout_btn.setStyleSheet(style.menu_button_style)
+        logout_btn.setProperty("menu", True)
         logout_btn.setFixedHeight(40)
         logout_btn.clicked.connect(self.logout)
         self.sidebar_layout.addWidget(logout_btn)
@@ -150,20 +124,13 @@ class MainWindow(QMainWindow):
         self.content_layout.setSpacing(0)
 
         self.top_bar = QWidget()
+        self.top_bar.setObjectName("topBar")
         self.top_bar.setFixedHeight(50)
-        self.top_bar.setStyleSheet(
-            f"""
-            background-color: {style.background_color};
-            border-bottom: 1px solid {style.current_line_color};
-            border-top-right-radius: 10px;
-        """
-        )
 
         self.top_bar_layout = QHBoxLayout(self.top_bar)
         self.top_bar_layout.setContentsMargins(10, 0, 10, 0)
 
         self.user_label = QLabel(f"Olá, {self.current_user['full_name']}")
-        self.user_label.setStyleSheet(f"color: {style.foreground_color};")
 
         self.window_controls = QWidget()
         self.controls_layout = QHBoxLayout(self.window_controls)
@@ -171,21 +138,21 @@ class MainWindow(QMainWindow):
         self.controls_layout.setSpacing(8)
 
         self.minimize_btn = QPushButton()
-        self.minimize_btn.setIcon(QIcon("./resources/icons/minimize.svg"))
+        self.minimize_btn.setIcon(get_icon("minimize"))
         self.minimize_btn.setFixedSize(24, 24)
-        self.minimize_btn.setStyleSheet(style.window_button_style)
+        self.minimize_btn.setProperty("variant", "window")
         self.minimize_btn.clicked.connect(self.showMinimized)
 
         self.maximize_btn = QPushButton()
-        self.maximize_btn.setIcon(QIcon("./resources/icons/maximize.svg"))
+        self.maximize_btn.setIcon(get_icon("maximize"))
         self.maximize_btn.setFixedSize(24, 24)
-        self.maximize_btn.setStyleSheet(style.window_button_style)
+        self.maximize_btn.setProperty("variant", "window")
         self.maximize_btn.clicked.connect(self.toggle_maximize)
 
         self.close_btn = QPushButton()
-        self.close_btn.setIcon(QIcon("./resources/icons/close.svg"))
+        self.close_btn.setIcon(get_icon("close"))
         self.close_btn.setFixedSize(24, 24)
-        self.close_btn.setStyleSheet(style.close_button_style)
+        self.close_btn.setProperty("variant", "close")
         self.close_btn.clicked.connect(self.close)
 
         self.controls_layout.addWidget(self.minimize_btn)
@@ -252,6 +219,23 @@ class MainWindow(QMainWindow):
             self.editing_page.load_initial_data(EventRepository(), TeamRepository())
             self.editing_page.setup_video_sync()
 
+        if hasattr(self, "timeline_page"):
+            self.timeline_page.load_initial_data(EventRepository())
+
+        self.start_notification_scheduler()
+
+    def start_notification_scheduler(self):
+        """Inicia a entrega das notificações da timeline, se ativada"""
+        if not self.config.get("notifications", {}).get("enabled", True):
+            return
+
+        from database.Database import Database
+        from utils.notifications import get_notification_store
+        from utils.timeline_scheduler import deliver_to_store, start_scheduler
+
+        db_path = str(Database().db_path)
+        start_scheduler(db_path, deliver_to_store(get_notification_store(db_path)))
+
     def logout(self):
         if hasattr(self, "app_widget"):
             self.container_layout.removeWidget(self.app_widget)
@@ -263,20 +247,18 @@ class MainWindow(QMainWindow):
         self.setup_login_widget()
 
     def show_page(self, index):
+        # Apenas os botões cujo estado mudou são repolidos
         for i, btn in enumerate(self.menu_buttons):
-            if i == index:
-                btn.setStyleSheet(style.menu_button_active_style)
-            else:
-                btn.setStyleSheet(style.menu_button_style)
+            set_style_property(btn, "active", i == index)
         self.pages.setCurrentIndex(index)
 
     def toggle_maximize(self):
         if self.isMaximized():
             self.showNormal()
-            self.maximize_btn.setIcon(QIcon("./resources/icons/maximize.svg"))
+            self.maximize_btn.setIcon(get_icon("maximize"))
         else:
             self.showMaximized()
-            self.maximize_btn.setIcon(QIcon("./resources/icons/restore.svg"))
+            self.maximize_btn.setIcon(get_icon("restore"))
 
     def mousePressEvent(self, event):
         if event.position().y() < 50:
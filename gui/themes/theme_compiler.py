@@ -0,0 +1,577 @@
+"""
+Compilador de temas para a interface gráfica do GoNetwork AI.
+
+Gera uma única folha de estilos para toda a aplicação a partir de tokens de
+tema (cores e tamanhos de fonte). Os widgets deixam de receber folhas de estilo
+individuais e passam a ser estilizados por nome de objeto (``#sidebar``) e por
+propriedades dinâmicas (``variant``, ``role``, ``accent``, ``active``).
+
+O resultado compilado fica em cache por esquema de cores e fator de escala de
+fonte, de modo que uma troca de tema se resume a um único ``setStyleSheet`` na
+aplicação, ou seja, um único repolish.
+"""
+
+from typing import Any, Dict, Optional, Tuple
+
+from PySide6.QtWidgets import QApplication, QWidget
+
+import gui.themes.dracula as dracula
+from utils.logger import get_logger
+
+logger = get_logger("theme_compiler")
+
+# Tokens de cores por esquema. As chaves correspondem aos valores de
+# utils.accessibility.ColorScheme para evitar dependência circular.
+THEME_TOKENS: Dict[str, Dict[str, str]] = {
+    "normal": {
+        "background": dracula.background_color,
+        "surface": dracula.current_line_color,
+        "surface_alt": dracula.BG_THREE,
+        "border": dracula.comment_color,
+        "foreground": dracula.foreground_color,
+        "muted": dracula.comment_color,
+        "primary": dracula.purple_color,
+        "primary_light": dracula.PRIMARY_LIGHT,
+        "primary_pressed": "#A77BDB",
+        "secondary": dracula.comment_color,
+        "secondary_hover": "#7D8AC1",
+        "secondary_pressed": "#4D5A8E",
+        "on_primary": dracula.background_color,
+        "purple": dracula.purple_color,
+        "green": dracula.green_color,
+        "orange": dracula.orange_color,
+        "red": dracula.red_color,
+        "cyan": dracula.cyan_color,
+        "yellow": dracula.yellow_color,
+        "pink": dracula.pink_color,
+        "danger_pressed": "#AA3333",
+    },
+    "dark": {
+        "background": "#2d2d2d",
+        "surface": "#3d3d3d",
+        "surface_alt": "#3a3a3a",
+        "border": "#555555",
+        "foreground": "#e0e0e0",
+        "muted": "#9e9e9e",
+        "primary": "#8c7ae6",
+        "primary_light": "#a99cf0",
+        "primary_pressed": "#6f5fd1",
+        "secondary": "#4d4d4d",
+        "secondary_hover": "#5d5d5d",
+        "secondary_pressed": "#3d3d3d",
+        "on_primary": "#ffffff",
+        "purple": "#a99cf0",
+        "green": "#66bb6a",
+        "orange": "#ffa726",
+        "red": "#ef5350",
+        "cyan": "#4dd0e1",
+        "yellow": "#fff176",
+        "pink": "#f06292",
+        "danger_pressed": "#c62828",
+    },
+    "light": {
+        "background": "#f8f8f2",
+        "surface": "#e6e6ef",
+        "surface_alt": "#ededf3",
+        "border": "#b6b9cc",
+        "foreground": "#282a36",
+        "muted": "#6272a4",
+        "primary": "#7c4dff",
+        "primary_light": "#9e7bff",
+        "primary_pressed": "#5e35b1",
+        "secondary": "#d0d2e0",
+        "secondary_hover": "#c0c3d6",
+        "secondary_pressed": "#a9adc6",
+        "on_primary": "#ffffff",
+        "purple": "#7c4dff",
+        "green": "#2e7d32",
+        "orange": "#ef6c00",
+        "red": "#c62828",
+        "cyan": "#00838f",
+        "yellow": "#9e9d24",
+        "pink": "#ad1457",
+        "danger_pressed": "#8e0000",
+    },
+    "high_contrast": {
+        "background": "#000000",
+        "surface": "#000000",
+        "surface_alt": "#222222",
+        "border": "#ffffff",
+        "foreground": "#ffffff",
+        "muted": "#ffffff",
+        "primary": "#ffff00",
+        "primary_light": "#ffff66",
+        "primary_pressed": "#cccc00",
+        "secondary": "#333333",
+        "secondary_hover": "#555555",
+        "secondary_pressed": "#777777",
+        "on_primary": "#000000",
+        "purple": "#ffff00",
+        "green": "#00ff00",
+        "orange": "#ffa500",
+        "red": "#ff4040",
+        "cyan": "#00ffff",
+        "yellow": "#ffff00",
+        "pink": "#ff80ff",
+        "danger_pressed": "#ff0000",
+    },
+}
+
+# Tamanhos base de fonte (em px) por papel de texto
+FONT_SIZES: Dict[str, int] = {
+    "base": 13,
+    "title": 24,
+    "section": 16,
+    "label": 14,
+    "caption": 12,
+    "small": 11,
+    "logo": 20,
+    "stat": 36,
+}
+
+# Cores de destaque que podem ser usadas via propriedade dinâmica "accent"
+ACCENTS = ("purple", "green", "orange", "red", "cyan", "yellow", "pink")
+
+# Variantes de botão que seguem o mesmo padrão de cor sólida
+_SOLID_BUTTONS = {
+    "success": ("green", "on_primary"),
+    "danger": ("red", "foreground"),
+    "warning": ("orange", "on_primary"),
+}
+
+_TEMPLATE = """
+QWidget {{
+    color: {foreground};
+    font-size: {font_base}px;
+}}
+
+/* Estrutura da janela principal */
+#container {{
+    background-color: {background};
+    border-radius: 10px;
+    border: 1px solid {border};
+}}
+#sidebar {{
+    background-color: {background};
+    border-right: 1px solid {surface};
+    border-top-left-radius: 10px;
+    border-bottom-left-radius: 10px;
+}}
+#topBar {{
+    background-color: {background};
+    border-bottom: 1px solid {surface};
+    border-top-right-radius: 10px;
+}}
+#logoLabel {{
+    color: {primary};
+    font-size: {font_logo}px;
+    font-weight: bold;
+    margin-bottom: 20px;
+    padding: 10px;
+}}
+
+/* Menu lateral */
+QPushButton[menu="true"] {{
+    color: {foreground};
+    background-color: transparent;
+    text-align: left;
+    border-radius: 5px;
+    padding: 5px;
+}}
+QPushButton[menu="true"]:hover {{
+    background-color: {surface};
+}}
+QPushButton[menu="true"][active="true"] {{
+    color: {on_primary};
+    background-color: {primary};
+    font-weight: bold;
+}}
+
+/* Textos */
+QLabel[role="title"] {{
+    color: {foreground};
+    font-size: {font_title}px;
+    font-weight: bold;
+}}
+QLabel[role="section"] {{
+    color: {foreground};
+    font-size: {font_section}px;
+    font-weight: bold;
+}}
+QLabel[role="muted"] {{
+    color: {muted};
+    font-size: {font_label}px;
+}}
+QLabel[role="caption"] {{
+    color: {foreground};
+    font-size: {font_caption}px;
+}}
+QLabel[role="small"] {{
+    color: {muted};
+    font-size: {font_small}px;
+}}
+QLabel[role="stat"] {{
+    font-size: {font_stat}px;
+    font-weight: bold;
+}}
+
+/* Cartões e painéis */
+QFrame[role="panel"] {{
+    background-color: {background};
+    border-radius: 8px;
+    border: 1px solid {surface};
+}}
+QFrame[role="card"] {{
+    background-color: {background};
+    border-radius: 8px;
+    padding: 10px;
+}}
+QFrame[role="card"]:hover {{
+    background-color: {surface};
+}}
+
+/* Botões */
+QPushButton[variant="primary"] {{
+    background-color: {primary};
+    color: {on_primary};
+    border-radius: 5px;
+    padding: 8px 15px;
+    font-weight: bold;
+}}
+QPushButton[variant="primary"]:hover {{
+    background-color: {primary_light};
+}}
+QPushButton[variant="primary"]:pressed {{
+    background-color: {primary_pressed};
+}}
+QPushButton[variant="primary"]:disabled {{
+    background-color: {surface};
+    color: {muted};
+}}
+QPushButton[variant="secondary"] {{
+    background-color: {secondary};
+    color: {foreground};
+    border-radius: 5px;
+    padding: 8px 15px;
+}}
+QPushButton[variant="secondary"]:hover {{
+    background-color: {secondary_hover};
+}}
+QPushButton[variant="secondary"]:pressed {{
+    background-color: {secondary_pressed};
+}}
+QPushButton[variant="flat"] {{
+    background-color: transparent;
+    border: none;
+}}
+QPushButton[variant="flat"]:hover {{
+    background-color: {surface};
+    border-radius: 12px;
+}}
+QPushButton[variant="link"] {{
+    background-color: transparent;
+    border: none;
+    text-decoration: underline;
+    font-size: {font_caption}px;
+}}
+QPushButton[variant="link"]:hover {{
+    color: {foreground};
+}}
+QPushButton[variant="window"], QPushButton[variant="close"] {{
+    background-color: {background};
+    border-radius: 5px;
+    border: none;
+}}
+QPushButton[variant="window"]:hover {{
+    background-color: {surface};
+}}
+QPushButton[variant="window"]:pressed {{
+    background-color: {border};
+}}
+QPushButton[variant="close"]:hover {{
+    background-color: {red};
+}}
+QPushButton[variant="close"]:pressed {{
+    background-color: {danger_pressed};
+}}
+{solid_buttons}
+/* Destaques de cor */
+{accents}
+/* Entradas */
+QLineEdit, QTextEdit, QPlainTextEdit, QSpinBox, QDoubleSpinBox, QTimeEdit,
+QDateEdit, QDateTimeEdit, QComboBox {{
+    background-color: {surface};
+    color: {foreground};
+    border-radius: 5px;
+    border: 1px solid {border};
+    padding: 5px;
+}}
+QLineEdit:focus, QTextEdit:focus, QPlainTextEdit:focus, QSpinBox:focus,
+QDoubleSpinBox:focus, QTimeEdit:focus, QDateEdit:focus, QDateTimeEdit:focus,
+QComboBox:focus {{
+    border: 2px solid {primary};
+}}
+QComboBox::drop-down {{
+    border: none;
+    background-color: transparent;
+}}
+QComboBox QAbstractItemView {{
+    background-color: {background};
+    color: {foreground};
+    border: 1px solid {border};
+    selection-background-color: {primary};
+    selection-color: {on_primary};
+}}
+
+/* Tabelas e listas */
+QTableView, QListView, QTreeView {{
+    background-color: {background};
+    color: {foreground};
+    border-radius: 5px;
+    border: 1px solid {border};
+    alternate-background-color: {surface_alt};
+}}
+QTableView::item:selected, QListView::item:selected, QTreeView::item:selected {{
+    background-color: {primary};
+    color: {on_primary};
+}}
+QHeaderView::section {{
+    background-color: {surface};
+    color: {foreground};
+    padding: 5px;
+    border: none;
+}}
+
+/* Barras de progresso */
+QProgressBar {{
+    background-color: {surface};
+    color: {foreground};
+    border-radius: 5px;
+    text-align: center;
+}}
+QProgressBar::chunk {{
+    background-color: {primary};
+    border-radius: 5px;
+}}
+
+/* Menus */
+QMenu {{
+    background-color: {background};
+    color: {foreground};
+    border: 1px solid {border};
+    border-radius: 5px;
+}}
+QMenu::item {{
+    padding: 5px 20px;
+}}
+QMenu::item:selected {{
+    background-color: {surface};
+}}
+
+/* Rolagem */
+QScrollArea {{
+    border: none;
+    background-color: transparent;
+}}
+QScrollBar:vertical {{
+    border: none;
+    background-color: {background};
+    width: 12px;
+}}
+QScrollBar::handle:vertical {{
+    background-color: {border};
+    min-height: 25px;
+    border-radius: 6px;
+}}
+QScrollBar:horizontal {{
+    border: none;
+    background-color: {background};
+    height: 12px;
+}}
+QScrollBar::handle:horizontal {{
+    background-color: {border};
+    min-width: 25px;
+    border-radius: 6px;
+}}
+QScrollBar::handle:hover {{
+    background-color: {primary};
+}}
+
+/* Modo para leitores de tela */
+*[screenReaderMode="true"]:focus {{
+    outline: 2px solid {primary};
+}}
+"""
+
+
+class ThemeCompiler:
+    """
+    Compila e aplica a folha de estilos global da aplicação.
+
+    As folhas compiladas ficam em cache por ``(esquema, escala de fonte)``.
+    Aplicar um tema já compilado não gera nenhum trabalho de formatação, e
+    reaplicar o mesmo tema é ignorado.
+    """
+
+    # Instância singleton
+    _instance = None
+
+    def __new__(cls):
+        """Implementa o padrão Singleton."""
+        if cls._instance is None:
+            cls._instance = super(ThemeCompiler, cls).__new__(cls)
+            cls._instance._cache = {}
+            cls._instance._current_key = None
+        return cls._instance
+
+    def compile(self, scheme: str = "normal", font_scale: float = 1.0) -> str:
+        """
+        Gera a folha de estilos para um esquema e escala de fonte.
+
+        Args:
+            scheme: Nome do esquema de cores (chave de THEME_TOKENS)
+            font_scale: Fator de escala aplicado a todos os tamanhos de fonte
+
+        Returns:
+            str: Folha de estilos compilada
+        """
+        key = self._make_key(scheme, font_scale)
+        stylesheet = self._cache.get(key)
+        if stylesheet is not None:
+            return stylesheet
+
+        tokens = THEME_TOKENS.get(key[0], THEME_TOKENS["normal"])
+        stylesheet = _TEMPLATE.format(**self._build_context(tokens, key[1]))
+        self._cache[key] = stylesheet
+        logger.debug(f"Tema compilado: {key[0]} (escala {key[1]})")
+        return stylesheet
+
+    def apply(
+        self,
+        scheme: str = "normal",
+        font_scale: float = 1.0,
+        app: Optional[QApplication] = None,
+    ) -> bool:
+        """
+        Aplica a folha de estilos compilada na aplicação.
+
+        Args:
+            scheme: Nome do esquema de cores
+            font_scale: Fator de escala das fontes
+            app: Aplicação alvo. Se None, usa QApplication.instance()
+
+        Returns:
+            bool: True se a folha de estilos foi trocada, False caso contrário
+        """
+        app = app or QApplication.instance()
+        if app is None:
+            return False
+
+        key = self._make_key(scheme, font_scale)
+        if key == self._current_key:
+            return False
+
+        app.setStyleSheet(self.compile(*key))
+        self._current_key = key
+        logger.info(f"Tema aplicado: {key[0]} (escala {key[1]})")
+        return True
+
+    def repolish(self, app: Optional[QApplication] = None) -> None:
+        """
+        Força um único repolish global com a folha de estilos atual.
+
+        Útil após alterar propriedades dinâmicas em muitos widgets de uma vez.
+        """
+        app = app or QApplication.instance()
+        if app is None:
+            return
+        app.setStyleSheet(app.styleSheet())
+
+    def current_tokens(self) -> Dict[str, str]:
+        """Retorna os tokens de cores do esquema aplicado atualmente."""
+        scheme = self._current_key[0] if self._current_key else "normal"
+        return THEME_TOKENS.get(scheme, THEME_TOKENS["normal"])
+
+    def clear_cache(self) -> None:
+        """Descarta todas as folhas de estilo compiladas."""
+        self._cache.clear()
+        self._current_key = None
+
+    @staticmethod
+    def _make_key(scheme: str, font_scale: float) -> Tuple[str, float]:
+        """Normaliza a chave de cache para evitar duplicatas por arredondamento."""
+        if scheme not in THEME_TOKENS:
+            scheme = "normal"
+        return scheme, round(float(font_scale), 2)
+
+    @staticmethod
+    def _build_context(tokens: Dict[str, str], font_scale: float) -> Dict[str, Any]:
+        """Monta o dicionário de substituição do template."""
+        context: Dict[str, Any] = dict(tokens)
+
+        for name, size in FONT_SIZES.items():
+            context[f"font_{name}"] = max(1, round(size * font_scale))
+
+        context["solid_buttons"] = "".join(
+            f"""
+QPushButton[variant="{variant}"] {{
+    background-color: {tokens[color]};
+    color: {tokens[text]};
+    border-radius: 5px;
+    padding: 8px 15px;
+    font-weight: bold;
+}}
+QPushButton[variant="{variant}"]:hover {{
+    background-color: {tokens['secondary_hover']};
+}}
+"""
+            for variant, (color, text) in _SOLID_BUTTONS.items()
+        )
+
+        context["accents"] = "".join(
+            f'QLabel[accent="{accent}"], QPushButton[accent="{accent}"] '
+            f"{{ color: {tokens[accent]}; }}\n"
+            for accent in ACCENTS
+        )
+
+        return context
+
+
+def get_theme_compiler() -> ThemeCompiler:
+    """Retorna a instância do compilador de temas."""
+    return ThemeCompiler()
+
+
+def apply_theme(scheme: str = "normal", font_scale: float = 1.0) -> bool:
+    """
+    Compila (se necessário) e aplica o tema na aplicação.
+
+    Args:
+        scheme: Nome do esquema de cores
+        font_scale: Fator de escala das fontes
+
+    Returns:
+        bool: True se a folha de estilos foi trocada
+    """
+    return get_theme_compiler().apply(scheme, font_scale)
+
+
+def set_style_property(widget: QWidget, name: str, value: Any) -> None:
+    """
+    Altera uma propriedade dinâmica usada pela folha de estilos global.
+
+    Apenas o widget alterado é repolido, em vez de recompilar uma folha de
+    estilos própria para ele.
+
+    Args:
+        widget: Widget a ser atualizado
+        name: Nome da propriedade (ex.: "active", "variant")
+        value: Novo valor da propriedade
+    """
+    if widget.property(name) == value:
+        return
+
+    widget.setProperty(name, value)
+    widget.style().unpolish(widget)
+    widget.style().polish(widget)
+    widget.update()
@@ -0,0 +1,142 @@
+"""
+Índice temporal dos comentários de uma edição de vídeo.
+
+Mantém os comentários ordenados por ``video_timestamp`` (em ms) para que a
+sincronização com o player encontre os comentários próximos da posição atual
+com busca binária, sem percorrer a lista inteira a cada atualização. Inserções,
+remoções e resoluções são aplicadas de forma incremental.
+
+Este módulo não depende do Qt.
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional
+
+if TYPE_CHECKING:
+    from database.models.comment_model import Comment
+
+
+class CommentTimeIndex:
+    """Comentários ordenados por posição no vídeo, com consultas por intervalo."""
+
+    def __init__(self, comments: Iterable["Comment"] = ()):
+        self._times: List[int] = []
+        self._comments: List["Comment"] = []
+        self._by_id: Dict[Any, "Comment"] = {}
+        self.pending_count = 0
+        self.reset(comments)
+
+    def __len__(self) -> int:
+        return len(self._comments)
+
+    def __iter__(self) -> Iterator["Comment"]:
+        return iter(self._comments)
+
+    def __contains__(self, comment_id: Any) -> bool:
+        return comment_id in self._by_id
+
+    def reset(self, comments: Iterable["Comment"]) -> None:
+        """Substitui todo o conteúdo do índice."""
+        ordered = sorted(
+            comments, key=lambda c: (int(c.video_timestamp or 0), str(c.id))
+        )
+        self._comments = ordered
+        self._times = [int(c.video_timestamp or 0) for c in ordered]
+        self._by_id = {c.id: c for c in ordered}
+        self.pending_count = sum(1 for c in ordered if not c.is_resolved)
+
+    def get(self, comment_id: Any) -> Optional["Comment"]:
+        """Retorna um comentário pelo ID."""
+        return self._by_id.get(comment_id)
+
+    def comment_at(self, position: int) -> "Comment":
+        """Retorna o comentário na posição informada da ordem temporal."""
+        return self._comments[position]
+
+    def index_of(self, comment_id: Any) -> int:
+        """Retorna a posição do comentário na ordem temporal (ou -1)."""
+        comment = self._by_id.get(comment_id)
+        if comment is None:
+            return -1
+
+        position = bisect_left(self._times, int(comment.video_timestamp or 0))
+        while position < len(self._comments):
+            if self._comments[position] is comment:
+                return position
+            position += 1
+        return -1
+
+    def add(self, comment: "Comment") -> int:
+        """
+        Insere um comentário mantendo a ordem.
+
+        Returns:
+            int: Posição em que o comentário foi inserido
+        """
+        if comment.id in self._by_id:
+            self.remove(comment.id)
+
+        time = int(comment.video_timestamp or 0)
+        position = bisect_right(self._times, time)
+        self._times.insert(position, time)
+        self._comments.insert(position, comment)
+        self._by_id[comment.id] = comment
+        if not comment.is_resolved:
+            self.pending_count += 1
+        return position
+
+    def remove(self, comment_id: Any) -> Optional["Comment"]:
+        """Remove um comentário do índice e o retorna."""
+        position = self.index_of(comment_id)
+        if position < 0:
+            return None
+
+        del self._times[position]
+        comment = self._comments.pop(position)
+        del self._by_id[comment_id]
+        if not comment.is_resolved:
+            self.pending_count -= 1
+        return comment
+
+    def set_resolved(
+        self, comment_id: Any, resolved: bool = True
+    ) -> Optional["Comment"]:
+        """Atualiza o estado de resolução de um comentário."""
+        comment = self._by_id.get(comment_id)
+        if comment is None or bool(comment.is_resolved) == resolved:
+            return comment
+
+        comment.is_resolved = resolved
+        self.pending_count += -1 if resolved else 1
+        return comment
+
+    def range(
+        self, start_ms: int, end_ms: int, include_resolved: bool = True
+    ) -> List["Comment"]:
+        """Retorna os comentários com video_timestamp em [start_ms, end_ms]."""
+        lo = bisect_left(self._times, start_ms)
+        hi = bisect_right(self._times, end_ms)
+        comments = self._comments[lo:hi]
+        if not include_resolved:
+            comments = [c for c in comments if not c.is_resolved]
+        return comments
+
+    def around(
+        self, position_ms: int, window_ms: int, include_resolved: bool = True
+    ) -> List["Comment"]:
+        """Retorna os comentários a até ``window_ms`` da posição informada."""
+        return self.range(
+            position_ms - window_ms, position_ms + window_ms, include_resolved
+        )
+
+    def nearest(self, position_ms: int) -> Optional["Comment"]:
+        """Retorna o comentário mais próximo da posição informada."""
+        if not self._comments:
+            return None
+
+        position = bisect_left(self._times, position_ms)
+        candidates = [
+            i for i in (position - 1, position) if 0 <= i < len(self._comments)
+        ]
+        best = min(candidates, key=lambda i: abs(self._times[i] - position_ms))
+        return self._comments[best]
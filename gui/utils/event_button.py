@@ -6,6 +6,8 @@ from PySide6.QtCore import QObject, QUrl, Signal, Slot
 from PySide6.QtGui import QDesktopServices
 from PySide6.QtWidgets import QFileDialog, QInputDialog, QMessageBox
 
+from gui.utils.icon_provider import get_icon
+
 
 class EventButton(QObject):
     """Classe para centralizar o tratamento de eventos de botão"""
@@ -81,7 +83,6 @@ class EventButton(QObject):
 
         # Adicionar as ações para a nova linha
         from PySide6.QtCore import QSize
-        from PySide6.QtGui import QIcon
         from PySide6.QtWidgets import QHBoxLayout, QPushButton, QWidget
 
         import gui.themes.dracula as style
@@ -92,7 +93,7 @@ class EventButton(QObject):
         actions_layout.setSpacing(5)
 
         view_btn = QPushButton()
-        view_btn.setIcon(QIcon("./resources/icons/view.svg"))
+        view_btn.setIcon(get_icon("view"))
         view_btn.setToolTip("Ver Detalhes")
         view_btn.setIconSize(QSize(16, 16))
         view_btn.setFixedSize(28, 28)
@@ -100,7 +101,7 @@ class EventButton(QObject):
         view_btn.clicked.connect(lambda: self.view_event_details(event_name))
 
         edit_btn = QPushButton()
-        edit_btn.setIcon(QIcon("./resources/icons/edit.svg"))
+        edit_btn.setIcon(get_icon("edit"))
         edit_btn.setToolTip("Editar")
         edit_btn.setIconSize(QSize(16, 16))
         edit_btn.setFixedSize(28, 28)
@@ -108,7 +109,7 @@ class EventButton(QObject):
         edit_btn.clicked.connect(lambda: self.edit_event(event_name))
 
         delete_btn = QPushButton()
-        delete_btn.setIcon(QIcon("./resources/icons/delete.svg"))
+        delete_btn.setIcon(get_icon("delete"))
         delete_btn.setToolTip("Excluir")
         delete_btn.setIconSize(QSize(16, 16))
         delete_btn.setFixedSize(28, 28)
@@ -197,7 +198,6 @@ class EventButton(QObject):
 
         # Email com ícone
         from PySide6.QtCore import QSize
-        from PySide6.QtGui import QIcon
         from PySide6.QtWidgets import QHBoxLayout, QLabel, QPushButton, QWidget
 
         import gui.themes.dracula as style
@@ -211,7 +211,7 @@ class EventButton(QObject):
         email_label.setStyleSheet(f"color: {style.foreground_color};")
 
         email_icon = QPushButton()
-        email_icon.setIcon(QIcon("./resources/icons/email.svg"))
+        email_icon.setIcon(get_icon("email"))
         email_icon.setToolTip("Enviar Email")
         email_icon.setIconSize(QSize(16, 16))
         email_icon.setFixedSize(24, 24)
@@ -247,7 +247,7 @@ class EventButton(QObject):
         actions_layout.setSpacing(5)
 
         edit_btn = QPushButton()
-        edit_btn.setIcon(QIcon("./resources/icons/edit.svg"))
+        edit_btn.setIcon(get_icon("edit"))
         edit_btn.setToolTip("Editar")
         edit_btn.setIconSize(QSize(16, 16))
         edit_btn.setFixedSize(28, 28)
@@ -255,7 +255,7 @@ class EventButton(QObject):
         edit_btn.clicked.connect(lambda: self.edit_team_member(name))
 
         delete_btn = QPushButton()
-        delete_btn.setIcon(QIcon("./resources/icons/delete.svg"))
+        delete_btn.setIcon(get_icon("delete"))
         delete_btn.setToolTip("Remover")
         delete_btn.setIconSize(QSize(16, 16))
         delete_btn.setFixedSize(28, 28)
@@ -303,7 +303,6 @@ class EventButton(QObject):
 
         # Email com ícone
         from PySide6.QtCore import QSize
-        from PySide6.QtGui import QIcon
         from PySide6.QtWidgets import QHBoxLayout, QLabel, QPushButton, QWidget
 
         import gui.themes.dracula as style
@@ -317,7 +316,7 @@ class EventButton(QObject):
         email_label.setStyleSheet(f"color: {style.foreground_color};")
 
         email_icon = QPushButton()
-        email_icon.setIcon(QIcon("./resources/icons/email.svg"))
+        email_icon.setIcon(get_icon("email"))
         email_icon.setToolTip("Enviar Email")
         email_icon.setIconSize(QSize(16, 16))
         email_icon.setFixedSize(24, 24)
@@ -353,7 +352,7 @@ class EventButton(QObject):
         actions_layout.setSpacing(5)
 
         view_btn = QPushButton()
-        view_btn.setIcon(QIcon("./resources/icons/view.svg"))
+        view_btn.setIcon(get_icon("view"))
         view_btn.setToolTip("Ver Detalhes")
         view_btn.setIconSize(QSize(16, 16))
         view_btn.setFixedSize(28, 28)
@@ -361,7 +360,7 @@ class EventButton(QObject):
         view_btn.clicked.connect(lambda: self.view_client_details(company))
 
         edit_btn = QPushButton()
-        edit_btn.setIcon(QIcon("./resources/icons/edit.svg"))
+        edit_btn.setIcon(get_icon("edit"))
         edit_btn.setToolTip("Editar")
         edit_btn.setIconSize(QSize(16, 16))
         edit_btn.setFixedSize(28, 28)
@@ -369,7 +368,7 @@ class EventButton(QObject):
         edit_btn.clicked.connect(lambda: self.edit_client(company))
 
         delete_btn = QPushButton()
-        delete_btn.setIcon(QIcon("./resources/icons/delete.svg"))
+        delete_btn.setIcon(get_icon("delete"))
         delete_btn.setToolTip("Remover")
         delete_btn.setIconSize(QSize(16, 16))
         delete_btn.setFixedSize(28, 28)
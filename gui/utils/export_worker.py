@@ -0,0 +1,98 @@
+"""
+Exportação de comentários fora da thread da interface.
+
+O ``CommentExportWorker`` roda no ``QThreadPool`` e grava o arquivo com
+``utils.exporters.export_comments`` a partir de um gerador (normalmente
+``CommentRepository.iter_comments_by_editing``), criado já na thread de
+trabalho. O progresso é emitido no máximo uma vez por ponto percentual (ou a
+cada 100 comentários, sem total conhecido), e ``cancel`` interrompe a gravação
+no próximo comentário, removendo o arquivo parcial.
+"""
+
+import threading
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+from utils.exporters import ExportCancelled, export_comments
+
+
+class ExportSignals(QObject):
+    """Sinais do worker de exportação (entregues na thread da interface)"""
+
+    # Comentários gravados, total esperado (0 se desconhecido)
+    progress = Signal(int, int)
+    # Arquivo gerado e número de comentários exportados
+    finished = Signal(str, int)
+    cancelled = Signal()
+    # Mensagem de erro
+    failed = Signal(str)
+
+
+class CommentExportWorker(QRunnable):
+    """Grava a exportação de comentários em segundo plano"""
+
+    def __init__(
+        self,
+        comments_factory,
+        filename,
+        export_format=None,
+        metadata=None,
+        title="Comentários",
+        total=0,
+    ):
+        """
+        Args:
+            comments_factory: Função sem argumentos que retorna o iterável de
+                comentários (chamada na thread de trabalho)
+            filename: Arquivo de saída
+            export_format: json, csv ou pdf (padrão: extensão do arquivo)
+            metadata: Metadados gravados junto com os comentários
+            title: Título do documento (PDF)
+            total: Número de comentários esperado, para o progresso
+        """
+        super().__init__()
+        self.comments_factory = comments_factory
+        self.filename = filename
+        self.export_format = export_format
+        self.metadata = metadata
+        self.title = title
+        self.total = total
+        self.signals = ExportSignals()
+        self._cancel = threading.Event()
+        self._last_percent = -1
+
+    def cancel(self):
+        """Pede a interrupção da exportação"""
+        self._cancel.set()
+
+    def start(self):
+        """Agenda a exportação no pool global de threads"""
+        QThreadPool.globalInstance().start(self)
+
+    def _report(self, count):
+        percent = count * 100 // self.total if self.total else count // 100
+        if percent != self._last_percent:
+            self._last_percent = percent
+            self.signals.progress.emit(count, self.total)
+
+    def run(self):
+        try:
+            count = export_comments(
+                self.comments_factory(),
+                self.filename,
+                self.export_format,
+                self.metadata,
+                self.title,
+                progress=self._report,
+                is_cancelled=self._cancel.is_set,
+            )
+        except ExportCancelled:
+            self.signals.cancelled.emit()
+        except ImportError:
+            self.signals.failed.emit(
+                "ReportLab não está instalado. Use 'pip install reportlab' para instalar."
+            )
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(self.filename, count)
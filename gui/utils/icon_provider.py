@@ -0,0 +1,239 @@
+"""
+Provedor central de ícones da interface gráfica.
+
+Cada SVG de ``resources/icons`` é analisado uma única vez (um ``QSvgRenderer``
+por ícone) e os pixmaps renderizados são guardados no ``QPixmapCache`` por
+tamanho e device pixel ratio. Os ``QIcon`` devolvidos também são
+compartilhados, de modo que construir listas de cards ou alternar o ícone de
+um botão não volta a ler nem a interpretar o arquivo SVG.
+
+Se o recurso Qt compilado (``gui/icons_rc.py``, gerado por
+``build_icon_resources.py``) estiver disponível, os ícones são lidos dele em vez
+do sistema de arquivos.
+"""
+
+import os
+from typing import Dict, Optional, Union
+
+from PySide6.QtCore import QFile, QRectF, QSize, Qt
+from PySide6.QtGui import QIcon, QIconEngine, QPainter, QPixmap, QPixmapCache
+from PySide6.QtSvg import QSvgRenderer
+from PySide6.QtWidgets import QApplication, QStyleOption
+
+from utils.logger import get_logger
+
+logger = get_logger("icon_provider")
+
+# Diretório dos ícones no sistema de arquivos e prefixo no recurso compilado
+ICONS_DIR = os.path.join("resources", "icons")
+RESOURCE_PREFIX = ":/icons"
+
+try:
+    # Registra os ícones no sistema de recursos do Qt (opcional)
+    import gui.icons_rc  # noqa: F401
+
+    _HAS_COMPILED_RESOURCES = True
+except ImportError:
+    _HAS_COMPILED_RESOURCES = False
+
+
+class _SvgIconEngine(QIconEngine):
+    """Engine de ícone que renderiza a partir do cache do IconProvider."""
+
+    def __init__(self, provider: "IconProvider", name: str):
+        super().__init__()
+        self._provider = provider
+        self._name = name
+
+    def pixmap(self, size: QSize, mode: QIcon.Mode, state: QIcon.State) -> QPixmap:
+        return self.scaledPixmap(size, mode, state, 1.0)
+
+    def scaledPixmap(
+        self, size: QSize, mode: QIcon.Mode, state: QIcon.State, scale: float
+    ) -> QPixmap:
+        pixmap = self._provider.pixmap(self._name, size, scale)
+
+        # Ícones desabilitados seguem o estilo atual (normalmente em cinza)
+        if mode == QIcon.Mode.Disabled and QApplication.instance() is not None:
+            return QApplication.style().generatedIconPixmap(
+                mode, pixmap, QStyleOption()
+            )
+        return pixmap
+
+    def paint(self, painter: QPainter, rect, mode: QIcon.Mode, state: QIcon.State):
+        device = painter.device()
+        scale = device.devicePixelRatioF() if device is not None else 1.0
+        painter.drawPixmap(rect, self.scaledPixmap(rect.size(), mode, state, scale))
+
+    def clone(self) -> "QIconEngine":
+        return _SvgIconEngine(self._provider, self._name)
+
+    def key(self) -> str:
+        return "gonetwork_svg"
+
+
+class IconProvider:
+    """
+    Cache central de ícones SVG.
+
+    Mantém um ``QSvgRenderer`` por ícone e um ``QIcon`` compartilhado por nome.
+    Os pixmaps ficam no ``QPixmapCache`` global do Qt, com chave por nome,
+    tamanho e device pixel ratio.
+    """
+
+    # Instância singleton
+    _instance = None
+
+    def __new__(cls):
+        """Implementa o padrão Singleton."""
+        if cls._instance is None:
+            cls._instance = super(IconProvider, cls).__new__(cls)
+            cls._instance._renderers = {}
+            cls._instance._icons = {}
+        return cls._instance
+
+    @staticmethod
+    def normalize_name(name: str) -> str:
+        """
+        Converte um caminho ou nome de arquivo no nome do ícone.
+
+        Aceita tanto ``"play"`` quanto ``"play.svg"`` ou
+        ``"./resources/icons/play.svg"``.
+        """
+        base = os.path.basename(name.replace("\\", "/"))
+        if base.lower().endswith(".svg"):
+            base = base[:-4]
+        return base
+
+    @staticmethod
+    def resolve_path(name: str) -> str:
+        """Retorna o caminho de origem do ícone (recurso compilado ou arquivo)."""
+        if _HAS_COMPILED_RESOURCES:
+            resource_path = f"{RESOURCE_PREFIX}/{name}.svg"
+            if QFile.exists(resource_path):
+                return resource_path
+        return os.path.join(ICONS_DIR, f"{name}.svg")
+
+    def renderer(self, name: str) -> Optional[QSvgRenderer]:
+        """
+        Retorna o renderer do ícone, analisando o SVG apenas na primeira vez.
+
+        Args:
+            name: Nome do ícone
+
+        Returns:
+            QSvgRenderer ou None se o ícone não existir ou for inválido
+        """
+        name = self.normalize_name(name)
+        if name in self._renderers:
+            return self._renderers[name]
+
+        path = self.resolve_path(name)
+        renderer = QSvgRenderer(path)
+        if not renderer.isValid():
+            logger.warning(f"Ícone não encontrado ou inválido: {path}")
+            renderer = None
+
+        # Ícones ausentes também ficam em cache para não tentar de novo
+        self._renderers[name] = renderer
+        return renderer
+
+    def icon(self, name: str) -> QIcon:
+        """
+        Retorna o QIcon compartilhado de um ícone.
+
+        Args:
+            name: Nome do ícone (ou caminho do SVG)
+
+        Returns:
+            QIcon: Ícone (nulo se o SVG não existir)
+        """
+        name = self.normalize_name(name)
+        icon = self._icons.get(name)
+        if icon is None:
+            if self.renderer(name) is None:
+                icon = QIcon()
+            else:
+                icon = QIcon(_SvgIconEngine(self, name))
+            self._icons[name] = icon
+        return icon
+
+    def pixmap(
+        self,
+        name: str,
+        size: Union[int, QSize],
+        device_pixel_ratio: Optional[float] = None,
+    ) -> QPixmap:
+        """
+        Retorna o pixmap renderizado de um ícone.
+
+        Args:
+            name: Nome do ícone (ou caminho do SVG)
+            size: Tamanho lógico (int para ícones quadrados ou QSize)
+            device_pixel_ratio: Densidade da tela. Se None, usa a da aplicação
+
+        Returns:
+            QPixmap: Pixmap renderizado (nulo se o ícone não existir)
+        """
+        name = self.normalize_name(name)
+        if isinstance(size, int):
+            size = QSize(size, size)
+        if device_pixel_ratio is None:
+            app = QApplication.instance()
+            device_pixel_ratio = app.devicePixelRatio() if app is not None else 1.0
+
+        cache_key = (
+            f"gonetwork_icon:{name}:{size.width()}x{size.height()}"
+            f"@{device_pixel_ratio:.2f}"
+        )
+        pixmap = QPixmap()
+        if QPixmapCache.find(cache_key, pixmap):
+            return pixmap
+
+        renderer = self.renderer(name)
+        if renderer is None or size.isEmpty():
+            return QPixmap()
+
+        pixmap = QPixmap(size * device_pixel_ratio)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        renderer.render(
+            painter,
+            QRectF(0, 0, pixmap.width(), pixmap.height()),
+        )
+        painter.end()
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+
+        QPixmapCache.insert(cache_key, pixmap)
+        return pixmap
+
+    def clear(self) -> None:
+        """Descarta renderers e ícones (os pixmaps expiram no QPixmapCache)."""
+        self._renderers.clear()
+        self._icons.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Retorna estatísticas do cache de ícones.
+
+        Returns:
+            Dicionário com a quantidade de SVGs analisados e ícones criados
+        """
+        return {
+            "renderers": len(self._renderers),
+            "icons": len(self._icons),
+        }
+
+
+def get_icon(name: str) -> QIcon:
+    """Atalho para IconProvider().icon(name)."""
+    return IconProvider().icon(name)
+
+
+def get_icon_pixmap(
+    name: str,
+    size: Union[int, QSize],
+    device_pixel_ratio: Optional[float] = None,
+) -> QPixmap:
+    """Atalho para IconProvider().pixmap(name, size, device_pixel_ratio)."""
+    return IconProvider().pixmap(name, size, device_pixel_ratio)
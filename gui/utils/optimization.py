@@ -6,10 +6,11 @@ o desempenho e a experiência do usuário na interface gráfica.
 """
 
 from functools import wraps
-from typing import Any, Callable, List, TypeVar
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+from weakref import WeakKeyDictionary, ref
 
-from PySide6.QtCore import Qt, QTimer
-from PySide6.QtWidgets import QApplication, QTableWidget, QWidget
+from PySide6.QtCore import QObject, Qt, QTimer
+from PySide6.QtWidgets import QAbstractItemView, QApplication, QTableWidget, QWidget
 
 from utils.logger import get_logger
 
@@ -18,47 +19,68 @@ logger = get_logger("gui_utils")
 T = TypeVar("T")
 
 
-def optimize_table_update(func: Callable[..., T]) -> Callable[..., T]:
+def _find_table(widget: QWidget) -> Optional[str]:
+    """Procura, entre os atributos da instância, a primeira tabela/visão."""
+    for attr_name, attr in vars(widget).items():
+        if isinstance(attr, QAbstractItemView):
+            return attr_name
+    return None
+
+
+def optimize_table_update(
+    func: Optional[Callable[..., T]] = None, *, table_attr: Optional[str] = None
+) -> Callable[..., T]:
     """
     Decorador para otimizar a atualização de tabelas.
 
     Desabilita as atualizações da tabela durante a execução da função decorada
     e as reabilita ao final, melhorando a performance em atualizações em lote.
 
+    A tabela pode ser indicada pelo nome do atributo
+    (``@optimize_table_update(table_attr="events_table")``). Sem o nome, ela é
+    procurada entre os atributos da instância uma única vez por classe, e não
+    a cada chamada.
+
     Args:
         func: Função a ser decorada que atualiza uma tabela
+        table_attr: Nome do atributo com a tabela (QTableWidget ou QTableView)
 
     Returns:
         Função decorada que otimiza as atualizações
     """
 
-    @wraps(func)
-    def wrapper(self, *args, **kwargs):
-        table = None
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        # Nome do atributo da tabela por classe do widget
+        resolved: Dict[type, Optional[str]] = {}
 
-        # Identificar o widget de tabela
-        for attr_name in dir(self):
-            attr = getattr(self, attr_name)
-            if isinstance(attr, QTableWidget):
-                table = attr
-                break
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            attr_name = table_attr
+            if attr_name is None:
+                cls = type(self)
+                if cls not in resolved:
+                    resolved[cls] = _find_table(self)
+                attr_name = resolved[cls]
+
+            table = getattr(self, attr_name, None) if attr_name else None
+            if table is None:
+                # Se não encontrou tabela, executa normalmente
+                return func(self, *args, **kwargs)
 
-        if table:
             # Desabilitar atualizações
             table.setUpdatesEnabled(False)
-
             try:
-                result = func(self, *args, **kwargs)
-                return result
+                return func(self, *args, **kwargs)
             finally:
                 # Reabilitar atualizações
                 table.setUpdatesEnabled(True)
                 table.viewport().update()
-        else:
-            # Se não encontrou tabela, executa normalmente
-            return func(self, *args, **kwargs)
 
-    return wrapper
+        return wrapper
+
+    if func is not None:
+        return decorator(func)
+    return decorator
 
 
 def batch_update_table(
@@ -112,7 +134,10 @@ def debounce(wait_ms: int = 300) -> Callable:
     """
     Decorador para evitar chamadas repetidas de uma função em curto intervalo.
 
-    Útil para operações como filtragem enquanto o usuário digita.
+    Útil para operações como filtragem enquanto o usuário digita. Cada
+    instância (primeiro argumento) tem o seu próprio QTimer, criado uma única
+    vez e reiniciado a cada chamada; ao disparar, a função recebe os
+    argumentos da última chamada.
 
     Args:
         wait_ms: Tempo de espera em milissegundos
@@ -122,18 +147,31 @@ def debounce(wait_ms: int = 300) -> Callable:
     """
 
     def decorator(func):
-        timer = None
+        # Timer e argumentos pendentes por instância
+        timers: "WeakKeyDictionary[Any, QTimer]" = WeakKeyDictionary()
+        pending: "WeakKeyDictionary[Any, tuple]" = WeakKeyDictionary()
+
+        def fire(owner):
+            args, kwargs = pending.pop(owner, ((), {}))
+            func(owner, *args, **kwargs)
 
         @wraps(func)
-        def debounced(*args, **kwargs):
-            nonlocal timer
-            if timer is not None:
-                timer.stop()
-
-            timer = QTimer()
-            timer.setSingleShot(True)
-            timer.timeout.connect(lambda: func(*args, **kwargs))
-            timer.start(wait_ms)
+        def debounced(owner, *args, **kwargs):
+            pending[owner] = (args, kwargs)
+
+            timer = timers.get(owner)
+            if timer is None:
+                # O timer pertence ao widget e é destruído junto com ele
+                timer = QTimer(owner if isinstance(owner, QObject) else None)
+                timer.setSingleShot(True)
+                timer.setInterval(wait_ms)
+                owner_ref = ref(owner)
+                timer.timeout.connect(
+                    lambda: owner_ref() is not None and fire(owner_ref())
+                )
+                timers[owner] = timer
+
+            timer.start()
 
         return debounced
 
@@ -0,0 +1,77 @@
+"""
+Normalização de texto e casamento de termos para a busca nas listas da GUI.
+
+Cada linha de uma lista tem uma chave de busca pré-calculada: o texto das
+colunas pesquisáveis em minúsculas (``casefold``), sem acentos e com espaços
+normalizados. A consulta passa pela mesma normalização e é dividida em termos;
+uma linha casa quando a chave contém todos os termos.
+
+Quando o usuário apenas estende a consulta (por exemplo, de "mar" para
+"maria"), nenhuma linha que não casava passa a casar, então só as linhas que
+casavam precisam ser testadas de novo (ver ``is_refinement``).
+
+Este módulo não depende do Qt, para poder rodar em uma thread de trabalho.
+"""
+
+import unicodedata
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+
+
+def normalize_text(value: Any) -> str:
+    """Converte um valor em texto minúsculo, sem acentos e espaços repetidos."""
+    if value is None:
+        return ""
+    text = unicodedata.normalize("NFKD", str(value).casefold())
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    return " ".join(text.split())
+
+
+def build_key(values: Iterable[Any]) -> str:
+    """Monta a chave de busca de uma linha a partir dos valores das colunas."""
+    return " ".join(normalize_text(value) for value in values if value is not None)
+
+
+def query_terms(query: Any) -> Tuple[str, ...]:
+    """Divide a consulta normalizada em termos (sem repetições)."""
+    return tuple(dict.fromkeys(normalize_text(query).split()))
+
+
+def is_refinement(previous: Sequence[str], terms: Sequence[str]) -> bool:
+    """
+    Indica se ``terms`` só pode restringir o resultado de ``previous``.
+
+    É o caso quando cada termo anterior está contido em algum termo novo:
+    toda chave que contém os termos novos também contém os anteriores.
+    """
+    if not previous:
+        return False
+    return all(any(old in new for new in terms) for old in previous)
+
+
+def key_matches(key: str, terms: Sequence[str]) -> bool:
+    """Indica se a chave contém todos os termos."""
+    return all(term in key for term in terms)
+
+
+def match_keys(
+    keys: Sequence[str],
+    terms: Sequence[str],
+    previous: Optional[Sequence[bool]] = None,
+) -> List[bool]:
+    """
+    Casa todas as chaves com os termos.
+
+    Args:
+        keys: Chaves de busca, uma por linha
+        terms: Termos normalizados da consulta
+        previous: Resultado da consulta anterior quando a nova é um
+            refinamento dela; linhas que não casavam não são testadas
+
+    Returns:
+        Lista com True para as linhas que casam
+    """
+    if not terms:
+        return [True] * len(keys)
+    if previous is None or len(previous) != len(keys):
+        return [key_matches(key, terms) for key in keys]
+    return [matched and key_matches(key, terms) for key, matched in zip(keys, previous)]
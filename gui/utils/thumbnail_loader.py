@@ -0,0 +1,115 @@
+"""
+Carregamento assíncrono de miniaturas na interface desktop.
+
+As miniaturas são decodificadas em uma thread do ``QThreadPool`` com
+``QImageReader`` e ``setScaledSize``, que em JPEG decodifica direto no tamanho
+reduzido. Quando o ``ThumbnailService`` (``utils/thumbnails.py``) consegue
+gerar a miniatura em disco, a leitura parte dela; senão, do arquivo original.
+
+A imagem pronta volta para a thread da interface, vira ``QPixmap`` e fica no
+``QPixmapCache``; ``thumbnailReady`` avisa quem pediu. Pedidos repetidos para
+o mesmo arquivo enquanto a decodificação não termina são ignorados.
+"""
+
+import os
+
+from PySide6.QtCore import QObject, QRunnable, QSize, Qt, QThreadPool, Signal
+from PySide6.QtGui import QImage, QImageReader, QPixmap, QPixmapCache
+
+from utils.thumbnails import DEFAULT_SIZE, get_thumbnail_service, is_image
+
+# Miniaturas da versão desktop, ao lado dos uploads
+THUMBNAILS_DIR = os.path.join("uploads", "thumbnails")
+
+
+def read_scaled_image(path, size):
+    """Lê uma imagem já reduzida para caber em ``size`` (QSize)"""
+    reader = QImageReader(path)
+    reader.setAutoTransform(True)
+    original = reader.size()
+    if original.isValid() and (
+        original.width() > size.width() or original.height() > size.height()
+    ):
+        reader.setScaledSize(original.scaled(size, Qt.KeepAspectRatio))
+    return reader.read()
+
+
+class _ThumbnailSignals(QObject):
+    """Sinais da tarefa de decodificação (emitidos na thread de trabalho)"""
+
+    loaded = Signal(str, QImage)
+
+
+class _ThumbnailTask(QRunnable):
+    """Decodifica a miniatura de um arquivo fora da thread da interface"""
+
+    def __init__(self, file_path, size, service, signals):
+        super().__init__()
+        self.file_path = file_path
+        self.size = size
+        self.service = service
+        self.signals = signals
+
+    def run(self):
+        source = self.service.get(
+            self.file_path, (self.size.width(), self.size.height())
+        )
+        image = read_scaled_image(source or self.file_path, self.size)
+        self.signals.loaded.emit(self.file_path, image)
+
+
+class ThumbnailLoader(QObject):
+    """Decodifica miniaturas em segundo plano e as guarda no QPixmapCache"""
+
+    # Caminho do arquivo cuja miniatura entrou no cache
+    thumbnailReady = Signal(str)
+
+    def __init__(self, size=DEFAULT_SIZE, parent=None):
+        super().__init__(parent)
+        self.size = QSize(*size)
+        self.service = get_thumbnail_service(THUMBNAILS_DIR)
+        self._pending = set()
+        # Arquivos que não puderam ser lidos como imagem
+        self._failed = set()
+
+        self._signals = _ThumbnailSignals()
+        self._signals.loaded.connect(self._on_loaded)
+
+    def cache_key(self, file_path):
+        return f"thumbnail:{self.size.width()}x{self.size.height()}:{file_path}"
+
+    def pixmap(self, file_path):
+        """
+        Retorna a miniatura já carregada.
+
+        Returns:
+            QPixmap: Miniatura, ou None se ainda não estiver no cache
+        """
+        pixmap = QPixmap()
+        if QPixmapCache.find(self.cache_key(file_path), pixmap):
+            return pixmap
+        return None
+
+    def request(self, file_path):
+        """
+        Agenda a decodificação da miniatura de um arquivo.
+
+        Returns:
+            bool: False se o arquivo não tiver miniatura
+        """
+        if not file_path or not is_image(file_path) or file_path in self._failed:
+            return False
+        if file_path not in self._pending:
+            self._pending.add(file_path)
+            QThreadPool.globalInstance().start(
+                _ThumbnailTask(file_path, self.size, self.service, self._signals)
+            )
+        return True
+
+    def _on_loaded(self, file_path, image):
+        self._pending.discard(file_path)
+        if image.isNull():
+            self._failed.add(file_path)
+            return
+        QPixmapCache.insert(self.cache_key(file_path), QPixmap.fromImage(image))
+        self.thumbnailReady.emit(file_path)
@@ -0,0 +1,198 @@
+"""
+Índice temporal para renderização da timeline.
+
+Organiza os itens de ``timeline_items`` em linhas (um responsável por linha),
+ordenados pelo início, para que a view consulte apenas a janela de tempo
+visível com busca binária em vez de percorrer todos os itens. Também agrupa
+tarefas muito próximas em clusters quando o zoom está afastado.
+
+Este módulo não depende do Qt.
+"""
+
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from utils.logger import get_logger
+
+logger = get_logger("timeline_index")
+
+# Linha usada para itens sem responsável definido
+UNASSIGNED_ROW = "Sem responsável"
+
+
+def parse_timeline_datetime(value: Any) -> Optional[datetime]:
+    """
+    Converte o valor de start_time/end_time em datetime.
+
+    Args:
+        value: String ISO 8601 (com "T" ou espaço) ou datetime
+
+    Returns:
+        datetime ou None se o valor for inválido
+    """
+    if isinstance(value, datetime):
+        return value
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(str(value).strip())
+    except ValueError:
+        return None
+
+
+class TimelineEntry:
+    """Item da timeline já convertido para segundos desde a origem."""
+
+    __slots__ = ("id", "row", "start", "end", "data")
+
+    def __init__(self, item_id: str, row: str, start: float, end: float, data: Dict):
+        self.id = item_id
+        self.row = row
+        self.start = start
+        self.end = end
+        self.data = data
+
+
+class TimelineIndex:
+    """
+    Índice por linha e por tempo dos itens de uma timeline.
+
+    Os tempos são armazenados em segundos relativos a ``origin`` (a hora cheia
+    do início do primeiro item), o que simplifica a conversão para coordenadas da cena.
+    """
+
+    def __init__(self, items: Iterable[Dict[str, Any]] = ()):
+        self.origin: Optional[datetime] = None
+        self.end_time = 0.0
+        self.rows: List[str] = []
+        self._entries: Dict[str, TimelineEntry] = {}
+        self._row_entries: Dict[str, List[TimelineEntry]] = {}
+        self._row_starts: Dict[str, List[float]] = {}
+        self._row_max_duration: Dict[str, float] = {}
+        self.rebuild(items)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self._entries
+
+    @staticmethod
+    def row_key(item: Dict[str, Any]) -> str:
+        """Retorna a linha (responsável) de um item."""
+        return (
+            item.get("responsible_name")
+            or (str(item["responsible_id"]) if item.get("responsible_id") else None)
+            or UNASSIGNED_ROW
+        )
+
+    def rebuild(self, items: Iterable[Dict[str, Any]]) -> None:
+        """
+        Reconstrói o índice a partir de uma lista de itens.
+
+        Itens com horários inválidos são ignorados.
+        """
+        parsed: List[Tuple[Dict[str, Any], datetime, datetime]] = []
+        for item in items:
+            start = parse_timeline_datetime(item.get("start_time"))
+            end = parse_timeline_datetime(item.get("end_time"))
+            if start is None or end is None or item.get("id") is None:
+                logger.warning(f"Item da timeline ignorado: {item.get('id')}")
+                continue
+            if end < start:
+                start, end = end, start
+            parsed.append((item, start, end))
+
+        # A origem é arredondada para a hora cheia para alinhar a régua
+        self.origin = min((start for _, start, _ in parsed), default=None)
+        if self.origin is not None:
+            self.origin = self.origin.replace(minute=0, second=0, microsecond=0)
+        self.end_time = 0.0
+        self.rows = []
+        self._entries = {}
+        self._row_entries = {}
+
+        for item, start, end in parsed:
+            entry = TimelineEntry(
+                str(item["id"]),
+                self.row_key(item),
+                (start - self.origin).total_seconds(),
+                (end - self.origin).total_seconds(),
+                item,
+            )
+            self._entries[entry.id] = entry
+            if entry.row not in self._row_entries:
+                self._row_entries[entry.row] = []
+                self.rows.append(entry.row)
+            self._row_entries[entry.row].append(entry)
+            self.end_time = max(self.end_time, entry.end)
+
+        self.rows.sort(key=lambda row: (row == UNASSIGNED_ROW, row.casefold()))
+        for row in self.rows:
+            self._reindex_row(row)
+
+    def _reindex_row(self, row: str) -> None:
+        """Reordena uma linha e recalcula seus arrays de busca."""
+        entries = self._row_entries.get(row, [])
+        entries.sort(key=lambda e: (e.start, e.end, e.id))
+        self._row_starts[row] = [e.start for e in entries]
+        self._row_max_duration[row] = max(
+            (e.end - e.start for e in entries), default=0.0
+        )
+
+    def get(self, item_id: str) -> Optional[TimelineEntry]:
+        """Retorna a entrada de um item pelo ID."""
+        return self._entries.get(str(item_id))
+
+    def entries(self) -> Iterable[TimelineEntry]:
+        """Itera sobre todas as entradas do índice."""
+        return self._entries.values()
+
+    def row_index(self, row: str) -> int:
+        """Retorna a posição vertical de uma linha (ou -1 se não existir)."""
+        try:
+            return self.rows.index(row)
+        except ValueError:
+            return -1
+
+    def query(self, row: str, t0: float, t1: float) -> List[TimelineEntry]:
+        """
+        Retorna os itens de uma linha que intersectam a janela [t0, t1].
+
+        Usa busca binária sobre os inícios; a maior duração da linha limita
+        o quanto é preciso voltar para achar itens que começaram antes de t0.
+        """
+        entries = self._row_entries.get(row)
+        if not entries:
+            return []
+
+        starts = self._row_starts[row]
+        lo = bisect_left(starts, t0 - self._row_max_duration[row])
+        hi = bisect_right(starts, t1)
+        return [e for e in entries[lo:hi] if e.end >= t0]
+
+    def clusters(
+        self, row: str, t0: float, t1: float, min_gap: float
+    ) -> List[Tuple[float, float, List[TimelineEntry]]]:
+        """
+        Agrupa itens visíveis de uma linha separados por menos de ``min_gap``.
+
+        Args:
+            row: Linha a consultar
+            t0: Início da janela (segundos)
+            t1: Fim da janela (segundos)
+            min_gap: Distância mínima (segundos) para manter itens separados
+
+        Returns:
+            Lista de tuplas (início, fim, entradas) em ordem de início
+        """
+        groups: List[Tuple[float, float, List[TimelineEntry]]] = []
+        for entry in self.query(row, t0, t1):
+            if groups and entry.start - groups[-1][1] < min_gap:
+                start, end, members = groups[-1]
+                members.append(entry)
+                groups[-1] = (start, max(end, entry.end), members)
+            else:
+                groups.append((entry.start, entry.end, [entry]))
+        return groups
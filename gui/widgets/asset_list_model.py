@@ -0,0 +1,228 @@
+"""
+Grade de assets em modelo/visão.
+
+Em vez de um ``QFrame`` por asset (com layout, rótulos, botões e menu
+próprios, todos criados de uma vez), os assets ficam em um
+``QAbstractListModel`` exibido por uma ``QListView`` em modo ícone e desenhados
+por um delegate. Só as células visíveis são pintadas, e a miniatura de uma
+imagem só é pedida ao ``ThumbnailLoader`` quando a célula aparece pela
+primeira vez; até lá é exibido o ícone do tipo de arquivo.
+"""
+
+import os
+
+from PySide6.QtCore import (
+    QAbstractListModel,
+    QAbstractProxyModel,
+    QEvent,
+    QModelIndex,
+    QRect,
+    QSize,
+    Qt,
+    Signal,
+)
+from PySide6.QtGui import QColor, QPainter
+from PySide6.QtWidgets import QStyle, QStyledItemDelegate
+
+import gui.themes.dracula as style
+from gui.utils.icon_provider import get_icon, get_icon_pixmap
+from gui.widgets.repository_table_model import RowRole
+
+# Dicionário completo do asset (mesmo papel das tabelas, para os filtros do
+# SearchFilterProxyModel por nome de campo)
+AssetRole = RowRole
+PathRole = Qt.UserRole + 2
+
+# Ícone exibido por extensão enquanto não há miniatura
+FILE_ICONS = {
+    "image": (".jpg", ".jpeg", ".png", ".gif", ".bmp", ".tiff"),
+    "video": (".mp4", ".mov", ".avi", ".mkv", ".wmv", ".flv"),
+    "audio": (".mp3", ".wav", ".ogg", ".flac", ".aac", ".m4a"),
+    "document": (".pdf", ".doc", ".docx", ".txt", ".rtf", ".xls", ".xlsx"),
+    "edit": (".psd", ".ai", ".fig", ".xd", ".sketch"),
+    "archive": (".zip", ".rar", ".7z", ".tar", ".gz"),
+    "logo": (".svg", ".eps", ".cdr"),
+}
+
+
+def file_icon_name(name):
+    """Nome do ícone para um arquivo, pela extensão"""
+    ext = os.path.splitext(name)[-1].lower() if name else ""
+    for icon, extensions in FILE_ICONS.items():
+        if ext in extensions:
+            return icon
+    return "file"
+
+
+class AssetListModel(QAbstractListModel):
+    """Lista de assets; a miniatura vem do ThumbnailLoader"""
+
+    def __init__(self, thumbnail_loader, parent=None):
+        super().__init__(parent)
+        self.thumbnail_loader = thumbnail_loader
+        self._assets = []
+        # Caminho -> linhas, para atualizar só as células da miniatura pronta
+        self._rows_by_path = {}
+        thumbnail_loader.thumbnailReady.connect(self._on_thumbnail_ready)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._assets)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._assets):
+            return None
+
+        asset = self._assets[index.row()]
+        if role == Qt.DisplayRole:
+            return asset.get("name")
+        if role == Qt.ToolTipRole:
+            return f"{asset.get('name')}\n{asset.get('type')}"
+        if role == Qt.DecorationRole:
+            return self.thumbnail_loader.pixmap(asset.get("path", ""))
+        if role == AssetRole:
+            return asset
+        if role == PathRole:
+            return asset.get("path", "")
+        return None
+
+    def set_assets(self, assets):
+        """Substitui os assets exibidos"""
+        self.beginResetModel()
+        self._assets = list(assets)
+        self._rows_by_path = {}
+        for row, asset in enumerate(self._assets):
+            if asset.get("path"):
+                self._rows_by_path.setdefault(asset["path"], []).append(row)
+        self.endResetModel()
+
+    def asset(self, row):
+        return self._assets[row] if 0 <= row < len(self._assets) else None
+
+    def _on_thumbnail_ready(self, file_path):
+        for row in self._rows_by_path.get(file_path, []):
+            index = self.index(row)
+            self.dataChanged.emit(index, index, [Qt.DecorationRole])
+
+
+class AssetItemDelegate(QStyledItemDelegate):
+    """Desenha um asset como cartão, com botões de download e de menu"""
+
+    # Ação ("download" ou "menu"), linha do modelo de origem e posição global
+    actionTriggered = Signal(str, int, object)
+
+    CARD_SIZE = QSize(180, 200)
+    PREVIEW_HEIGHT = 120
+    ICON_SIZE = 64
+    BUTTON_SIZE = 28
+    MARGIN = 5
+    RADIUS = 8
+
+    def __init__(self, thumbnail_loader, parent=None):
+        super().__init__(parent)
+        self.thumbnail_loader = thumbnail_loader
+
+    def sizeHint(self, option, index):
+        return self.CARD_SIZE
+
+    def _layout(self, rect):
+        card = rect.adjusted(self.MARGIN, self.MARGIN, -self.MARGIN, -self.MARGIN)
+        preview = QRect(card.left(), card.top() + 5, card.width(), self.PREVIEW_HEIGHT)
+        buttons_top = card.bottom() - self.BUTTON_SIZE - 4
+        center = card.center().x()
+        download = QRect(
+            center - self.BUTTON_SIZE - 2,
+            buttons_top,
+            self.BUTTON_SIZE,
+            self.BUTTON_SIZE,
+        )
+        menu = QRect(center + 2, buttons_top, self.BUTTON_SIZE, self.BUTTON_SIZE)
+        text = QRect(
+            card.left() + 5,
+            preview.bottom() + 2,
+            card.width() - 10,
+            buttons_top - preview.bottom() - 4,
+        )
+        return {
+            "card": card,
+            "preview": preview,
+            "text": text,
+            "download": download,
+            "menu": menu,
+        }
+
+    def paint(self, painter, option, index):
+        asset = index.data(AssetRole)
+        if asset is None:
+            return super().paint(painter, option, index)
+
+        layout = self._layout(option.rect)
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        background = QColor(style.BG_THREE)
+        if option.state & QStyle.State_MouseOver:
+            background = background.lighter(115)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(background)
+        painter.drawRoundedRect(layout["card"], self.RADIUS, self.RADIUS)
+
+        # Miniatura (pedida só quando a célula é pintada) ou ícone do tipo
+        pixmap = index.data(Qt.DecorationRole)
+        if pixmap is None:
+            self.thumbnail_loader.request(asset.get("path", ""))
+            pixmap = get_icon_pixmap(file_icon_name(asset.get("name")), self.ICON_SIZE)
+        preview = layout["preview"]
+        size = pixmap.deviceIndependentSize().toSize()
+        painter.drawPixmap(
+            preview.center().x() - size.width() // 2,
+            preview.center().y() - size.height() // 2,
+            pixmap,
+        )
+
+        # Nome (até duas linhas) e tipo
+        text = layout["text"]
+        metrics = option.fontMetrics
+        name = metrics.elidedText(
+            asset.get("name", ""), Qt.ElideMiddle, 2 * text.width()
+        )
+        painter.setPen(QColor(style.foreground_color))
+        painter.drawText(
+            text.adjusted(0, 0, 0, -metrics.height()),
+            Qt.AlignHCenter | Qt.AlignTop | Qt.TextWrapAnywhere,
+            name,
+        )
+        painter.setPen(QColor(style.comment_color))
+        painter.drawText(text, Qt.AlignHCenter | Qt.AlignBottom, asset.get("type", ""))
+
+        # Botões
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(style.current_line_color))
+        offset = (self.BUTTON_SIZE - 16) // 2
+        for icon, button in (
+            ("download", layout["download"]),
+            ("more", layout["menu"]),
+        ):
+            painter.drawRoundedRect(button, 5, 5)
+            get_icon(icon).paint(
+                painter, button.adjusted(offset, offset, -offset, -offset)
+            )
+
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if (
+            event.type() == QEvent.MouseButtonRelease
+            and event.button() == Qt.LeftButton
+        ):
+            layout = self._layout(option.rect)
+            position = event.position().toPoint()
+            for action in ("download", "menu"):
+                if layout[action].contains(position):
+                    source = index
+                    while isinstance(source.model(), QAbstractProxyModel):
+                        source = source.model().mapToSource(source)
+                    self.actionTriggered.emit(
+                        action, source.row(), event.globalPosition().toPoint()
+                    )
+                    return True
+        return super().editorEvent(event, model, option, index)
@@ -1,5 +1,4 @@
 from PySide6.QtCore import QSize, Qt
-from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import (
     QCheckBox,
     QComboBox,
@@ -20,6 +19,7 @@ from PySide6.QtWidgets import (
 )
 
 import gui.themes.dracula as style
+from gui.utils.icon_provider import get_icon
 
 
 class BriefingWidget(QWidget):
@@ -55,13 +55,13 @@ class BriefingWidget(QWidget):
 
         # Botão de gerar timeline
         self.timeline_button = QPushButton("Gerar Timeline")
-        self.timeline_button.setIcon(QIcon("./resources/icons/timeline-generate.svg"))
+        self.timeline_button.setIcon(get_icon("timeline-generate"))
         self.timeline_button.setStyleSheet(style.button_style)
         self.timeline_button.setFixedHeight(36)
 
         # Botão de salvar
         self.save_button = QPushButton("Salvar")
-        self.save_button.setIcon(QIcon("./resources/icons/save.svg"))
+        self.save_button.setIcon(get_icon("save"))
         self.save_button.setStyleSheet(style.secondary_button_style)
         self.save_button.setFixedHeight(36)
 
@@ -209,7 +209,7 @@ class BriefingWidget(QWidget):
         sponsor_selector.setFixedWidth(250)
 
         remove_btn = QPushButton()
-        remove_btn.setIcon(QIcon("./resources/icons/trash.svg"))
+        remove_btn.setIcon(get_icon("trash"))
         remove_btn.setIconSize(QSize(16, 16))
         remove_btn.setFixedSize(30, 30)
         remove_btn.setStyleSheet(style.secondary_button_style)
@@ -269,7 +269,7 @@ class BriefingWidget(QWidget):
         action_title.setStyleSheet(f"color: {style.purple_color}; font-weight: bold;")
 
         remove_btn = QPushButton()
-        remove_btn.setIcon(QIcon("./resources/icons/trash.svg"))
+        remove_btn.setIcon(get_icon("trash"))
         remove_btn.setIconSize(QSize(16, 16))
         remove_btn.setFixedSize(28, 28)
         remove_btn.setStyleSheet(style.secondary_button_style)
@@ -405,7 +405,7 @@ class BriefingWidget(QWidget):
         stage_input.setFixedWidth(250)
 
         remove_btn = QPushButton()
-        remove_btn.setIcon(QIcon("./resources/icons/trash.svg"))
+        remove_btn.setIcon(get_icon("trash"))
         remove_btn.setIconSize(QSize(16, 16))
         remove_btn.setFixedSize(30, 30)
         remove_btn.setStyleSheet(style.secondary_button_style)
@@ -480,7 +480,7 @@ class BriefingWidget(QWidget):
         header_layout.addStretch()
 
         remove_btn = QPushButton()
-        remove_btn.setIcon(QIcon("./resources/icons/trash.svg"))
+        remove_btn.setIcon(get_icon("trash"))
         remove_btn.setIconSize(QSize(16, 16))
         remove_btn.setFixedSize(28, 28)
         remove_btn.setStyleSheet(style.secondary_button_style)
@@ -687,7 +687,7 @@ class BriefingWidget(QWidget):
         header.addStretch()
 
         remove_btn = QPushButton()
-        remove_btn.setIcon(QIcon("./resources/icons/trash.svg"))
+        remove_btn.setIcon(get_icon("trash"))
         remove_btn.setIconSize(QSize(16, 16))
         remove_btn.setFixedSize(28, 28)
         remove_btn.setStyleSheet(style.secondary_button_style)
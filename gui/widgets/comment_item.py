@@ -98,6 +98,13 @@ class CommentItem(QWidget):
         """Emite sinal para marcar o comentário como resolvido"""
         self.resolveRequested.emit(self.comment.id)
 
+    def markResolved(self):
+        """Atualiza o widget quando o comentário é marcado como resolvido"""
+        self.comment.is_resolved = True
+        if hasattr(self, "resolveButton"):
+            self.resolveButton.hide()
+        self.updateAppearance()
+
     def setActive(self, active=True):
         """Define se o comentário está ativo (atual no vídeo)"""
         if active != self.is_active:
@@ -0,0 +1,445 @@
+"""
+Lista de comentários de edição em modelo/visão.
+
+Em vez de um widget (com rótulos, botões e folha de estilo próprios) por
+comentário, os comentários ficam em um ``QAbstractListModel`` apoiado no
+``CommentTimeIndex`` e são desenhados por um delegate. A quantidade de widgets
+e o uso de memória não crescem com o número de comentários.
+
+- ``CommentListModel`` expõe os comentários na ordem do vídeo, carregando as
+  linhas em lotes (``canFetchMore``/``fetchMore``) e atualizando apenas a linha
+  afetada quando um comentário é resolvido, inserido ou fica ativo.
+- ``CommentFilterProxyModel`` filtra por texto (autor e comentário) e por
+  resolvidos/pendentes.
+- ``CommentItemDelegate`` desenha o cartão do comentário e trata os cliques em
+  "Ir para momento" e "Marcar como resolvido".
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from PySide6.QtCore import (
+    QAbstractListModel,
+    QEvent,
+    QModelIndex,
+    QRect,
+    QSize,
+    Qt,
+    Signal,
+)
+from PySide6.QtGui import QColor, QFont, QFontMetrics, QPainter, QPen
+from PySide6.QtWidgets import QStyle, QStyledItemDelegate
+
+import gui.themes.dracula as style
+from gui.utils.comment_index import CommentTimeIndex
+from gui.widgets.search_filter_proxy import SearchFilterProxyModel
+
+# Papéis de dados do modelo
+CommentRole = Qt.UserRole + 1
+CommentIdRole = Qt.UserRole + 2
+ResolvedRole = Qt.UserRole + 3
+ActiveRole = Qt.UserRole + 4
+TimestampRole = Qt.UserRole + 5
+
+
+def format_video_timestamp(milliseconds: int) -> str:
+    """Formata uma posição do vídeo (ms) como MM:SS"""
+    seconds = int(milliseconds or 0) // 1000
+    return f"{seconds // 60:02d}:{seconds % 60:02d}"
+
+
+class CommentListModel(QAbstractListModel):
+    """Comentários de uma edição, na ordem do vídeo"""
+
+    # Quantidade de linhas expostas à visão a cada fetchMore
+    BATCH_SIZE = 100
+
+    def __init__(self, index: Optional[CommentTimeIndex] = None, parent=None):
+        super().__init__(parent)
+        self.comment_index = index if index is not None else CommentTimeIndex()
+        self._loaded = min(len(self.comment_index), self.BATCH_SIZE)
+        self._active_ids: Set[Any] = set()
+
+    # ----- Interface do QAbstractListModel -----
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return self._loaded
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid() or not 0 <= index.row() < self._loaded:
+            return None
+
+        comment = self.comment_index.comment_at(index.row())
+        if role == CommentRole:
+            return comment
+        if role == Qt.DisplayRole:
+            return comment.text
+        if role == CommentIdRole:
+            return comment.id
+        if role == ResolvedRole:
+            return bool(comment.is_resolved)
+        if role == ActiveRole:
+            return comment.id in self._active_ids
+        if role == TimestampRole:
+            return int(comment.video_timestamp or 0)
+        if role == Qt.ToolTipRole:
+            return (
+                f"{comment.author} em {format_video_timestamp(comment.video_timestamp)}"
+            )
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        if parent.isValid():
+            return False
+        return self._loaded < len(self.comment_index)
+
+    def fetchMore(self, parent=QModelIndex()) -> None:
+        if parent.isValid():
+            return
+        remaining = len(self.comment_index) - self._loaded
+        count = min(remaining, self.BATCH_SIZE)
+        if count <= 0:
+            return
+
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    # ----- Operações -----
+
+    def reset(self, comments: Iterable[Any]) -> None:
+        """Substitui todos os comentários do modelo"""
+        self.beginResetModel()
+        self.comment_index.reset(comments)
+        self._loaded = min(len(self.comment_index), self.BATCH_SIZE)
+        self._active_ids = set()
+        self.endResetModel()
+
+    def ensure_loaded(self, row: int) -> None:
+        """Carrega os lotes necessários para que a linha exista na visão"""
+        while row >= self._loaded and self.canFetchMore():
+            self.fetchMore()
+
+    def row_of(self, comment_id: Any) -> int:
+        """Retorna a linha do comentário (ou -1)"""
+        return self.comment_index.index_of(comment_id)
+
+    def add_comment(self, comment) -> int:
+        """
+        Insere um comentário na posição do vídeo.
+
+        Returns:
+            int: Linha do comentário
+        """
+        if comment.id in self.comment_index:
+            self.remove_comment(comment.id)
+
+        row = self.comment_index.add(comment)
+        if row <= self._loaded:
+            self.beginInsertRows(QModelIndex(), row, row)
+            self._loaded += 1
+            self.endInsertRows()
+        return row
+
+    def remove_comment(self, comment_id: Any) -> None:
+        """Remove um comentário do modelo"""
+        row = self.comment_index.index_of(comment_id)
+        if row < 0:
+            return
+
+        if row < self._loaded:
+            self.beginRemoveRows(QModelIndex(), row, row)
+            self.comment_index.remove(comment_id)
+            self._loaded -= 1
+            self.endRemoveRows()
+        else:
+            self.comment_index.remove(comment_id)
+        self._active_ids.discard(comment_id)
+
+    def set_resolved(self, comment_id: Any, resolved: bool = True) -> None:
+        """Atualiza o estado de resolução, redesenhando apenas a linha afetada"""
+        self.comment_index.set_resolved(comment_id, resolved)
+        self._emit_row_changed(comment_id, [ResolvedRole])
+
+    def set_active_ids(self, active_ids: Set[Any]) -> None:
+        """Define os comentários ativos (próximos da posição do vídeo)"""
+        changed = self._active_ids ^ set(active_ids)
+        self._active_ids = set(active_ids)
+        for comment_id in changed:
+            self._emit_row_changed(comment_id, [ActiveRole])
+
+    def _emit_row_changed(self, comment_id: Any, roles) -> None:
+        row = self.comment_index.index_of(comment_id)
+        if 0 <= row < self._loaded:
+            model_index = self.index(row)
+            self.dataChanged.emit(model_index, model_index, roles)
+
+
+def comment_search_values(model, row: int) -> List[str]:
+    """Valores pesquisáveis de um comentário: autor e texto"""
+    comment = model.index(row, 0).data(CommentRole)
+    if comment is None:
+        return []
+    return [comment.author, comment.text]
+
+
+class CommentFilterProxyModel(SearchFilterProxyModel):
+    """Filtra os comentários por texto e por estado (resolvidos e/ou pendentes)"""
+
+    def __init__(self, parent=None):
+        super().__init__(row_text=comment_search_values, parent=parent)
+        self.show_resolved = True
+        self.show_pending = True
+        # A resolução de um comentário pode mudar o resultado do filtro
+        self.setDynamicSortFilter(True)
+        self.setFilterRole(ResolvedRole)
+
+    def set_filters(self, show_resolved: bool, show_pending: bool) -> None:
+        """Atualiza quais estados de comentário são exibidos"""
+        if (show_resolved, show_pending) == (self.show_resolved, self.show_pending):
+            return
+        self.show_resolved = show_resolved
+        self.show_pending = show_pending
+        self.invalidateFilter()
+
+    def accepts_row(self, source_row: int, source_parent: QModelIndex) -> bool:
+        resolved = (
+            self.sourceModel().index(source_row, 0, source_parent).data(ResolvedRole)
+        )
+        return self.show_resolved if resolved else self.show_pending
+
+
+class CommentItemDelegate(QStyledItemDelegate):
+    """Desenha um comentário como cartão, sem criar widgets por item"""
+
+    goToTimestampRequested = Signal(int)
+    resolveRequested = Signal(str)  # ID do comentário
+
+    MARGIN = 4
+    PADDING = 10
+    BORDER = 3
+    SPACING = 6
+    BUTTON_PADDING = 10
+    RADIUS = 5
+
+    GO_TO_TEXT = "Ir para momento"
+    RESOLVE_TEXT = "Marcar como resolvido"
+    RESOLVED_TEXT = "✓ Resolvido"
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.is_editor = False
+        # Altura do texto por (ID, texto) na largura atual; evita refazer a
+        # quebra de linhas a cada sizeHint
+        self._text_heights: Dict[Tuple[Any, str], int] = {}
+        self._text_width = 0
+
+    def set_editor_mode(self, is_editor: bool) -> None:
+        """Exibe ou oculta a ação de resolver comentários"""
+        self.is_editor = is_editor
+
+    def clear_cache(self) -> None:
+        """Descarta as alturas calculadas (por exemplo, ao recarregar)"""
+        self._text_heights.clear()
+
+    # ----- Geometria -----
+
+    @staticmethod
+    def _bold(font: QFont) -> QFont:
+        bold = QFont(font)
+        bold.setBold(True)
+        return bold
+
+    def _text_height(self, comment, width: int, metrics: QFontMetrics) -> int:
+        if width != self._text_width:
+            self._text_heights.clear()
+            self._text_width = width
+
+        key = (comment.id, comment.text)
+        height = self._text_heights.get(key)
+        if height is None:
+            height = metrics.boundingRect(
+                QRect(0, 0, max(width, 1), 100000),
+                Qt.TextWordWrap,
+                comment.text or "",
+            ).height()
+            self._text_heights[key] = height
+        return height
+
+    def _has_footer(self, comment) -> bool:
+        return bool(comment.is_resolved) or self.is_editor
+
+    def _layout(self, rect: QRect, comment, font: QFont) -> Dict[str, QRect]:
+        """Calcula as áreas do cartão dentro do retângulo da linha"""
+        metrics = QFontMetrics(font)
+        bold_metrics = QFontMetrics(self._bold(font))
+
+        card = rect.adjusted(self.MARGIN, self.MARGIN, -self.MARGIN, -self.MARGIN)
+        content = card.adjusted(
+            self.PADDING + self.BORDER, self.PADDING, -self.PADDING, -self.PADDING
+        )
+
+        button_height = metrics.height() + self.SPACING
+        header_height = max(bold_metrics.height(), button_height)
+        go_to_width = (
+            metrics.horizontalAdvance(self.GO_TO_TEXT) + 2 * self.BUTTON_PADDING
+        )
+        go_to = QRect(
+            content.right() - go_to_width + 1,
+            content.top(),
+            go_to_width,
+            header_height,
+        )
+        header = QRect(
+            content.left(),
+            content.top(),
+            content.width() - go_to_width - self.SPACING,
+            header_height,
+        )
+
+        text_top = header.bottom() + 1 + self.SPACING
+        text = QRect(
+            content.left(),
+            text_top,
+            content.width(),
+            self._text_height(comment, content.width(), metrics),
+        )
+
+        layout = {"card": card, "header": header, "go_to": go_to, "text": text}
+        if self._has_footer(comment):
+            label = self.RESOLVED_TEXT if comment.is_resolved else self.RESOLVE_TEXT
+            footer_width = metrics.horizontalAdvance(label) + 2 * self.BUTTON_PADDING
+            layout["footer"] = QRect(
+                content.right() - footer_width + 1,
+                text.bottom() + 1 + self.SPACING,
+                footer_width,
+                button_height,
+            )
+        return layout
+
+    def sizeHint(self, option, index: QModelIndex) -> QSize:
+        comment = index.data(CommentRole)
+        if comment is None:
+            return super().sizeHint(option, index)
+
+        width = option.rect.width()
+        view = self.parent()
+        if width <= 0 and view is not None and hasattr(view, "viewport"):
+            width = view.viewport().width()
+
+        layout = self._layout(QRect(0, 0, max(width, 200), 0), comment, option.font)
+        bottom = layout.get("footer", layout["text"]).bottom()
+        return QSize(width, bottom + 1 + self.PADDING + self.MARGIN)
+
+    # ----- Desenho -----
+
+    def paint(self, painter: QPainter, option, index: QModelIndex) -> None:
+        comment = index.data(CommentRole)
+        if comment is None:
+            return super().paint(painter, option, index)
+
+        active = bool(index.data(ActiveRole))
+        resolved = bool(comment.is_resolved)
+        layout = self._layout(option.rect, comment, option.font)
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        # Fundo e borda lateral conforme o estado
+        card = layout["card"]
+        background = QColor(style.PRIMARY_LIGHT if active else style.BG_THREE)
+        if option.state & QStyle.State_MouseOver and not active:
+            background = background.lighter(115)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(background)
+        painter.drawRoundedRect(card, self.RADIUS, self.RADIUS)
+
+        if active or resolved:
+            accent = QColor(style.PRIMARY if active else style.SUCCESS)
+            painter.setBrush(accent)
+            painter.drawRoundedRect(
+                QRect(card.left(), card.top(), self.BORDER, card.height()), 1, 1
+            )
+
+        text_color = QColor(style.background_color if active else style.FONT_COLOR)
+
+        # Cabeçalho: autor e posição no vídeo
+        bold = self._bold(option.font)
+        header = layout["header"]
+        painter.setPen(text_color)
+        painter.setFont(bold)
+        author = QFontMetrics(bold).elidedText(
+            str(comment.author or ""), Qt.ElideRight, header.width() // 2
+        )
+        painter.drawText(header, Qt.AlignLeft | Qt.AlignVCenter, author)
+        author_width = QFontMetrics(bold).horizontalAdvance(author)
+
+        painter.setFont(option.font)
+        painter.drawText(
+            header.adjusted(author_width + self.SPACING, 0, 0, 0),
+            Qt.AlignLeft | Qt.AlignVCenter,
+            f"em {format_video_timestamp(comment.video_timestamp)}",
+        )
+
+        # Botão "Ir para momento"
+        self._draw_button(
+            painter, layout["go_to"], self.GO_TO_TEXT, style.current_line_color
+        )
+
+        # Texto do comentário
+        painter.setPen(text_color)
+        painter.drawText(
+            layout["text"],
+            Qt.AlignLeft | Qt.AlignTop | Qt.TextWordWrap,
+            comment.text or "",
+        )
+
+        # Rodapé: estado de resolução ou ação de resolver
+        footer = layout.get("footer")
+        if footer is not None:
+            if resolved:
+                painter.setPen(QColor(style.SUCCESS))
+                painter.drawText(
+                    footer, Qt.AlignRight | Qt.AlignVCenter, self.RESOLVED_TEXT
+                )
+            else:
+                self._draw_button(painter, footer, self.RESOLVE_TEXT, style.PRIMARY)
+
+        painter.restore()
+
+    def _draw_button(self, painter: QPainter, rect: QRect, text: str, color) -> None:
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(color))
+        painter.drawRoundedRect(rect, self.RADIUS, self.RADIUS)
+        painter.setPen(QPen(QColor(style.FONT_COLOR)))
+        painter.drawText(rect, Qt.AlignCenter, text)
+
+    # ----- Interação -----
+
+    def editorEvent(self, event, model, option, index: QModelIndex) -> bool:
+        if event.type() != QEvent.MouseButtonRelease:
+            return super().editorEvent(event, model, option, index)
+        if event.button() != Qt.LeftButton:
+            return False
+
+        comment = index.data(CommentRole)
+        if comment is None:
+            return False
+
+        layout = self._layout(option.rect, comment, option.font)
+        position = event.position().toPoint()
+        if layout["go_to"].contains(position):
+            self.goToTimestampRequested.emit(int(comment.video_timestamp or 0))
+            return True
+
+        footer = layout.get("footer")
+        if (
+            footer is not None
+            and not comment.is_resolved
+            and self.is_editor
+            and footer.contains(position)
+        ):
+            self.resolveRequested.emit(str(comment.id))
+            return True
+        return False
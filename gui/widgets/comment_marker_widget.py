@@ -1,65 +1,214 @@
 """
 Widget para exibir marcadores de comentários na timeline de um vídeo
+
+Os marcadores são agregados por coluna de pixel (histograma de densidade) e
+desenhados uma única vez em um pixmap, refeito apenas quando os comentários,
+a duração do vídeo ou a largura do widget mudam. Durante a reprodução cada
+repintura apenas copia esse pixmap. O mesmo agrupamento por coluna serve de
+índice para identificar os comentários sob o cursor.
 """
 
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QBrush, QColor, QPainter
-from PySide6.QtWidgets import QWidget
+from PySide6.QtCore import QRect, Qt, Signal
+from PySide6.QtGui import QColor, QPainter, QPixmap
+from PySide6.QtWidgets import QToolTip, QWidget
+
+from gui.widgets.comment_list_model import format_video_timestamp
 
 
 class CommentMarkerWidget(QWidget):
     """Widget para representar marcadores de comentários na timeline do vídeo"""
 
+    # Emitido ao clicar em um marcador, com a posição (ms) do comentário
+    markerClicked = Signal(int)
+
+    # Cor para comentários pendentes (azul) e resolvidos (verde)
+    PENDING_COLOR = QColor(51, 153, 255)
+    RESOLVED_COLOR = QColor(102, 204, 102)
+
+    MARKER_WIDTH = 2
+    # Altura mínima (fração) de uma coluna com um único comentário
+    MIN_BAR_RATIO = 0.4
+    # Distância (px) em que um marcador ainda é considerado sob o cursor
+    HIT_TOLERANCE = 3
+    # Comentários listados no tooltip de uma coluna
+    TOOLTIP_LIMIT = 3
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.comments = []
         self.video_duration = 0
         self.setFixedHeight(10)
+        self.setMouseTracking(True)
+
+        # Comentários por coluna de pixel e pixmap já desenhado
+        self._columns = []
+        self._pixmap = None
+        self._hover_column = -1
 
     def set_comments(self, comments):
         """Define os comentários a serem exibidos"""
-        self.comments = comments
-        self.update()
+        self.comments = list(comments)
+        self._invalidate()
 
     def set_duration(self, duration):
         """Define a duração total do vídeo em ms"""
-        self.video_duration = max(1, duration)  # Evitar divisão por zero
+        duration = max(1, duration)  # Evitar divisão por zero
+        if duration != self.video_duration:
+            self.video_duration = duration
+            self._invalidate()
+
+    # ----- Cache -----
+
+    def _invalidate(self):
+        """Descarta o histograma e o pixmap; serão refeitos na próxima pintura"""
+        self._columns = []
+        self._pixmap = None
+        self._hover_column = -1
         self.update()
 
+    def _build_columns(self):
+        """Agrupa os comentários pela coluna de pixel em que caem"""
+        width = max(1, self.width())
+        columns = [[] for _ in range(width)]
+        if self.video_duration > 0:
+            for comment in self.comments:
+                x_pos = int(comment.video_timestamp / self.video_duration * width)
+                columns[min(max(x_pos, 0), width - 1)].append(comment)
+        self._columns = columns
+
+    def _column_color(self, comments):
+        """Interpola a cor da coluna pela proporção de comentários resolvidos"""
+        ratio = sum(1 for c in comments if c.is_resolved) / len(comments)
+        pending, resolved = self.PENDING_COLOR, self.RESOLVED_COLOR
+        return QColor(
+            round(pending.red() + (resolved.red() - pending.red()) * ratio),
+            round(pending.green() + (resolved.green() - pending.green()) * ratio),
+            round(pending.blue() + (resolved.blue() - pending.blue()) * ratio),
+        )
+
+    def _render(self):
+        """Desenha o histograma de densidade em um pixmap"""
+        if not self._columns:
+            self._build_columns()
+
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(
+            max(1, round(self.width() * ratio)), max(1, round(self.height() * ratio))
+        )
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+
+        densest = max((len(c) for c in self._columns), default=0)
+        if densest:
+            height = self.height()
+            painter = QPainter(pixmap)
+            for x_pos, comments in enumerate(self._columns):
+                if not comments:
+                    continue
+                # Colunas com mais comentários ficam mais altas
+                share = len(comments) / densest
+                bar_height = max(
+                    1,
+                    round(
+                        height * (self.MIN_BAR_RATIO + (1 - self.MIN_BAR_RATIO) * share)
+                    ),
+                )
+                painter.fillRect(
+                    x_pos - self.MARKER_WIDTH // 2,
+                    height - bar_height,
+                    self.MARKER_WIDTH,
+                    bar_height,
+                    self._column_color(comments),
+                )
+            painter.end()
+
+        self._pixmap = pixmap
+
+    # ----- Eventos -----
+
+    def resizeEvent(self, event):
+        if event.oldSize().width() != event.size().width():
+            self._invalidate()
+        super().resizeEvent(event)
+
     def paintEvent(self, event):
         """Desenha os marcadores na timeline"""
         if not self.comments or self.video_duration <= 0:
             return
 
+        if self._pixmap is None:
+            self._render()
+
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
+        painter.drawPixmap(0, 0, self._pixmap)
 
-        # Dimensões do widget
-        width = self.width()
-        height = self.height()
+        # Destaque da coluna sob o cursor
+        if self._hover_column >= 0:
+            painter.fillRect(
+                QRect(
+                    self._hover_column - self.MARKER_WIDTH // 2,
+                    0,
+                    self.MARKER_WIDTH,
+                    self.height(),
+                ),
+                QColor(255, 255, 255, 120),
+            )
 
-        # Cor para comentários normais (azul)
-        normal_color = QColor(51, 153, 255)
+    def column_at(self, x_pos):
+        """
+        Retorna a coluna com comentários mais próxima de ``x_pos``.
 
-        # Cor para comentários resolvidos (verde)
-        resolved_color = QColor(102, 204, 102)
+        Consulta apenas as colunas dentro de HIT_TOLERANCE pixels.
 
-        # Desenhar marcadores para cada comentário
-        for comment in self.comments:
-            # Calcular posição relativa
-            position = comment.video_timestamp / self.video_duration
-            x_pos = int(position * width)
+        Returns:
+            int: Coluna encontrada ou -1
+        """
+        if not self._columns:
+            self._build_columns()
+
+        for offset in range(self.HIT_TOLERANCE + 1):
+            for column in (x_pos - offset, x_pos + offset):
+                if 0 <= column < len(self._columns) and self._columns[column]:
+                    return column
+        return -1
+
+    def comments_at(self, x_pos):
+        """Retorna os comentários sob a posição horizontal informada"""
+        column = self.column_at(x_pos)
+        return list(self._columns[column]) if column >= 0 else []
+
+    def mouseMoveEvent(self, event):
+        x_pos = int(event.position().x())
+        column = self.column_at(x_pos)
+        if column != self._hover_column:
+            self._hover_column = column
+            self.update()
+
+        if column < 0:
+            QToolTip.hideText()
+            self.unsetCursor()
+            return
 
-            # Selecionar cor com base no status
-            if comment.is_resolved:
-                color = resolved_color
-            else:
-                color = normal_color
+        self.setCursor(Qt.PointingHandCursor)
+        comments = self._columns[column]
+        lines = [
+            f"{format_video_timestamp(c.video_timestamp)} {c.author}: {c.text}"
+            for c in comments[: self.TOOLTIP_LIMIT]
+        ]
+        if len(comments) > self.TOOLTIP_LIMIT:
+            lines.append(f"+{len(comments) - self.TOOLTIP_LIMIT} comentário(s)")
+        QToolTip.showText(event.globalPosition().toPoint(), "\n".join(lines), self)
 
-            # Desenhar marcador
-            painter.setBrush(QBrush(color))
-            painter.setPen(Qt.NoPen)
+    def leaveEvent(self, event):
+        if self._hover_column >= 0:
+            self._hover_column = -1
+            self.update()
+        super().leaveEvent(event)
 
-            # Desenhar um pequeno retângulo
-            marker_width = 2
-            painter.drawRect(x_pos - marker_width // 2, 0, marker_width, height)
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            comments = self.comments_at(int(event.position().x()))
+            if comments:
+                self.markerClicked.emit(comments[0].video_timestamp)
+                return
+        super().mousePressEvent(event)
@@ -1,5 +1,5 @@
 from PySide6.QtCore import QSize, Qt
-from PySide6.QtGui import QBrush, QColor, QFont, QIcon
+from PySide6.QtGui import QBrush, QColor, QFont
 from PySide6.QtWidgets import (
     QFrame,
     QHBoxLayout,
@@ -15,6 +15,7 @@ from PySide6.QtWidgets import (
 )
 
 import gui.themes.dracula as style
+from gui.utils.icon_provider import get_icon, get_icon_pixmap
 
 
 class DashboardWidget(QWidget):
@@ -31,9 +32,7 @@ class DashboardWidget(QWidget):
 
         # Título
         self.title_label = QLabel("Dashboard")
-        self.title_label.setStyleSheet(
-            f"color: {style.foreground_color}; font-size: 24px; font-weight: bold;"
-        )
+        self.title_label.setProperty("role", "title")
 
         # Adicionar ao layout do cabeçalho
         self.header_layout.addWidget(self.title_label)
@@ -45,22 +44,22 @@ class DashboardWidget(QWidget):
 
         # Eventos próximos
         self.upcoming_events_frame = self.create_stat_card(
-            "Eventos Próximos", "3", style.purple_color, "calendar-active"
+            "Eventos Próximos", "3", "purple", "calendar-active"
         )
 
         # Entregas de hoje
         self.today_deliveries_frame = self.create_stat_card(
-            "Entregas Hoje", "5", style.green_color, "delivery-today"
+            "Entregas Hoje", "5", "green", "delivery-today"
         )
 
         # Pendentes de edição
         self.pending_edits_frame = self.create_stat_card(
-            "Edições Pendentes", "8", style.orange_color, "pending-edit"
+            "Edições Pendentes", "8", "orange", "pending-edit"
         )
 
         # Aprovações pendentes
         self.pending_approvals_frame = self.create_stat_card(
-            "Aprovações Pendentes", "2", style.red_color, "approval"
+            "Aprovações Pendentes", "2", "red", "approval"
         )
 
         # Adicionar cards ao layout
@@ -71,15 +70,7 @@ class DashboardWidget(QWidget):
 
         # Seção de eventos
         self.events_section = QFrame()
-        self.events_section.setStyleSheet(
-            f"""
-            QFrame {{
-                background-color: {style.background_color};
-                border-radius: 8px;
-                border: 1px solid {style.current_line_color};
-            }}
-        """
-        )
+        self.events_section.setProperty("role", "panel")
 
         self.events_layout = QVBoxLayout(self.events_section)
         self.events_layout.setContentsMargins(15, 15, 15, 15)
@@ -88,13 +79,11 @@ class DashboardWidget(QWidget):
         # Cabeçalho de eventos
         self.events_header = QHBoxLayout()
         self.events_title = QLabel("Eventos Recentes")
-        self.events_title.setStyleSheet(
-            f"color: {style.foreground_color}; font-size: 16px; font-weight: bold;"
-        )
+        self.events_title.setProperty("role", "section")
 
         self.view_all_events = QPushButton("Ver Todos")
-        self.view_all_events.setStyleSheet(style.secondary_button_style)
-        self.view_all_events.setIcon(QIcon("./resources/icons/calendar.svg"))
+        self.view_all_events.setProperty("variant", "secondary")
+        self.view_all_events.setIcon(get_icon("calendar"))
         self.view_all_events.setIconSize(QSize(16, 16))
         self.view_all_events.clicked.connect(self.ver_todos_eventos)
 
@@ -115,7 +104,6 @@ class DashboardWidget(QWidget):
         self.events_table.horizontalHeader().setSectionResizeMode(
             3, QHeaderView.ResizeMode.ResizeToContents
         )
-        self.events_table.setStyleSheet(style.table_style)
 
         # Adicionar dados de exemplo
         self.add_sample_events()
@@ -124,15 +112,7 @@ class DashboardWidget(QWidget):
 
         # Seção de tarefas
         self.tasks_section = QFrame()
-        self.tasks_section.setStyleSheet(
-            f"""
-            QFrame {{
-                background-color: {style.background_color};
-                border-radius: 8px;
-                border: 1px solid {style.current_line_color};
-            }}
-        """
-        )
+        self.tasks_section.setProperty("role", "panel")
 
         self.tasks_layout = QVBoxLayout(self.tasks_section)
         self.tasks_layout.setContentsMargins(15, 15, 15, 15)
@@ -141,13 +121,11 @@ class DashboardWidget(QWidget):
         # Cabeçalho de tarefas
         self.tasks_header = QHBoxLayout()
         self.tasks_title = QLabel("Tarefas Pendentes")
-        self.tasks_title.setStyleSheet(
-            f"color: {style.foreground_color}; font-size: 16px; font-weight: bold;"
-        )
+        self.tasks_title.setProperty("role", "section")
 
         self.view_all_tasks = QPushButton("Ver Todas as Tarefas")
-        self.view_all_tasks.setStyleSheet(style.secondary_button_style)
-        self.view_all_tasks.setIcon(QIcon("./resources/icons/document.svg"))
+        self.view_all_tasks.setProperty("variant", "secondary")
+        self.view_all_tasks.setIcon(get_icon("document"))
         self.view_all_tasks.setIconSize(QSize(16, 16))
         self.view_all_tasks.clicked.connect(self.ver_todas_tarefas)
 
@@ -171,7 +149,6 @@ class DashboardWidget(QWidget):
         self.tasks_table.horizontalHeader().setSectionResizeMode(
             3, QHeaderView.ResizeMode.ResizeToContents
         )
-        self.tasks_table.setStyleSheet(style.table_style)
 
         # Adicionar dados de exemplo
         self.add_sample_tasks()
@@ -184,19 +161,11 @@ class DashboardWidget(QWidget):
         self.layout.addWidget(self.events_section)
         self.layout.addWidget(self.tasks_section)
 
-    def create_stat_card(self, title, value, color, icon_name):
+    def create_stat_card(self, title, value, accent, icon_name):
         """Criar um card de estatística"""
 
         frame = QFrame()
-        frame.setStyleSheet(
-            f"""
-            QFrame {{
-                background-color: {style.background_color};
-                border-radius: 8px;
-                border: 1px solid {style.current_line_color};
-            }}
-        """
-        )
+        frame.setProperty("role", "panel")
 
         layout = QVBoxLayout(frame)
         layout.setContentsMargins(15, 15, 15, 15)
@@ -204,13 +173,11 @@ class DashboardWidget(QWidget):
 
         header_layout = QHBoxLayout()
         icon = QLabel()
-        icon.setPixmap(
-            QIcon(f"./resources/icons/{icon_name}.svg").pixmap(QSize(20, 20))
-        )
-        icon.setStyleSheet(f"color: {color};")
+        icon.setPixmap(get_icon_pixmap(icon_name, 20))
+        icon.setProperty("accent", accent)
 
         title_label = QLabel(title)
-        title_label.setStyleSheet(f"color: {style.comment_color}; font-size: 14px;")
+        title_label.setProperty("role", "muted")
 
         header_layout.addWidget(icon)
         header_layout.addWidget(title_label)
@@ -218,25 +185,12 @@ class DashboardWidget(QWidget):
 
         value_label = QLabel(value)
         value_label.setAlignment(Qt.AlignCenter)
-        value_label.setStyleSheet(
-            f"color: {color}; font-size: 36px; font-weight: bold;"
-        )
+        value_label.setProperty("role", "stat")
+        value_label.setProperty("accent", accent)
 
         view_details = QPushButton("Ver Detalhes")
-        view_details.setStyleSheet(
-            f"""
-            QPushButton {{
-                color: {color};
-                background-color: transparent;
-                border: none;
-                text-decoration: underline;
-                font-size: 12px;
-            }}
-            QPushButton:hover {{
-                color: {style.foreground_color};
-            }}
-        """
-        )
+        view_details.setProperty("variant", "link")
+        view_details.setProperty("accent", accent)
         view_details.setCursor(Qt.PointingHandCursor)
         view_details.clicked.connect(lambda: self.ver_detalhes(title))
 
@@ -284,21 +238,21 @@ class DashboardWidget(QWidget):
             actions_layout.setSpacing(5)
 
             view_btn = QPushButton()
-            view_btn.setIcon(QIcon("./resources/icons/view.svg"))
+            view_btn.setIcon(get_icon("view"))
             view_btn.setToolTip("Ver Detalhes")
             view_btn.setIconSize(QSize(16, 16))
             view_btn.setFixedSize(28, 28)
-            view_btn.setStyleSheet(style.secondary_button_style)
+            view_btn.setProperty("variant", "secondary")
             view_btn.clicked.connect(
                 lambda checked=False, t=event[0]: self.ver_detalhes(t)
             )
 
             edit_btn = QPushButton()
-            edit_btn.setIcon(QIcon("./resources/icons/edit.svg"))
+            edit_btn.setIcon(get_icon("edit"))
             edit_btn.setToolTip("Editar")
             edit_btn.setIconSize(QSize(16, 16))
             edit_btn.setFixedSize(28, 28)
-            edit_btn.setStyleSheet(style.secondary_button_style)
+            edit_btn.setProperty("variant", "secondary")
 
             actions_layout.addWidget(view_btn)
             actions_layout.addWidget(edit_btn)
@@ -328,20 +282,6 @@ class DashboardWidget(QWidget):
             # Progresso
             progress_bar = QProgressBar()
             progress_bar.setValue(task[2])
-            progress_bar.setStyleSheet(
-                f"""
-                QProgressBar {{
-                    background-color: {style.current_line_color};
-                    color: {style.foreground_color};
-                    border-radius: 5px;
-                    text-align: center;
-                }}
-                QProgressBar::chunk {{
-                    background-color: {style.purple_color};
-                    border-radius: 5px;
-                }}
-            """
-            )
             self.tasks_table.setCellWidget(row, 2, progress_bar)
 
             # Ações
@@ -351,18 +291,18 @@ class DashboardWidget(QWidget):
             actions_layout.setSpacing(5)
 
             complete_btn = QPushButton()
-            complete_btn.setIcon(QIcon("./resources/icons/check.svg"))
+            complete_btn.setIcon(get_icon("check"))
             complete_btn.setToolTip("Marcar como Concluído")
             complete_btn.setIconSize(QSize(16, 16))
             complete_btn.setFixedSize(28, 28)
-            complete_btn.setStyleSheet(style.secondary_button_style)
+            complete_btn.setProperty("variant", "secondary")
 
             edit_btn = QPushButton()
-            edit_btn.setIcon(QIcon("./resources/icons/edit.svg"))
+            edit_btn.setIcon(get_icon("edit"))
             edit_btn.setToolTip("Editar")
             edit_btn.setIconSize(QSize(16, 16))
             edit_btn.setFixedSize(28, 28)
-            edit_btn.setStyleSheet(style.secondary_button_style)
+            edit_btn.setProperty("variant", "secondary")
 
             actions_layout.addWidget(complete_btn)
             actions_layout.addWidget(edit_btn)
@@ -1,26 +1,103 @@
 from PySide6.QtCore import QSize, Qt
-from PySide6.QtGui import QBrush, QColor, QFont, QIcon  # Adicionado QFont aqui
 from PySide6.QtWidgets import (
     QComboBox,
     QFrame,
     QHBoxLayout,
-    QHeaderView,
     QLabel,
     QProgressBar,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
 
 import gui.themes.dracula as style
+from database.DeliveryRepository import DeliveryRepository
+from gui.utils.icon_provider import get_icon
+from gui.widgets.repository_table_model import (
+    ActionsDelegate,
+    ListPageSource,
+    ProgressDelegate,
+    RepositoryPageSource,
+    RepositoryTableModel,
+    TableColumn,
+    configure_table_view,
+)
+
+STATUS_COLORS = {
+    "Pendente": style.comment_color,
+    "Em andamento": style.orange_color,
+    "Entregue para revisão": style.cyan_color,
+    "Em revisão": style.purple_color,
+    "Aprovada": style.green_color,
+    "Em alteração": style.pink_color,
+    "Concluída": style.green_color,
+    "Atrasada": style.red_color,
+}
+
+# Exibidas enquanto não há entregas cadastradas no banco
+SAMPLE_DELIVERIES = [
+    {
+        "title": "Abertura do evento",
+        "deadline": "Hoje, 18:30",
+        "responsible": "Maria Souza",
+        "status": "Em andamento",
+        "progress": 60,
+    },
+    {
+        "title": "Entrevista com artista principal",
+        "deadline": "Hoje, 19:45",
+        "responsible": "Pedro Alves",
+        "status": "Entregue para revisão",
+        "progress": 90,
+    },
+    {
+        "title": "Patrocinador A - Ativação",
+        "deadline": "Hoje, 20:00",
+        "responsible": "Maria Souza",
+        "status": "Atrasada",
+        "progress": 30,
+    },
+    {
+        "title": "Teaser final",
+        "deadline": "Hoje, 22:30",
+        "responsible": "Pedro Alves",
+        "status": "Pendente",
+        "progress": 0,
+    },
+    {
+        "title": "Aftermovie",
+        "deadline": "25 Mai, 18:00",
+        "responsible": "Maria Souza",
+        "status": "Pendente",
+        "progress": 10,
+    },
+    {
+        "title": "Melhores momentos",
+        "deadline": "26 Mai, 12:00",
+        "responsible": "Pedro Alves",
+        "status": "Pendente",
+        "progress": 0,
+    },
+]
+
+
+def progress_color(delivery, progress):
+    """Cor da barra de progresso de uma entrega"""
+    if progress >= 100:
+        return style.green_color
+    if delivery and delivery.get("status") == "Atrasada":
+        return style.red_color
+    return style.purple_color
 
 
 class DeliveryWidget(QWidget):
     def __init__(self):
         super().__init__()
 
+        # Repositório
+        self.delivery_repository = DeliveryRepository()
+
         # Layout principal
         self.layout = QVBoxLayout(self)
         self.layout.setContentsMargins(20, 20, 20, 20)
@@ -50,10 +127,11 @@ class DeliveryWidget(QWidget):
 
         # Refresh button
         self.refresh_button = QPushButton()
-        self.refresh_button.setIcon(QIcon("./resources/icons/refresh.svg"))
+        self.refresh_button.setIcon(get_icon("refresh"))
         self.refresh_button.setIconSize(QSize(16, 16))
         self.refresh_button.setFixedSize(36, 36)
         self.refresh_button.setStyleSheet(style.secondary_button_style)
+        self.refresh_button.clicked.connect(self.load_deliveries)
 
         # Adicionar ao layout do cabeçalho
         self.header_layout.addWidget(self.title_label)
@@ -219,25 +297,39 @@ class DeliveryWidget(QWidget):
         self.filter_layout.addWidget(self.responsible_filter)
         self.filter_layout.addStretch()
 
-        # Tabela de entregas
-        self.deliveries_table = QTableWidget()
-        self.deliveries_table.setColumnCount(6)
-        self.deliveries_table.setHorizontalHeaderLabels(
-            ["Entrega", "Prazo", "Responsável", "Status", "Progresso", "Ações"]
+        # Tabela de entregas (paginada e ordenada pelo banco de dados)
+        self.deliveries_model = RepositoryTableModel(
+            [
+                TableColumn("title", "Entrega"),
+                TableColumn("deadline", "Prazo"),
+                TableColumn("responsible", "Responsável", sortable=False),
+                TableColumn("status", "Status", colors=STATUS_COLORS, bold=True),
+                TableColumn("progress", "Progresso"),
+                TableColumn("actions", "Ações", sortable=False),
+            ],
+            parent=self,
         )
-        self.deliveries_table.horizontalHeader().setSectionResizeMode(
-            0, QHeaderView.ResizeMode.Stretch
+        self.deliveries_table = QTableView()
+        self.deliveries_table.setStyleSheet(style.table_style)
+        self.deliveries_table.setItemDelegateForColumn(
+            4, ProgressDelegate(progress_color, self.deliveries_table)
         )
-        self.deliveries_table.horizontalHeader().setSectionResizeMode(
-            4, QHeaderView.ResizeMode.Stretch
+        self.deliveries_table.setItemDelegateForColumn(
+            5,
+            ActionsDelegate(
+                [("view", "view", "Ver Detalhes"), ("edit", "edit", "Editar")],
+                self.deliveries_table,
+            ),
         )
-        self.deliveries_table.horizontalHeader().setSectionResizeMode(
-            5, QHeaderView.ResizeMode.ResizeToContents
+        configure_table_view(
+            self.deliveries_table,
+            self.deliveries_model,
+            stretch_columns=(0, 4),
+            sort_column=(1, Qt.AscendingOrder),
         )
-        self.deliveries_table.setStyleSheet(style.table_style)
 
-        # Adicionar algumas entregas de exemplo
-        self.add_sample_deliveries()
+        # Carregar entregas
+        self.load_deliveries()
 
         # Progresso geral
         self.overall_layout = QHBoxLayout()
@@ -282,119 +374,14 @@ class DeliveryWidget(QWidget):
         self.layout.addWidget(self.deliveries_table)
         self.layout.addLayout(self.overall_layout)
 
-    def add_sample_deliveries(self):
-        # Status colors
-        status_colors = {
-            "Pendente": style.comment_color,
-            "Em andamento": style.orange_color,
-            "Entregue para revisão": style.cyan_color,
-            "Em revisão": style.purple_color,
-            "Aprovada": style.green_color,
-            "Em alteração": style.pink_color,
-            "Concluída": style.green_color,
-            "Atrasada": style.red_color,
-        }
-
-        # Dados de exemplo
-        deliveries = [
-            [
-                "Abertura do evento",
-                "Hoje, 18:30",
-                "Maria Souza",
-                "Em andamento",
-                60,
-            ],
-            [
-                "Entrevista com artista principal",
-                "Hoje, 19:45",
-                "Pedro Alves",
-                "Entregue para revisão",
-                90,
-            ],
-            [
-                "Patrocinador A - Ativação",
-                "Hoje, 20:00",
-                "Maria Souza",
-                "Atrasada",
-                30,
-            ],
-            ["Teaser final", "Hoje, 22:30", "Pedro Alves", "Pendente", 0],
-            ["Aftermovie", "25 Mai, 18:00", "Maria Souza", "Pendente", 10],
-            [
-                "Melhores momentos",
-                "26 Mai, 12:00",
-                "Pedro Alves",
-                "Pendente",
-                0,
-            ],
-        ]
-
-        self.deliveries_table.setRowCount(len(deliveries))
-
-        for row, delivery in enumerate(deliveries):
-            # Nome da entrega
-            self.deliveries_table.setItem(row, 0, QTableWidgetItem(delivery[0]))
-
-            # Prazo
-            self.deliveries_table.setItem(row, 1, QTableWidgetItem(delivery[1]))
-
-            # Responsável
-            self.deliveries_table.setItem(row, 2, QTableWidgetItem(delivery[2]))
-
-            # Status
-            status_item = QTableWidgetItem(delivery[3])
-            status_color = status_colors.get(delivery[3], style.comment_color)
-            status_item.setForeground(QBrush(QColor(status_color)))
-            status_item.setFont(QFont("Arial", 9, QFont.Bold))
-            self.deliveries_table.setItem(row, 3, status_item)
-
-            # Progresso
-            progress_bar = QProgressBar()
-            progress_bar.setValue(delivery[4])
-            progress_bar.setFixedHeight(15)
-            progress_color = style.purple_color
-            if delivery[4] >= 100:
-                progress_color = style.green_color
-            elif delivery[3] == "Atrasada":
-                progress_color = style.red_color
-
-            progress_bar.setStyleSheet(
-                f"""
-                QProgressBar {{
-                    background-color: {style.current_line_color};
-                    border-radius: 6px;
-                    text-align: center;
-                    color: transparent;
-                }}
-                QProgressBar::chunk {{
-                    background-color: {progress_color};
-                    border-radius: 6px;
-                }}
-            """
+    def load_deliveries(self):
+        """Carrega as entregas do banco, ou as de exemplo se ainda não houver"""
+        if self.delivery_repository.count():
+            source = RepositoryPageSource(
+                self.delivery_repository.count,
+                self.delivery_repository.get_page,
+                self.delivery_repository.get_by_id,
             )
-
-            self.deliveries_table.setCellWidget(row, 4, progress_bar)
-
-            # Ações
-            actions_layout = QHBoxLayout()
-            actions_layout.setContentsMargins(5, 0, 5, 0)
-            actions_layout.setSpacing(5)
-
-            view_btn = QPushButton()
-            view_btn.setIcon(QIcon("./resources/icons/view.svg"))
-            view_btn.setIconSize(QSize(16, 16))
-            view_btn.setFixedSize(28, 28)
-            view_btn.setStyleSheet(style.secondary_button_style)
-
-            edit_btn = QPushButton()
-            edit_btn.setIcon(QIcon("./resources/icons/edit.svg"))
-            edit_btn.setIconSize(QSize(16, 16))
-            edit_btn.setFixedSize(28, 28)
-            edit_btn.setStyleSheet(style.secondary_button_style)
-
-            actions_layout.addWidget(view_btn)
-            actions_layout.addWidget(edit_btn)
-
-            actions_widget = QWidget()
-            actions_widget.setLayout(actions_layout)
-            self.deliveries_table.setCellWidget(row, 5, actions_widget)
+        else:
+            source = ListPageSource(SAMPLE_DELIVERIES)
+        self.deliveries_model.set_source(source)
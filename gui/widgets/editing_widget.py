@@ -4,9 +4,10 @@ import os
 import uuid
 
 from PySide6.QtCore import QPoint, QSize, Qt, QTimer, QUrl, Signal
-from PySide6.QtGui import QIcon, QPixmap
+from PySide6.QtGui import QPixmap
 from PySide6.QtMultimedia import QMediaPlayer
 from PySide6.QtWidgets import (
+    QAbstractItemView,
     QApplication,
     QComboBox,
     QFileDialog,
@@ -15,11 +16,12 @@ from PySide6.QtWidgets import (
     QInputDialog,
     QLabel,
     QLineEdit,
+    QListView,
     QListWidget,
     QListWidgetItem,
     QMessageBox,
+    QProgressDialog,
     QPushButton,
-    QScrollArea,
     QSlider,
     QSplitter,
     QTableWidget,
@@ -32,12 +34,23 @@ from PySide6.QtWidgets import (
 import gui.themes.dracula as style
 from database.CommentRepository import CommentRepository
 from database.models import comment_model
+from database.models.comment_model import Comment
 from database.VideoRepository import VideoRepository
-from gui.widgets.comment_item import CommentItem
+from gui.utils.comment_index import CommentTimeIndex
+from gui.utils.export_worker import CommentExportWorker
+from gui.utils.icon_provider import get_icon
+from gui.widgets.comment_list_model import (
+    CommentFilterProxyModel,
+    CommentItemDelegate,
+    CommentListModel,
+)
 from gui.widgets.comment_marker_widget import CommentMarkerWidget
+from gui.widgets.load_comments_function import load_comments
 from gui.widgets.player_component import VideoPlayerComponent
 from gui.widgets.version_info_widget import VersionInfoWidget
-from utils.exporters import CommentExporter
+from utils.logger import get_logger
+
+logger = get_logger("editing_widget")
 
 # Definindo estilos de botão que possam estar faltando no módulo de temas
 if not hasattr(style, "btn_primary"):
@@ -111,6 +124,13 @@ if not hasattr(style, "BG_FOUR"):
 class EditingWidget(QWidget):
     """Widget para gerenciar edições de vídeo"""
 
+    # Janela (ms) em torno da posição do vídeo em que um comentário fica ativo
+    COMMENT_SYNC_WINDOW_MS = 2000
+    # Intervalo (ms) da sincronização durante a reprodução (~25 quadros/s)
+    COMMENT_SYNC_INTERVAL_MS = 40
+
+    load_comments = load_comments
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
@@ -122,7 +142,14 @@ class EditingWidget(QWidget):
         self.current_user = None
         self.current_event = None
         self.current_editing = None
-        self.comment_items = []
+        # Exportação de comentários em andamento (CommentExportWorker)
+        self._export_worker = None
+
+        # Comentários ordenados por posição no vídeo, expostos à lista por
+        # um modelo (sem um widget por comentário)
+        self.comment_index = CommentTimeIndex()
+        self.comment_model = CommentListModel(self.comment_index, self)
+        self.active_comment_ids = set()
 
         # Inicializar interface
         self.init_ui()
@@ -189,6 +216,7 @@ class EditingWidget(QWidget):
 
         # Widget de marcadores de comentários
         self.comment_markers = CommentMarkerWidget()
+        self.comment_markers.markerClicked.connect(self.go_to_comment)
 
         # Layout do player e marcadores
         player_layout = QVBoxLayout()
@@ -204,9 +232,7 @@ class EditingWidget(QWidget):
 
         # Botão de tela cheia
         self.fullscreen_btn = QPushButton()
-        self.fullscreen_btn.setIcon(
-            QIcon(os.path.join("resources", "icons", "fullscreen.svg"))
-        )
+        self.fullscreen_btn.setIcon(get_icon("fullscreen"))
         self.fullscreen_btn.setToolTip("Visualizar em tela cheia")
         self.fullscreen_btn.setFixedSize(32, 32)
         self.fullscreen_btn.setStyleSheet(style.btn_secondary)
@@ -255,12 +281,26 @@ class EditingWidget(QWidget):
         self.comments_widget = QWidget()
         comments_layout = QVBoxLayout(self.comments_widget)
 
-        # Área de rolagem para comentários
-        self.comments_scroll = QScrollArea()
-        self.comments_scroll.setWidgetResizable(True)
-        self.comments_scroll_content = QWidget()
-        self.comments_layout = QVBoxLayout(self.comments_scroll_content)
-        self.comments_scroll.setWidget(self.comments_scroll_content)
+        # Lista de comentários (modelo + proxy de filtro + delegate)
+        self.comment_proxy = CommentFilterProxyModel(self)
+        self.comment_proxy.setSourceModel(self.comment_model)
+
+        self.comments_view = QListView()
+        self.comments_view.setModel(self.comment_proxy)
+        self.comments_view.setSelectionMode(QAbstractItemView.NoSelection)
+        self.comments_view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.comments_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.comments_view.setResizeMode(QListView.Adjust)
+        self.comments_view.setLayoutMode(QListView.Batched)
+        self.comments_view.setMouseTracking(True)
+        self.comments_view.setStyleSheet(
+            "QListView { background-color: transparent; border: none; }"
+        )
+
+        self.comment_delegate = CommentItemDelegate(self.comments_view)
+        self.comment_delegate.goToTimestampRequested.connect(self.go_to_comment)
+        self.comment_delegate.resolveRequested.connect(self.resolve_comment)
+        self.comments_view.setItemDelegate(self.comment_delegate)
 
         # Área para adicionar comentários
         self.comment_text = QTextEdit()
@@ -314,21 +354,29 @@ class EditingWidget(QWidget):
         self.show_pending_btn.setStyleSheet(style.btn_secondary)
         self.show_pending_btn.setCursor(Qt.PointingHandCursor)
 
+        # Busca por autor ou texto do comentário
+        self.comment_search = QLineEdit()
+        self.comment_search.setPlaceholderText("Buscar comentários...")
+        self.comment_search.setStyleSheet(style.input_style)
+        self.comment_search.setClearButtonEnabled(True)
+
         # Conectar sinais
         self.show_resolved_btn.clicked.connect(self.update_comment_filters)
         self.show_pending_btn.clicked.connect(self.update_comment_filters)
+        self.comment_search.textChanged.connect(self.comment_proxy.set_search_text)
 
         filter_layout.addWidget(filter_label)
         filter_layout.addWidget(self.show_resolved_btn)
         filter_layout.addWidget(self.show_pending_btn)
         filter_layout.addStretch()
+        filter_layout.addWidget(self.comment_search)
 
         comments_controls.addWidget(self.comment_text)
         comments_controls.addWidget(self.add_comment_btn)
 
         comments_layout.addLayout(comments_controls)
         comments_layout.addLayout(filter_layout)  # Adicionando os filtros
-        comments_layout.addWidget(self.comments_scroll)
+        comments_layout.addWidget(self.comments_view)
         comments_layout.addWidget(self.export_comments_btn)
 
         # Tab 2: Entregas
@@ -530,7 +578,7 @@ class EditingWidget(QWidget):
         """Manipulador para quando o editor selecionado muda"""
         # Versão simplificada do método para evitar mais erros
         if index >= 0:
-            print(f"Editor alterado para índice: {index}")
+            logger.debug(f"Editor alterado para índice: {index}")
             # Aqui seria implementada a lógica para carregar os dados do editor selecionado
 
     # Demais métodos continuam inalterados
@@ -540,13 +588,16 @@ class EditingWidget(QWidget):
     def setup_video_sync(self):
         """Configura a sincronização entre vídeo e comentários"""
         self.sync_timer = QTimer(self)
-        self.sync_timer.setInterval(1000)  # 1 segundo
+        self.sync_timer.setInterval(self.COMMENT_SYNC_INTERVAL_MS)
         self.sync_timer.timeout.connect(self.check_comment_sync)
 
-        # Conectar ao estado de reprodução
-        self.video_player.mediaPlayer.playbackStateChanged.connect(
+        # Conectar à posição (saltos) e ao estado de reprodução
+        self.video_player.mediaPlayer.positionChanged.connect(
             self.handle_playback_change
         )
+        self.video_player.mediaPlayer.playbackStateChanged.connect(
+            self.handle_playback_state_change
+        )
 
         # Conectar à mudança de duração para atualizar marcadores de comentários
         self.video_player.mediaPlayer.durationChanged.connect(
@@ -634,21 +685,74 @@ class EditingWidget(QWidget):
         return None
 
     def add_comment(self):
-        """Método temporário para adicionar comentários"""
-        QMessageBox.information(
-            self,
-            "Funcionalidade em Desenvolvimento",
-            "A funcionalidade de adicionar comentários está em desenvolvimento. Em breve estará disponível!",
+        """Adiciona um comentário na posição atual do vídeo"""
+        text = self.comment_text.toPlainText().strip()
+        if not text:
+            return
+
+        edit_id = self.current_editing.get("id") if self.current_editing else None
+        if not edit_id:
+            QMessageBox.information(
+                self,
+                "Adicionar Comentário",
+                "Selecione uma edição antes de adicionar comentários.",
+            )
+            return
+
+        user = self.current_user or {}
+        comment = Comment(
+            text=text,
+            author=user.get("id", ""),
+            video_timestamp=self.video_player.getCurrentTime(),
         )
 
+        try:
+            self.comment_repository.add_comment(comment, edit_id)
+        except Exception as e:
+            QMessageBox.critical(
+                self, "Erro", f"Não foi possível adicionar o comentário: {str(e)}"
+            )
+            return
+
+        # Exibir o nome do autor, como nos comentários carregados do banco
+        comment.author = user.get("name") or user.get("username") or comment.author
+
+        # Inserção incremental no índice e na lista, na posição do vídeo
+        self.comment_model.add_comment(comment)
+        self.comment_markers.set_comments(list(self.comment_index))
+        self.comment_text.clear()
+
+        self.update_active_comments(self.video_player.getCurrentTime(), force=True)
+
+    def resolve_comment(self, comment_id):
+        """Marca um comentário como resolvido"""
+        try:
+            if not self.comment_repository.resolve_comment(comment_id):
+                return
+        except Exception as e:
+            QMessageBox.critical(
+                self, "Erro", f"Não foi possível resolver o comentário: {str(e)}"
+            )
+            return
+
+        # Atualiza apenas a linha do comentário (o proxy refaz o filtro dela)
+        self.comment_model.set_resolved(comment_id)
+        proxy_index = self._comment_proxy_index(comment_id)
+        if proxy_index.isValid():
+            self.comment_delegate.sizeHintChanged.emit(proxy_index)
+        self.comment_markers.set_comments(list(self.comment_index))
+
     def export_comments(self):
         """Exporta os comentários da edição atual para um arquivo"""
+        edit_id = self.current_editing.get("id") if self.current_editing else None
+        total, resolved = (
+            self.comment_repository.count_comments_by_editing(edit_id)
+            if edit_id
+            else (0, 0)
+        )
+
         # Verificar se existem comentários para exportar
-        if (
-            not hasattr(self, "comment_items")
-            or not self.comment_items
-            or len(self.comment_items) == 0
-        ):
+        if not total:
             QMessageBox.information(
                 self,
                 "Exportar Comentários",
@@ -656,14 +760,16 @@ class EditingWidget(QWidget):
             )
             return
 
-        # Obter lista de comentários
-        comments = []
-        for item in self.comment_items:
-            if item and hasattr(item, "comment"):
-                comments.append(item.comment)
+        if self._export_worker is not None:
+            QMessageBox.information(
+                self,
+                "Exportar Comentários",
+                "Já existe uma exportação em andamento.",
+            )
+            return
 
         # Diálogo para escolher o formato e local do arquivo
-        formats = ["JSON (*.json)", "PDF (*.pdf)"]
+        formats = ["JSON (*.json)", "CSV (*.csv)", "PDF (*.pdf)"]
         selected_format, _ = QInputDialog.getItem(
             self,
             "Exportar Comentários",
@@ -677,7 +783,7 @@ class EditingWidget(QWidget):
             return
 
         # Definir extensão do arquivo
-        extension = ".json" if "JSON" in selected_format else ".pdf"
+        extension = "." + selected_format.split()[0].lower()
 
         # Diálogo para escolher onde salvar o arquivo
         file_name, _ = QFileDialog.getSaveFileName(
@@ -692,45 +798,64 @@ class EditingWidget(QWidget):
 
         # Obter metadados da edição
         metadata = {
-            "título_edição": (
-                "Edição sem título"
-                if not hasattr(self, "current_editing")
-                else self.current_editing.get("title", "Sem título")
-            ),
-            "total_comentários": len(comments),
-            "comentários_resolvidos": sum(1 for c in comments if c.is_resolved),
+            "título_edição": self.current_editing.get("title", "Sem título"),
+            "total_comentários": total,
+            "comentários_resolvidos": resolved,
         }
 
-        # Exportar com base no formato selecionado
-        success = False
-        if extension == ".json":
-            success = CommentExporter.export_to_json(comments, file_name, metadata)
-        else:
-            success = CommentExporter.export_to_pdf(
-                comments, file_name, "Comentários da Edição", metadata
-            )
+        # Os comentários são lidos do banco em lotes e gravados pelo worker,
+        # sem passar pela lista exibida
+        worker = CommentExportWorker(
+            lambda: CommentRepository().iter_comments_by_editing(edit_id),
+            file_name,
+            extension.lstrip("."),
+            metadata,
+            "Comentários da Edição",
+            total,
+        )
 
-        # Notificar o usuário sobre o resultado
-        if success:
+        progress = QProgressDialog(
+            "Exportando comentários...", "Cancelar", 0, total, self
+        )
+        progress.setWindowTitle("Exportar Comentários")
+        progress.setWindowModality(Qt.WindowModal)
+        progress.setMinimumDuration(500)
+        progress.canceled.connect(worker.cancel)
+        worker.signals.progress.connect(lambda count, _: progress.setValue(count))
+
+        def finish():
+            self._export_worker = None
+            progress.reset()
+            progress.deleteLater()
+
+        def on_finished(path, count):
+            finish()
             QMessageBox.information(
                 self,
                 "Exportar Comentários",
-                f"Comentários exportados com sucesso para:\n{file_name}",
+                f"{count} comentários exportados com sucesso para:\n{path}",
             )
-        else:
+
+        def on_failed(message):
+            finish()
             QMessageBox.critical(
                 self,
                 "Erro na Exportação",
-                f"Não foi possível exportar os comentários para {file_name}.",
+                f"Não foi possível exportar os comentários para {file_name}.\n"
+                f"{message}",
             )
 
+        worker.signals.finished.connect(on_finished)
+        worker.signals.failed.connect(on_failed)
+        worker.signals.cancelled.connect(finish)
+
+        self._export_worker = worker
+        worker.start()
+
     def update_comment_filters(self):
         """Atualiza os filtros de exibição de comentários"""
-        # Versão simplificada do método para evitar mais erros
-        QMessageBox.information(
-            self,
-            "Filtros de Comentários",
-            "A funcionalidade de filtros de comentários está em implementação.",
+        self.comment_proxy.set_filters(
+            self.show_resolved_btn.isChecked(), self.show_pending_btn.isChecked()
         )
 
     def add_new_delivery(self):
@@ -771,32 +896,64 @@ class EditingWidget(QWidget):
 
     def check_comment_sync(self):
         """Verifica e atualiza a sincronização dos comentários com o vídeo"""
-        # Implementação simplificada
-        if (
-            hasattr(self, "video_player")
-            and self.video_player
-            and hasattr(self, "comment_items")
-        ):
-            current_position = self.video_player.getCurrentTime()
-            print(f"Verificando sincronização na posição: {current_position}")
-            # Aqui seria implementada a lógica para sincronizar os comentários
+        if hasattr(self, "video_player") and self.video_player:
+            self.update_active_comments(self.video_player.getCurrentTime())
 
     def handle_playback_change(self, position):
         """Manipulador para quando a posição do vídeo muda"""
-        # Implementação simplificada
-        print(f"Posição atualizada: {position} ms")
-        # Aqui seria implementada a lógica para atualizar a interface com a posição atual
+        self.update_active_comments(position)
+
+    def handle_playback_state_change(self, state):
+        """Sincroniza os comentários continuamente apenas durante a reprodução"""
+        if state == QMediaPlayer.PlaybackState.PlayingState:
+            self.sync_timer.start()
+        else:
+            self.sync_timer.stop()
+            self.check_comment_sync()
+
+    def update_active_comments(self, position, force=False):
+        """
+        Destaca os comentários próximos da posição atual do vídeo.
+
+        A busca usa o índice temporal (busca binária); apenas as linhas que
+        entram ou saem do conjunto de comentários ativos são redesenhadas.
+        """
+        active = self.comment_index.around(position, self.COMMENT_SYNC_WINDOW_MS)
+        active_ids = {comment.id for comment in active}
+        if active_ids == self.active_comment_ids and not force:
+            return
+
+        self.comment_model.set_active_ids(active_ids)
+        self.active_comment_ids = active_ids
+
+        # Rolar até o comentário ativo mais próximo da posição
+        if active:
+            nearest = min(active, key=lambda c: abs(c.video_timestamp - position))
+            proxy_index = self._comment_proxy_index(nearest.id)
+            if proxy_index.isValid():
+                self.comments_view.scrollTo(proxy_index)
+
+    def _comment_proxy_index(self, comment_id):
+        """Retorna o índice do comentário na lista filtrada, carregando-o se preciso"""
+        row = self.comment_model.row_of(comment_id)
+        if row >= 0:
+            self.comment_model.ensure_loaded(row)
+        return self.comment_proxy.mapFromSource(self.comment_model.index(row))
+
+    def go_to_comment(self, position):
+        """Leva o vídeo até a posição de um comentário e o destaca"""
+        self.video_player.jumpToPosition(position)
+        self.update_active_comments(position, force=True)
 
     def handle_duration_change(self, duration):
         """Manipulador para quando a duração do vídeo muda"""
         # Implementação simplificada
         if hasattr(self, "comment_markers") and self.comment_markers:
             self.comment_markers.set_duration(duration)
-            print(f"Duração do vídeo atualizada: {duration} ms")
 
     def load_video_edits(self, event_id):
         """Versão simplificada para carregar edições de vídeo"""
-        print(f"Carregando edições para o evento: {event_id}")
+        logger.debug(f"Carregando edições para o evento: {event_id}")
 
         # Exibir mensagem de funcionalidade em implementação
         QMessageBox.information(
@@ -828,10 +985,10 @@ class EditingWidget(QWidget):
                     url = QUrl.fromLocalFile(os.path.abspath(video_path))
                     self.video_player.setSource(url)
                 else:
-                    print(f"Arquivo de vídeo não encontrado: {video_path}")
+                    logger.warning(f"Arquivo de vídeo não encontrado: {video_path}")
 
             # Carregar comentários
             self.load_comments()
 
         except Exception as e:
-            print(f"Erro ao carregar dados da edição: {str(e)}")
+            logger.error(f"Erro ao carregar dados da edição: {str(e)}")
@@ -4,7 +4,7 @@ import os
 import uuid
 
 from PySide6.QtCore import QPoint, QSize, Qt, QTimer, QUrl, Signal
-from PySide6.QtGui import QIcon, QPixmap
+from PySide6.QtGui import QPixmap
 from PySide6.QtMultimedia import QMediaPlayer
 from PySide6.QtWidgets import (
     QApplication,
@@ -33,11 +33,15 @@ import gui.themes.dracula as style
 from database.CommentRepository import CommentRepository
 from database.models import comment_model
 from database.VideoRepository import VideoRepository
+from gui.utils.icon_provider import get_icon
 from gui.widgets.comment_item import CommentItem
 from gui.widgets.comment_marker_widget import CommentMarkerWidget
 from gui.widgets.player_component import VideoPlayerComponent
 from gui.widgets.version_info_widget import VersionInfoWidget
 from utils.exporters import CommentExporter
+from utils.logger import get_logger
+
+logger = get_logger("editing_widget")
 
 # Definindo estilos de botão que possam estar faltando no módulo de temas
 if not hasattr(style, "btn_primary"):
@@ -204,9 +208,7 @@ class EditingWidget(QWidget):
 
         # Botão de tela cheia
         self.fullscreen_btn = QPushButton()
-        self.fullscreen_btn.setIcon(
-            QIcon(os.path.join("resources", "icons", "fullscreen.svg"))
-        )
+        self.fullscreen_btn.setIcon(get_icon("fullscreen"))
         self.fullscreen_btn.setToolTip("Visualizar em tela cheia")
         self.fullscreen_btn.setFixedSize(32, 32)
         self.fullscreen_btn.setStyleSheet(style.btn_secondary)
@@ -530,7 +532,7 @@ class EditingWidget(QWidget):
         """Manipulador para quando o editor selecionado muda"""
         # Versão simplificada do método para evitar mais erros
         if index >= 0:
-            print(f"Editor alterado para índice: {index}")
+            logger.debug(f"Editor alterado para índice: {index}")
             # Aqui seria implementada a lógica para carregar os dados do editor selecionado
 
     # Demais métodos continuam inalterados
@@ -778,13 +780,13 @@ class EditingWidget(QWidget):
             and hasattr(self, "comment_items")
         ):
             current_position = self.video_player.getCurrentTime()
-            print(f"Verificando sincronização na posição: {current_position}")
+            logger.debug(f"Verificando sincronização na posição: {current_position}")
             # Aqui seria implementada a lógica para sincronizar os comentários
 
     def handle_playback_change(self, position):
         """Manipulador para quando a posição do vídeo muda"""
         # Implementação simplificada
-        print(f"Posição atualizada: {position} ms")
+        logger.debug("Posição atualizada: %s ms", position)
         # Aqui seria implementada a lógica para atualizar a interface com a posição atual
 
     def handle_duration_change(self, duration):
@@ -792,11 +794,11 @@ class EditingWidget(QWidget):
         # Implementação simplificada
         if hasattr(self, "comment_markers") and self.comment_markers:
             self.comment_markers.set_duration(duration)
-            print(f"Duração do vídeo atualizada: {duration} ms")
+            logger.debug(f"Duração do vídeo atualizada: {duration} ms")
 
     def load_video_edits(self, event_id):
         """Versão simplificada para carregar edições de vídeo"""
-        print(f"Carregando edições para o evento: {event_id}")
+        logger.debug(f"Carregando edições para o evento: {event_id}")
 
         # Exibir mensagem de funcionalidade em implementação
         QMessageBox.information(
@@ -828,10 +830,10 @@ class EditingWidget(QWidget):
                     url = QUrl.fromLocalFile(os.path.abspath(video_path))
                     self.video_player.setSource(url)
                 else:
-                    print(f"Arquivo de vídeo não encontrado: {video_path}")
+                    logger.warning(f"Arquivo de vídeo não encontrado: {video_path}")
 
             # Carregar comentários
             self.load_comments()
 
         except Exception as e:
-            print(f"Erro ao carregar dados da edição: {str(e)}")
+            logger.error(f"Erro ao carregar dados da edição: {str(e)}")
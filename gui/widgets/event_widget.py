@@ -1,28 +1,101 @@
-from PySide6.QtCore import QDate, QSize, Qt
-from PySide6.QtGui import QBrush, QColor, QIcon
+import sqlite3
+from datetime import datetime
+
+from PySide6.QtCore import QDate, Qt
 from PySide6.QtWidgets import (
     QComboBox,
     QDateEdit,
     QFrame,
     QHBoxLayout,
-    QHeaderView,
     QLabel,
     QLineEdit,
     QMessageBox,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
 
 import gui.themes.dracula as style
+from database.EventRepository import EventRepository
+from database.TeamRepository import TeamRepository
+from gui.utils.icon_provider import get_icon
+from gui.widgets.repository_table_model import (
+    ActionsDelegate,
+    ListPageSource,
+    RepositoryPageSource,
+    RepositoryTableModel,
+    TableColumn,
+    configure_table_view,
+)
+from gui.widgets.search_filter_proxy import SearchFilterProxyModel
+
+STATUS_COLORS = {
+    "Em planejamento": style.cyan_color,
+    "Confirmado": style.purple_color,
+    "Em andamento": style.orange_color,
+    "Concluído": style.green_color,
+    "Cancelado": style.red_color,
+}
+
+# Exibidos enquanto não há eventos cadastrados no banco
+SAMPLE_EVENTS = [
+    {
+        "name": "Festival de Música",
+        "date": "18-20 Mai 2025",
+        "location": "Arena São Paulo",
+        "client": "Empresa ABC",
+        "status": "Em planejamento",
+    },
+    {
+        "name": "Lançamento de Produto",
+        "date": "25 Mai 2025",
+        "location": "Centro de Convenções",
+        "client": "XYZ Corp",
+        "status": "Confirmado",
+    },
+    {
+        "name": "Conferência Tech",
+        "date": "01 Jun 2025",
+        "location": "Hotel Grand",
+        "client": "Tech Solutions",
+        "status": "Em planejamento",
+    },
+    {
+        "name": "Treinamento Corporativo",
+        "date": "15 Jun 2025",
+        "location": "Sede da Empresa",
+        "client": "Consultoria DEF",
+        "status": "Confirmado",
+    },
+    {
+        "name": "Premiação Anual",
+        "date": "30 Jun 2025",
+        "location": "Teatro Municipal",
+        "client": "Associação GHI",
+        "status": "Em planejamento",
+    },
+]
+
+
+def format_event_date(value, row=None):
+    """Exibe datas ISO (AAAA-MM-DD) como DD/MM/AAAA; outros textos sem alteração"""
+    if not value:
+        return ""
+    try:
+        return datetime.strptime(str(value)[:10], "%Y-%m-%d").strftime("%d/%m/%Y")
+    except ValueError:
+        return str(value)
 
 
 class EventWidget(QWidget):
     def __init__(self):
         super().__init__()
 
+        # Repositórios
+        self.event_repository = EventRepository()
+        self.team_repository = TeamRepository()
+
         # Layout principal
         self.layout = QVBoxLayout(self)
         self.layout.setContentsMargins(20, 20, 20, 20)
@@ -39,7 +112,7 @@ class EventWidget(QWidget):
 
         # Botão Novo Evento
         self.new_event_button = QPushButton("Novo Evento")
-        self.new_event_button.setIcon(QIcon("./resources/icons/add-event.svg"))
+        self.new_event_button.setIcon(get_icon("add-event"))
         self.new_event_button.setStyleSheet(style.button_style)
         self.new_event_button.setFixedHeight(36)
         self.new_event_button.clicked.connect(self.criar_novo_evento)
@@ -101,7 +174,7 @@ class EventWidget(QWidget):
 
         # Botão de busca
         self.search_button = QPushButton()
-        self.search_button.setIcon(QIcon("./resources/icons/search.svg"))
+        self.search_button.setIcon(get_icon("search"))
         self.search_button.setFixedSize(36, 36)
         self.search_button.setStyleSheet(style.secondary_button_style)
 
@@ -116,34 +189,50 @@ class EventWidget(QWidget):
         self.filter_layout.addWidget(self.search_input)
         self.filter_layout.addWidget(self.search_button)
 
-        # Tabela de eventos
-        self.events_table = QTableWidget()
-        self.events_table.setColumnCount(6)
-        self.events_table.setHorizontalHeaderLabels(
-            ["Nome do Evento", "Data", "Local", "Cliente", "Status", "Ações"]
-        )
-        self.events_table.horizontalHeader().setSectionResizeMode(
-            0, QHeaderView.ResizeMode.Stretch
-        )
-        self.events_table.horizontalHeader().setSectionResizeMode(
-            1, QHeaderView.ResizeMode.ResizeToContents
-        )
-        self.events_table.horizontalHeader().setSectionResizeMode(
-            2, QHeaderView.ResizeMode.ResizeToContents
+        # Tabela de eventos (paginada e ordenada pelo banco de dados)
+        self.events_model = RepositoryTableModel(
+            [
+                TableColumn("name", "Nome do Evento"),
+                TableColumn("date", "Data", formatter=format_event_date),
+                TableColumn("location", "Local"),
+                TableColumn("client", "Cliente"),
+                TableColumn("status", "Status", colors=STATUS_COLORS),
+                TableColumn("actions", "Ações", sortable=False),
+            ],
+            parent=self,
         )
-        self.events_table.horizontalHeader().setSectionResizeMode(
-            3, QHeaderView.ResizeMode.ResizeToContents
+        # Busca por nome, local, cliente e status; filtros por tipo e status
+        self.events_proxy = SearchFilterProxyModel(search_columns=[0, 2, 3, 4])
+        self.events_proxy.setSourceModel(self.events_model)
+        self.search_input.textChanged.connect(self.events_proxy.set_search_text)
+        self.search_button.clicked.connect(
+            lambda: self.events_proxy.set_search_text(
+                self.search_input.text(), immediate=True
+            )
         )
-        self.events_table.horizontalHeader().setSectionResizeMode(
-            4, QHeaderView.ResizeMode.ResizeToContents
+        self.type_filter.currentIndexChanged.connect(self.update_event_filters)
+        self.status_filter.currentIndexChanged.connect(self.update_event_filters)
+
+        self.events_table = QTableView()
+        self.events_table.setStyleSheet(style.table_style)
+
+        self.events_actions = ActionsDelegate(
+            [
+                ("view", "view", "Ver Detalhes"),
+                ("edit", "edit", "Editar"),
+                ("delete", "delete", "Excluir"),
+            ],
+            self.events_table,
         )
-        self.events_table.horizontalHeader().setSectionResizeMode(
-            5, QHeaderView.ResizeMode.ResizeToContents
+        self.events_actions.actionTriggered.connect(self.on_event_action)
+        self.events_table.setItemDelegateForColumn(5, self.events_actions)
+
+        configure_table_view(
+            self.events_table, self.events_proxy, sort_column=(1, Qt.DescendingOrder)
         )
-        self.events_table.setStyleSheet(style.table_style)
 
-        # Adicionar dados de exemplo
-        self.add_sample_events()
+        # Carregar eventos
+        self.load_events()
 
         # Novo evento frame
         self.add_event_frame = QFrame()
@@ -266,7 +355,7 @@ class EventWidget(QWidget):
         self.cancel_button.setFixedHeight(36)
 
         self.create_button = QPushButton("Criar Evento")
-        self.create_button.setIcon(QIcon("./resources/icons/save.svg"))
+        self.create_button.setIcon(get_icon("save"))
         self.create_button.setStyleSheet(style.button_style)
         self.create_button.setFixedHeight(36)
         self.create_button.clicked.connect(self.criar_novo_evento)
@@ -282,113 +371,66 @@ class EventWidget(QWidget):
         self.layout.addWidget(self.events_table)
         self.layout.addWidget(self.add_event_frame)
 
-    def add_sample_events(self):
-        # Dados de exemplo
-        events = [
-            [
-                "Festival de Música",
-                "18-20 Mai 2025",
-                "Arena São Paulo",
-                "Empresa ABC",
-                "Em planejamento",
-            ],
-            [
-                "Lançamento de Produto",
-                "25 Mai 2025",
-                "Centro de Convenções",
-                "XYZ Corp",
-                "Confirmado",
-            ],
-            [
-                "Conferência Tech",
-                "01 Jun 2025",
-                "Hotel Grand",
-                "Tech Solutions",
-                "Em planejamento",
-            ],
-            [
-                "Treinamento Corporativo",
-                "15 Jun 2025",
-                "Sede da Empresa",
-                "Consultoria DEF",
-                "Confirmado",
-            ],
-            [
-                "Premiação Anual",
-                "30 Jun 2025",
-                "Teatro Municipal",
-                "Associação GHI",
-                "Em planejamento",
-            ],
-        ]
-
-        status_colors = {
-            "Em planejamento": style.cyan_color,
-            "Confirmado": style.purple_color,
-            "Em andamento": style.orange_color,
-            "Concluído": style.green_color,
-            "Cancelado": style.red_color,
-        }
-
-        self.events_table.setRowCount(len(events))
-
-        for row, event in enumerate(events):
-            # Nome do evento
-            self.events_table.setItem(row, 0, QTableWidgetItem(event[0]))
-
-            # Data
-            self.events_table.setItem(row, 1, QTableWidgetItem(event[1]))
-
-            # Local
-            self.events_table.setItem(row, 2, QTableWidgetItem(event[2]))
-
-            # Cliente
-            self.events_table.setItem(row, 3, QTableWidgetItem(event[3]))
-
-            # Status
-            status_item = QTableWidgetItem(event[4])
-            status_color = status_colors.get(event[4], style.comment_color)
-            status_item.setForeground(QBrush(QColor(status_color)))
-            self.events_table.setItem(row, 4, status_item)
-
-            # Ações
-            actions_widget = QWidget()
-            actions_layout = QHBoxLayout(actions_widget)
-            actions_layout.setContentsMargins(5, 0, 5, 0)
-            actions_layout.setSpacing(5)
-
-            view_btn = QPushButton()
-            view_btn.setIcon(QIcon("./resources/icons/view.svg"))
-            view_btn.setToolTip("Ver Detalhes")
-            view_btn.setIconSize(QSize(16, 16))
-            view_btn.setFixedSize(28, 28)
-            view_btn.setStyleSheet(style.secondary_button_style)
-
-            edit_btn = QPushButton()
-            edit_btn.setIcon(QIcon("./resources/icons/edit.svg"))
-            edit_btn.setToolTip("Editar")
-            edit_btn.setIconSize(QSize(16, 16))
-            edit_btn.setFixedSize(28, 28)
-            edit_btn.setStyleSheet(style.secondary_button_style)
-
-            delete_btn = QPushButton()
-            delete_btn.setIcon(QIcon("./resources/icons/delete.svg"))
-            delete_btn.setToolTip("Excluir")
-            delete_btn.setIconSize(QSize(16, 16))
-            delete_btn.setFixedSize(28, 28)
-            delete_btn.setStyleSheet(style.secondary_button_style)
-
-            actions_layout.addWidget(view_btn)
-            actions_layout.addWidget(edit_btn)
-            actions_layout.addWidget(delete_btn)
-            actions_layout.addStretch()
-
-            self.events_table.setCellWidget(row, 5, actions_widget)
+    def load_events(self):
+        """Carrega os eventos do banco, ou os de exemplo se ainda não houver"""
+        if self.event_repository.count():
+            source = RepositoryPageSource(
+                self.event_repository.count,
+                self.event_repository.get_page,
+                self.event_repository.get_table_row,
+            )
+        else:
+            source = ListPageSource(SAMPLE_EVENTS)
+        self.events_model.set_source(source)
+
+    def update_event_filters(self):
+        """Aplica os filtros de tipo e status (o primeiro item exibe todos)"""
+        event_type = self.type_filter.currentText()
+        status = self.status_filter.currentText()
+        self.events_proxy.set_field_filter(
+            "type", event_type if self.type_filter.currentIndex() > 0 else None
+        )
+        self.events_proxy.set_field_filter(
+            4, status if self.status_filter.currentIndex() > 0 else None
+        )
+
+    def on_event_action(self, action, row):
+        """Trata os botões de ação de uma linha da tabela de eventos"""
+        event = self.events_model.row_data(row)
+        if action != "delete" or not event:
+            return
+
+        if not isinstance(event.get("id"), int):
+            QMessageBox.information(
+                self, "Excluir", "Eventos de exemplo não podem ser excluídos."
+            )
+            return
+
+        answer = QMessageBox.question(
+            self, "Excluir", f"Excluir o evento '{event.get('name')}'?"
+        )
+        if answer != QMessageBox.Yes:
+            return
+
+        try:
+            self.event_repository.delete(event["id"])
+        except sqlite3.Error as e:
+            QMessageBox.critical(self, "Erro", f"Erro ao excluir evento: {str(e)}")
+            return
+
+        # Remove apenas a linha excluída, sem recarregar a tabela
+        self.events_model.refresh_row(event["id"])
+
+    def _client_id(self, company):
+        """Retorna o ID do cliente pelo nome, cadastrando-o se necessário"""
+        for client in self.team_repository.search_clients(company):
+            if client.get("company") == company:
+                return client["id"]
+        return self.team_repository.create_client({"company": company})
 
     def criar_novo_evento(self):
         """Cria um novo evento com os dados do formulário"""
         nome = self.event_name_input.text()
-        data = self.event_date_input.date().toString("dd/MM/yyyy")
         local = self.event_location_input.text()
         cliente = self.event_client_input.currentText()
         tipo = self.event_type_input.currentText()
@@ -398,62 +440,23 @@ class EventWidget(QWidget):
             QMessageBox.warning(self, "Erro", "Preencha todos os campos obrigatórios")
             return
 
-        # Adicionar à tabela de eventos
-        row = self.events_table.rowCount()
-        self.events_table.insertRow(row)
-
-        # Inserir os dados nas células
-        self.events_table.setItem(row, 0, QTableWidgetItem(nome))
-        self.events_table.setItem(row, 1, QTableWidgetItem(data))
-        self.events_table.setItem(row, 2, QTableWidgetItem(local))
-        self.events_table.setItem(row, 3, QTableWidgetItem(cliente))
-
-        # Status com cor
-        status_item = QTableWidgetItem(status)
-        status_colors = {
-            "Em planejamento": style.cyan_color,
-            "Confirmado": style.purple_color,
-            "Em andamento": style.orange_color,
-            "Concluído": style.green_color,
-            "Cancelado": style.red_color,
-        }
-        status_color = status_colors.get(status, style.comment_color)
-        status_item.setForeground(QBrush(QColor(status_color)))
-        self.events_table.setItem(row, 4, status_item)
-
-        # Ações
-        actions_widget = QWidget()
-        actions_layout = QHBoxLayout(actions_widget)
-        actions_layout.setContentsMargins(5, 0, 5, 0)
-        actions_layout.setSpacing(5)
-
-        view_btn = QPushButton()
-        view_btn.setIcon(QIcon("./resources/icons/view.svg"))
-        view_btn.setToolTip("Ver Detalhes")
-        view_btn.setIconSize(QSize(16, 16))
-        view_btn.setFixedSize(28, 28)
-        view_btn.setStyleSheet(style.secondary_button_style)
-
-        edit_btn = QPushButton()
-        edit_btn.setIcon(QIcon("./resources/icons/edit.svg"))
-        edit_btn.setToolTip("Editar")
-        edit_btn.setIconSize(QSize(16, 16))
-        edit_btn.setFixedSize(28, 28)
-        edit_btn.setStyleSheet(style.secondary_button_style)
-
-        delete_btn = QPushButton()
-        delete_btn.setIcon(QIcon("./resources/icons/delete.svg"))
-        delete_btn.setToolTip("Excluir")
-        delete_btn.setIconSize(QSize(16, 16))
-        delete_btn.setFixedSize(28, 28)
-        delete_btn.setStyleSheet(style.secondary_button_style)
-
-        actions_layout.addWidget(view_btn)
-        actions_layout.addWidget(edit_btn)
-        actions_layout.addWidget(delete_btn)
-        actions_layout.addStretch()
-
-        self.events_table.setCellWidget(row, 5, actions_widget)
+        # Salvar no banco e recarregar a primeira página da tabela
+        try:
+            self.event_repository.create(
+                {
+                    "name": nome,
+                    "date": self.event_date_input.date().toString("yyyy-MM-dd"),
+                    "location": local,
+                    "client_id": self._client_id(cliente),
+                    "type": tipo,
+                    "status": status,
+                }
+            )
+        except sqlite3.Error as e:
+            QMessageBox.critical(self, "Erro", f"Erro ao criar evento: {str(e)}")
+            return
+
+        self.load_events()
 
         # Limpar campos
         self.event_name_input.clear()
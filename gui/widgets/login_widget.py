@@ -1,5 +1,5 @@
 from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QFont, QIcon, QPixmap
+from PySide6.QtGui import QFont, QPixmap
 from PySide6.QtWidgets import (
     QCheckBox,
     QFrame,
@@ -14,6 +14,7 @@ from PySide6.QtWidgets import (
 
 import gui.themes.dracula as style
 from database.models import User
+from gui.utils.icon_provider import get_icon
 
 
 class LoginWidget(QWidget):
@@ -73,14 +74,14 @@ class LoginWidget(QWidget):
 
         # Botão minimizar
         self.minimize_btn = QPushButton()
-        self.minimize_btn.setIcon(QIcon("./resources/icons/minimize.svg"))
+        self.minimize_btn.setIcon(get_icon("minimize"))
         self.minimize_btn.setFixedSize(24, 24)
         self.minimize_btn.setStyleSheet(style.window_button_style)
         self.minimize_btn.clicked.connect(self.window().showMinimized)
 
         # Botão fechar
         self.close_btn = QPushButton()
-        self.close_btn.setIcon(QIcon("./resources/icons/close.svg"))
+        self.close_btn.setIcon(get_icon("close"))
         self.close_btn.setFixedSize(24, 24)
         self.close_btn.setStyleSheet(style.close_button_style)
         self.close_btn.clicked.connect(self.window().close)
@@ -1,7 +1,4 @@
-import os
-
 from PySide6.QtCore import Qt, Signal, Slot
-from PySide6.QtGui import QIcon
 from PySide6.QtMultimedia import QAudioOutput, QMediaPlayer
 from PySide6.QtMultimediaWidgets import QVideoWidget
 from PySide6.QtWidgets import (
@@ -14,6 +11,7 @@ from PySide6.QtWidgets import (
 )
 
 import gui.themes.dracula as style
+from gui.utils.icon_provider import get_icon
 
 
 class VideoPlayerComponent(QWidget):
@@ -50,7 +48,7 @@ class VideoPlayerComponent(QWidget):
 
         # Botão Play/Pause
         self.playButton = QPushButton()
-        self.playButton.setIcon(QIcon(os.path.join("resources", "icons", "play.svg")))
+        self.playButton.setIcon(get_icon("play"))
         self.playButton.setFixedSize(32, 32)
         self.playButton.setObjectName("playButton")
         self.playButton.setStyleSheet(style.btn_secondary)
@@ -82,14 +80,10 @@ class VideoPlayerComponent(QWidget):
     def togglePlayPause(self):
         if self.mediaPlayer.playbackState() == QMediaPlayer.PlaybackState.PlayingState:
             self.mediaPlayer.pause()
-            self.playButton.setIcon(
-                QIcon(os.path.join("resources", "icons", "play.svg"))
-            )
+            self.playButton.setIcon(get_icon("play"))
         else:
             self.mediaPlayer.play()
-            self.playButton.setIcon(
-                QIcon(os.path.join("resources", "icons", "pause.svg"))
-            )
+            self.playButton.setIcon(get_icon("pause"))
 
     @Slot(int)
     def positionChanged(self, position):
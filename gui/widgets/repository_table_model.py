@@ -0,0 +1,528 @@
+"""
+Modelo de tabela paginado, apoiado nos repositórios.
+
+As tabelas de eventos, equipe, clientes e entregas usam ``QTableView`` com um
+``RepositoryTableModel`` em vez de ``QTableWidget`` preenchido item a item:
+
+- as linhas são buscadas em páginas conforme a rolagem
+  (``canFetchMore``/``fetchMore``), então só as linhas já vistas ficam em
+  memória; cada página continua a partir da última linha carregada (coluna
+  de ordenação e id), sem ``OFFSET``;
+- a ordenação pelo cabeçalho é repassada ao repositório (``ORDER BY`` no
+  SQLite) e recomeça a paginação;
+- ``refresh_row`` relê uma única linha e redesenha apenas ela.
+
+Colunas de ações e de progresso são desenhadas por delegates, sem widgets por
+célula.
+"""
+
+from PySide6.QtCore import (
+    QAbstractProxyModel,
+    QAbstractTableModel,
+    QEvent,
+    QModelIndex,
+    QRect,
+    QSize,
+    Qt,
+    Signal,
+)
+from PySide6.QtGui import QBrush, QColor, QFont, QPainter
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QHeaderView,
+    QStyledItemDelegate,
+    QToolTip,
+)
+
+import gui.themes.dracula as style
+from gui.utils.icon_provider import get_icon
+
+# Papel com o dicionário completo da linha
+RowRole = Qt.UserRole + 1
+# Papel com o valor bruto da célula (sem formatação)
+ValueRole = Qt.UserRole + 2
+
+# Linhas medidas no ajuste das colunas ao conteúdo
+RESIZE_PRECISION_ROWS = 50
+
+
+class TableColumn:
+    """Descrição de uma coluna de RepositoryTableModel"""
+
+    def __init__(
+        self,
+        key,
+        title,
+        sortable=True,
+        colors=None,
+        icon=None,
+        bold=False,
+        formatter=None,
+    ):
+        """
+        Args:
+            key: Chave do valor no dicionário da linha (e na ordenação)
+            title: Título exibido no cabeçalho
+            sortable: Se a coluna pode ser ordenada pelo repositório
+            colors: Cor do texto por valor da célula (ex.: status)
+            icon: Nome do ícone exibido junto ao valor
+            bold: Exibe o valor em negrito
+            formatter: Função (valor, linha) -> texto exibido
+        """
+        self.key = key
+        self.title = title
+        self.sortable = sortable
+        self.colors = colors or {}
+        self.icon = icon
+        self.bold = bold
+        self.formatter = formatter
+
+
+class RepositoryPageSource:
+    """Fonte de linhas paginada a partir de métodos de um repositório"""
+
+    def __init__(self, count, fetch_page, fetch_row=None):
+        """
+        Args:
+            count: Função () -> quantidade total de linhas
+            fetch_page: Função (offset, limit, order_by, descending, after)
+                -> linhas; ``after`` é a última linha já carregada
+            fetch_row: Função (id) -> linha atualizada ou None
+        """
+        self._count = count
+        self._fetch_page = fetch_page
+        self._fetch_row = fetch_row
+
+    def count(self):
+        return self._count()
+
+    def fetch_page(self, offset, limit, order_by, descending, after=None):
+        kwargs = {"descending": descending}
+        if order_by:
+            kwargs["order_by"] = order_by
+        if after is not None:
+            kwargs["after"] = after
+        return self._fetch_page(offset=offset, limit=limit, **kwargs)
+
+    def fetch_row(self, row_id):
+        return self._fetch_row(row_id) if self._fetch_row else None
+
+
+class ListPageSource:
+    """Fonte de linhas em memória, usada para os dados de exemplo"""
+
+    def __init__(self, rows):
+        self.rows = []
+        for position, row in enumerate(rows):
+            row = dict(row)
+            row.setdefault("id", f"exemplo-{position}")
+            self.rows.append(row)
+
+    def count(self):
+        return len(self.rows)
+
+    def fetch_page(self, offset, limit, order_by, descending, after=None):
+        rows = self.rows
+        if order_by:
+            rows = sorted(
+                rows,
+                key=lambda row: (row.get(order_by) is None, row.get(order_by)),
+                reverse=descending,
+            )
+        return rows[offset : offset + limit]
+
+    def fetch_row(self, row_id):
+        return next((row for row in self.rows if row["id"] == row_id), None)
+
+
+class RepositoryTableModel(QAbstractTableModel):
+    """Modelo de tabela que busca as linhas do repositório sob demanda"""
+
+    # Quantidade de linhas buscadas a cada fetchMore
+    PAGE_SIZE = 200
+
+    def __init__(self, columns, source=None, parent=None):
+        super().__init__(parent)
+        self.columns = list(columns)
+        self.source = source
+        self.order_by = None
+        self.descending = False
+
+        self._rows = []
+        self._positions = {}
+        self._total = 0
+        self._brushes = {}
+        self._bold_font = QFont()
+        self._bold_font.setBold(True)
+
+        if source is not None:
+            self.refresh()
+
+    # ----- Interface do QAbstractTableModel -----
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.columns)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if (
+            role == Qt.DisplayRole
+            and orientation == Qt.Horizontal
+            and 0 <= section < len(self.columns)
+        ):
+            return self.columns[section].title
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row = self._rows[index.row()]
+        if role == RowRole:
+            return row
+
+        column = self.columns[index.column()]
+        value = row.get(column.key)
+
+        if role == Qt.DisplayRole:
+            return self._display_text(column, row)
+        if role == ValueRole:
+            return value
+        if role == Qt.ForegroundRole and column.colors:
+            color = column.colors.get(value)
+            return self._brush(color) if color else None
+        if role == Qt.DecorationRole and column.icon and value:
+            return get_icon(column.icon)
+        if role == Qt.FontRole and column.bold:
+            return self._bold_font
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self.source is None:
+            return False
+        return len(self._rows) < self._total
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self.source is None:
+            return
+        self._fetch(self.PAGE_SIZE)
+
+    def fetch_all(self):
+        """Busca de uma vez todas as linhas que ainda não foram carregadas"""
+        if self.canFetchMore():
+            self._fetch(self._total - len(self._rows))
+
+    def _fetch(self, count):
+        offset = len(self._rows)
+        limit = min(count, self._total - offset)
+        if limit <= 0:
+            return
+
+        # A página continua a partir da última linha (paginação por chave)
+        after = self._rows[-1] if self._rows else None
+        page = self.source.fetch_page(
+            offset, limit, self.order_by, self.descending, after
+        )
+        if len(page) < limit:
+            # Linhas removidas desde a contagem: a tabela termina aqui
+            self._total = offset + len(page)
+        self.append_rows(page)
+
+    def remaining_rows_loader(self):
+        """
+        Retorna uma função que busca as linhas ainda não carregadas, sem
+        alterar o modelo, para ser chamada em uma thread de trabalho.
+
+        As linhas buscadas entram no modelo depois, por ``append_rows``.
+        """
+        source, order_by, descending = self.source, self.order_by, self.descending
+        offset = len(self._rows)
+        remaining = self._total - offset
+        last = self._rows[-1] if self._rows else None
+
+        def load():
+            rows = []
+            while len(rows) < remaining:
+                limit = min(self.PAGE_SIZE * 10, remaining - len(rows))
+                page = source.fetch_page(
+                    offset + len(rows),
+                    limit,
+                    order_by,
+                    descending,
+                    rows[-1] if rows else last,
+                )
+                rows.extend(page)
+                if len(page) < limit:
+                    break
+            return rows
+
+        return load
+
+    def append_rows(self, rows):
+        """Acrescenta ao fim da tabela linhas já buscadas na fonte"""
+        if not rows:
+            return
+        offset = len(self._rows)
+        self.beginInsertRows(QModelIndex(), offset, offset + len(rows) - 1)
+        for position, row in enumerate(rows, offset):
+            self._positions[row.get("id")] = position
+        self._rows.extend(rows)
+        self._total = max(self._total, len(self._rows))
+        self.endInsertRows()
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Ordena pelo repositório e recomeça a paginação"""
+        if not 0 <= column < len(self.columns) or not self.columns[column].sortable:
+            return
+
+        order_by = self.columns[column].key
+        descending = order == Qt.DescendingOrder
+        if (order_by, descending) == (self.order_by, self.descending):
+            return
+
+        self.order_by = order_by
+        self.descending = descending
+        self.refresh()
+
+    # ----- Operações -----
+
+    def set_source(self, source):
+        """Troca a fonte das linhas e recarrega a tabela"""
+        self.source = source
+        self.refresh()
+
+    def refresh(self):
+        """Recarrega a contagem e a primeira página"""
+        self.beginResetModel()
+        self._rows = []
+        self._positions = {}
+        self._total = self.source.count() if self.source is not None else 0
+        self.endResetModel()
+        self.fetchMore()
+
+    def refresh_row(self, row_id):
+        """
+        Relê uma linha da fonte e atualiza apenas ela.
+
+        Se a linha não existir mais, ela é removida da tabela.
+
+        Returns:
+            bool: True se a linha estava carregada na tabela
+        """
+        position = self._positions.get(row_id)
+        if position is None:
+            return False
+
+        row = self.source.fetch_row(row_id)
+        if row is None:
+            self.beginRemoveRows(QModelIndex(), position, position)
+            del self._rows[position]
+            del self._positions[row_id]
+            for later in self._rows[position:]:
+                self._positions[later.get("id")] -= 1
+            self._total -= 1
+            self.endRemoveRows()
+            return True
+
+        self._rows[position] = row
+        self.dataChanged.emit(
+            self.index(position, 0), self.index(position, len(self.columns) - 1)
+        )
+        return True
+
+    def row_data(self, row):
+        """Retorna o dicionário de uma linha carregada"""
+        return self._rows[row] if 0 <= row < len(self._rows) else None
+
+    def loaded_rows(self):
+        """Cópia da lista das linhas já carregadas"""
+        return list(self._rows)
+
+    def display_values(self, row, columns):
+        """
+        Textos exibidos de uma linha (dicionário) nas colunas indicadas.
+
+        Não acessa o modelo, então pode ser usado fora da thread da interface.
+        """
+        return [self._display_text(self.columns[column], row) for column in columns]
+
+    @staticmethod
+    def _display_text(column, row):
+        value = row.get(column.key)
+        if column.formatter:
+            return column.formatter(value, row)
+        return "" if value is None else str(value)
+
+    @property
+    def total_rows(self):
+        """Quantidade total de linhas na fonte (carregadas ou não)"""
+        return self._total
+
+    def _brush(self, color):
+        brush = self._brushes.get(color)
+        if brush is None:
+            brush = self._brushes[color] = QBrush(QColor(color))
+        return brush
+
+
+class ActionsDelegate(QStyledItemDelegate):
+    """Desenha botões de ação em uma célula, sem widgets por linha"""
+
+    # Nome da ação e linha do modelo de origem (sem proxies de filtro)
+    actionTriggered = Signal(str, int)
+
+    BUTTON_SIZE = 28
+    ICON_SIZE = 16
+    SPACING = 5
+    MARGIN = 5
+
+    def __init__(self, actions, parent=None):
+        """
+        Args:
+            actions: Lista de tuplas (nome, ícone, dica)
+        """
+        super().__init__(parent)
+        self.actions = list(actions)
+
+    def _button_rects(self, rect):
+        top = rect.top() + (rect.height() - self.BUTTON_SIZE) // 2
+        left = rect.left() + self.MARGIN
+        rects = []
+        for _ in self.actions:
+            rects.append(QRect(left, top, self.BUTTON_SIZE, self.BUTTON_SIZE))
+            left += self.BUTTON_SIZE + self.SPACING
+        return rects
+
+    def _action_at(self, rect, position):
+        for action, button in zip(self.actions, self._button_rects(rect)):
+            if button.contains(position):
+                return action
+        return None
+
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index)
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(style.current_line_color))
+        offset = (self.BUTTON_SIZE - self.ICON_SIZE) // 2
+        for (_, icon, _), button in zip(self.actions, self._button_rects(option.rect)):
+            painter.drawRoundedRect(button, 5, 5)
+            get_icon(icon).paint(
+                painter,
+                button.adjusted(offset, offset, -offset, -offset),
+            )
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        count = len(self.actions)
+        return QSize(
+            2 * self.MARGIN + count * self.BUTTON_SIZE + (count - 1) * self.SPACING,
+            self.BUTTON_SIZE + 8,
+        )
+
+    def editorEvent(self, event, model, option, index):
+        if (
+            event.type() == QEvent.MouseButtonRelease
+            and event.button() == Qt.LeftButton
+        ):
+            action = self._action_at(option.rect, event.position().toPoint())
+            if action is not None:
+                while isinstance(index.model(), QAbstractProxyModel):
+                    index = index.model().mapToSource(index)
+                self.actionTriggered.emit(action[0], index.row())
+                return True
+        return super().editorEvent(event, model, option, index)
+
+    def helpEvent(self, event, view, option, index):
+        if event.type() == QEvent.ToolTip:
+            action = self._action_at(option.rect, event.pos())
+            if action is not None:
+                QToolTip.showText(event.globalPos(), action[2], view)
+                return True
+        return super().helpEvent(event, view, option, index)
+
+
+class ProgressDelegate(QStyledItemDelegate):
+    """Desenha uma barra de progresso (0 a 100) a partir do valor da célula"""
+
+    BAR_HEIGHT = 15
+
+    def __init__(self, color_for_row=None, parent=None):
+        """
+        Args:
+            color_for_row: Função (linha, progresso) -> cor da barra
+        """
+        super().__init__(parent)
+        self.color_for_row = color_for_row
+
+    def paint(self, painter, option, index):
+        try:
+            progress = max(0, min(100, int(index.data(ValueRole) or 0)))
+        except (TypeError, ValueError):
+            progress = 0
+
+        color = style.purple_color
+        if self.color_for_row:
+            color = self.color_for_row(index.data(RowRole), progress)
+
+        bar = QRect(
+            option.rect.left() + 5,
+            option.rect.top() + (option.rect.height() - self.BAR_HEIGHT) // 2,
+            option.rect.width() - 10,
+            self.BAR_HEIGHT,
+        )
+        radius = self.BAR_HEIGHT / 2 - 1
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(style.current_line_color))
+        painter.drawRoundedRect(bar, radius, radius)
+        if progress:
+            filled = QRect(bar)
+            filled.setWidth(max(self.BAR_HEIGHT, bar.width() * progress // 100))
+            painter.setBrush(QColor(color))
+            painter.drawRoundedRect(filled, radius, radius)
+        painter.restore()
+
+
+def configure_table_view(view, model, stretch_columns=(0,), sort_column=None):
+    """
+    Configura uma QTableView para um RepositoryTableModel (ou um proxy dele).
+
+    As linhas têm altura fixa (sem medir o conteúdo de cada uma), o ajuste das
+    colunas ao conteúdo considera só as linhas próximas das visíveis e a
+    ordenação pelo cabeçalho é repassada ao modelo.
+
+    Args:
+        view: QTableView a configurar
+        model: Modelo da tabela
+        stretch_columns: Colunas que ocupam o espaço restante
+        sort_column: Tupla (coluna, Qt.SortOrder) da ordenação inicial
+    """
+    view.setModel(model)
+    view.setSelectionBehavior(QAbstractItemView.SelectRows)
+    view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+    view.setWordWrap(False)
+
+    vertical = view.verticalHeader()
+    vertical.setSectionResizeMode(QHeaderView.Fixed)
+    vertical.setDefaultSectionSize(ActionsDelegate.BUTTON_SIZE + 8)
+
+    header = view.horizontalHeader()
+    header.setResizeContentsPrecision(RESIZE_PRECISION_ROWS)
+    for column in range(model.columnCount()):
+        mode = (
+            QHeaderView.ResizeMode.Stretch
+            if column in stretch_columns
+            else QHeaderView.ResizeMode.ResizeToContents
+        )
+        header.setSectionResizeMode(column, mode)
+
+    if sort_column is not None:
+        header.setSortIndicator(*sort_column)
+    view.setSortingEnabled(True)
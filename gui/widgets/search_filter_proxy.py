@@ -0,0 +1,426 @@
+"""
+Proxy de filtragem com busca por chaves pré-calculadas.
+
+``SearchFilterProxyModel`` mantém, para cada linha do modelo de origem, uma
+chave de busca normalizada (ver ``gui/utils/text_search.py``) e o resultado da
+consulta atual. As chaves são atualizadas de forma incremental conforme o
+modelo de origem insere, remove ou altera linhas, e a consulta:
+
+- é aplicada com atraso (debounce por instância) enquanto o usuário digita;
+- reaproveita o resultado anterior quando apenas estende a consulta;
+- roda em uma thread de trabalho quando o modelo é grande, sem travar a
+  interface; o filtro só é reaplicado quando o resultado chega.
+
+Em modelos de repositório ainda não carregados por inteiro, a própria tarefa
+de trabalho busca no banco as linhas que faltam e monta as chaves a partir dos
+dicionários das linhas; a thread da interface só acrescenta as linhas prontas
+ao modelo.
+
+``filterAcceptsRow`` apenas consulta o resultado já calculado.
+"""
+
+from PySide6.QtCore import (
+    QModelIndex,
+    QObject,
+    QRunnable,
+    QSortFilterProxyModel,
+    Qt,
+    QThreadPool,
+    QTimer,
+    Signal,
+)
+
+from gui.utils.text_search import (
+    build_key,
+    is_refinement,
+    key_matches,
+    match_keys,
+    normalize_text,
+    query_terms,
+)
+from gui.widgets.repository_table_model import RepositoryTableModel, RowRole
+
+
+class _MatchSignals(QObject):
+    """Sinais da tarefa de busca (emitidos na thread de trabalho)"""
+
+    finished = Signal(int, object)
+
+
+class _MatchTask(QRunnable):
+    """
+    Casa as chaves com a consulta fora da thread da interface.
+
+    Com ``load_rest``, busca antes as linhas que faltam no modelo; com
+    ``key_for``, monta as chaves que faltam a partir das linhas (``rows`` são
+    as já carregadas). Emite (linhas buscadas, chaves, resultado).
+    """
+
+    def __init__(
+        self,
+        generation,
+        keys,
+        terms,
+        previous,
+        signals,
+        rows=None,
+        key_for=None,
+        load_rest=None,
+    ):
+        super().__init__()
+        self.generation = generation
+        self.keys = keys
+        self.terms = terms
+        self.previous = previous
+        self.signals = signals
+        self.rows = rows
+        self.key_for = key_for
+        self.load_rest = load_rest
+
+    def run(self):
+        keys = list(self.keys)
+        previous = self.previous
+        fetched = self.load_rest() if self.load_rest is not None else []
+        if fetched:
+            keys.extend([None] * len(fetched))
+            if previous is not None:
+                # Linhas novas ainda não foram testadas
+                previous = list(previous) + [True] * len(fetched)
+
+        if self.key_for is not None:
+            rows = self.rows + fetched
+            for position, key in enumerate(keys):
+                if key is None:
+                    keys[position] = self.key_for(rows[position])
+
+        if self.terms:
+            matches = match_keys(keys, self.terms, previous)
+        else:
+            matches = [None] * len(keys)
+        self.signals.finished.emit(self.generation, (fetched, keys, matches))
+
+
+class SearchFilterProxyModel(QSortFilterProxyModel):
+    """Filtra as linhas do modelo de origem por texto e por valores de colunas"""
+
+    # Atraso (ms) entre a última tecla e a aplicação da busca
+    SEARCH_DELAY_MS = 200
+    # A partir de quantas linhas a busca roda em uma thread de trabalho
+    WORKER_THRESHOLD = 20000
+
+    # Emitido quando a busca começa (True) e termina (False) em segundo plano
+    searchRunning = Signal(bool)
+
+    def __init__(self, search_columns=None, row_text=None, parent=None):
+        """
+        Args:
+            search_columns: Colunas pesquisadas (None = todas)
+            row_text: Função (modelo, linha) -> valores pesquisáveis da linha;
+                por padrão usa o texto exibido nas colunas pesquisadas
+        """
+        super().__init__(parent)
+        self.search_columns = search_columns
+        self.row_text = row_text
+
+        self._keys = []
+        self._matches = []
+        self._terms = ()
+        self._pending_text = ""
+        self._field_filters = {}
+
+        # Uma geração por consulta; resultados de consultas antigas são
+        # descartados. A revisão muda a cada alteração nas linhas.
+        self._generation = 0
+        self._revision = 0
+        self._task_revision = 0
+        self._task_signals = None
+        # Chaves e resultados das linhas que o proxy está acrescentando
+        self._incoming = None
+
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(self.SEARCH_DELAY_MS)
+        self._search_timer.timeout.connect(self._apply_pending_search)
+
+    # ----- Modelo de origem -----
+
+    def setSourceModel(self, model):
+        previous = self.sourceModel()
+        if previous is not None:
+            for signal, slot in self._source_connections(previous):
+                signal.disconnect(slot)
+
+        # Conectados antes do proxy para que as chaves já estejam ajustadas
+        # quando ele reavaliar as linhas alteradas
+        if model is not None:
+            for signal, slot in self._source_connections(model):
+                signal.connect(slot)
+
+        self._reset_keys(model.rowCount() if model is not None else 0)
+        super().setSourceModel(model)
+
+    def _source_connections(self, model):
+        return [
+            (model.rowsAboutToBeInserted, self._on_rows_inserted),
+            (model.rowsAboutToBeRemoved, self._on_rows_removed),
+            (model.dataChanged, self._on_data_changed),
+            (model.modelReset, self._on_model_reset),
+            (model.layoutChanged, self._on_model_reset),
+        ]
+
+    def _reset_keys(self, count):
+        self._keys = [None] * count
+        self._matches = [None] * count
+        self._revision += 1
+
+    def _on_rows_inserted(self, parent, first, last):
+        if parent.isValid():
+            return
+        count = last - first + 1
+        if self._incoming is not None and len(self._incoming[0]) == count:
+            keys, matches = self._incoming
+        else:
+            keys, matches = [None] * count, [None] * count
+        self._keys[first:first] = keys
+        self._matches[first:first] = matches
+        self._revision += 1
+
+    def _on_rows_removed(self, parent, first, last):
+        if parent.isValid():
+            return
+        del self._keys[first : last + 1]
+        del self._matches[first : last + 1]
+        self._revision += 1
+
+    def _on_data_changed(self, top_left, bottom_right, roles=()):
+        for row in range(top_left.row(), bottom_right.row() + 1):
+            if row < len(self._keys):
+                self._keys[row] = None
+                self._matches[row] = None
+        self._revision += 1
+
+    def _on_model_reset(self):
+        self._reset_keys(self.sourceModel().rowCount())
+        if self._terms or self._field_filters:
+            # Modelos paginados voltam à primeira página ao reordenar
+            QTimer.singleShot(0, self._restart_search)
+
+    # ----- Chaves -----
+
+    def _row_values(self, row):
+        model = self.sourceModel()
+        if self.row_text is not None:
+            return self.row_text(model, row)
+
+        columns = self.search_columns
+        if columns is None:
+            columns = range(model.columnCount())
+        return [model.index(row, column).data(Qt.DisplayRole) for column in columns]
+
+    def _key(self, row):
+        key = self._keys[row]
+        if key is None:
+            key = self._keys[row] = build_key(self._row_values(row))
+        return key
+
+    def _all_keys(self):
+        """Calcula as chaves que faltam e retorna a lista completa"""
+        for row, key in enumerate(self._keys):
+            if key is None:
+                self._key(row)
+        return list(self._keys)
+
+    # ----- Busca -----
+
+    @property
+    def search_text(self):
+        return self._pending_text
+
+    def set_search_text(self, text, immediate=False):
+        """
+        Define o texto da busca.
+
+        A busca é aplicada SEARCH_DELAY_MS após a última chamada, ou na hora
+        com ``immediate=True``.
+        """
+        self._pending_text = text or ""
+        if immediate:
+            self._search_timer.stop()
+            self._apply_pending_search()
+        else:
+            self._search_timer.start()
+
+    def _apply_pending_search(self):
+        terms = query_terms(self._pending_text)
+        if terms == self._terms:
+            return
+
+        previous_terms = self._terms
+        self._terms = terms
+        self._generation += 1
+
+        if not terms:
+            self._matches = [None] * len(self._keys)
+            self.invalidateFilter()
+            return
+
+        # Linhas que não casavam continuam de fora quando a consulta só foi
+        # estendida; as demais são testadas de novo
+        previous = None
+        if is_refinement(previous_terms, terms) and None not in self._matches:
+            previous = list(self._matches)
+
+        self._run_search(previous)
+
+    def _restart_search(self):
+        """Refaz a consulta atual do zero (ex.: após o modelo ser recarregado)"""
+        if self._terms or self._field_filters:
+            self._generation += 1
+            self._run_search(None)
+
+    def _lazy_repository(self):
+        """Modelo de repositório cujas chaves podem ser montadas fora da interface"""
+        model = self.sourceModel()
+        if isinstance(model, RepositoryTableModel) and self.row_text is None:
+            return model
+        return None
+
+    def _run_search(self, previous):
+        model = self._lazy_repository()
+        if model is not None:
+            if not model.canFetchMore() and len(self._keys) < self.WORKER_THRESHOLD:
+                self._match_now(self._all_keys(), previous)
+                return
+            # Busca das linhas que faltam e montagem das chaves em segundo plano
+            columns = self.search_columns
+            if columns is None:
+                columns = range(model.columnCount())
+            columns = list(columns)
+            task_args = {
+                "rows": model.loaded_rows(),
+                "key_for": lambda row: build_key(model.display_values(row, columns)),
+                "load_rest": (
+                    model.remaining_rows_loader() if model.canFetchMore() else None
+                ),
+            }
+            keys = list(self._keys)
+        else:
+            self._load_all_rows()
+            keys = self._all_keys()
+            if len(keys) < self.WORKER_THRESHOLD:
+                self._match_now(keys, previous)
+                return
+            task_args = {}
+
+        # Consulta grande: casamento em segundo plano; até o resultado chegar
+        # a lista continua com o filtro anterior
+        signals = _MatchSignals()
+        signals.finished.connect(self._on_worker_finished)
+        self._task_signals = signals
+        self._task_revision = self._revision
+        self.searchRunning.emit(True)
+        QThreadPool.globalInstance().start(
+            _MatchTask(
+                self._generation, keys, self._terms, previous, signals, **task_args
+            )
+        )
+
+    def _match_now(self, keys, previous):
+        if self._terms:
+            self._matches = match_keys(keys, self._terms, previous)
+        self.invalidateFilter()
+
+    def _on_worker_finished(self, generation, result):
+        if generation != self._generation:
+            return
+
+        self._task_signals = None
+        self.searchRunning.emit(False)
+        fetched, keys, matches = result
+        loaded = len(self._keys)
+        changed = self._task_revision != self._revision
+        if changed or len(keys) != loaded + len(fetched):
+            # As linhas mudaram durante a busca: recomeça com as linhas atuais
+            self._restart_search()
+            return
+
+        self._keys = keys[:loaded]
+        self._matches = matches[:loaded]
+        if fetched:
+            # _on_rows_inserted usa as chaves já prontas das linhas novas
+            self._incoming = (keys[loaded:], matches[loaded:])
+            try:
+                self.sourceModel().append_rows(fetched)
+            finally:
+                self._incoming = None
+        self.invalidateFilter()
+
+    def _load_all_rows(self):
+        """Carrega as linhas ainda não buscadas por modelos paginados"""
+        model = self.sourceModel()
+        if isinstance(model, RepositoryTableModel):
+            model.fetch_all()
+        elif model is not None:
+            while model.canFetchMore(QModelIndex()):
+                model.fetchMore(QModelIndex())
+
+    # ----- Filtros por coluna -----
+
+    def set_field_filter(self, column, value):
+        """
+        Mantém apenas as linhas cujo texto na coluna é igual a ``value``.
+
+        ``column`` é o número de uma coluna exibida ou, para modelos de
+        repositório, o nome de um campo da linha (ex.: ``"type"``). ``None`` ou
+        texto vazio remove o filtro da coluna.
+        """
+        if value:
+            self._field_filters[column] = normalize_text(value)
+            model = self.sourceModel()
+            if self._lazy_repository() is not None and model.canFetchMore():
+                # As linhas que faltam chegam em segundo plano
+                self._restart_search()
+            else:
+                self._load_all_rows()
+        else:
+            self._field_filters.pop(column, None)
+        self.invalidateFilter()
+
+    # ----- QSortFilterProxyModel -----
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        # Modelos de repositório ordenam no banco de dados
+        model = self.sourceModel()
+        if isinstance(model, RepositoryTableModel):
+            model.sort(column, order)
+        else:
+            super().sort(column, order)
+
+    def accepts_row(self, source_row, source_parent):
+        """Filtro adicional das subclasses"""
+        return True
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if source_parent.isValid():
+            return True
+
+        if self._terms and source_row < len(self._matches):
+            matched = self._matches[source_row]
+            if matched is None:
+                matched = key_matches(self._key(source_row), self._terms)
+                self._matches[source_row] = matched
+            if not matched:
+                return False
+
+        if self._field_filters:
+            model = self.sourceModel()
+            for column, value in self._field_filters.items():
+                if isinstance(column, str):
+                    row = model.index(source_row, 0, source_parent).data(RowRole)
+                    text = (row or {}).get(column)
+                else:
+                    text = model.index(source_row, column, source_parent).data()
+                if normalize_text(text) != value:
+                    return False
+
+        return self.accepts_row(source_row, source_parent)
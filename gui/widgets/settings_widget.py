@@ -1,7 +1,6 @@
 import os
 
 from PySide6.QtCore import QSize, Qt
-from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import (
     QCheckBox,
     QComboBox,
@@ -21,6 +20,7 @@ from PySide6.QtWidgets import (
 
 import gui.themes.dracula as style
 import utils.helpers as helpers
+from gui.utils.icon_provider import get_icon
 
 
 class SettingsWidget(QWidget):
@@ -43,7 +43,7 @@ class SettingsWidget(QWidget):
 
         # Botão de salvar
         self.save_button = QPushButton("Salvar Configurações")
-        self.save_button.setIcon(QIcon("./resources/icons/save.svg"))
+        self.save_button.setIcon(get_icon("save"))
         self.save_button.setStyleSheet(style.button_style)
         self.save_button.setFixedHeight(36)
 
@@ -184,7 +184,7 @@ class SettingsWidget(QWidget):
         self.upload_dir_input.setReadOnly(True)
 
         self.upload_dir_button = QPushButton("Escolher")
-        self.upload_dir_button.setIcon(QIcon("./resources/icons/folder.svg"))
+        self.upload_dir_button.setIcon(get_icon("folder"))
         self.upload_dir_button.setStyleSheet(style.secondary_button_style)
         self.upload_dir_button.clicked.connect(
             lambda: self.choose_directory(self.upload_dir_input)
@@ -202,7 +202,7 @@ class SettingsWidget(QWidget):
         self.export_dir_input.setReadOnly(True)
 
         self.export_dir_button = QPushButton("Escolher")
-        self.export_dir_button.setIcon(QIcon("./resources/icons/folder.svg"))
+        self.export_dir_button.setIcon(get_icon("folder"))
         self.export_dir_button.setStyleSheet(style.secondary_button_style)
         self.export_dir_button.clicked.connect(
             lambda: self.choose_directory(self.export_dir_input)
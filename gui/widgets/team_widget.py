@@ -1,26 +1,106 @@
-from PySide6.QtCore import QSize, Qt
-from PySide6.QtGui import QIcon, QPixmap
+import sqlite3
+
+from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (
     QFrame,
     QHBoxLayout,
-    QHeaderView,
     QInputDialog,
     QLabel,
+    QLineEdit,
     QMessageBox,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
 
-import gui.themes.dracula as style
+from database.TeamRepository import TeamRepository
+from gui.utils.icon_provider import get_icon
+from gui.widgets.repository_table_model import (
+    ActionsDelegate,
+    ListPageSource,
+    RepositoryPageSource,
+    RepositoryTableModel,
+    TableColumn,
+    configure_table_view,
+)
+from gui.widgets.search_filter_proxy import SearchFilterProxyModel
+
+# Exibidos enquanto não há membros/clientes cadastrados no banco
+SAMPLE_TEAM = [
+    {
+        "name": "Maria Souza",
+        "role": "Editora de Vídeo",
+        "email": "maria@gonetwork.ai",
+        "contact": "(11) 98765-4321",
+    },
+    {
+        "name": "Pedro Alves",
+        "role": "Diretor de Fotografia",
+        "email": "pedro@gonetwork.ai",
+        "contact": "(11) 97654-3210",
+    },
+    {
+        "name": "Ana Silva",
+        "role": "Produtora",
+        "email": "ana@gonetwork.ai",
+        "contact": "(11) 96543-2109",
+    },
+    {
+        "name": "Carlos Mendes",
+        "role": "Editor de Áudio",
+        "email": "carlos@gonetwork.ai",
+        "contact": "(11) 95432-1098",
+    },
+    {
+        "name": "Luciana Santos",
+        "role": "Motion Designer",
+        "email": "luciana@gonetwork.ai",
+        "contact": "(11) 94321-0987",
+    },
+]
+
+SAMPLE_CLIENTS = [
+    {
+        "company": "Empresa ABC",
+        "contact_person": "João Oliveira",
+        "email": "joao@empresaabc.com",
+        "phone": "(11) 3456-7890",
+    },
+    {
+        "company": "XYZ Corp",
+        "contact_person": "Fernanda Gomes",
+        "email": "fernanda@xyzcorp.com",
+        "phone": "(11) 2345-6789",
+    },
+    {
+        "company": "Tech Solutions",
+        "contact_person": "Ricardo Dias",
+        "email": "ricardo@techsolutions.com",
+        "phone": "(11) 4567-8901",
+    },
+    {
+        "company": "Consultoria DEF",
+        "contact_person": "Amanda Cruz",
+        "email": "amanda@def.com.br",
+        "phone": "(11) 5678-9012",
+    },
+    {
+        "company": "Associação GHI",
+        "contact_person": "Roberto Lima",
+        "email": "roberto@ghi.org.br",
+        "phone": "(11) 6789-0123",
+    },
+]
 
 
 class TeamWidget(QWidget):
     def __init__(self):
         super().__init__()
 
+        # Repositório
+        self.team_repository = TeamRepository()
+
         # Layout principal
         self.layout = QVBoxLayout(self)
         self.layout.setContentsMargins(20, 20, 20, 20)
@@ -31,45 +111,44 @@ class TeamWidget(QWidget):
 
         # Título
         self.title_label = QLabel("Gerenciamento de Equipe")
-        self.title_label.setStyleSheet(
-            f"color: {style.foreground_color}; font-size: 24px; font-weight: bold;"
-        )
+        self.title_label.setProperty("role", "title")
 
         # Botões
         self.button_layout = QHBoxLayout()
         self.button_layout.setSpacing(10)
 
         self.add_member_button = QPushButton("Adicionar Membro")
-        self.add_member_button.setIcon(QIcon("./resources/icons/user-add.svg"))
+        self.add_member_button.setIcon(get_icon("user-add"))
         self.add_member_button.setFixedHeight(36)
-        self.add_member_button.setStyleSheet(style.button_style)
+        self.add_member_button.setProperty("variant", "primary")
         self.add_member_button.clicked.connect(self.adicionar_membro)
 
         self.add_client_button = QPushButton("Adicionar Cliente")
-        self.add_client_button.setIcon(QIcon("./resources/icons/client-add.svg"))
+        self.add_client_button.setIcon(get_icon("client-add"))
         self.add_client_button.setFixedHeight(36)
-        self.add_client_button.setStyleSheet(style.secondary_button_style)
+        self.add_client_button.setProperty("variant", "secondary")
         self.add_client_button.clicked.connect(self.adicionar_cliente)
 
         self.button_layout.addWidget(self.add_member_button)
         self.button_layout.addWidget(self.add_client_button)
 
+        # Busca em membros e clientes
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("Buscar membros e clientes...")
+        self.search_input.setFixedHeight(36)
+        self.search_input.setFixedWidth(260)
+        self.search_input.setClearButtonEnabled(True)
+        self.search_input.textChanged.connect(self.filtrar)
+
         # Adicionar ao layout do cabeçalho
         self.header_layout.addWidget(self.title_label)
         self.header_layout.addStretch()
+        self.header_layout.addWidget(self.search_input)
         self.header_layout.addLayout(self.button_layout)
 
         # Tabela de membros da equipe
         self.team_frame = QFrame()
-        self.team_frame.setStyleSheet(
-            f"""
-            QFrame {{
-                background-color: {style.background_color};
-                border-radius: 8px;
-                border: 1px solid {style.current_line_color};
-            }}
-        """
-        )
+        self.team_frame.setProperty("role", "panel")
 
         self.team_layout = QVBoxLayout(self.team_frame)
         self.team_layout.setContentsMargins(15, 15, 15, 15)
@@ -77,50 +156,41 @@ class TeamWidget(QWidget):
 
         # Título da seção
         self.team_section_title = QLabel("Membros da Equipe")
-        self.team_section_title.setStyleSheet(
-            f"color: {style.foreground_color}; font-size: 16px; font-weight: bold;"
-        )
+        self.team_section_title.setProperty("role", "section")
         self.team_layout.addWidget(self.team_section_title)
 
-        # Tabela de membros
-        self.team_table = QTableWidget()
-        self.team_table.setColumnCount(5)
-        self.team_table.setHorizontalHeaderLabels(
-            ["Nome", "Função", "Email", "Contato", "Ações"]
-        )
-        self.team_table.horizontalHeader().setSectionResizeMode(
-            0, QHeaderView.ResizeMode.Stretch
-        )
-        self.team_table.horizontalHeader().setSectionResizeMode(
-            1, QHeaderView.ResizeMode.ResizeToContents
-        )
-        self.team_table.horizontalHeader().setSectionResizeMode(
-            2, QHeaderView.ResizeMode.ResizeToContents
+        # Tabela de membros (paginada e ordenada pelo banco de dados)
+        self.team_model = RepositoryTableModel(
+            [
+                TableColumn("name", "Nome"),
+                TableColumn("role", "Função"),
+                TableColumn("email", "Email", icon="email"),
+                TableColumn("contact", "Contato"),
+                TableColumn("actions", "Ações", sortable=False),
+            ],
+            parent=self,
         )
-        self.team_table.horizontalHeader().setSectionResizeMode(
-            3, QHeaderView.ResizeMode.ResizeToContents
+        self.team_proxy = SearchFilterProxyModel(search_columns=[0, 1, 2, 3])
+        self.team_proxy.setSourceModel(self.team_model)
+        self.team_table = QTableView()
+        self.team_actions = ActionsDelegate(
+            [("edit", "edit", "Editar"), ("delete", "delete", "Remover")],
+            self.team_table,
         )
-        self.team_table.horizontalHeader().setSectionResizeMode(
-            4, QHeaderView.ResizeMode.ResizeToContents
+        self.team_actions.actionTriggered.connect(self.on_member_action)
+        self.team_table.setItemDelegateForColumn(4, self.team_actions)
+        configure_table_view(
+            self.team_table, self.team_proxy, sort_column=(0, Qt.AscendingOrder)
         )
-        self.team_table.setStyleSheet(style.table_style)
 
-        # Adicionar dados de exemplo
-        self.add_sample_team()
+        # Carregar membros
+        self.load_team()
 
         self.team_layout.addWidget(self.team_table)
 
         # Tabela de clientes
         self.client_frame = QFrame()
-        self.client_frame.setStyleSheet(
-            f"""
-            QFrame {{
-                background-color: {style.background_color};
-                border-radius: 8px;
-                border: 1px solid {style.current_line_color};
-            }}
-        """
-        )
+        self.client_frame.setProperty("role", "panel")
 
         self.client_layout = QVBoxLayout(self.client_frame)
         self.client_layout.setContentsMargins(15, 15, 15, 15)
@@ -128,36 +198,39 @@ class TeamWidget(QWidget):
 
         # Título da seção
         self.client_section_title = QLabel("Clientes")
-        self.client_section_title.setStyleSheet(
-            f"color: {style.foreground_color}; font-size: 16px; font-weight: bold;"
-        )
+        self.client_section_title.setProperty("role", "section")
         self.client_layout.addWidget(self.client_section_title)
 
-        # Tabela de clientes
-        self.client_table = QTableWidget()
-        self.client_table.setColumnCount(5)
-        self.client_table.setHorizontalHeaderLabels(
-            ["Empresa/Cliente", "Responsável", "Email", "Telefone", "Ações"]
-        )
-        self.client_table.horizontalHeader().setSectionResizeMode(
-            0, QHeaderView.ResizeMode.Stretch
-        )
-        self.client_table.horizontalHeader().setSectionResizeMode(
-            1, QHeaderView.ResizeMode.ResizeToContents
-        )
-        self.client_table.horizontalHeader().setSectionResizeMode(
-            2, QHeaderView.ResizeMode.ResizeToContents
+        # Tabela de clientes (paginada e ordenada pelo banco de dados)
+        self.client_model = RepositoryTableModel(
+            [
+                TableColumn("company", "Empresa/Cliente"),
+                TableColumn("contact_person", "Responsável"),
+                TableColumn("email", "Email", icon="email"),
+                TableColumn("phone", "Telefone"),
+                TableColumn("actions", "Ações", sortable=False),
+            ],
+            parent=self,
         )
-        self.client_table.horizontalHeader().setSectionResizeMode(
-            3, QHeaderView.ResizeMode.ResizeToContents
+        self.client_proxy = SearchFilterProxyModel(search_columns=[0, 1, 2, 3])
+        self.client_proxy.setSourceModel(self.client_model)
+        self.client_table = QTableView()
+        self.client_actions = ActionsDelegate(
+            [
+                ("view", "view", "Ver Detalhes"),
+                ("edit", "edit", "Editar"),
+                ("delete", "delete", "Remover"),
+            ],
+            self.client_table,
         )
-        self.client_table.horizontalHeader().setSectionResizeMode(
-            4, QHeaderView.ResizeMode.ResizeToContents
+        self.client_actions.actionTriggered.connect(self.on_client_action)
+        self.client_table.setItemDelegateForColumn(4, self.client_actions)
+        configure_table_view(
+            self.client_table, self.client_proxy, sort_column=(0, Qt.AscendingOrder)
         )
-        self.client_table.setStyleSheet(style.table_style)
 
-        # Adicionar dados de exemplo
-        self.add_sample_clients()
+        # Carregar clientes
+        self.load_clients()
 
         self.client_layout.addWidget(self.client_table)
 
@@ -166,220 +239,75 @@ class TeamWidget(QWidget):
         self.layout.addWidget(self.team_frame)
         self.layout.addWidget(self.client_frame)
 
-    def add_sample_team(self):
-        # Dados de exemplo
-        team = [
-            [
-                "Maria Souza",
-                "Editora de Vídeo",
-                "maria@gonetwork.ai",
-                "(11) 98765-4321",
-            ],
-            [
-                "Pedro Alves",
-                "Diretor de Fotografia",
-                "pedro@gonetwork.ai",
-                "(11) 97654-3210",
-            ],
-            ["Ana Silva", "Produtora", "ana@gonetwork.ai", "(11) 96543-2109"],
-            [
-                "Carlos Mendes",
-                "Editor de Áudio",
-                "carlos@gonetwork.ai",
-                "(11) 95432-1098",
-            ],
-            [
-                "Luciana Santos",
-                "Motion Designer",
-                "luciana@gonetwork.ai",
-                "(11) 94321-0987",
-            ],
-        ]
-
-        self.team_table.setRowCount(len(team))
-
-        for row, member in enumerate(team):
-            # Nome
-            self.team_table.setItem(row, 0, QTableWidgetItem(member[0]))
-
-            # Função
-            self.team_table.setItem(row, 1, QTableWidgetItem(member[1]))
-
-            # Email
-            email_container = QWidget()
-            email_layout = QHBoxLayout(email_container)
-            email_layout.setContentsMargins(5, 0, 5, 0)
-            email_layout.setSpacing(5)
-
-            email_label = QLabel(member[2])
-            email_label.setStyleSheet(f"color: {style.foreground_color};")
-
-            email_icon = QPushButton()
-            email_icon.setIcon(QIcon("./resources/icons/email.svg"))
-            email_icon.setToolTip("Enviar Email")
-            email_icon.setIconSize(QSize(16, 16))
-            email_icon.setFixedSize(24, 24)
-            email_icon.setStyleSheet(
-                f"""
-                QPushButton {{
-                    background-color: transparent;
-                    border: none;
-                }}
-                QPushButton:hover {{
-                    background-color: {style.current_line_color};
-                    border-radius: 12px;
-                }}
-            """
+    def load_team(self):
+        """Carrega os membros do banco, ou os de exemplo se ainda não houver"""
+        if self.team_repository.count_members():
+            source = RepositoryPageSource(
+                self.team_repository.count_members,
+                self.team_repository.get_members_page,
+                self.team_repository.get_member_by_id,
+            )
+        else:
+            source = ListPageSource(SAMPLE_TEAM)
+        self.team_model.set_source(source)
+
+    def load_clients(self):
+        """Carrega os clientes do banco, ou os de exemplo se ainda não houver"""
+        if self.team_repository.count_clients():
+            source = RepositoryPageSource(
+                self.team_repository.count_clients,
+                self.team_repository.get_clients_page,
+                self.team_repository.get_client_by_id,
+            )
+        else:
+            source = ListPageSource(SAMPLE_CLIENTS)
+        self.client_model.set_source(source)
+
+    def filtrar(self, text):
+        """Filtra as tabelas de membros e de clientes pelo texto da busca"""
+        self.team_proxy.set_search_text(text)
+        self.client_proxy.set_search_text(text)
+
+    def on_member_action(self, action, row):
+        """Trata os botões de ação de uma linha da tabela de membros"""
+        if action == "delete":
+            self._remove_row(
+                self.team_model, row, "name", self.team_repository.delete_member
             )
 
-            email_layout.addWidget(email_label)
-            email_layout.addWidget(email_icon)
-            email_layout.addStretch()
-
-            self.team_table.setCellWidget(row, 2, email_container)
-
-            # Contato
-            self.team_table.setItem(row, 3, QTableWidgetItem(member[3]))
-
-            # Ações
-            actions_widget = QWidget()
-            actions_layout = QHBoxLayout(actions_widget)
-            actions_layout.setContentsMargins(5, 0, 5, 0)
-            actions_layout.setSpacing(5)
-
-            edit_btn = QPushButton()
-            edit_btn.setIcon(QIcon("./resources/icons/edit.svg"))
-            edit_btn.setToolTip("Editar")
-            edit_btn.setIconSize(QSize(16, 16))
-            edit_btn.setFixedSize(28, 28)
-            edit_btn.setStyleSheet(style.secondary_button_style)
+    def on_client_action(self, action, row):
+        """Trata os botões de ação de uma linha da tabela de clientes"""
+        if action == "delete":
+            self._remove_row(
+                self.client_model, row, "company", self.team_repository.delete_client
+            )
 
-            delete_btn = QPushButton()
-            delete_btn.setIcon(QIcon("./resources/icons/delete.svg"))
-            delete_btn.setToolTip("Remover")
-            delete_btn.setIconSize(QSize(16, 16))
-            delete_btn.setFixedSize(28, 28)
-            delete_btn.setStyleSheet(style.secondary_button_style)
+    def _remove_row(self, model, row, name_key, delete):
+        """Remove um registro do banco e apenas a sua linha da tabela"""
+        record = model.row_data(row)
+        if not record:
+            return
 
-            actions_layout.addWidget(edit_btn)
-            actions_layout.addWidget(delete_btn)
-            actions_layout.addStretch()
+        if not isinstance(record.get("id"), int):
+            QMessageBox.information(
+                self, "Remover", "Registros de exemplo não podem ser removidos."
+            )
+            return
 
-            self.team_table.setCellWidget(row, 4, actions_widget)
+        answer = QMessageBox.question(
+            self, "Remover", f"Remover '{record.get(name_key)}'?"
+        )
+        if answer != QMessageBox.Yes:
+            return
 
-    def add_sample_clients(self):
-        # Dados de exemplo
-        clients = [
-            [
-                "Empresa ABC",
-                "João Oliveira",
-                "joao@empresaabc.com",
-                "(11) 3456-7890",
-            ],
-            [
-                "XYZ Corp",
-                "Fernanda Gomes",
-                "fernanda@xyzcorp.com",
-                "(11) 2345-6789",
-            ],
-            [
-                "Tech Solutions",
-                "Ricardo Dias",
-                "ricardo@techsolutions.com",
-                "(11) 4567-8901",
-            ],
-            [
-                "Consultoria DEF",
-                "Amanda Cruz",
-                "amanda@def.com.br",
-                "(11) 5678-9012",
-            ],
-            [
-                "Associação GHI",
-                "Roberto Lima",
-                "roberto@ghi.org.br",
-                "(11) 6789-0123",
-            ],
-        ]
-
-        self.client_table.setRowCount(len(clients))
-
-        for row, client in enumerate(clients):
-            # Empresa/Cliente
-            self.client_table.setItem(row, 0, QTableWidgetItem(client[0]))
-
-            # Responsável
-            self.client_table.setItem(row, 1, QTableWidgetItem(client[1]))
-
-            # Email
-            email_container = QWidget()
-            email_layout = QHBoxLayout(email_container)
-            email_layout.setContentsMargins(5, 0, 5, 0)
-            email_layout.setSpacing(5)
-
-            email_label = QLabel(client[2])
-            email_label.setStyleSheet(f"color: {style.foreground_color};")
-
-            email_icon = QPushButton()
-            email_icon.setIcon(QIcon("./resources/icons/email.svg"))
-            email_icon.setToolTip("Enviar Email")
-            email_icon.setIconSize(QSize(16, 16))
-            email_icon.setFixedSize(24, 24)
-            email_icon.setStyleSheet(
-                f"""
-                QPushButton {{
-                    background-color: transparent;
-                    border: none;
-                }}
-                QPushButton:hover {{
-                    background-color: {style.current_line_color};
-                    border-radius: 12px;
-                }}
-            """
-            )
+        try:
+            delete(record["id"])
+        except sqlite3.Error as e:
+            QMessageBox.critical(self, "Erro", f"Erro ao remover: {str(e)}")
+            return
 
-            email_layout.addWidget(email_label)
-            email_layout.addWidget(email_icon)
-            email_layout.addStretch()
-
-            self.client_table.setCellWidget(row, 2, email_container)
-
-            # Telefone
-            self.client_table.setItem(row, 3, QTableWidgetItem(client[3]))
-
-            # Ações
-            actions_widget = QWidget()
-            actions_layout = QHBoxLayout(actions_widget)
-            actions_layout.setContentsMargins(5, 0, 5, 0)
-            actions_layout.setSpacing(5)
-
-            edit_btn = QPushButton()
-            edit_btn.setIcon(QIcon("./resources/icons/edit.svg"))
-            edit_btn.setToolTip("Editar")
-            edit_btn.setIconSize(QSize(16, 16))
-            edit_btn.setFixedSize(28, 28)
-            edit_btn.setStyleSheet(style.secondary_button_style)
-
-            delete_btn = QPushButton()
-            delete_btn.setIcon(QIcon("./resources/icons/delete.svg"))
-            delete_btn.setToolTip("Remover")
-            delete_btn.setIconSize(QSize(16, 16))
-            delete_btn.setFixedSize(28, 28)
-            delete_btn.setStyleSheet(style.secondary_button_style)
-
-            view_btn = QPushButton()
-            view_btn.setIcon(QIcon("./resources/icons/view.svg"))
-            view_btn.setToolTip("Ver Detalhes")
-            view_btn.setIconSize(QSize(16, 16))
-            view_btn.setFixedSize(28, 28)
-            view_btn.setStyleSheet(style.secondary_button_style)
-
-            actions_layout.addWidget(view_btn)
-            actions_layout.addWidget(edit_btn)
-            actions_layout.addWidget(delete_btn)
-            actions_layout.addStretch()
-
-            self.client_table.setCellWidget(row, 4, actions_widget)
+        # Remove apenas a linha excluída, sem recarregar a tabela
+        model.refresh_row(record["id"])
 
     def adicionar_membro(self):
         """Adiciona um novo membro à equipe"""
@@ -399,77 +327,15 @@ class TeamWidget(QWidget):
         if not ok4 or not contato:
             return
 
-        # Adicionar à tabela
-        row = self.team_table.rowCount()
-        self.team_table.insertRow(row)
-
-        # Nome
-        self.team_table.setItem(row, 0, QTableWidgetItem(nome))
-
-        # Função
-        self.team_table.setItem(row, 1, QTableWidgetItem(funcao))
-
-        # Email com ícone
-        email_container = QWidget()
-        email_layout = QHBoxLayout(email_container)
-        email_layout.setContentsMargins(5, 0, 5, 0)
-        email_layout.setSpacing(5)
-
-        email_label = QLabel(email)
-        email_label.setStyleSheet(f"color: {style.foreground_color};")
-
-        email_icon = QPushButton()
-        email_icon.setIcon(QIcon("./resources/icons/email.svg"))
-        email_icon.setToolTip("Enviar Email")
-        email_icon.setIconSize(QSize(16, 16))
-        email_icon.setFixedSize(24, 24)
-        email_icon.setStyleSheet(
-            f"""
-            QPushButton {{
-                background-color: transparent;
-                border: none;
-            }}
-            QPushButton:hover {{
-                background-color: {style.current_line_color};
-                border-radius: 12px;
-            }}
-        """
-        )
-
-        email_layout.addWidget(email_label)
-        email_layout.addWidget(email_icon)
-        email_layout.addStretch()
-
-        self.team_table.setCellWidget(row, 2, email_container)
-
-        # Contato
-        self.team_table.setItem(row, 3, QTableWidgetItem(contato))
-
-        # Ações
-        actions_widget = QWidget()
-        actions_layout = QHBoxLayout(actions_widget)
-        actions_layout.setContentsMargins(5, 0, 5, 0)
-        actions_layout.setSpacing(5)
-
-        edit_btn = QPushButton()
-        edit_btn.setIcon(QIcon("./resources/icons/edit.svg"))
-        edit_btn.setToolTip("Editar")
-        edit_btn.setIconSize(QSize(16, 16))
-        edit_btn.setFixedSize(28, 28)
-        edit_btn.setStyleSheet(style.secondary_button_style)
-
-        delete_btn = QPushButton()
-        delete_btn.setIcon(QIcon("./resources/icons/delete.svg"))
-        delete_btn.setToolTip("Remover")
-        delete_btn.setIconSize(QSize(16, 16))
-        delete_btn.setFixedSize(28, 28)
-        delete_btn.setStyleSheet(style.secondary_button_style)
-
-        actions_layout.addWidget(edit_btn)
-        actions_layout.addWidget(delete_btn)
-        actions_layout.addStretch()
-
-        self.team_table.setCellWidget(row, 4, actions_widget)
+        # Salvar no banco e recarregar a primeira página da tabela
+        try:
+            self.team_repository.create_member(
+                {"name": nome, "role": funcao, "email": email, "contact": contato}
+            )
+        except sqlite3.Error as e:
+            QMessageBox.critical(self, "Erro", f"Erro ao adicionar membro: {str(e)}")
+            return
+        self.load_team()
 
         QMessageBox.information(
             self, "Sucesso", f"Membro '{nome}' adicionado com sucesso!"
@@ -493,85 +359,20 @@ class TeamWidget(QWidget):
         if not ok4 or not telefone:
             return
 
-        # Adicionar à tabela
-        row = self.client_table.rowCount()
-        self.client_table.insertRow(row)
-
-        # Empresa
-        self.client_table.setItem(row, 0, QTableWidgetItem(empresa))
-
-        # Responsável
-        self.client_table.setItem(row, 1, QTableWidgetItem(responsavel))
-
-        # Email com ícone
-        email_container = QWidget()
-        email_layout = QHBoxLayout(email_container)
-        email_layout.setContentsMargins(5, 0, 5, 0)
-        email_layout.setSpacing(5)
-
-        email_label = QLabel(email)
-        email_label.setStyleSheet(f"color: {style.foreground_color};")
-
-        email_icon = QPushButton()
-        email_icon.setIcon(QIcon("./resources/icons/email.svg"))
-        email_icon.setToolTip("Enviar Email")
-        email_icon.setIconSize(QSize(16, 16))
-        email_icon.setFixedSize(24, 24)
-        email_icon.setStyleSheet(
-            f"""
-            QPushButton {{
-                background-color: transparent;
-                border: none;
-            }}
-            QPushButton:hover {{
-                background-color: {style.current_line_color};
-                border-radius: 12px;
-            }}
-        """
-        )
-
-        email_layout.addWidget(email_label)
-        email_layout.addWidget(email_icon)
-        email_layout.addStretch()
-
-        self.client_table.setCellWidget(row, 2, email_container)
-
-        # Telefone
-        self.client_table.setItem(row, 3, QTableWidgetItem(telefone))
-
-        # Ações
-        actions_widget = QWidget()
-        actions_layout = QHBoxLayout(actions_widget)
-        actions_layout.setContentsMargins(5, 0, 5, 0)
-        actions_layout.setSpacing(5)
-
-        edit_btn = QPushButton()
-        edit_btn.setIcon(QIcon("./resources/icons/edit.svg"))
-        edit_btn.setToolTip("Editar")
-        edit_btn.setIconSize(QSize(16, 16))
-        edit_btn.setFixedSize(28, 28)
-        edit_btn.setStyleSheet(style.secondary_button_style)
-
-        delete_btn = QPushButton()
-        delete_btn.setIcon(QIcon("./resources/icons/delete.svg"))
-        delete_btn.setToolTip("Remover")
-        delete_btn.setIconSize(QSize(16, 16))
-        delete_btn.setFixedSize(28, 28)
-        delete_btn.setStyleSheet(style.secondary_button_style)
-
-        view_btn = QPushButton()
-        view_btn.setIcon(QIcon("./resources/icons/view.svg"))
-        view_btn.setToolTip("Ver Detalhes")
-        view_btn.setIconSize(QSize(16, 16))
-        view_btn.setFixedSize(28, 28)
-        view_btn.setStyleSheet(style.secondary_button_style)
-
-        actions_layout.addWidget(view_btn)
-        actions_layout.addWidget(edit_btn)
-        actions_layout.addWidget(delete_btn)
-        actions_layout.addStretch()
-
-        self.client_table.setCellWidget(row, 4, actions_widget)
+        # Salvar no banco e recarregar a primeira página da tabela
+        try:
+            self.team_repository.create_client(
+                {
+                    "company": empresa,
+                    "contact_person": responsavel,
+                    "email": email,
+                    "phone": telefone,
+                }
+            )
+        except sqlite3.Error as e:
+            QMessageBox.critical(self, "Erro", f"Erro ao adicionar cliente: {str(e)}")
+            return
+        self.load_clients()
 
         QMessageBox.information(
             self, "Sucesso", f"Cliente '{empresa}' adicionado com sucesso!"
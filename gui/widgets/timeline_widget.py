@@ -1,28 +1,128 @@
-from PySide6.QtCore import QPoint, QRectF, QSize, Qt
-from PySide6.QtGui import QBrush, QColor, QFont, QIcon, QPainter, QPen
+import math
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from PySide6.QtCore import QPointF, QRectF, Qt, QTimer, QVariantAnimation
+from PySide6.QtGui import QBrush, QColor, QFont, QPainter, QPen, QPixmap, QPixmapCache
 from PySide6.QtWidgets import (
     QComboBox,
     QFrame,
+    QGraphicsItem,
     QGraphicsRectItem,
     QGraphicsScene,
-    QGraphicsTextItem,
     QGraphicsView,
     QHBoxLayout,
     QLabel,
     QPushButton,
-    QScrollArea,
-    QSizePolicy,
     QVBoxLayout,
     QWidget,
 )
 
 import gui.themes.dracula as style
+from gui.utils.icon_provider import get_icon
+from gui.utils.timeline_index import TimelineIndex
+from utils.logger import get_logger
+
+logger = get_logger("timeline_widget")
+
+# Cores por tipo de tarefa
+TASK_TYPE_COLORS = {
+    "captação": style.purple_color,
+    "edição": style.orange_color,
+    "entrega": style.green_color,
+    "aprovação": style.cyan_color,
+}
+
+# Status que sobrepõem a cor do tipo de tarefa
+STATUS_COLORS = {
+    "concluído": style.comment_color,
+    "atrasado": style.red_color,
+}
+
+
+def task_color(item: Dict[str, Any]) -> QColor:
+    """
+    Retorna a cor de um item da timeline.
+
+    O status (concluído/atrasado) tem prioridade, seguido da cor gravada no
+    item e, por fim, da cor do tipo de tarefa.
+    """
+    status = (item.get("status") or "").casefold()
+    if status in STATUS_COLORS:
+        return QColor(STATUS_COLORS[status])
+
+    if item.get("color"):
+        color = QColor(item["color"])
+        if color.isValid():
+            return color
+
+    task_type = (item.get("task_type") or "").casefold()
+    return QColor(TASK_TYPE_COLORS.get(task_type, style.purple_color))
+
+
+def example_timeline_items(day: Optional[datetime] = None) -> List[Dict[str, Any]]:
+    """
+    Gera itens de exemplo no mesmo formato de TimelineRepository.get_by_event.
+
+    Usado enquanto nenhum evento foi carregado do banco de dados.
+    """
+    if day is None:
+        day = datetime.now()
+    base = day.replace(hour=10, minute=0, second=0, microsecond=0)
+
+    # Responsável -> (início em horas a partir das 10h, duração, título, tipo, status)
+    tasks = {
+        "João Silva": [
+            (1.5, 2.0, "Captação - Palco Principal", "Captação", "Em andamento"),
+            (4.0, 1.0, "Patrocinador A - Stand", "Captação", "Pendente"),
+            (7.5, 1.5, "Captação - Backstage", "Captação", "Concluído"),
+        ],
+        "Maria Souza": [
+            (2.0, 1.5, "Edição - Abertura", "Edição", "Em andamento"),
+            (5.0, 0.5, "Entrega - Reels Patrocinador", "Entrega", "Concluído"),
+            (8.0, 2.0, "Edição - Teaser Final", "Edição", "Pendente"),
+        ],
+        "Carlos Lima": [
+            (3.0, 1.0, "Captação Drone - Área Externa", "Captação", "Pendente"),
+            (6.0, 0.5, "Captação Drone - Vista Geral", "Captação", "Atrasado"),
+        ],
+        "Ana Costa": [
+            (2.5, 0.5, "Aprovação - Material Inicial", "Aprovação", "Pendente"),
+            (4.5, 0.5, "Entrega - Stories", "Entrega", "Pendente"),
+            (9.0, 1.0, "Aprovação - Teaser", "Aprovação", "Pendente"),
+        ],
+    }
+
+    items = []
+    for member, member_tasks in tasks.items():
+        for start, duration, title, task_type, status in member_tasks:
+            start_time = base + timedelta(hours=start)
+            items.append(
+                {
+                    "id": f"example-{len(items)}",
+                    "title": title,
+                    "start_time": start_time.isoformat(),
+                    "end_time": (start_time + timedelta(hours=duration)).isoformat(),
+                    "responsible_name": member,
+                    "task_type": task_type,
+                    "status": status,
+                }
+            )
+    return items
 
 
 class TimelineWidget(QWidget):
+    # Intervalo (ms) da atualização automática durante o evento
+    AUTO_REFRESH_INTERVAL = 30000
+
     def __init__(self):
         super().__init__()
 
+        self.event_repository = None
+        self.timeline_repository = None
+        # Evento e itens/dependências do grafo em uso pela view
+        self._graph_key = None
+
         # Layout principal
         self.layout = QVBoxLayout(self)
         self.layout.setContentsMargins(20, 20, 20, 20)
@@ -52,12 +152,12 @@ class TimelineWidget(QWidget):
 
         # Botões de ação
         self.refresh_button = QPushButton("Atualizar")
-        self.refresh_button.setIcon(QIcon("./resources/icons/refresh.svg"))
+        self.refresh_button.setIcon(get_icon("refresh"))
         self.refresh_button.setStyleSheet(style.secondary_button_style)
         self.refresh_button.setFixedHeight(36)
 
         self.export_button = QPushButton("Exportar")
-        self.export_button.setIcon(QIcon("./resources/icons/export.svg"))
+        self.export_button.setIcon(get_icon("export"))
         self.export_button.setStyleSheet(style.secondary_button_style)
         self.export_button.setFixedHeight(36)
 
@@ -129,269 +229,799 @@ class TimelineWidget(QWidget):
         # View da timeline
         self.timeline_view = TimelineView()
 
+        # Itens do evento atual (antes de carregar um evento, os de exemplo)
+        self.timeline_items = list(self.timeline_view.timeline_items)
+
         # Adicionar todos os layouts ao layout principal
         self.layout.addLayout(self.header_layout)
         self.layout.addLayout(self.filter_layout)
         self.layout.addWidget(self.timeline_view)
 
+        # Conectar sinais
+        self.event_selector.currentIndexChanged.connect(self.on_event_changed)
+        self.refresh_button.clicked.connect(self.refresh_timeline)
+        self.member_filter.currentIndexChanged.connect(self.apply_filters)
+        self.activity_filter.currentIndexChanged.connect(self.apply_filters)
+        self.status_filter.currentIndexChanged.connect(self.apply_filters)
+
+        # Atualização periódica; como a view aplica só as diferenças, não há
+        # redesenho completo nem perda de rolagem/zoom
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(self.AUTO_REFRESH_INTERVAL)
+        self.refresh_timer.timeout.connect(self.refresh_timeline)
+
+    def load_initial_data(self, event_repository, timeline_repository=None):
+        """Carrega a lista de eventos e a timeline do evento selecionado"""
+        from database.TimelineRepository import TimelineRepository
+
+        self.event_repository = event_repository
+        self.timeline_repository = timeline_repository or TimelineRepository()
+
+        events = self.event_repository.get_all()
+        if not events:
+            # Sem eventos cadastrados, mantém a timeline de exemplo
+            return
+
+        self.event_selector.blockSignals(True)
+        self.event_selector.clear()
+        for event in events:
+            self.event_selector.addItem(event["name"], event["id"])
+        self.event_selector.blockSignals(False)
+
+        self.refresh_timeline()
+        self.refresh_timer.start()
+
+    def on_event_changed(self, index):
+        """Manipulador para quando o evento selecionado muda"""
+        if index < 0:
+            return
+        self.refresh_timeline()
+
+    def refresh_timeline(self):
+        """Recarrega os itens do evento selecionado a partir do banco de dados"""
+        event_id = self.event_selector.currentData()
+        if event_id is None or self.timeline_repository is None:
+            return
+
+        self.timeline_items = self.timeline_repository.get_by_event(event_id)
+        logger.info(f"Timeline carregada: {len(self.timeline_items)} itens")
+
+        # O caminho crítico considera todos os itens do evento, não só os
+        # filtrados. O grafo só é remontado quando o evento ou o conjunto de
+        # itens/dependências muda; as alterações de horário feitas pelo
+        # repositório já foram aplicadas a ele de forma incremental.
+        graph_key = (
+            event_id,
+            frozenset(
+                (str(item.get("id")), str(item.get("dependencies") or ""))
+                for item in self.timeline_items
+            ),
+        )
+        if graph_key != self._graph_key:
+            self._graph_key = graph_key
+            graph = self.timeline_repository.get_dependency_graph(
+                event_id, self.timeline_items
+            )
+        else:
+            graph = self.timeline_repository.get_dependency_graph(event_id)
+        self.timeline_view.set_schedule(graph)
+        self.update_member_filter()
+        self.apply_filters()
+
+    def update_member_filter(self):
+        """Preenche o filtro de membros com os responsáveis do evento"""
+        current = self.member_filter.currentText()
+        members = sorted(
+            {
+                item["responsible_name"]
+                for item in self.timeline_items
+                if item.get("responsible_name")
+            },
+            key=str.casefold,
+        )
+
+        self.member_filter.blockSignals(True)
+        self.member_filter.clear()
+        self.member_filter.addItem("Todos os Membros")
+        self.member_filter.addItems(members)
+        if current in members:
+            self.member_filter.setCurrentText(current)
+        self.member_filter.blockSignals(False)
+
+    def apply_filters(self, *args):
+        """Aplica os filtros de membro, atividade e status aos itens carregados"""
+        member = (
+            self.member_filter.currentText()
+            if self.member_filter.currentIndex() > 0
+            else None
+        )
+        activity = (
+            self.activity_filter.currentText().casefold()
+            if self.activity_filter.currentIndex() > 0
+            else None
+        )
+        status = (
+            self.status_filter.currentText().casefold()
+            if self.status_filter.currentIndex() > 0
+            else None
+        )
+
+        filtered = [
+            item
+            for item in self.timeline_items
+            if (member is None or item.get("responsible_name") == member)
+            and (
+                activity is None or (item.get("task_type") or "").casefold() == activity
+            )
+            and (status is None or (item.get("status") or "").casefold() == status)
+        ]
+        self.timeline_view.set_items(filtered)
+
+
+class TimelineTaskItem(QGraphicsRectItem):
+    """Barra de uma tarefa; o título é desenhado no próprio paint."""
+
+    # Largura mínima (px) para desenhar o título
+    MIN_TEXT_WIDTH = 24
+
+    _font = None
+
+    def __init__(self, rect: QRectF, title: str, color: QColor, tooltip: str = ""):
+        super().__init__(rect)
+        self.title = title
+        self.critical = False
+        self._color_animation = None
+        self.setBrush(QBrush(color))
+        self.setPen(self.base_pen())
+        self.setZValue(1)  # Sobrepor às linhas de grade
+        if tooltip:
+            self.setToolTip(tooltip)
+
+    def base_pen(self) -> QPen:
+        return QPen(QColor(style.background_color), 1)
+
+    def set_critical(self, critical: bool):
+        """Destaca a barra quando o item está no caminho crítico"""
+        if critical == self.critical:
+            return
+        self.critical = critical
+        pen = self.base_pen()
+        if critical:
+            pen.setColor(QColor(style.pink_color))
+            pen.setWidth(3)
+        self.setPen(pen)
+
+    def set_title(self, title: str):
+        if title != self.title:
+            self.title = title
+            self.update()
+
+    def set_color(self, color: QColor, duration: int = 0):
+        """
+        Altera a cor da barra, com transição animada se ``duration`` > 0.
+
+        Args:
+            color: Nova cor
+            duration: Duração da transição em milissegundos
+        """
+        current = self.brush().color()
+        if current == color:
+            return
+
+        self.stop_animation()
+        if duration <= 0:
+            self.setBrush(QBrush(color))
+            return
+
+        animation = QVariantAnimation()
+        animation.setStartValue(current)
+        animation.setEndValue(color)
+        animation.setDuration(duration)
+        animation.valueChanged.connect(lambda value: self.setBrush(QBrush(value)))
+        animation.start()
+        self._color_animation = animation
+
+    def stop_animation(self):
+        """Interrompe a transição de cor em andamento (aplicando a cor final)"""
+        if self._color_animation is not None:
+            self._color_animation.stop()
+            self.setBrush(QBrush(self._color_animation.endValue()))
+            self._color_animation = None
+
+    @classmethod
+    def font(cls) -> QFont:
+        if cls._font is None:
+            cls._font = QFont("Arial", 8)
+        return cls._font
+
+    def paint(self, painter, option, widget=None):
+        rect = self.rect()
+        painter.setPen(self.pen())
+        painter.setBrush(self.brush())
+        painter.drawRect(rect)
+
+        text_rect = rect.adjusted(4, 0, -4, 0)
+        if not self.title or text_rect.width() < self.MIN_TEXT_WIDTH:
+            return
+
+        painter.setFont(self.font())
+        painter.setPen(QColor(style.background_color))
+        text = painter.fontMetrics().elidedText(
+            self.title, Qt.TextElideMode.ElideRight, int(text_rect.width())
+        )
+        painter.drawText(text_rect, Qt.AlignmentFlag.AlignCenter, text)
+
+
+class TimelineClusterItem(TimelineTaskItem):
+    """Grupo de tarefas próximas, exibido quando o zoom está afastado."""
+
+    # Quantidade máxima de títulos listados no tooltip
+    MAX_TOOLTIP_TITLES = 10
+
+    def __init__(self, rect: QRectF, entries):
+        titles = [entry.data.get("title") or "" for entry in entries]
+        tooltip = "\n".join(titles[: self.MAX_TOOLTIP_TITLES])
+        if len(titles) > self.MAX_TOOLTIP_TITLES:
+            tooltip += f"\n... e mais {len(titles) - self.MAX_TOOLTIP_TITLES}"
+
+        super().__init__(
+            rect, f"{len(entries)} tarefas", QColor(style.comment_color), tooltip
+        )
+
+    def base_pen(self) -> QPen:
+        pen = QPen(QColor(style.foreground_color), 1)
+        pen.setStyle(Qt.PenStyle.DashLine)
+        return pen
+
+
+class TimelineHeaderItem(QGraphicsItem):
+    """Régua de horários, mantida no topo da área visível."""
+
+    def __init__(self, view: "TimelineView"):
+        super().__init__()
+        self.view = view
+        self._width = 0.0
+        self.setZValue(12)
+        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemUsesExtendedStyleOption)
+
+    def set_width(self, width: float):
+        self.prepareGeometryChange()
+        self._width = width
+
+    def boundingRect(self) -> QRectF:
+        return QRectF(0, 0, self._width, TimelineView.HEADER_HEIGHT)
+
+    def paint(self, painter, option, widget=None):
+        height = TimelineView.HEADER_HEIGHT
+        exposed = option.exposedRect
+        painter.fillRect(exposed, QColor(style.current_line_color))
+        painter.setPen(QColor(style.comment_color))
+        painter.drawLine(
+            QPointF(exposed.left(), height - 1), QPointF(exposed.right(), height - 1)
+        )
+
+        painter.setFont(self.view.label_font())
+        label_width = TimelineView.MIN_TICK_SPACING
+        for x, seconds in self.view.ticks(
+            exposed.left() - label_width, exposed.right()
+        ):
+            painter.setPen(QColor(style.comment_color))
+            painter.drawLine(QPointF(x, height - 8), QPointF(x, height))
+            painter.setPen(QColor(style.foreground_color))
+            painter.drawText(
+                QRectF(x + 4, 0, label_width, height),
+                Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                self.view.tick_label(seconds),
+            )
+
+
+class TimelineRowLabelsItem(QGraphicsItem):
+    """Nomes dos responsáveis, mantidos na borda esquerda da área visível."""
+
+    WIDTH = 180
+
+    def __init__(self, view: "TimelineView"):
+        super().__init__()
+        self.view = view
+        self._height = 0.0
+        self.setZValue(11)
+        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemUsesExtendedStyleOption)
+
+    def set_height(self, height: float):
+        self.prepareGeometryChange()
+        self._height = height
+
+    def boundingRect(self) -> QRectF:
+        return QRectF(0, 0, self.WIDTH, self._height)
+
+    def paint(self, painter, option, widget=None):
+        exposed = option.exposedRect
+        rows = self.view.index.rows
+        first, last = self.view.row_range(exposed.top(), exposed.bottom())
+
+        painter.setFont(self.view.label_font())
+        metrics = painter.fontMetrics()
+        background = QColor(style.current_line_color)
+        background.setAlpha(220)
+
+        for row in range(first, last + 1):
+            y = TimelineView.HEADER_HEIGHT + row * TimelineView.ROW_HEIGHT
+            text = metrics.elidedText(
+                rows[row], Qt.TextElideMode.ElideRight, self.WIDTH - 24
+            )
+            label_rect = QRectF(
+                6, y + 4, metrics.horizontalAdvance(text) + 12, metrics.height() + 6
+            )
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(background)
+            painter.drawRoundedRect(label_rect, 4, 4)
+            painter.setPen(QColor(style.foreground_color))
+            painter.drawText(label_rect, Qt.AlignmentFlag.AlignCenter, text)
+
 
 class TimelineView(QGraphicsView):
-    def __init__(self):
+    """
+    Visualização da timeline de um evento.
+
+    Os itens vêm de ``TimelineRepository.get_by_event`` e ficam em um
+    ``TimelineIndex``; apenas os itens dentro da janela visível (mais uma
+    margem) viram ``QGraphicsItem``. Com o zoom afastado, tarefas muito
+    próximas são agrupadas em clusters. O grid de fundo é desenhado em tiles
+    guardados no ``QPixmapCache``.
+
+    ``set_items`` pode ser chamado a cada atualização: os itens da cena são
+    mantidos por ID e apenas os novos, removidos ou alterados são tocados,
+    preservando rolagem e zoom.
+    """
+
+    HEADER_HEIGHT = 40
+    ROW_HEIGHT = 60
+    TILE_SIZE = 512
+
+    # Limites e padrão do zoom, em pixels por hora
+    MIN_PIXELS_PER_HOUR = 4.0
+    MAX_PIXELS_PER_HOUR = 2400.0
+    DEFAULT_PIXELS_PER_HOUR = 160.0
+
+    # Abaixo deste zoom as tarefas próximas são agrupadas
+    DETAIL_PIXELS_PER_HOUR = 60.0
+    # Distância (px) abaixo da qual duas tarefas entram no mesmo cluster
+    CLUSTER_GAP = 6
+    # Espaçamento mínimo (px) entre marcações da régua
+    MIN_TICK_SPACING = 80
+    # Largura mínima (px) de uma tarefa muito curta
+    MIN_ITEM_WIDTH = 2.0
+    # Margem materializada além da área visível (fração da viewport)
+    WINDOW_MARGIN = 0.5
+    # Duração (ms) da transição de cor quando o status de uma tarefa muda
+    COLOR_ANIMATION_MS = 400
+
+    # Intervalos possíveis da régua (segundos), todos divisores de um dia
+    GRID_STEPS = (900, 1800, 3600, 7200, 10800, 21600, 43200, 86400)
+
+    _label_font = None
+
+    def __init__(self, items: Optional[List[Dict[str, Any]]] = None):
         super().__init__()
 
         # Configuração da view
         self.setRenderHint(QPainter.RenderHint.Antialiasing)
         self.setBackgroundBrush(QBrush(QColor(style.background_color)))
         self.setFrameShape(QFrame.Shape.NoFrame)
-        self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
+        self.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
+        self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.SmartViewportUpdate)
+        self.setCacheMode(QGraphicsView.CacheModeFlag.CacheBackground)
+        self.setOptimizationFlags(
+            QGraphicsView.OptimizationFlag.DontSavePainterState
+            | QGraphicsView.OptimizationFlag.DontAdjustForAntialiasing
+        )
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOn)
 
-        # Criar a cena
+        # Criar a cena (índice BSP para consultas por área)
         self.scene = QGraphicsScene()
+        self.scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.BspTreeIndex)
         self.setScene(self.scene)
 
-        # Configurar cena
-        self.scene.setBackgroundBrush(QBrush(QColor(style.background_color)))
+        self.index = TimelineIndex()
+        self.timeline_items: List[Dict[str, Any]] = []
+        self.pixels_per_hour = self.DEFAULT_PIXELS_PER_HOUR
+        self.timeline_repository = None
+
+        # Cronograma calculado (caminho crítico) e itens sem folga
+        self.schedule = None
+        self._critical_ids = set()
+
+        # Itens materializados, por chave ("task", id) ou ("cluster", ...)
+        self._visible_items: Dict[tuple, QGraphicsItem] = {}
+        self._materialized = QRectF()
+        self._tile_generation = 0
+
+        # Régua e nomes das linhas acompanham a rolagem
+        self.header_item = TimelineHeaderItem(self)
+        self.row_labels_item = TimelineRowLabelsItem(self)
+        self.scene.addItem(self.header_item)
+        self.scene.addItem(self.row_labels_item)
 
-        # Gerar timeline de exemplo
-        self.generate_example_timeline()
+        if items is None:
+            # Gerar timeline de exemplo
+            self.generate_example_timeline()
+        else:
+            self.set_items(items)
+
+    # ----- Dados -----
 
     def generate_example_timeline(self):
-        # Limpar cena anterior
-        self.scene.clear()
-
-        # Definir dimensões da timeline
-        timeline_width = 2000  # Largura total (scrollable)
-        timeline_height = 600  # Altura visível
-
-        # Configurar dimensões da cena
-        self.scene.setSceneRect(0, 0, timeline_width, timeline_height)
-
-        # Desenhar grid de horas (linhas verticais)
-        hours = 12  # 12 horas na timeline
-        hour_width = timeline_width / hours
-
-        # Desenhar linhas horizontais (separadores de membros da equipe)
-        team_members = [
-            "João (Cinegrafia)",
-            "Maria (Edição)",
-            "Carlos (Drone)",
-            "Ana (Coordenação)",
-        ]
-        row_height = timeline_height / (len(team_members) + 1)  # +1 para cabeçalho
-
-        # Desenhar cabeçalho com horas
-        header_rect = QGraphicsRectItem(0, 0, timeline_width, row_height)
-        header_rect.setBrush(QBrush(QColor(style.current_line_color)))
-        header_rect.setPen(QPen(QColor(style.comment_color)))
-        self.scene.addItem(header_rect)
-
-        # Adicionar horas ao cabeçalho
-        for i in range(hours + 1):
-            hour = 10 + i  # Começando às 10h
-            hour_str = f"{hour}:00" if hour < 24 else f"{hour-24}:00"
-
-            # Texto da hora
-            hour_text = QGraphicsTextItem(hour_str)
-            hour_text.setFont(QFont("Arial", 10))
-            hour_text.setDefaultTextColor(QColor(style.foreground_color))
-            hour_text.setPos(i * hour_width - 15, 10)
-            self.scene.addItem(hour_text)
-
-            # Linha vertical da hora
-            if i > 0:
-                hour_line = QGraphicsRectItem(i * hour_width, 0, 1, timeline_height)
-                hour_line.setBrush(QBrush(QColor(style.comment_color)))
-                hour_line.setPen(QPen(QColor(style.comment_color)))
-                self.scene.addItem(hour_line)
-
-        # Adicionar membros da equipe e suas linhas
-        for i, member in enumerate(team_members):
-            # Posição vertical
-            y_pos = (i + 1) * row_height
-
-            # Linha horizontal (separador)
-            line = QGraphicsRectItem(0, y_pos, timeline_width, 1)
-            line.setBrush(QBrush(QColor(style.comment_color)))
-            line.setPen(QPen(QColor(style.comment_color)))
-            self.scene.addItem(line)
-
-            # Nome do membro
-            member_text = QGraphicsTextItem(member)
-            member_text.setFont(QFont("Arial", 10))
-            member_text.setDefaultTextColor(QColor(style.foreground_color))
-            member_text.setPos(10, y_pos + 10)
-            self.scene.addItem(member_text)
-
-            # Adicionar tarefas para este membro
-            self.add_tasks_for_member(i, y_pos, row_height, hour_width)
-
-    def add_tasks_for_member(self, member_index, y_pos, row_height, hour_width):
-        # Cores para diferentes tipos de tarefas
-        task_colors = {
-            "captação": QColor(style.purple_color),
-            "edição": QColor(style.orange_color),
-            "entrega": QColor(style.green_color),
-            "aprovação": QColor(style.cyan_color),
-            "concluído": QColor(style.comment_color),
-            "atrasado": QColor(style.red_color),
-        }
-
-        # Exemplo de tarefas para cada membro
-        if member_index == 0:  # João (Cinegrafia)
-            # Tarefa 1: Captação de palco
-            self.add_task(
-                1.5,
-                2.0,
-                y_pos,
-                row_height,
-                hour_width,
-                "Captação - Palco Principal",
-                task_colors["captação"],
-            )
+        """Exibe a timeline de exemplo"""
+        self.set_items(example_timeline_items())
 
-            # Tarefa 2: Captação de patrocinador
-            self.add_task(
-                4.0,
-                1.0,
-                y_pos,
-                row_height,
-                hour_width,
-                "Patrocinador A - Stand",
-                task_colors["captação"],
-            )
+    def load_event(self, event_id, filters=None) -> int:
+        """
+        Carrega os itens de um evento do banco de dados.
 
-            # Tarefa 3: Captação concluída
-            self.add_task(
-                7.5,
-                1.5,
-                y_pos,
-                row_height,
-                hour_width,
-                "Captação - Backstage",
-                task_colors["concluído"],
-            )
+        Args:
+            event_id: ID do evento
+            filters: Filtros repassados a TimelineRepository.get_by_event
 
-        elif member_index == 1:  # Maria (Edição)
-            # Tarefa 1: Edição em andamento
-            self.add_task(
-                2.0,
-                1.5,
-                y_pos,
-                row_height,
-                hour_width,
-                "Edição - Abertura",
-                task_colors["edição"],
-            )
+        Returns:
+            int: Número de itens carregados
+        """
+        if self.timeline_repository is None:
+            from database.TimelineRepository import TimelineRepository
 
-            # Tarefa 2: Entrega concluída
-            self.add_task(
-                5.0,
-                0.5,
-                y_pos,
-                row_height,
-                hour_width,
-                "Entrega - Reels Patrocinador",
-                task_colors["concluído"],
-            )
+            self.timeline_repository = TimelineRepository()
 
-            # Tarefa 3: Edição futura
-            self.add_task(
-                8.0,
-                2.0,
-                y_pos,
-                row_height,
-                hour_width,
-                "Edição - Teaser Final",
-                task_colors["edição"],
-            )
+        items = self.timeline_repository.get_by_event(event_id, filters)
+        self.set_items(items)
+        return len(self.index)
 
-        elif member_index == 2:  # Carlos (Drone)
-            # Tarefa 1: Captação drone
-            self.add_task(
-                3.0,
-                1.0,
-                y_pos,
-                row_height,
-                hour_width,
-                "Captação Drone - Área Externa",
-                task_colors["captação"],
-            )
+    def set_schedule(self, graph):
+        """
+        Define o grafo de dependências usado para destacar o caminho crítico.
 
-            # Tarefa 2: Captação atrasada
-            self.add_task(
-                6.0,
-                0.5,
-                y_pos,
-                row_height,
-                hour_width,
-                "Captação Drone - Vista Geral",
-                task_colors["atrasado"],
-            )
+        Args:
+            graph: DependencyGraph do evento, ou None para remover o destaque
+        """
+        self.schedule = graph
+        if graph is not None and graph.dependency_count:
+            self._critical_ids = graph.critical_ids()
+        else:
+            self._critical_ids = set()
 
-        elif member_index == 3:  # Ana (Coordenação)
-            # Tarefa 1: Aprovação
-            self.add_task(
-                2.5,
-                0.5,
-                y_pos,
-                row_height,
-                hour_width,
-                "Aprovação - Material Inicial",
-                task_colors["aprovação"],
-            )
+        for key, item in self._visible_items.items():
+            if key[0] == "task":
+                item.set_critical(key[1] in self._critical_ids)
+                item.setToolTip(self._task_tooltip(self.index.get(key[1]).data))
+
+    def set_items(self, items: List[Dict[str, Any]]):
+        """
+        Atualiza os itens exibidos.
+
+        O índice temporal é reconstruído, mas os QGraphicsItem existentes são
+        reaproveitados por ID: só os itens adicionados, removidos, movidos ou
+        com status alterado são modificados na cena.
+        """
+        old_origin = self.index.origin
+        old_rows = list(self.index.rows)
+
+        self.timeline_items = list(items)
+        self.index.rebuild(self.timeline_items)
+
+        if self.index.rows != old_rows or self.index.origin != old_origin:
+            self._invalidate_tiles()
+            self.header_item.update()
+            self.row_labels_item.update()
+        self._update_scene_rect()
+
+        # Se a origem mudou, compensa a rolagem para o conteúdo não saltar
+        if old_origin is not None and self.index.origin is not None:
+            shift = (old_origin - self.index.origin).total_seconds() * self._scale
+            if shift:
+                scroll_bar = self.horizontalScrollBar()
+                scroll_bar.setValue(int(scroll_bar.value() + shift))
+
+        self._refresh_visible(force=True, sync=True)
+
+    # ----- Geometria -----
+
+    @property
+    def _scale(self) -> float:
+        """Pixels por segundo."""
+        return self.pixels_per_hour / 3600.0
+
+    @classmethod
+    def label_font(cls) -> QFont:
+        if cls._label_font is None:
+            cls._label_font = QFont("Arial", 10)
+        return cls._label_font
+
+    def row_range(self, top: float, bottom: float):
+        """Retorna (primeira, última) linha que intersecta o intervalo vertical"""
+        count = len(self.index.rows)
+        first = max(0, int((top - self.HEADER_HEIGHT) // self.ROW_HEIGHT))
+        last = min(count - 1, int((bottom - self.HEADER_HEIGHT) // self.ROW_HEIGHT))
+        return first, last
+
+    def grid_step(self) -> int:
+        """Intervalo da régua (segundos) para o zoom atual"""
+        for step in self.GRID_STEPS:
+            if step * self._scale >= self.MIN_TICK_SPACING:
+                return step
+        return self.GRID_STEPS[-1]
+
+    def ticks(self, x0: float, x1: float):
+        """Gera (x, segundos) das marcações da régua entre x0 e x1"""
+        step = self.grid_step()
+        scale = self._scale
+        # Alinha as marcações à meia-noite da origem
+        offset = 0
+        if self.index.origin is not None:
+            offset = self.index.origin.hour * 3600
+        seconds = math.floor((max(x0, 0) / scale + offset) / step) * step - offset
+        while seconds * scale <= x1:
+            if seconds >= 0:
+                yield seconds * scale, seconds
+            seconds += step
+
+    def tick_label(self, seconds: float) -> str:
+        """Texto de uma marcação da régua"""
+        if self.index.origin is None:
+            return f"{int(seconds // 3600)}h"
+        moment = self.index.origin + timedelta(seconds=seconds)
+        if moment.hour == 0 and moment.minute == 0:
+            return moment.strftime("%d/%m")
+        return moment.strftime("%H:%M")
+
+    def _update_scene_rect(self):
+        width = max(
+            float(self.viewport().width()), (self.index.end_time + 3600) * self._scale
+        )
+        height = max(
+            float(self.viewport().height()),
+            self.HEADER_HEIGHT + max(1, len(self.index.rows)) * self.ROW_HEIGHT,
+        )
+        self.scene.setSceneRect(0, 0, width, height)
+        self.header_item.set_width(width)
+        self.row_labels_item.set_height(height)
+        self._pin_overlays()
+
+    def _pin_overlays(self):
+        """Mantém a régua no topo e os nomes das linhas à esquerda"""
+        top_left = self.mapToScene(0, 0)
+        self.header_item.setPos(0, max(0.0, top_left.y()))
+        self.row_labels_item.setPos(max(0.0, top_left.x()), 0)
+
+    # ----- Zoom e rolagem -----
+
+    def set_zoom(self, pixels_per_hour: float, anchor: Optional[float] = None):
+        """
+        Altera o zoom mantendo fixo o instante sob ``anchor``.
+
+        Args:
+            pixels_per_hour: Novo zoom
+            anchor: Posição x na viewport (padrão: centro)
+        """
+        pixels_per_hour = min(
+            self.MAX_PIXELS_PER_HOUR, max(self.MIN_PIXELS_PER_HOUR, pixels_per_hour)
+        )
+        if math.isclose(pixels_per_hour, self.pixels_per_hour):
+            return
+
+        if anchor is None:
+            anchor = self.viewport().width() / 2
+        seconds = self.mapToScene(int(anchor), 0).x() / self._scale
+
+        self.pixels_per_hour = pixels_per_hour
+        self._invalidate_tiles()
+        self._update_scene_rect()
+        self.horizontalScrollBar().setValue(int(seconds * self._scale - anchor))
+        self._pin_overlays()
+        self._refresh_visible(force=True, sync=True)
+
+    def wheelEvent(self, event):
+        # Ctrl + roda altera o zoom; sem modificador, rola normalmente
+        if event.modifiers() & Qt.KeyboardModifier.ControlModifier:
+            factor = 1.25 ** (event.angleDelta().y() / 120)
+            self.set_zoom(self.pixels_per_hour * factor, event.position().x())
+            event.accept()
+            return
+        super().wheelEvent(event)
+
+    def scrollContentsBy(self, dx, dy):
+        super().scrollContentsBy(dx, dy)
+        self._pin_overlays()
+        self._refresh_visible()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._update_scene_rect()
+        self._refresh_visible()
+
+    # ----- Materialização dos itens visíveis -----
+
+    def _discard_item(self, item: QGraphicsItem):
+        item.stop_animation()
+        self.scene.removeItem(item)
+
+    def _refresh_visible(self, force: bool = False, sync: bool = False):
+        """
+        Cria apenas os itens da janela visível e remove os que saíram dela.
+
+        Args:
+            force: Recalcula mesmo se a área visível já estiver materializada
+            sync: Atualiza também geometria, título e cor dos itens existentes
+        """
+        view_rect = self.mapToScene(self.viewport().rect()).boundingRect()
+        if not force and self._materialized.contains(view_rect):
+            return
+
+        margin_x = view_rect.width() * self.WINDOW_MARGIN
+        margin_y = view_rect.height() * self.WINDOW_MARGIN
+        window = view_rect.adjusted(-margin_x, -margin_y, margin_x, margin_y)
+
+        scale = self._scale
+        t0 = max(0.0, window.left() / scale)
+        t1 = window.right() / scale
+        first, last = self.row_range(window.top(), window.bottom())
+        detailed = self.pixels_per_hour >= self.DETAIL_PIXELS_PER_HOUR
+
+        wanted = {}
+        for row_number in range(first, last + 1):
+            row = self.index.rows[row_number]
+            if detailed:
+                for entry in self.index.query(row, t0, t1):
+                    wanted[("task", entry.id)] = (
+                        row_number,
+                        entry.start,
+                        entry.end,
+                        [entry],
+                    )
+                continue
+
+            gap = self.CLUSTER_GAP / scale
+            for start, end, members in self.index.clusters(row, t0, t1, gap):
+                if len(members) == 1:
+                    key = ("task", members[0].id)
+                else:
+                    key = ("cluster", row, members[0].id, members[-1].id, len(members))
+                wanted[key] = (row_number, start, end, members)
+
+        for key in list(self._visible_items):
+            if key not in wanted:
+                self._discard_item(self._visible_items.pop(key))
+
+        for key, (row_number, start, end, members) in wanted.items():
+            item = self._visible_items.get(key)
+            if item is None:
+                item = self._create_item(key, row_number, start, end, members)
+                self.scene.addItem(item)
+                self._visible_items[key] = item
+            elif sync:
+                self._update_item(item, key, row_number, start, end, members)
 
-            # Tarefa 2: Entrega
-            self.add_task(
-                4.5,
-                0.5,
-                y_pos,
-                row_height,
-                hour_width,
-                "Entrega - Stories",
-                task_colors["entrega"],
+        self._materialized = window
+
+    def _item_rect(self, row_number: int, start: float, end: float) -> QRectF:
+        height = self.ROW_HEIGHT * 0.7
+        y = (
+            self.HEADER_HEIGHT
+            + row_number * self.ROW_HEIGHT
+            + (self.ROW_HEIGHT - height) / 2
+        )
+        width = max(self.MIN_ITEM_WIDTH, (end - start) * self._scale)
+        return QRectF(start * self._scale, y, width, height)
+
+    def _create_item(self, key, row_number, start, end, members) -> QGraphicsItem:
+        rect = self._item_rect(row_number, start, end)
+        if key[0] == "cluster":
+            item = TimelineClusterItem(rect, members)
+            item.set_critical(any(entry.id in self._critical_ids for entry in members))
+            return item
+
+        data = members[0].data
+        item = TimelineTaskItem(
+            rect, data.get("title") or "", task_color(data), self._task_tooltip(data)
+        )
+        item.set_critical(key[1] in self._critical_ids)
+        return item
+
+    def _update_item(self, item, key, row_number, start, end, members):
+        """Aplica a um item existente a posição e os dados atuais"""
+        rect = self._item_rect(row_number, start, end)
+        if item.rect() != rect:
+            item.setRect(rect)
+
+        if key[0] == "task":
+            data = members[0].data
+            item.set_title(data.get("title") or "")
+            item.setToolTip(self._task_tooltip(data))
+            item.set_color(task_color(data), self.COLOR_ANIMATION_MS)
+            item.set_critical(key[1] in self._critical_ids)
+
+    def _task_tooltip(self, data: Dict[str, Any]) -> str:
+        lines = [
+            part
+            for part in (
+                data.get("title"),
+                data.get("task_type"),
+                data.get("status"),
+                data.get("location"),
             )
+            if part
+        ]
+
+        if self._critical_ids and self.schedule is not None:
+            slack = self.schedule.slack(data.get("id"))
+            if str(data.get("id")) in self._critical_ids:
+                lines.append("Caminho crítico")
+            elif slack is not None:
+                minutes = int(slack // 60)
+                lines.append(f"Folga: {minutes // 60}h{minutes % 60:02d}")
+        return "\n".join(lines)
+
+    # ----- Fundo em tiles -----
 
-            # Tarefa 3: Aprovação futura
-            self.add_task(
-                9.0,
-                1.0,
-                y_pos,
-                row_height,
-                hour_width,
-                "Aprovação - Teaser",
-                task_colors["aprovação"],
+    def _invalidate_tiles(self):
+        """Descarta os tiles de fundo (zoom ou linhas mudaram)"""
+        self._tile_generation += 1
+        self.resetCachedContent()
+
+    def drawBackground(self, painter, rect):
+        painter.fillRect(rect, QColor(style.background_color))
+
+        tile = self.TILE_SIZE
+        first_x = int(math.floor(rect.left() / tile))
+        last_x = int(math.floor(rect.right() / tile))
+        first_y = int(math.floor(rect.top() / tile))
+        last_y = int(math.floor(rect.bottom() / tile))
+
+        for tile_y in range(max(0, first_y), last_y + 1):
+            for tile_x in range(max(0, first_x), last_x + 1):
+                painter.drawPixmap(
+                    QPointF(tile_x * tile, tile_y * tile), self._tile(tile_x, tile_y)
+                )
+
+    def _tile(self, tile_x: int, tile_y: int) -> QPixmap:
+        """Retorna um tile do grid de fundo, renderizando-o se necessário"""
+        ratio = self.devicePixelRatioF()
+        cache_key = (
+            f"timeline_tile:{id(self)}:{self._tile_generation}:"
+            f"{tile_x}:{tile_y}@{ratio:.2f}"
+        )
+        pixmap = QPixmap()
+        if QPixmapCache.find(cache_key, pixmap):
+            return pixmap
+
+        tile = self.TILE_SIZE
+        left, top = tile_x * tile, tile_y * tile
+        right, bottom = left + tile, top + tile
+
+        pixmap = QPixmap(int(tile * ratio), int(tile * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(QColor(style.background_color))
+
+        painter = QPainter(pixmap)
+        painter.translate(-left, -top)
+
+        # Faixas alternadas e separadores das linhas
+        band = QColor(style.current_line_color)
+        band.setAlpha(60)
+        line_pen = QPen(QColor(style.comment_color), 1)
+        first, last = self.row_range(top, bottom)
+        for row_number in range(first, last + 1):
+            y = self.HEADER_HEIGHT + row_number * self.ROW_HEIGHT
+            if row_number % 2:
+                painter.fillRect(QRectF(left, y, tile, self.ROW_HEIGHT), band)
+            painter.setPen(line_pen)
+            painter.drawLine(
+                QPointF(left, y + self.ROW_HEIGHT), QPointF(right, y + self.ROW_HEIGHT)
             )
 
-    def add_task(
-        self, start_hour, duration, y_pos, row_height, hour_width, title, color
-    ):
-        # Calcular posições
-        x = start_hour * hour_width
-        width = duration * hour_width
-        height = row_height * 0.7
-        y = y_pos + (row_height - height) / 2
-
-        # Criar retângulo da tarefa
-        task_rect = QGraphicsRectItem(x, y, width, height)
-        task_rect.setBrush(QBrush(color))
-        task_rect.setPen(QPen(QColor(style.background_color), 1))
-        task_rect.setZValue(1)  # Sobrepor às linhas de grade
-
-        # Adicionar texto
-        task_text = QGraphicsTextItem(title)
-        task_text.setFont(QFont("Arial", 8))
-        task_text.setDefaultTextColor(QColor(style.background_color))
-
-        # Centralizar texto (aproximadamente)
-        text_width = task_text.boundingRect().width()
-        text_height = task_text.boundingRect().height()
-        text_x = x + (width - text_width) / 2
-        text_y = y + (height - text_height) / 2
-
-        task_text.setPos(text_x, text_y)
-        task_text.setZValue(2)  # Sobrepor ao retângulo
-
-        # Adicionar à cena
-        self.scene.addItem(task_rect)
-        self.scene.addItem(task_text)
+        # Linhas verticais do grid
+        grid_top = max(float(top), float(self.HEADER_HEIGHT))
+        painter.setPen(line_pen)
+        for x, _ in self.ticks(left, right):
+            painter.drawLine(QPointF(x, grid_top), QPointF(x, bottom))
+
+        painter.end()
+        QPixmapCache.insert(cache_key, pixmap)
+        return pixmap
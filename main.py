@@ -6,6 +6,7 @@ from PySide6.QtWidgets import QApplication
 
 from gui.main_window import MainWindow
 from gui.splash_screen import SplashScreen
+from gui.themes.theme_compiler import apply_theme
 
 # Garantir que o diretório atual esteja no path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -15,6 +16,9 @@ if __name__ == "__main__":
     app = QApplication(sys.argv)
     app.setApplicationName("GoNetwork AI")
 
+    # Aplicar a folha de estilos global compilada a partir do tema
+    apply_theme()
+
     # Exibir tela de splash
     splash = SplashScreen()
     splash.show()
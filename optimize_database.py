@@ -106,6 +106,11 @@ def create_indices(db: Database) -> bool:
             "columns": ["timeline_item_id"],
             "name": "idx_timeline_notifications_item",
         },
+        {
+            "table": "timeline_notifications",
+            "columns": ["sent", "notification_time"],
+            "name": "idx_timeline_notifications_due",
+        },
         # Tabelas de vídeos
         {"table": "videos", "columns": ["event_id"], "name": "idx_videos_event"},
         {
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testes para a paginação de Database.fetch_page
+"""
+
+import sqlite3
+
+import pytest
+
+from database.Database import Database
+
+
+class TestFetchPage:
+    @pytest.fixture
+    def db(self):
+        """Database sobre um banco em memória (sem o singleton)"""
+        db = object.__new__(Database)
+        db.connection = sqlite3.connect(":memory:")
+        db.connection.row_factory = sqlite3.Row
+        db.connection.execute(
+            "CREATE TABLE events (id INTEGER PRIMARY KEY, name TEXT, date TEXT)"
+        )
+        rows = [
+            (index, f"Evento {index}", None if index % 7 == 0 else f"2025-{index % 5}")
+            for index in range(1, 101)
+        ]
+        db.connection.executemany("INSERT INTO events VALUES (?, ?, ?)", rows)
+        yield db
+        db.connection.close()
+
+    def pages(self, db, **kwargs):
+        """Percorre a consulta inteira página a página, por chave"""
+        ids, last = [], None
+        while True:
+            page = db.fetch_page("SELECT * FROM events", limit=15, after=last, **kwargs)
+            ids.extend(row["id"] for row in page)
+            if len(page) < 15:
+                return ids
+            last = page[-1]
+
+    @pytest.mark.parametrize("order_by", [None, "date", "name"])
+    @pytest.mark.parametrize("descending", [False, True])
+    def test_keyset_matches_offset_order(self, db, order_by, descending):
+        expected = [
+            row["id"]
+            for row in db.fetch_page(
+                "SELECT * FROM events",
+                order_by=order_by,
+                descending=descending,
+                limit=1000,
+            )
+        ]
+
+        assert self.pages(db, order_by=order_by, descending=descending) == expected
+        assert len(expected) == 100
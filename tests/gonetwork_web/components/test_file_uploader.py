@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testes para o upload de arquivos da versão web
+"""
+
+import io
+import os
+
+import pytest
+
+pytest.importorskip("streamlit")
+
+
+class UploadedFile(io.BytesIO):
+    """Imita o UploadedFile do Streamlit"""
+
+    def __init__(self, name, content, type=None):
+        super().__init__(content)
+        self.name = name
+        self.type = type
+
+
+@pytest.fixture
+def web(web_modules, monkeypatch, tmp_path):
+    from components import file_uploader
+    from utils.database import Database
+    from utils.file_manager import FileManager
+
+    db_path = str(tmp_path / "gonetwork.db")
+    monkeypatch.setattr(Database, "get_db_path", staticmethod(lambda: db_path))
+    return file_uploader, FileManager
+
+
+class TestUploadAndList:
+    def test_uploaded_file_is_listed(self, web, tmp_path):
+        file_uploader, FileManager = web
+        uploads = str(tmp_path / "uploads")
+
+        path = file_uploader.handle_uploaded_file(
+            UploadedFile("roteiro.txt", b"conteudo", "text/plain"), uploads
+        )
+
+        assert path is not None
+        listed = FileManager.list_files(uploads)
+        assert [info["abs_path"] for info in listed] == [os.path.abspath(path)]
+        assert listed[0]["extension"] == ".txt"
+
+    def test_duplicate_upload_shares_blob(self, web, tmp_path):
+        file_uploader, FileManager = web
+        uploads = str(tmp_path / "uploads")
+
+        first = file_uploader.handle_uploaded_file(
+            UploadedFile("a.txt", b"igual"), uploads
+        )
+        second = file_uploader.handle_uploaded_file(
+            UploadedFile("b.txt", b"igual"), uploads
+        )
+
+        assert first == second
+        assert len(FileManager.list_files(uploads)) == 1
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Configurações para os testes da versão web
+"""
+
+import os
+import sys
+
+import pytest
+
+WEB_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "gonetwork_web",
+)
+# Pacotes da versão web; ``utils`` encobre o pacote de mesmo nome da raiz
+WEB_PACKAGES = ("utils", "components", "pages", "config")
+
+
+def _is_web_module(name):
+    return name.split(".")[0] in WEB_PACKAGES
+
+
+@pytest.fixture
+def web_modules():
+    """Torna importáveis os módulos da versão web durante o teste"""
+    saved = {
+        name: module for name, module in sys.modules.items() if _is_web_module(name)
+    }
+    for name in saved:
+        del sys.modules[name]
+    sys.path.insert(0, WEB_DIR)
+    try:
+        yield
+    finally:
+        sys.path.remove(WEB_DIR)
+        for name in [name for name in sys.modules if _is_web_module(name)]:
+            del sys.modules[name]
+        sys.modules.update(saved)
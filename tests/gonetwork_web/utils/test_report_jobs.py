@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testes para a fila de relatórios da versão web
+"""
+
+import sqlite3
+import time
+
+import pytest
+
+pytest.importorskip("plotly")
+
+
+@pytest.fixture
+def report_jobs(web_modules):
+    from utils import report_jobs
+
+    return report_jobs
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "gonetwork.db")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE events (id INTEGER PRIMARY KEY, name TEXT)")
+    conn.commit()
+    conn.close()
+    return path
+
+
+def write(db_path):
+    conn = sqlite3.connect(db_path)
+    conn.execute("INSERT INTO events (name) VALUES ('novo')")
+    conn.commit()
+    conn.close()
+
+
+class FakeEngine:
+    mode = "snapshot"
+
+    def __init__(self):
+        self.refreshed = []
+
+    def refresh_snapshot(self, force=False, not_before=None):
+        self.refreshed.append(not_before)
+
+    def connect(self):
+        return sqlite3.connect(":memory:")
+
+
+class TestDataVersion:
+    def test_snapshot_mode_uses_the_snapshot_period(self, report_jobs, db_path):
+        analytics = {"mode": "snapshot", "snapshot_interval": 300}
+
+        version = report_jobs.data_version(db_path, analytics)
+        write(db_path)
+        assert report_jobs.data_version(db_path, analytics) == version
+        assert report_jobs.data_version(db_path) != version
+
+    def test_snapshot_older_than_the_version_is_refreshed(
+        self, report_jobs, db_path, monkeypatch
+    ):
+        engine = FakeEngine()
+        monkeypatch.setattr(report_jobs, "get_engine", lambda *args: engine)
+        monkeypatch.setitem(report_jobs.REPORTS, "teste", (lambda conn: "dados", None))
+
+        version = report_jobs.data_version(db_path, {"mode": "snapshot"})
+        assert report_jobs.run_report("teste", [], db_path, {}, version) == "dados"
+        assert engine.refreshed == [float(version.split(":")[1])]
+
+
+class TestSubmit:
+    @pytest.fixture
+    def queue(self, report_jobs, db_path, tmp_path, monkeypatch):
+        monkeypatch.setattr(report_jobs.ReportQueue, "_dispatch", lambda *args: None)
+        return report_jobs.ReportQueue(db_path, directory=str(tmp_path / "jobs"))
+
+    def finish(self, report_jobs, queue, key):
+        with open(queue.result_path(key), "wb") as file:
+            file.write(b"resultado")
+        conn = sqlite3.connect(queue.jobs_db)
+        conn.execute(
+            "UPDATE report_jobs SET status = ?, finished_at = ? WHERE key = ?",
+            (report_jobs.DONE, time.time(), key),
+        )
+        conn.commit()
+        conn.close()
+
+    def test_previous_result_while_new_version_runs(self, report_jobs, queue, db_path):
+        first = queue.submit("eventos", ["2025-01-01"])
+        assert first["previous_key"] is None
+        self.finish(report_jobs, queue, first["key"])
+
+        write(db_path)
+        second = queue.submit("eventos", ["2025-01-01"])
+        assert second["key"] != first["key"]
+        assert second["status"] == report_jobs.QUEUED
+        assert second["previous_key"] == first["key"]
+
+        # Outros parâmetros não reaproveitam o resultado
+        other = queue.submit("eventos", ["2025-02-01"])
+        assert other["previous_key"] is None
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testes para a normalização e o casamento de termos da busca
+"""
+
+from gui.utils.text_search import (
+    build_key,
+    is_refinement,
+    match_keys,
+    normalize_text,
+    query_terms,
+)
+
+
+class TestTextSearch:
+    def test_normalize_text(self):
+        assert normalize_text("  João   CONCEIÇÃO ") == "joao conceicao"
+        assert normalize_text("Straße") == "strasse"
+        assert normalize_text(None) == ""
+
+    def test_query_terms(self):
+        assert query_terms("Maria  maria Édição") == ("maria", "edicao")
+        assert query_terms("   ") == ()
+
+    def test_is_refinement(self):
+        assert is_refinement(("mar",), ("maria",))
+        assert is_refinement(("mar",), ("maria", "souza"))
+        assert not is_refinement(("maria",), ("mar",))
+        assert not is_refinement((), ("mar",))
+
+    def test_match_keys_with_refinement(self):
+        keys = [
+            build_key(["Maria Souza", "Editora de Vídeo"]),
+            build_key(["Mário Lima", "Produtor"]),
+            build_key(["Ana Silva", "Produtora"]),
+        ]
+        first = match_keys(keys, query_terms("mar"))
+        assert first == [True, True, False]
+
+        refined = match_keys(keys, query_terms("mar video"), previous=first)
+        assert refined == [True, False, False]
+        assert refined == match_keys(keys, query_terms("mar video"))
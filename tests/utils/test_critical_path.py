@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testes para o motor de caminho crítico da timeline
+"""
+
+import json
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from utils.critical_path import DependencyGraph, parse_dependencies
+
+BASE = datetime(2025, 5, 18, 10, 0)
+
+
+def make_item(item_id, start_minutes, duration_minutes, dependencies=None):
+    start = BASE + timedelta(minutes=start_minutes)
+    return {
+        "id": item_id,
+        "start_time": start.isoformat(),
+        "end_time": (start + timedelta(minutes=duration_minutes)).isoformat(),
+        "dependencies": json.dumps(dependencies or []),
+    }
+
+
+class TestDependencyGraph:
+    @pytest.fixture
+    def graph(self):
+        """Cadeia a -> b -> d com um ramo paralelo a -> c -> d mais curto."""
+        return DependencyGraph(
+            [
+                make_item("a", 0, 60),
+                make_item("b", 0, 120, ["a"]),
+                make_item("c", 0, 30, ["a"]),
+                make_item("d", 0, 60, ["b", "c"]),
+            ]
+        )
+
+    def test_parse_dependencies(self):
+        assert parse_dependencies('["a", "b"]') == ["a", "b"]
+        assert parse_dependencies("a, b") == ["a", "b"]
+        assert parse_dependencies(None) == []
+        assert parse_dependencies(["x"]) == ["x"]
+
+    def test_topological_order(self, graph):
+        order = graph.topological_order()
+        assert order.index("a") < order.index("b") < order.index("d")
+        assert order.index("c") < order.index("d")
+
+    def test_critical_path_and_slack(self, graph):
+        assert graph.critical_path() == ["a", "b", "d"]
+        assert graph.critical_ids() == {"a", "b", "d"}
+        assert graph.slack("c") == pytest.approx(90 * 60)
+
+        schedule = graph.schedule("d")
+        assert schedule["earliest_start"] == BASE + timedelta(minutes=180)
+        assert schedule["critical"]
+
+    def test_update_item_is_incremental(self, graph):
+        # Alongar "c" o torna crítico no lugar de "b"
+        changed = graph.update_item(
+            "c", BASE.isoformat(), (BASE + timedelta(minutes=200)).isoformat()
+        )
+        assert "c" in changed
+        assert graph.critical_path() == ["a", "c", "d"]
+        assert graph.slack("b") == pytest.approx(80 * 60)
+
+    def test_cycles_are_reported(self):
+        graph = DependencyGraph(
+            [make_item("x", 0, 10, ["y"]), make_item("y", 0, 10, ["x"])]
+        )
+        assert graph.cycles == {"x", "y"}
+        assert len(graph.results()) == 2
+
+    def test_incremental_matches_full_recompute(self):
+        rng = random.Random(42)
+        items = []
+        for i in range(300):
+            dependencies = [str(j) for j in rng.sample(range(i), min(i, 2))]
+            items.append(
+                make_item(str(i), rng.randint(0, 600), rng.randint(5, 90), dependencies)
+            )
+        graph = DependencyGraph(items)
+
+        for _ in range(20):
+            item = rng.choice(items)
+            start = BASE + timedelta(minutes=rng.randint(0, 600))
+            end = start + timedelta(minutes=rng.randint(5, 90))
+            item["start_time"], item["end_time"] = start.isoformat(), end.isoformat()
+            graph.update_item(item["id"], start, end)
+
+            full = DependencyGraph(items)
+            for item_id, schedule in full.results().items():
+                assert graph.slack(item_id) == pytest.approx(schedule["slack"])
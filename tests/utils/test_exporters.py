@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testes para os exportadores de comentários
+"""
+
+import csv
+import json
+import os
+
+import pytest
+
+from database.models.comment_model import Comment
+from utils.exporters import (
+    CommentExporter,
+    ExportCancelled,
+    export_comments,
+    format_video_time,
+)
+
+
+def make_comments(count):
+    """Gera comentários sob demanda, como o gerador do repositório"""
+    for i in range(count):
+        yield Comment(
+            id=str(i),
+            text=f"Comentário {i}, com vírgula",
+            author=f"autor{i}",
+            timestamp="2025-05-01 10:00:00",
+            video_timestamp=i * 61000,
+            is_resolved=i % 2 == 0,
+        )
+
+
+class TestCommentExporters:
+    def test_format_video_time(self):
+        assert format_video_time(0) == "00:00"
+        assert format_video_time(61500) == "01:01"
+        assert format_video_time(None) == "00:00"
+
+    def test_json_streaming(self, tmp_path):
+        filename = str(tmp_path / "saida" / "comentarios.json")
+        progress = []
+
+        count = export_comments(
+            make_comments(5),
+            filename,
+            metadata={"título": "Teste"},
+            progress=progress.append,
+        )
+
+        assert count == 5
+        assert progress == [1, 2, 3, 4, 5]
+        with open(filename, encoding="utf-8") as file:
+            data = json.load(file)
+        assert data["metadata"] == {"título": "Teste"}
+        assert data["total_comments"] == 5
+        assert data["resolved_comments"] == 3
+        assert [c["id"] for c in data["comments"]] == ["0", "1", "2", "3", "4"]
+        assert data["comments"][1]["formatted_timestamp"] == "01:01"
+
+    def test_json_empty(self, tmp_path):
+        filename = str(tmp_path / "vazio.json")
+        assert CommentExporter.export_to_json(iter(()), filename)
+        with open(filename, encoding="utf-8") as file:
+            data = json.load(file)
+        assert data["comments"] == []
+        assert data["total_comments"] == 0
+
+    def test_csv_streaming(self, tmp_path):
+        filename = str(tmp_path / "comentarios.csv")
+        assert CommentExporter.export_to_csv(make_comments(3), filename)
+
+        with open(filename, encoding="utf-8", newline="") as file:
+            rows = list(csv.DictReader(file))
+        assert len(rows) == 3
+        assert rows[0]["text"] == "Comentário 0, com vírgula"
+        assert rows[0]["status"] == "Resolvido"
+        assert rows[1]["status"] == "Pendente"
+        assert rows[2]["formatted_timestamp"] == "02:02"
+
+    def test_cancel_removes_partial_file(self, tmp_path):
+        filename = str(tmp_path / "comentarios.csv")
+        written = []
+
+        with pytest.raises(ExportCancelled):
+            export_comments(
+                make_comments(100),
+                filename,
+                progress=written.append,
+                is_cancelled=lambda: len(written) >= 10,
+            )
+
+        assert len(written) == 10
+        assert not os.path.exists(filename)
+        assert not os.path.exists(filename + ".part")
+
+    def test_unknown_format(self, tmp_path):
+        with pytest.raises(ValueError):
+            export_comments(make_comments(1), str(tmp_path / "comentarios.txt"))
+
+    def test_pdf_keeps_style_across_pages(self, tmp_path, monkeypatch):
+        canvas = pytest.importorskip("reportlab.pdfgen.canvas")
+        drawn = []
+        draw_string = canvas.Canvas.drawString
+
+        def record(pdf, x, y, text, *args, **kwargs):
+            style = (pdf._fontname, pdf._fontsize, pdf._fillColorObj)
+            drawn.append((pdf.getPageNumber(), text, style))
+            return draw_string(pdf, x, y, text, *args, **kwargs)
+
+        monkeypatch.setattr(canvas.Canvas, "drawString", record)
+        filename = str(tmp_path / "comentarios.pdf")
+
+        comments = [
+            Comment(
+                id=str(i),
+                text="texto longo " * 60,
+                author=f"autor{i}",
+                video_timestamp=0,
+            )
+            for i in range(40)
+        ]
+
+        assert export_comments(comments, filename) == 40
+        assert drawn[-1][0] > 1
+        styles = {}
+        for _, text, style in drawn:
+            kind = "header" if text.split(".")[0].isdigit() else text[:10]
+            styles.setdefault(kind, set()).add(style)
+        # showPage() não volta à fonte padrão (Helvetica 12) no meio da lista
+        assert len(styles["header"]) == 1
+        assert next(iter(styles["header"]))[:2] == ("Helvetica-Bold", 10)
+        assert len(styles["texto long"]) == 1
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testes para o módulo de logging
+"""
+
+import json
+import logging
+import queue
+import sys
+import threading
+
+import pytest
+
+from utils import logger as logger_module
+from utils.logger import (
+    JsonFormatter,
+    RateLimitFilter,
+    configure_logging,
+    get_logger,
+)
+
+
+def make_record(message="mensagem", level=logging.DEBUG, lineno=10, args=None):
+    return logging.LogRecord(
+        "gonetwork.teste", level, "/tmp/modulo.py", lineno, message, args, None
+    )
+
+
+class TestRateLimitFilter:
+    def test_limits_each_call_site(self):
+        rate_filter = RateLimitFilter(rate=3, per=60)
+
+        passed = [rate_filter.filter(make_record()) for _ in range(10)]
+        assert passed.count(True) == 3
+        # Outra linha tem a sua própria cota
+        assert rate_filter.filter(make_record(lineno=20))
+
+    def test_warnings_always_pass(self):
+        rate_filter = RateLimitFilter(rate=1, per=60)
+
+        assert all(
+            rate_filter.filter(make_record(level=logging.WARNING)) for _ in range(5)
+        )
+
+    def test_reports_suppressed_records(self, monkeypatch):
+        clock = [0.0]
+        monkeypatch.setattr(logger_module.time, "monotonic", lambda: clock[0])
+        rate_filter = RateLimitFilter(rate=1, per=1)
+
+        assert rate_filter.filter(make_record())
+        assert not rate_filter.filter(make_record())
+        assert not rate_filter.filter(make_record())
+
+        clock[0] = 1.0
+        record = make_record("posição %s", args=(5,))
+        assert rate_filter.filter(record)
+        assert record.getMessage() == "posição 5 (+2 suprimidas)"
+
+
+class TestJsonFormatter:
+    def test_one_object_per_line(self):
+        record = make_record("valor %s", level=logging.INFO, args=(42,))
+
+        entry = json.loads(JsonFormatter().format(record))
+        assert entry["message"] == "valor 42"
+        assert entry["level"] == "INFO"
+        assert entry["logger"] == "gonetwork.teste"
+        assert entry["line"] == 10
+
+    def test_includes_exception(self):
+        try:
+            raise ValueError("falhou")
+        except ValueError:
+            record = logging.LogRecord(
+                "gonetwork.teste",
+                logging.ERROR,
+                "/tmp/modulo.py",
+                1,
+                "erro",
+                None,
+                sys.exc_info(),
+            )
+
+        entry = json.loads(JsonFormatter().format(record))
+        assert "ValueError: falhou" in entry["exception"]
+
+
+class TestQueuePipeline:
+    def test_logger_only_enqueues(self):
+        handlers = logger_module.logger.handlers
+        assert handlers == [logger_module.queue_handler]
+        assert logger_module.file_handler in logger_module.listener.handlers
+
+    def test_full_queue_drops_instead_of_blocking(self):
+        handler = logger_module._NonBlockingQueueHandler(queue.Queue(1))
+
+        handler.handle(make_record("primeira"))
+        finished = threading.Event()
+
+        def emit():
+            handler.handle(make_record("segunda"))
+            finished.set()
+
+        threading.Thread(target=emit).start()
+        assert finished.wait(1)
+        assert handler.dropped == 1
+
+    def test_prepare_keeps_exception_for_writer(self):
+        handler = logger_module._NonBlockingQueueHandler(queue.Queue())
+        try:
+            raise KeyError("x")
+        except KeyError:
+            record = make_record("erro %s", logging.ERROR, args=("y",))
+            record.exc_info = sys.exc_info()
+
+        prepared = handler.prepare(record)
+        assert prepared.msg == "erro y"
+        assert prepared.args is None
+        assert prepared.exc_info is not None
+
+
+class TestConfigureLogging:
+    @pytest.fixture(autouse=True)
+    def restore(self):
+        yield
+        configure_logging({})
+        get_logger("teste_config").setLevel(logging.NOTSET)
+        configure_logging({"rate_limits": {"teste_config": 0}})
+
+    def test_levels_rate_limits_and_json(self):
+        configure_logging(
+            {
+                "levels": {"teste_config": "WARNING"},
+                "rate_limits": {"teste_config": 2},
+                "json": True,
+            }
+        )
+
+        module_logger = get_logger("teste_config")
+        assert module_logger.level == logging.WARNING
+        assert len(module_logger.filters) == 1
+        assert isinstance(logger_module.file_handler.formatter, JsonFormatter)
+
+        # Reaplicar não duplica o filtro
+        configure_logging({"rate_limits": {"teste_config": 2}})
+        assert len(module_logger.filters) == 1
+        assert logger_module.file_handler.formatter is logger_module.formatter
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testes para o repositório de notificações
+"""
+
+import random
+import sqlite3
+
+import pytest
+
+from utils.notifications import NotificationStore
+
+
+def count_unread(db_path, user_id):
+    """Contagem direta das não lidas (para conferir o contador)"""
+    conn = sqlite3.connect(db_path)
+    try:
+        personal = conn.execute(
+            "SELECT COUNT(*) FROM user_notifications WHERE user_id = ? AND read = 0",
+            (user_id,),
+        ).fetchone()[0]
+        broadcast = conn.execute(
+            """
+            SELECT COUNT(*) FROM user_notifications n
+            WHERE n.user_id IS NULL AND NOT EXISTS (
+                SELECT 1 FROM notification_reads r
+                WHERE r.notification_id = n.id AND r.user_id = ?
+            )
+            """,
+            (user_id,),
+        ).fetchone()[0]
+    finally:
+        conn.close()
+    return personal + broadcast
+
+
+class TestNotificationStore:
+    @pytest.fixture
+    def db_path(self, tmp_path):
+        return str(tmp_path / "gonetwork.db")
+
+    @pytest.fixture
+    def store(self, db_path):
+        store = NotificationStore(db_path, purge_batch=2)
+        yield store
+        store.stop()
+
+    def test_unread_count_per_user(self, store):
+        first = store.add("Para o usuário 1", user_id=1)
+        second = store.add("Para todos")
+        store.add("Para o usuário 2", "warning", user_id=2)
+
+        assert first != second
+        assert store.unread_count(1) == 2
+        assert store.unread_count(2) == 2
+        assert store.unread_count(None) == 1
+        assert [n["message"] for n in store.get_all(1)] == [
+            "Para todos",
+            "Para o usuário 1",
+        ]
+
+    def test_broadcast_is_read_per_user(self, store):
+        broadcast = store.add("Para todos")
+        personal = store.add("Pessoal", user_id=1)
+
+        store.mark_as_read(broadcast, user_id=1)
+        assert store.unread_count(1) == 1
+        assert store.unread_count(2) == 1
+
+        store.mark_as_read(personal, user_id=2)  # não é do usuário 2
+        assert store.unread_count(1) == 1
+
+        store.mark_as_read(personal, user_id=1)
+        assert store.unread_count(1) == 0
+        assert store.get_all(1) == []
+        assert {n["id"]: n["read"] for n in store.get_all(1, include_read=True)} == {
+            broadcast: True,
+            personal: True,
+        }
+
+    def test_mark_all_as_read(self, store):
+        store.add("Pessoal", user_id=1)
+        store.add("Para todos")
+        store.add("Outro usuário", user_id=2)
+
+        store.mark_all_as_read(1)
+        store.mark_all_as_read(1)
+        assert store.unread_count(1) == 0
+        assert store.unread_count(2) == 2
+
+    def test_expired_are_hidden_and_purged_in_batches(self, store, db_path):
+        for index in range(5):
+            store.add(f"Vencida {index}", expiry_minutes=-1, user_id=1)
+        expired_broadcast = store.add("Geral vencida", expiry_minutes=-1)
+        store.mark_as_read(expired_broadcast, user_id=1)
+        store.add("Ativa", user_id=1)
+
+        assert [n["message"] for n in store.get_all(1)] == ["Ativa"]
+
+        assert store.purge_expired(max_batches=1) == 2
+        assert store.purge_expired() == 4
+        assert store.purge_expired() == 0
+        assert store.unread_count(1) == 1 == count_unread(db_path, "1")
+        assert store.unread_count(2) == 0
+
+    def test_notifications_persist_between_instances(self, store, db_path):
+        store.add("Persistente", "success", user_id=1)
+
+        other = NotificationStore(db_path)
+        assert other.unread_count(1) == 1
+        assert other.get_all(1)[0]["type"] == "success"
+
+    def test_counter_matches_direct_count(self, store, db_path):
+        random.seed(7)
+        users = [None, 1, 2, 3]
+        ids = []
+        for _ in range(200):
+            action = random.random()
+            user = random.choice(users)
+            if action < 0.5 or not ids:
+                ids.append(
+                    store.add("x", expiry_minutes=random.choice([-1, 60]), user_id=user)
+                )
+            elif action < 0.8:
+                store.mark_as_read(random.choice(ids), user_id=user)
+            elif action < 0.9:
+                store.mark_all_as_read(user)
+            else:
+                store.purge_expired(max_batches=1)
+
+        store.purge_expired()
+        for user in users:
+            reader = "" if user is None else str(user)
+            assert store.unread_count(user) == count_unread(db_path, reader)
+
+    def test_invalid_type(self, store):
+        with pytest.raises(ValueError):
+            store.add("x", "urgente")
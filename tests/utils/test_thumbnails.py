@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testes para o cache de miniaturas
+"""
+
+import os
+
+import pytest
+
+from utils.thumbnails import (
+    ThumbnailService,
+    file_digest,
+    is_image,
+    thumbnail_name,
+)
+
+
+def write_file(path, content):
+    with open(path, "wb") as file:
+        file.write(content)
+    return str(path)
+
+
+class TestThumbnailService:
+    @pytest.fixture
+    def service(self, tmp_path):
+        service = ThumbnailService(
+            str(tmp_path / "thumbs"), max_bytes=100, use_processes=False
+        )
+        yield service
+        service.shutdown()
+
+    def test_name_depends_on_content_and_size(self, tmp_path):
+        first = write_file(tmp_path / "a.png", b"conteudo")
+        copy = write_file(tmp_path / "b.png", b"conteudo")
+        other = write_file(tmp_path / "c.png", b"outro")
+
+        assert file_digest(first) == file_digest(copy)
+        assert file_digest(first) != file_digest(other)
+        assert thumbnail_name("abc", (120, 90)) == "abc_120x90.png"
+        assert is_image("Foto.JPG")
+        assert not is_image("video.mp4")
+
+    def test_digest_is_reused_until_file_changes(self, service, tmp_path):
+        path = write_file(tmp_path / "a.png", b"um")
+        digest = service.digest(path)
+        service._digests[os.path.abspath(path)] = (
+            *service._stat_key(path),
+            "memorizado",
+        )
+        assert service.digest(path) == "memorizado"
+
+        write_file(tmp_path / "a.png", b"conteudo diferente")
+        assert service.digest(path) not in ("memorizado", digest)
+
+    def test_lookup_never_hashes_in_caller(self, service, tmp_path, monkeypatch):
+        path = write_file(tmp_path / "a.png", b"um")
+        digest = service.digest(path)
+        service.shutdown()
+
+        def fail(path):
+            raise AssertionError("hash calculado na thread de quem chamou")
+
+        monkeypatch.setattr("utils.thumbnails.file_digest", fail)
+        restarted = ThumbnailService(service.directory, use_processes=False)
+        try:
+            # Hash guardado em disco, identificado por caminho/tamanho/mtime
+            stat_key = restarted._stat_key(path)
+            assert restarted._known_digest(os.path.abspath(path), stat_key) == digest
+            # Hash desconhecido: não lê o arquivo, só informa que não há cache
+            other = write_file(tmp_path / "b.png", b"dois")
+            assert restarted.cached_path(other) is None
+        finally:
+            restarted.shutdown()
+
+    def test_least_recently_used_are_evicted(self, service):
+        os.makedirs(service.directory)
+        for name in ("a.png", "b.png", "c.png"):
+            write_file(os.path.join(service.directory, name), b"x" * 40)
+            os.utime(os.path.join(service.directory, name), (1, 1 + len(name)))
+
+        with service._lock:
+            service._load_entries()
+            service._touch("a.png")
+            service._record("c.png", 40)
+            write_file(os.path.join(service.directory, "d.png"), b"x" * 40)
+            service._record("d.png", 40)
+
+        remaining = sorted(os.listdir(service.directory))
+        assert "b.png" not in remaining
+        assert service.total_bytes <= 100
+
+    def test_request_reuses_existing_thumbnail(self, service, tmp_path):
+        path = write_file(tmp_path / "a.png", b"imagem")
+        name = thumbnail_name(service.digest(path), (50, 50))
+        os.makedirs(service.directory, exist_ok=True)
+        write_file(os.path.join(service.directory, name), b"miniatura")
+
+        future = service.request(path, (50, 50))
+        assert future.result(timeout=5) == os.path.join(service.directory, name)
+        assert service._executor is None
+
+    def test_missing_file_resolves_to_none(self, service, tmp_path):
+        assert service.request(str(tmp_path / "nao_existe.png")).result() is None
+        assert service.get(str(tmp_path / "nao_existe.png")) is None
+
+    def test_generates_reduced_thumbnail(self, service, tmp_path):
+        Image = pytest.importorskip("PIL.Image")
+        path = str(tmp_path / "grande.jpg")
+        Image.new("RGB", (1600, 1200), "red").save(path)
+
+        thumbnail = service.request(path, (120, 120)).result(timeout=30)
+        with Image.open(thumbnail) as image:
+            assert max(image.size) == 120
+        assert service.get(path, (120, 120)) == thumbnail
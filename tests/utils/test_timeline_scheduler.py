@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testes para o agendador de notificações da timeline
+"""
+
+import sqlite3
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+from utils.notifications import NotificationStore
+from utils.timeline_scheduler import NotificationScheduler, deliver_to_store
+
+SCHEMA = """
+CREATE TABLE timeline_notifications (
+    id TEXT PRIMARY KEY,
+    timeline_item_id TEXT NOT NULL,
+    notification_time TEXT NOT NULL,
+    notification_type TEXT NOT NULL,
+    message TEXT NOT NULL,
+    sent INTEGER DEFAULT 0,
+    read INTEGER DEFAULT 0,
+    created_at TEXT NOT NULL
+)
+"""
+
+NOW = datetime(2025, 6, 1, 12, 0, 0).timestamp()
+
+
+def iso(timestamp):
+    return datetime.fromtimestamp(timestamp).isoformat()
+
+
+def notification(notification_id, due, type="Lembrete"):
+    return {
+        "id": notification_id,
+        "timeline_item_id": "item",
+        "notification_time": iso(due),
+        "notification_type": type,
+        "message": f"Mensagem {notification_id}",
+    }
+
+
+class TestNotificationScheduler:
+    @pytest.fixture
+    def db_path(self, tmp_path):
+        path = str(tmp_path / "gonetwork.db")
+        conn = sqlite3.connect(path)
+        conn.execute(SCHEMA)
+        conn.commit()
+        conn.close()
+        return path
+
+    @pytest.fixture
+    def delivered(self):
+        return []
+
+    @pytest.fixture
+    def scheduler(self, db_path, delivered):
+        scheduler = NotificationScheduler(
+            db_path, delivered.append, window=60, batch_size=100
+        )
+        yield scheduler
+        scheduler.stop()
+
+    def insert(self, db_path, notifications):
+        conn = sqlite3.connect(db_path)
+        with conn:
+            conn.executemany(
+                "INSERT INTO timeline_notifications (id, timeline_item_id, "
+                "notification_time, notification_type, message, created_at) "
+                "VALUES (:id, :timeline_item_id, :notification_time, "
+                ":notification_type, :message, '')",
+                notifications,
+            )
+        conn.close()
+
+    def sent_ids(self, db_path):
+        conn = sqlite3.connect(db_path)
+        rows = conn.execute(
+            "SELECT id FROM timeline_notifications WHERE sent = 1 ORDER BY id"
+        ).fetchall()
+        conn.close()
+        return [row[0] for row in rows]
+
+    def test_creates_due_index(self, scheduler, db_path):
+        conn = sqlite3.connect(db_path)
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM timeline_notifications "
+            "WHERE sent = 0 AND notification_time <= ?",
+            ("x",),
+        ).fetchall()
+        conn.close()
+        assert "idx_timeline_notifications_due" in str(plan)
+
+    def test_loads_only_the_next_window(self, scheduler, db_path):
+        self.insert(
+            db_path,
+            [notification("a", NOW + 10), notification("b", NOW + 3600)],
+        )
+
+        wake = scheduler.tick(NOW)
+        assert scheduler.pending_count() == 1
+        assert wake == pytest.approx(NOW + scheduler.check_interval)
+
+    def test_fires_due_in_batches_and_marks_sent(self, scheduler, db_path, delivered):
+        self.insert(
+            db_path,
+            [notification(f"n{index:03d}", NOW + 5) for index in range(250)]
+            + [notification("late", NOW + 30)],
+        )
+
+        scheduler.tick(NOW)
+        assert delivered == []
+
+        scheduler.tick(NOW + 5)
+        assert [len(batch) for batch in delivered] == [100, 100, 50]
+        assert len(self.sent_ids(db_path)) == 250
+        assert scheduler.pending_count() == 1
+
+    def test_overdue_fire_immediately(self, scheduler, db_path, delivered):
+        self.insert(db_path, [notification("old", NOW - 600)])
+
+        scheduler.tick(NOW)
+        assert [n["id"] for n in delivered[0]] == ["old"]
+
+    def test_schedule_without_reloading(self, scheduler, db_path, delivered):
+        scheduler.tick(NOW)
+        new = notification("new", NOW + 2)
+        self.insert(db_path, [new])
+        scheduler.schedule(new)
+        scheduler._changed_elsewhere()  # ignora a gravação acima
+
+        assert scheduler.pending_count() == 1
+        scheduler.tick(NOW + 2)
+        assert [n["id"] for n in delivered[0]] == ["new"]
+
+    def test_detects_inserts_from_other_connections(
+        self, scheduler, db_path, delivered
+    ):
+        scheduler.tick(NOW)
+        self.insert(db_path, [notification("other", NOW + 1.5)])
+
+        scheduler.tick(NOW + 1.5)
+        assert [n["id"] for n in delivered[0]] == ["other"]
+
+    def test_already_sent_are_not_delivered_again(self, scheduler, db_path, delivered):
+        self.insert(db_path, [notification("a", NOW + 1), notification("b", NOW + 1)])
+        scheduler.tick(NOW)
+
+        conn = sqlite3.connect(db_path)
+        with conn:
+            conn.execute("UPDATE timeline_notifications SET sent = 1 WHERE id = 'a'")
+        conn.close()
+
+        scheduler.fire_due(NOW + 1)
+        assert [n["id"] for n in delivered[0]] == ["b"]
+
+    def test_thread_delivers_on_time(self, db_path):
+        fired = threading.Event()
+        latency = []
+
+        def deliver(batch):
+            latency.append(time.time() - due)
+            fired.set()
+
+        scheduler = NotificationScheduler(db_path, deliver, check_interval=0.2)
+        scheduler.start()
+        try:
+            time.sleep(0.1)
+            due = time.time() + 0.3
+            new = notification("soon", due)
+            self.insert(db_path, [new])
+            scheduler.schedule(new)
+            assert fired.wait(2)
+        finally:
+            scheduler.stop()
+        assert 0 <= latency[0] < 0.2
+
+    def test_deliver_to_store(self, db_path):
+        store = NotificationStore(db_path)
+        deliver = deliver_to_store(store)
+
+        deliver(
+            [
+                notification("a", NOW, "Alerta"),
+                notification("b", NOW, "Emergência"),
+            ]
+        )
+        assert store.unread_count(1) == 2
+        assert {n["type"] for n in store.get_all(1)} == {"warning", "error"}
@@ -15,6 +15,7 @@ from PySide6.QtCore import QEvent, QObject, Qt, Signal
 from PySide6.QtGui import QAction, QFont, QKeySequence
 from PySide6.QtWidgets import QApplication, QWidget
 
+from gui.themes.theme_compiler import get_theme_compiler
 from utils.logger import get_logger
 
 # Configurar logger
@@ -88,6 +89,9 @@ class AccessibilityManager(QObject):
         # Dicionário de fontes em cache
         self._font_cache: Dict[str, QFont] = {}
 
+        # Tamanho de fonte original da aplicação (antes de qualquer escala)
+        self._base_point_size: Optional[float] = None
+
         # Registrar para eventos de aplicação
         app = QApplication.instance()
         if app:
@@ -207,20 +211,14 @@ class AccessibilityManager(QObject):
         if not app:
             return
 
-        # Obter fonte atual
-        current_font = app.font()
+        # Guardar o tamanho original para não acumular escalas sucessivas
+        if self._base_point_size is None:
+            self._base_point_size = app.font().pointSizeF()
 
         # Aplicar fator de escala
         scale_factor = self._font_scale_factors[self._font_size]
-        new_size = (
-            current_font.pointSizeF()
-            * scale_factor
-            / self._font_scale_factors[FontSize.NORMAL]
-        )
-
-        # Criar nova fonte
-        new_font = QFont(current_font)
-        new_font.setPointSizeF(new_size)
+        new_font = QFont(app.font())
+        new_font.setPointSizeF(self._base_point_size * scale_factor)
 
         # Aplicar a nova fonte à aplicação
         app.setFont(new_font)
@@ -228,9 +226,9 @@ class AccessibilityManager(QObject):
         # Limpar cache de fontes
         self._font_cache.clear()
 
-        # Forçar atualização de todos os widgets
-        for widget in app.allWidgets():
-            widget.update()
+        # Os tamanhos em px da folha de estilos também dependem da escala;
+        # a folha compilada é trocada de uma só vez (um único repolish)
+        self._update_application_style()
 
     def _update_application_style(self) -> None:
         """Atualiza o estilo da aplicação com base no esquema de cores."""
@@ -238,87 +236,11 @@ class AccessibilityManager(QObject):
         if not app:
             return
 
-        # Configurações específicas por esquema de cores
-        if self._color_scheme == ColorScheme.HIGH_CONTRAST:
-            app.setStyleSheet(
-                """
-                QWidget {
-                    background-color: black;
-                    color: white;
-                    border: 1px solid white;
-                }
-                QLabel {
-                    border: none;
-                }
-                QPushButton {
-                    background-color: black;
-                    color: white;
-                    border: 2px solid white;
-                    padding: 5px;
-                }
-                QPushButton:hover {
-                    background-color: #333;
-                }
-                QPushButton:pressed {
-                    background-color: #555;
-                }
-                QLineEdit, QTextEdit, QPlainTextEdit, QComboBox {
-                    background-color: black;
-                    color: white;
-                    border: 2px solid white;
-                    padding: 3px;
-                }
-                QTableView, QListView, QTreeView {
-                    background-color: black;
-                    color: white;
-                    border: 1px solid white;
-                    alternate-background-color: #222;
-                }
-                QHeaderView::section {
-                    background-color: black;
-                    color: white;
-                    border: 1px solid white;
-                    padding: 4px;
-                }
-            """
-            )
-        elif self._color_scheme == ColorScheme.DARK:
-            app.setStyleSheet(
-                """
-                QWidget {
-                    background-color: #2d2d2d;
-                    color: #e0e0e0;
-                }
-                QPushButton {
-                    background-color: #3d3d3d;
-                    color: #e0e0e0;
-                    border: 1px solid #555;
-                    border-radius: 3px;
-                    padding: 5px;
-                }
-                QPushButton:hover {
-                    background-color: #4d4d4d;
-                }
-                QPushButton:pressed {
-                    background-color: #5d5d5d;
-                }
-                QLineEdit, QTextEdit, QPlainTextEdit, QComboBox {
-                    background-color: #3d3d3d;
-                    color: #e0e0e0;
-                    border: 1px solid #555;
-                    border-radius: 3px;
-                    padding: 3px;
-                }
-                QTableView, QListView, QTreeView {
-                    background-color: #2d2d2d;
-                    color: #e0e0e0;
-                    alternate-background-color: #3a3a3a;
-                }
-            """
-            )
-        else:
-            # Restaurar estilo normal
-            app.setStyleSheet("")
+        get_theme_compiler().apply(
+            self._color_scheme.value,
+            self._font_scale_factors[self._font_size],
+            app,
+        )
 
     def _update_accessibility_properties(self) -> None:
         """Atualiza propriedades de acessibilidade nos widgets."""
@@ -337,10 +259,8 @@ class AccessibilityManager(QObject):
             else:
                 widget.setProperty("screenReaderMode", False)
 
-            # Forçar atualização de estilo
-            widget.style().unpolish(widget)
-            widget.style().polish(widget)
-            widget.update()
+        # Forçar atualização de estilo com um único repolish global
+        get_theme_compiler().repolish(app)
 
     def eventFilter(self, obj: QObject, event: QEvent) -> bool:
         """
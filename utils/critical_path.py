@@ -0,0 +1,381 @@
+"""
+Motor de dependências e caminho crítico da timeline.
+
+Lê a coluna ``dependencies`` (lista JSON de IDs) de ``timeline_items``, ordena
+os itens topologicamente e calcula, para cada item, o início/fim mais cedo, o
+início/fim mais tarde, a folga e se ele está no caminho crítico.
+
+Um item nunca começa antes do horário planejado (``start_time``) nem antes do
+fim de todas as suas dependências. Quando o horário de um único item muda,
+``update_item`` propaga a alteração apenas pelos sucessores (passo de ida) e
+pelos antecessores afetados (passo de volta), em vez de recalcular tudo.
+
+Este módulo usa apenas a biblioteca padrão, para poder ser carregado também
+pela versão web (ver ``gonetwork_web/utils/critical_path.py``).
+"""
+
+import heapq
+import json
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+# Tolerância (segundos) para considerar a folga nula
+SLACK_EPSILON = 1e-6
+
+
+def parse_dependencies(value: Any) -> List[str]:
+    """
+    Converte o valor da coluna ``dependencies`` em lista de IDs.
+
+    Aceita lista JSON (``'["a", "b"]'``), lista Python ou IDs separados por
+    vírgula. Valores vazios ou inválidos resultam em lista vazia.
+    """
+    if not value:
+        return []
+    if isinstance(value, (list, tuple, set)):
+        return [str(v) for v in value if v]
+
+    text = str(value).strip()
+    try:
+        parsed = json.loads(text)
+    except ValueError:
+        return [part.strip() for part in text.split(",") if part.strip()]
+
+    if isinstance(parsed, list):
+        return [str(v) for v in parsed if v]
+    if parsed:
+        return [str(parsed)]
+    return []
+
+
+def _parse_datetime(value: Any) -> Optional[datetime]:
+    if isinstance(value, datetime):
+        return value
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(str(value).strip())
+    except ValueError:
+        return None
+
+
+class DependencyGraph:
+    """
+    Grafo de dependências dos itens de um evento.
+
+    Internamente os itens são numerados e os tempos ficam em segundos
+    relativos a ``origin``, em listas indexadas pelo número do item.
+
+    Atributos públicos:
+        origin: Início planejado mais cedo entre os itens
+        project_end: Fim mais cedo do evento considerando as dependências
+        cycles: IDs de itens em dependências circulares, ou que dependem
+            delas (calculados sem essas dependências)
+        missing: IDs referenciados em ``dependencies`` que não existem
+    """
+
+    def __init__(self, items: Iterable[Dict[str, Any]] = ()):
+        self.rebuild(items)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, item_id: Any) -> bool:
+        return str(item_id) in self._index
+
+    @property
+    def dependency_count(self) -> int:
+        """Número de dependências válidas entre itens do grafo."""
+        return sum(len(preds) for preds in self._preds)
+
+    # ----- Construção -----
+
+    def rebuild(self, items: Iterable[Dict[str, Any]]) -> None:
+        """Reconstrói o grafo e recalcula todo o cronograma."""
+        parsed = []
+        for item in items:
+            start = _parse_datetime(item.get("start_time"))
+            end = _parse_datetime(item.get("end_time"))
+            if item.get("id") is None or start is None or end is None:
+                continue
+            parsed.append((str(item["id"]), start, max(start, end), item))
+
+        self.origin = min((start for _, start, _, _ in parsed), default=datetime.now())
+        self.project_end = 0.0
+        self.cycles: Set[str] = set()
+        self.missing: Set[str] = set()
+
+        self._ids: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._planned: List[float] = []
+        self._duration: List[float] = []
+        for item_id, start, end, _ in parsed:
+            if item_id in self._index:
+                continue
+            self._index[item_id] = len(self._ids)
+            self._ids.append(item_id)
+            self._planned.append((start - self.origin).total_seconds())
+            self._duration.append((end - start).total_seconds())
+
+        count = len(self._ids)
+        self._preds: List[List[int]] = [[] for _ in range(count)]
+        self._succs: List[List[int]] = [[] for _ in range(count)]
+        for item_id, _, _, item in parsed:
+            node = self._index[item_id]
+            for dep_id in parse_dependencies(item.get("dependencies")):
+                dep = self._index.get(dep_id)
+                if dep is None:
+                    self.missing.add(dep_id)
+                elif dep != node and dep not in self._preds[node]:
+                    self._preds[node].append(dep)
+                    self._succs[dep].append(node)
+
+        self._sort()
+
+        self._es = [0.0] * count
+        self._lf = [0.0] * count
+        self._forward(self._order)
+        self._update_project_end()
+        self._backward(reversed(self._order))
+
+    def _sort(self) -> None:
+        """Ordena os itens topologicamente (algoritmo de Kahn)."""
+        count = len(self._ids)
+        in_degree = [len(preds) for preds in self._preds]
+        queue = deque(
+            sorted(
+                (n for n in range(count) if in_degree[n] == 0),
+                key=lambda n: self._planned[n],
+            )
+        )
+        order = []
+        while queue:
+            node = queue.popleft()
+            order.append(node)
+            for succ in self._succs[node]:
+                in_degree[succ] -= 1
+                if in_degree[succ] == 0:
+                    queue.append(succ)
+
+        if len(order) < count:
+            # Itens em ciclos são calculados sem as dependências do ciclo
+            remaining = [n for n in range(count) if in_degree[n] > 0]
+            remaining_set = set(remaining)
+            for node in remaining:
+                self.cycles.add(self._ids[node])
+                self._preds[node] = [
+                    p for p in self._preds[node] if p not in remaining_set
+                ]
+                self._succs[node] = [
+                    s for s in self._succs[node] if s not in remaining_set
+                ]
+            order.extend(sorted(remaining, key=lambda n: self._planned[n]))
+
+        self._order = order
+        self._rank = [0] * count
+        for rank, node in enumerate(order):
+            self._rank[node] = rank
+
+    # ----- Cálculo -----
+
+    def _earliest_start(self, node: int) -> float:
+        start = self._planned[node]
+        for pred in self._preds[node]:
+            start = max(start, self._es[pred] + self._duration[pred])
+        return start
+
+    def _latest_finish(self, node: int) -> float:
+        finish = self.project_end
+        for succ in self._succs[node]:
+            finish = min(finish, self._lf[succ] - self._duration[succ])
+        return finish
+
+    def _forward(self, nodes: Iterable[int]) -> None:
+        for node in nodes:
+            self._es[node] = self._earliest_start(node)
+
+    def _backward(self, nodes: Iterable[int]) -> None:
+        for node in nodes:
+            self._lf[node] = self._latest_finish(node)
+
+    def _update_project_end(self) -> bool:
+        """Recalcula o fim do evento; retorna True se ele mudou."""
+        end = max((es + d for es, d in zip(self._es, self._duration)), default=0.0)
+        changed = end != self.project_end
+        self.project_end = end
+        return changed
+
+    def _propagate(
+        self, seeds: Iterable[int], forward: bool, forced: Iterable[int] = ()
+    ) -> Set[int]:
+        """
+        Recalcula a partir de ``seeds`` seguindo a ordem topológica.
+
+        Um item só é reprocessado se algum vizinho de que ele depende mudou,
+        o que limita o trabalho à região afetada do grafo. Os itens em
+        ``forced`` propagam para os vizinhos mesmo sem mudança própria (por
+        exemplo, quando só a duração mudou).
+        """
+        changed: Set[int] = set()
+        forced = set(forced)
+        sign = 1 if forward else -1
+        heap = [(sign * self._rank[n], n) for n in set(seeds)]
+        heapq.heapify(heap)
+        queued = {n for _, n in heap}
+
+        values = self._es if forward else self._lf
+        compute = self._earliest_start if forward else self._latest_finish
+        neighbours = self._succs if forward else self._preds
+
+        while heap:
+            _, node = heapq.heappop(heap)
+            queued.discard(node)
+            value = compute(node)
+            if value == values[node] and node not in forced:
+                continue
+            values[node] = value
+            changed.add(node)
+            for other in neighbours[node]:
+                if other not in queued:
+                    queued.add(other)
+                    heapq.heappush(heap, (sign * self._rank[other], other))
+        return changed
+
+    def update_item(
+        self,
+        item_id: Any,
+        start_time: Any = None,
+        end_time: Any = None,
+    ) -> Set[str]:
+        """
+        Atualiza o horário planejado de um item e recalcula incrementalmente.
+
+        Args:
+            item_id: ID do item
+            start_time: Novo início (ISO 8601 ou datetime); None mantém o atual
+            end_time: Novo fim (ISO 8601 ou datetime); None mantém o atual
+
+        Returns:
+            IDs dos itens cujo cronograma mudou
+        """
+        node = self._index.get(str(item_id))
+        if node is None:
+            return set()
+
+        start = _parse_datetime(start_time)
+        end = _parse_datetime(end_time)
+        planned_start = (
+            (start - self.origin).total_seconds()
+            if start is not None
+            else self._planned[node]
+        )
+        planned_end = (
+            (end - self.origin).total_seconds()
+            if end is not None
+            else self._planned[node] + self._duration[node]
+        )
+        self._planned[node] = planned_start
+        self._duration[node] = max(0.0, planned_end - planned_start)
+
+        # Passo de ida: o item e seus sucessores
+        changed = self._propagate([node], forward=True, forced=[node])
+        changed.add(node)
+
+        # Passo de volta: se o fim do evento mudou, todos os prazos mudam
+        if self._update_project_end():
+            self._backward(reversed(self._order))
+            return set(self._ids)
+
+        seeds = set(changed)
+        for other in changed:
+            seeds.update(self._preds[other])
+        changed |= self._propagate(seeds, forward=False)
+        return {self._ids[n] for n in changed}
+
+    # ----- Resultados -----
+
+    def _slack(self, node: int) -> float:
+        return self._lf[node] - self._duration[node] - self._es[node]
+
+    def _to_datetime(self, seconds: float) -> datetime:
+        return self.origin + timedelta(seconds=seconds)
+
+    def schedule(self, item_id: Any) -> Optional[Dict[str, Any]]:
+        """
+        Retorna o cronograma calculado de um item.
+
+        Returns:
+            Dicionário com earliest_start, earliest_finish, latest_start,
+            latest_finish (datetime), slack (segundos) e critical (bool), ou
+            None se o item não existir
+        """
+        node = self._index.get(str(item_id))
+        if node is None:
+            return None
+
+        es = self._es[node]
+        lf = self._lf[node]
+        duration = self._duration[node]
+        slack = self._slack(node)
+        return {
+            "earliest_start": self._to_datetime(es),
+            "earliest_finish": self._to_datetime(es + duration),
+            "latest_start": self._to_datetime(lf - duration),
+            "latest_finish": self._to_datetime(lf),
+            "slack": slack,
+            "critical": slack <= SLACK_EPSILON,
+        }
+
+    def results(self) -> Dict[str, Dict[str, Any]]:
+        """Retorna o cronograma de todos os itens, por ID."""
+        return {item_id: self.schedule(item_id) for item_id in self._ids}
+
+    def slack(self, item_id: Any) -> Optional[float]:
+        """Retorna a folga (segundos) de um item."""
+        node = self._index.get(str(item_id))
+        return None if node is None else self._slack(node)
+
+    def critical_ids(self) -> Set[str]:
+        """Retorna os IDs de todos os itens sem folga."""
+        return {
+            self._ids[n]
+            for n in range(len(self._ids))
+            if self._slack(n) <= SLACK_EPSILON
+        }
+
+    def critical_path(self) -> List[str]:
+        """
+        Retorna a cadeia de itens que determina o fim do evento.
+
+        Parte do item que termina por último e volta pelas dependências que
+        o impediram de começar antes.
+        """
+        if not self._ids:
+            return []
+
+        node = max(
+            range(len(self._ids)),
+            key=lambda n: (self._es[n] + self._duration[n], -self._rank[n]),
+        )
+        path = [node]
+        while True:
+            driver = next(
+                (
+                    pred
+                    for pred in self._preds[node]
+                    if self._es[pred] + self._duration[pred]
+                    >= self._es[node] - SLACK_EPSILON
+                ),
+                None,
+            )
+            if driver is None:
+                break
+            path.append(driver)
+            node = driver
+
+        return [self._ids[n] for n in reversed(path)]
+
+    def topological_order(self) -> List[str]:
+        """Retorna os IDs em ordem topológica."""
+        return [self._ids[n] for n in self._order]
@@ -1,11 +1,258 @@
 """
 Utilitários para exportação de dados
+
+Os exportadores recebem qualquer iterável de comentários (por exemplo, o
+gerador ``CommentRepository.iter_comments_by_editing``) e gravam o arquivo à
+medida que os comentários chegam, sem montar a lista completa em memória. A
+gravação é feita em ``<arquivo>.part``, renomeado ao final; se a exportação
+for cancelada ou falhar, o arquivo parcial é removido.
 """
 
+import csv
 import datetime
 import json
 import os
 
+# Formatos aceitos por ``export_comments``
+EXPORT_FORMATS = ("json", "csv", "pdf")
+
+CSV_COLUMNS = [
+    "id",
+    "author",
+    "video_timestamp",
+    "formatted_timestamp",
+    "status",
+    "text",
+    "timestamp",
+]
+
+
+class ExportCancelled(Exception):
+    """A exportação foi interrompida pelo usuário"""
+
+
+def format_video_time(milliseconds):
+    """Formata a posição no vídeo (ms) como MM:SS"""
+    seconds = int(milliseconds or 0) // 1000
+    return f"{seconds // 60:02d}:{seconds % 60:02d}"
+
+
+def comment_to_dict(comment):
+    """Converte um comentário (Comment ou objeto equivalente) em dicionário"""
+    if hasattr(comment, "to_dict"):
+        comment_dict = comment.to_dict()
+    else:
+        # Se não for um objeto Comment com método to_dict
+        comment_dict = {
+            "id": getattr(comment, "id", ""),
+            "text": getattr(comment, "text", ""),
+            "author": getattr(comment, "author", ""),
+            "timestamp": getattr(comment, "timestamp", ""),
+            "video_timestamp": getattr(comment, "video_timestamp", 0),
+            "is_resolved": getattr(comment, "is_resolved", False),
+        }
+    comment_dict["formatted_timestamp"] = format_video_time(
+        comment_dict.get("video_timestamp", 0)
+    )
+    return comment_dict
+
+
+def _status(comment_dict):
+    return "Resolvido" if comment_dict.get("is_resolved") else "Pendente"
+
+
+def _stream(comments, progress=None, is_cancelled=None):
+    """
+    Percorre os comentários já convertidos em dicionário, avisando o progresso.
+
+    Args:
+        progress: Função chamada com o número de comentários já gravados
+        is_cancelled: Função que retorna True para interromper a exportação
+    """
+    for count, comment in enumerate(comments, 1):
+        if is_cancelled is not None and is_cancelled():
+            raise ExportCancelled()
+        yield comment_to_dict(comment)
+        if progress is not None:
+            progress(count)
+
+
+def _write_json(comments, file, metadata, progress, is_cancelled):
+    file.write("{\n")
+    file.write(f'    "metadata": {json.dumps(metadata or {}, ensure_ascii=False)},\n')
+    export_date = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    file.write(f'    "export_date": "{export_date}",\n')
+    file.write('    "comments": [')
+
+    total = resolved = 0
+    for comment_dict in _stream(comments, progress, is_cancelled):
+        item = json.dumps(comment_dict, ensure_ascii=False, indent=4)
+        file.write("," if total else "")
+        file.write("\n        " + item.replace("\n", "\n        "))
+        total += 1
+        resolved += bool(comment_dict.get("is_resolved"))
+
+    file.write("\n    ]" if total else "]")
+    file.write(f',\n    "total_comments": {total},\n')
+    file.write(f'    "resolved_comments": {resolved}\n')
+    file.write("}\n")
+    return total
+
+
+def _write_csv(comments, file, metadata, progress, is_cancelled):
+    writer = csv.writer(file)
+    writer.writerow(CSV_COLUMNS)
+    total = 0
+    for comment_dict in _stream(comments, progress, is_cancelled):
+        writer.writerow(
+            [
+                comment_dict.get("id", ""),
+                comment_dict.get("author", ""),
+                comment_dict.get("video_timestamp", 0),
+                comment_dict["formatted_timestamp"],
+                _status(comment_dict),
+                comment_dict.get("text", ""),
+                comment_dict.get("timestamp", ""),
+            ]
+        )
+        total += 1
+    return total
+
+
+def _write_pdf(comments, filename, title, metadata, progress, is_cancelled):
+    """
+    Grava o PDF desenhando os comentários direto no canvas, página a página.
+
+    Os flowables do platypus precisam da lista inteira de elementos antes de
+    ``build``; aqui cada comentário é desenhado e descartado. Os totais vêm dos
+    metadados, já que o resumo fica no topo da primeira página.
+    """
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.utils import simpleSplit
+    from reportlab.pdfgen import canvas
+
+    width, height = letter
+    margin = 50
+    text_width = width - 2 * margin
+    line_height = 13
+
+    pdf = canvas.Canvas(filename, pagesize=letter)
+    pdf.setTitle(title)
+    y = height - margin
+    # Fonte, tamanho e cor em uso: showPage() volta ao padrão do ReportLab
+    style = ("Helvetica", 10, colors.black)
+
+    def apply_style():
+        pdf.setFont(style[0], style[1])
+        pdf.setFillColor(style[2])
+
+    def ensure_space(lines):
+        nonlocal y
+        if y - lines * line_height < margin:
+            pdf.showPage()
+            apply_style()
+            y = height - margin
+
+    def draw_lines(lines, font="Helvetica", size=10, color=colors.black):
+        nonlocal y, style
+        style = (font, size, color)
+        apply_style()
+        for line in lines:
+            ensure_space(1)
+            pdf.drawString(margin, y, line)
+            y -= line_height
+
+    # Título e metadados
+    pdf.setFont("Helvetica-Bold", 18)
+    pdf.drawCentredString(width / 2, y, title)
+    y -= 30
+    for key, value in (metadata or {}).items():
+        draw_lines(simpleSplit(f"{key}: {value}", "Helvetica", 10, text_width))
+    y -= 15
+    draw_lines(["Lista de Comentários"], "Helvetica-Bold", 14)
+    y -= 5
+
+    total = 0
+    for comment_dict in _stream(comments, progress, is_cancelled):
+        total += 1
+        header = (
+            f"{total}. {comment_dict.get('author', '')} "
+            f"({comment_dict['formatted_timestamp']}) - {_status(comment_dict)}"
+        )
+        body = simpleSplit(
+            str(comment_dict.get("text", "")), "Helvetica", 10, text_width
+        )
+        ensure_space(2)
+        y -= 6
+        draw_lines([header], "Helvetica-Bold", 10)
+        draw_lines(body, color=colors.darkslategray)
+
+    # Rodapé
+    y -= 15
+    draw_lines(
+        [
+            f"Total de comentários exportados: {total}",
+            f"Exportado em: {datetime.datetime.now().strftime('%d/%m/%Y %H:%M:%S')}",
+        ]
+    )
+    pdf.save()
+    return total
+
+
+def export_comments(
+    comments,
+    filename,
+    export_format=None,
+    metadata=None,
+    title="Comentários",
+    progress=None,
+    is_cancelled=None,
+):
+    """
+    Exporta comentários gravando o arquivo de forma incremental.
+
+    Args:
+        comments: Iterável de objetos Comment (pode ser um gerador)
+        filename: Nome do arquivo de saída
+        export_format: json, csv ou pdf (padrão: extensão do arquivo)
+        metadata: Dicionário com metadados adicionais
+        title: Título do documento (PDF)
+        progress: Função chamada com o número de comentários já gravados
+        is_cancelled: Função que retorna True para interromper a exportação
+
+    Returns:
+        int: Número de comentários exportados
+
+    Raises:
+        ExportCancelled: Se ``is_cancelled`` pediu a interrupção
+    """
+    export_format = (export_format or os.path.splitext(filename)[1].lstrip(".")).lower()
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Formato de exportação não suportado: {export_format}")
+
+    # Criar diretório se não existir
+    directory = os.path.dirname(filename)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    temporary = f"{filename}.part"
+    try:
+        if export_format == "pdf":
+            total = _write_pdf(
+                comments, temporary, title, metadata, progress, is_cancelled
+            )
+        else:
+            write = _write_json if export_format == "json" else _write_csv
+            with open(temporary, "w", encoding="utf-8", newline="") as file:
+                total = write(comments, file, metadata, progress, is_cancelled)
+        os.replace(temporary, filename)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+    return total
+
 
 class CommentExporter:
     """Classe para exportar comentários em diferentes formatos"""
@@ -16,7 +263,7 @@ class CommentExporter:
         Exporta comentários para arquivo JSON
 
         Args:
-            comments: Lista de objetos Comment
+            comments: Lista (ou iterável) de objetos Comment
             filename: Nome do arquivo de saída
             metadata: Dicionário com metadados adicionais
 
@@ -24,61 +271,39 @@ class CommentExporter:
             bool: True se sucesso, False caso contrário
         """
         try:
-            # Converter comentários para dicionários
-            comments_data = []
-            for comment in comments:
-                if hasattr(comment, "to_dict"):
-                    comment_dict = comment.to_dict()
-                else:
-                    # Se não for um objeto Comment com método to_dict
-                    comment_dict = {
-                        "id": getattr(comment, "id", ""),
-                        "text": getattr(comment, "text", ""),
-                        "author": getattr(comment, "author", ""),
-                        "timestamp": getattr(comment, "timestamp", ""),
-                        "video_timestamp": getattr(comment, "video_timestamp", 0),
-                        "is_resolved": getattr(comment, "is_resolved", False),
-                    }
-
-                # Adicionar timestamp formatado
-                if "video_timestamp" in comment_dict:
-                    seconds = comment_dict["video_timestamp"] // 1000
-                    minutes = seconds // 60
-                    seconds = seconds % 60
-                    comment_dict["formatted_timestamp"] = f"{minutes:02d}:{seconds:02d}"
-
-                comments_data.append(comment_dict)
-
-            # Estrutura do arquivo
-            data = {
-                "metadata": metadata or {},
-                "export_date": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "comments": comments_data,
-                "total_comments": len(comments_data),
-                "resolved_comments": sum(
-                    1 for c in comments_data if c.get("is_resolved", False)
-                ),
-            }
-
-            # Criar diretório se não existir
-            os.makedirs(os.path.dirname(filename), exist_ok=True)
-
-            # Salvar arquivo
-            with open(filename, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=4)
-
+            export_comments(comments, filename, "json", metadata)
             return True
         except Exception as e:
             print(f"Erro ao exportar comentários para JSON: {str(e)}")
             return False
 
+    @staticmethod
+    def export_to_csv(comments, filename, metadata=None):
+        """
+        Exporta comentários para arquivo CSV
+
+        Args:
+            comments: Lista (ou iterável) de objetos Comment
+            filename: Nome do arquivo de saída
+            metadata: Ignorado (mantido pela mesma assinatura dos demais)
+
+        Returns:
+            bool: True se sucesso, False caso contrário
+        """
+        try:
+            export_comments(comments, filename, "csv", metadata)
+            return True
+        except Exception as e:
+            print(f"Erro ao exportar comentários para CSV: {str(e)}")
+            return False
+
     @staticmethod
     def export_to_pdf(comments, filename, title="Comentários", metadata=None):
         """
         Exporta comentários para arquivo PDF
 
         Args:
-            comments: Lista de objetos Comment
+            comments: Lista (ou iterável) de objetos Comment
             filename: Nome do arquivo de saída
             title: Título do documento
             metadata: Dicionário com metadados adicionais
@@ -87,176 +312,13 @@ class CommentExporter:
             bool: True se sucesso, False caso contrário
         """
         try:
-            # Verificar se ReportLab está disponível
-            try:
-                from reportlab.lib import colors
-                from reportlab.lib.pagesizes import letter
-                from reportlab.lib.styles import (
-                    ParagraphStyle,
-                    getSampleStyleSheet,
-                )
-                from reportlab.platypus import (
-                    Paragraph,
-                    SimpleDocTemplate,
-                    Spacer,
-                    Table,
-                    TableStyle,
-                )
-            except ImportError:
-                print(
-                    "ReportLab não está instalado. Use 'pip install reportlab' para instalar."
-                )
-                return False
-
-            # Criar diretório se não existir
-            os.makedirs(os.path.dirname(filename), exist_ok=True)
-
-            # Criar documento
-            doc = SimpleDocTemplate(filename, pagesize=letter)
-            styles = getSampleStyleSheet()
-            title_style = styles["Title"]
-            normal_style = styles["Normal"]
-            subtitle_style = ParagraphStyle(
-                "Subtitle",
-                parent=styles["Heading2"],
-                fontSize=14,
-                spaceAfter=12,
-            )
-
-            # Elementos do PDF
-            elements = []
-
-            # Título
-            elements.append(Paragraph(title, title_style))
-            elements.append(Spacer(1, 12))
-
-            # Metadados
-            if metadata:
-                info_text = ""
-                for key, value in metadata.items():
-                    info_text += f"<b>{key}:</b> {value}<br/>"
-                elements.append(Paragraph(info_text, normal_style))
-                elements.append(Spacer(1, 15))
-
-            # Estatísticas
-            resolved_count = sum(
-                1 for c in comments if getattr(c, "is_resolved", False)
-            )
-            elements.append(
-                Paragraph(
-                    f"<b>Total de comentários:</b> {len(comments)}<br/>"
-                    f"<b>Comentários resolvidos:</b> {resolved_count}",
-                    normal_style,
-                )
-            )
-            elements.append(Spacer(1, 20))
-
-            # Subtítulo para tabela
-            elements.append(Paragraph("Lista de Comentários", subtitle_style))
-            elements.append(Spacer(1, 10))
-
-            # Tabela de comentários
-            data = [["Autor", "Tempo", "Status", "Comentário"]]
-
-            for comment in comments:
-                # Formatação do timestamp
-                ts = getattr(comment, "video_timestamp", 0)
-                seconds = ts // 1000
-                minutes = seconds // 60
-                seconds = seconds % 60
-                formatted_time = f"{minutes:02d}:{seconds:02d}"
-
-                # Status de resolução
-                status = (
-                    "Resolvido"
-                    if getattr(comment, "is_resolved", False)
-                    else "Pendente"
-                )
-
-                # Texto do comentário (limitado para tabela)
-                text = getattr(comment, "text", "")
-                if len(text) > 80:
-                    text = text[:77] + "..."
-
-                data.append(
-                    [
-                        getattr(comment, "author", ""),
-                        formatted_time,
-                        status,
-                        text,
-                    ]
-                )
-
-            # Criar tabela
-            table = Table(data, colWidths=[100, 60, 70, 260])
-            table.setStyle(
-                TableStyle(
-                    [
-                        ("BACKGROUND", (0, 0), (-1, 0), colors.darkgrey),
-                        ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                        ("ALIGN", (0, 0), (-1, 0), "CENTER"),
-                        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                        ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
-                        ("GRID", (0, 0), (-1, -1), 1, colors.black),
-                        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                        ("WORDWRAP", (3, 1), (3, -1), True),
-                    ]
-                )
-            )
-            elements.append(table)
-
-            # Comentários detalhados
-            elements.append(Spacer(1, 30))
-            elements.append(Paragraph("Comentários Detalhados", subtitle_style))
-
-            for i, comment in enumerate(comments):
-                elements.append(Spacer(1, 15))
-
-                # Formatação do timestamp
-                ts = getattr(comment, "video_timestamp", 0)
-                seconds = ts // 1000
-                minutes = seconds // 60
-                seconds = seconds % 60
-                formatted_time = f"{minutes:02d}:{seconds:02d}"
-
-                # Status
-                status = (
-                    "Resolvido"
-                    if getattr(comment, "is_resolved", False)
-                    else "Pendente"
-                )
-
-                # Cabeçalho do comentário
-                elements.append(
-                    Paragraph(
-                        f"<b>{i+1}. {getattr(comment, 'author', '')}</b> ({formatted_time}) - "
-                        f"<i>{status}</i>",
-                        ParagraphStyle(
-                            "CommentTitle",
-                            parent=normal_style,
-                            fontName="Helvetica-Bold",
-                            fontSize=10,
-                        ),
-                    )
-                )
-
-                # Texto do comentário
-                elements.append(Paragraph(getattr(comment, "text", ""), normal_style))
-                elements.append(Spacer(1, 5))
-
-            # Rodapé
-            elements.append(Spacer(1, 30))
-            elements.append(
-                Paragraph(
-                    f"Exportado em: {datetime.datetime.now().strftime('%d/%m/%Y %H:%M:%S')}",
-                    normal_style,
-                )
-            )
-
-            # Gerar PDF
-            doc.build(elements)
+            export_comments(comments, filename, "pdf", metadata, title)
             return True
-
+        except ImportError:
+            print(
+                "ReportLab não está instalado. Use 'pip install reportlab' para instalar."
+            )
+            return False
         except Exception as e:
             print(f"Erro ao exportar comentários para PDF: {str(e)}")
             return False
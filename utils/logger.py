@@ -3,15 +3,33 @@ Módulo de logging para o sistema GoNetwork AI.
 
 Este módulo fornece funcionalidades de logging padronizadas para todo o projeto,
 incluindo rotação de logs e diferentes níveis de logging para arquivo e console.
+
+Quem chama ``logger.debug``/``info``... não escreve nada: o registro vai para
+uma fila (``QueueHandler``) e uma thread (``QueueListener``) faz a escrita no
+arquivo e no console. Assim o log não trava o acesso ao banco nem a interface.
+Se a fila encher, os registros excedentes são descartados (e contados em
+``dropped_records``) em vez de bloquear quem chamou.
+
+A seção ``logging`` do ``config.json`` permite ajustar:
+
+- ``level``: nível do logger ``gonetwork`` (padrão DEBUG);
+- ``levels``: nível por módulo, ex. ``{"database": "INFO"}``;
+- ``rate_limits``: registros por segundo, por linha de código, para módulos
+  com mensagens muito frequentes, ex. ``{"database": 5}``;
+- ``json``: grava o arquivo em JSON (um objeto por linha).
 """
 
+import atexit
+import json
 import logging
-import os
+import queue
 import sys
+import threading
+import time
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 # Cria o diretório de logs se não existir
 log_dir = Path("logs")
@@ -22,6 +40,11 @@ if not log_dir.exists():
 log_filename = "gonetwork.log"
 log_path = log_dir / log_filename
 
+# Registros aguardando escrita; acima disso são descartados
+QUEUE_SIZE = 10_000
+# Arquivo de configuração com a seção "logging"
+CONFIG_PATH = Path("config.json")
+
 # Configuração do logger
 logger = logging.getLogger("gonetwork")
 logger.setLevel(logging.DEBUG)
@@ -44,9 +67,144 @@ formatter = logging.Formatter(
 file_handler.setFormatter(formatter)
 console_handler.setFormatter(formatter)
 
-# Adiciona os handlers ao logger
-logger.addHandler(file_handler)
-logger.addHandler(console_handler)
+
+class JsonFormatter(logging.Formatter):
+    """Formata cada registro como um objeto JSON em uma linha"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "file": record.filename,
+            "line": record.lineno,
+            "thread": record.threadName,
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Limita os registros de cada linha de código a ``rate`` por ``per``
+    segundos.
+
+    Só vale para registros até ``max_level`` (DEBUG, por padrão): avisos e
+    erros sempre passam. O número de registros suprimidos é anexado ao
+    próximo registro que passar daquela linha.
+    """
+
+    def __init__(self, rate: float, per: float = 1.0, max_level: int = logging.DEBUG):
+        super().__init__()
+        self.rate = rate
+        self.per = per
+        self.max_level = max_level
+        self._buckets: Dict[tuple, list] = {}  # linha -> [fichas, instante, suprimidos]
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self.max_level:
+            return True
+
+        key = (record.pathname, record.lineno)
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = [self.rate, now, 0]
+            else:
+                elapsed = now - bucket[1]
+                bucket[0] = min(self.rate, bucket[0] + elapsed * self.rate / self.per)
+                bucket[1] = now
+            if bucket[0] < 1:
+                bucket[2] += 1
+                return False
+            bucket[0] -= 1
+            suppressed, bucket[2] = bucket[2], 0
+
+        if suppressed:
+            record.msg = f"{record.getMessage()} (+{suppressed} suprimidas)"
+            record.args = None
+        return True
+
+
+class _NonBlockingQueueHandler(QueueHandler):
+    """QueueHandler que nunca espera: com a fila cheia, descarta o registro"""
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Só resolve a mensagem; data, contexto e traceback são formatados
+        # pela thread de escrita
+        message = record.getMessage()
+        if record.args:
+            record.msg = message
+            record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+_queue = queue.Queue(QUEUE_SIZE)
+queue_handler = _NonBlockingQueueHandler(_queue)
+listener = QueueListener(
+    _queue, file_handler, console_handler, respect_handler_level=True
+)
+
+# Adiciona o handler da fila ao logger
+logger.addHandler(queue_handler)
+listener.start()
+atexit.register(listener.stop)
+
+_rate_limit_filters: Dict[str, RateLimitFilter] = {}
+
+
+def dropped_records() -> int:
+    """Registros descartados porque a fila de escrita estava cheia"""
+    return queue_handler.dropped
+
+
+def _load_settings() -> dict:
+    try:
+        with open(CONFIG_PATH, "r", encoding="utf-8") as f:
+            return json.load(f).get("logging", {})
+    except (OSError, ValueError, AttributeError):
+        return {}
+
+
+def configure_logging(settings: Optional[dict] = None) -> None:
+    """
+    Aplica a configuração de logging (seção ``logging`` do ``config.json``).
+
+    Args:
+        settings: Configuração; se None, é lida do ``config.json``.
+            Chaves: level, levels, rate_limits e json (ver o início do módulo)
+    """
+    if settings is None:
+        settings = _load_settings()
+
+    logger.setLevel(settings.get("level", "DEBUG"))
+    for name, level in settings.get("levels", {}).items():
+        get_logger(name).setLevel(level)
+
+    for name, rate in settings.get("rate_limits", {}).items():
+        module_logger = get_logger(name)
+        previous = _rate_limit_filters.pop(name, None)
+        if previous is not None:
+            module_logger.removeFilter(previous)
+        if rate:
+            _rate_limit_filters[name] = RateLimitFilter(rate)
+            module_logger.addFilter(_rate_limit_filters[name])
+
+    file_handler.setFormatter(JsonFormatter() if settings.get("json") else formatter)
 
 
 def get_logger(name: Optional[str] = None) -> logging.Logger:
@@ -56,6 +214,7 @@ def get_logger(name: Optional[str] = None) -> logging.Logger:
     O logger retornado está configurado com handlers para arquivo (com rotação)
     e console, com níveis de logging diferentes para cada um. O arquivo de log
     captura mensagens de DEBUG e acima, enquanto o console mostra INFO e acima.
+    A escrita é feita em segundo plano (ver o início do módulo).
 
     Args:
         name (str, opcional): Nome do módulo. Se None, retorna o logger raiz.
@@ -71,3 +230,6 @@ def get_logger(name: Optional[str] = None) -> logging.Logger:
     if name:
         return logging.getLogger(f"gonetwork.{name}")
     return logger
+
+
+configure_logging()
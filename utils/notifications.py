@@ -0,0 +1,400 @@
+"""
+Notificações persistentes, compartilhadas pela versão desktop e pela web.
+
+As notificações ficam na tabela ``user_notifications`` do banco principal
+(``data/gonetwork.db``), indexada por ``(user_id, read, expiry)``, então
+sobrevivem ao fim da sessão e são vistas por qualquer processo que abra o
+banco. ``user_id`` NULL indica uma notificação para todos os usuários; quem já
+leu cada uma delas fica em ``notification_reads``.
+
+O número de não lidas não é contado a cada consulta: gatilhos do SQLite
+mantêm ``notification_counters`` atualizada a cada inserção, leitura e
+remoção. ``unread_count`` lê duas linhas pela chave primária (a do usuário e
+a ``'*'`` das notificações gerais), em tempo constante. A soma é
+
+    não lidas(usuário) = contador[usuário] + contador['*']
+
+em que ``contador[usuário]`` = pessoais não lidas - gerais já lidas.
+
+As notificações vencidas deixam de ser listadas na hora (filtro por
+``expiry``) e são removidas em lotes de ``PURGE_BATCH`` por uma thread em
+segundo plano, a cada ``PURGE_INTERVAL`` segundos; até lá elas ainda contam
+como não lidas.
+
+Este módulo usa apenas a biblioteca padrão, para poder ser carregado também
+pela versão web (ver ``gonetwork_web/utils/notifications.py``).
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Tipos de notificação aceitos
+NOTIFICATION_TYPES = ("info", "success", "warning", "error")
+# Notificações removidas por lote na limpeza das vencidas
+PURGE_BATCH = 500
+# Intervalo (s) entre as limpezas em segundo plano
+PURGE_INTERVAL = 60.0
+
+# Chave do contador das notificações gerais (user_id NULL)
+_BROADCAST = "*"
+# Leitor das notificações gerais quando não há usuário logado
+_ANONYMOUS = ""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS user_notifications (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id TEXT,
+    message TEXT NOT NULL,
+    type TEXT NOT NULL DEFAULT 'info',
+    created_at REAL NOT NULL,
+    expiry REAL NOT NULL,
+    read INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE INDEX IF NOT EXISTS idx_user_notifications_user
+    ON user_notifications (user_id, read, expiry);
+CREATE INDEX IF NOT EXISTS idx_user_notifications_expiry
+    ON user_notifications (expiry);
+
+CREATE TABLE IF NOT EXISTS notification_reads (
+    notification_id INTEGER NOT NULL,
+    user_id TEXT NOT NULL,
+    PRIMARY KEY (notification_id, user_id)
+);
+
+CREATE TABLE IF NOT EXISTS notification_counters (
+    user_id TEXT PRIMARY KEY,
+    unread INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_user_notifications_insert
+AFTER INSERT ON user_notifications WHEN NEW.read = 0
+BEGIN
+    INSERT INTO notification_counters (user_id, unread)
+    VALUES (COALESCE(NEW.user_id, '*'), 1)
+    ON CONFLICT (user_id) DO UPDATE SET unread = unread + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_user_notifications_read
+AFTER UPDATE OF read ON user_notifications
+WHEN NEW.user_id IS NOT NULL AND NEW.read != OLD.read
+BEGIN
+    UPDATE notification_counters
+    SET unread = unread + (CASE WHEN NEW.read THEN -1 ELSE 1 END)
+    WHERE user_id = NEW.user_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_user_notifications_delete
+AFTER DELETE ON user_notifications
+BEGIN
+    UPDATE notification_counters SET unread = unread - 1
+    WHERE OLD.read = 0 AND user_id = COALESCE(OLD.user_id, '*');
+    DELETE FROM notification_reads WHERE notification_id = OLD.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_notification_reads_insert
+AFTER INSERT ON notification_reads
+BEGIN
+    INSERT INTO notification_counters (user_id, unread)
+    VALUES (NEW.user_id, -1)
+    ON CONFLICT (user_id) DO UPDATE SET unread = unread - 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_notification_reads_delete
+AFTER DELETE ON notification_reads
+BEGIN
+    UPDATE notification_counters SET unread = unread + 1
+    WHERE user_id = OLD.user_id;
+END;
+"""
+
+# Notificações pessoais e gerais ativas de um leitor, com o estado de leitura
+_LIST_QUERY = """
+SELECT * FROM (
+    SELECT id, user_id, message, type, created_at, expiry, read
+    FROM user_notifications
+    WHERE user_id = ? AND expiry > ? AND (? OR read = 0)
+    UNION ALL
+    SELECT n.id, n.user_id, n.message, n.type, n.created_at, n.expiry,
+           r.user_id IS NOT NULL AS read
+    FROM user_notifications n
+    LEFT JOIN notification_reads r
+        ON r.notification_id = n.id AND r.user_id = ?
+    WHERE n.user_id IS NULL AND n.expiry > ? AND (? OR r.user_id IS NULL)
+)
+ORDER BY created_at DESC, id DESC
+LIMIT ?
+"""
+
+
+def _reader(user_id) -> str:
+    return _ANONYMOUS if user_id is None else str(user_id)
+
+
+class NotificationStore:
+    """Notificações em SQLite com contador de não lidas e limpeza em lotes"""
+
+    def __init__(self, db_path: str, purge_batch: int = PURGE_BATCH):
+        self.db_path = db_path
+        self.purge_batch = purge_batch
+        self._local = threading.local()
+        self._stop = threading.Event()
+        self._purger: Optional[threading.Thread] = None
+
+        directory = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(directory, exist_ok=True)
+        self._connection().executescript(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        # Uma conexão por thread (Streamlit e o purgador usam threads próprias)
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            self._local.conn = conn
+        return conn
+
+    def add(
+        self,
+        message: str,
+        type: str = "info",
+        expiry_minutes: float = 60,
+        user_id=None,
+    ) -> int:
+        """
+        Adiciona uma notificação.
+
+        Args:
+            message: Texto da mensagem
+            type: info, success, warning ou error
+            expiry_minutes: Tempo em minutos até a expiração
+            user_id: ID do usuário destinatário (None = todos os usuários)
+
+        Returns:
+            int: ID da notificação
+        """
+        if type not in NOTIFICATION_TYPES:
+            raise ValueError(f"Tipo de notificação inválido: {type}")
+
+        now = time.time()
+        conn = self._connection()
+        with conn:
+            cursor = conn.execute(
+                """
+                INSERT INTO user_notifications
+                    (user_id, message, type, created_at, expiry)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (
+                    None if user_id is None else str(user_id),
+                    message,
+                    type,
+                    now,
+                    now + expiry_minutes * 60,
+                ),
+            )
+        return cursor.lastrowid
+
+    def add_many(
+        self,
+        notifications: Iterable[Tuple[str, str]],
+        expiry_minutes: float = 60,
+        user_id=None,
+    ) -> None:
+        """
+        Adiciona várias notificações em uma única transação.
+
+        Args:
+            notifications: Pares (mensagem, tipo)
+            expiry_minutes: Tempo em minutos até a expiração
+            user_id: ID do usuário destinatário (None = todos os usuários)
+        """
+        now = time.time()
+        user_id = None if user_id is None else str(user_id)
+        rows = []
+        for message, type in notifications:
+            if type not in NOTIFICATION_TYPES:
+                raise ValueError(f"Tipo de notificação inválido: {type}")
+            rows.append((user_id, message, type, now, now + expiry_minutes * 60))
+
+        conn = self._connection()
+        with conn:
+            conn.executemany(
+                """
+                INSERT INTO user_notifications
+                    (user_id, message, type, created_at, expiry)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+
+    def get_all(
+        self, user_id=None, include_read: bool = False, limit: int = 50
+    ) -> List[Dict]:
+        """
+        Notificações ativas (não vencidas) de um usuário, das mais recentes
+        para as mais antigas.
+
+        Args:
+            user_id: ID do usuário (as notificações gerais sempre entram)
+            include_read: Se deve incluir notificações já lidas
+            limit: Número máximo de notificações
+
+        Returns:
+            list: Dicionários com id, message, type, timestamp, expiry, read e
+            user_id
+        """
+        reader = _reader(user_id)
+        now = time.time()
+        params = (reader, now, include_read, reader, now, include_read, limit)
+        rows = self._connection().execute(_LIST_QUERY, params).fetchall()
+        return [
+            {
+                "id": row["id"],
+                "message": row["message"],
+                "type": row["type"],
+                "timestamp": datetime.fromtimestamp(row["created_at"]),
+                "expiry": row["expiry"],
+                "read": bool(row["read"]),
+                "user_id": row["user_id"],
+            }
+            for row in rows
+        ]
+
+    def unread_count(self, user_id=None) -> int:
+        """Não lidas do usuário (contador mantido pelos gatilhos, O(1))"""
+        row = (
+            self._connection()
+            .execute(
+                "SELECT COALESCE(SUM(unread), 0) FROM notification_counters "
+                "WHERE user_id IN (?, ?)",
+                (_reader(user_id), _BROADCAST),
+            )
+            .fetchone()
+        )
+        return max(row[0], 0)
+
+    def mark_as_read(self, notification_id: int, user_id=None) -> None:
+        """
+        Marca uma notificação como lida.
+
+        Notificações gerais são marcadas apenas para ``user_id``.
+        """
+        reader = _reader(user_id)
+        conn = self._connection()
+        with conn:
+            conn.execute(
+                "UPDATE user_notifications SET read = 1 "
+                "WHERE id = ? AND user_id = ? AND read = 0",
+                (notification_id, reader),
+            )
+            conn.execute(
+                """
+                INSERT OR IGNORE INTO notification_reads (notification_id, user_id)
+                SELECT id, ? FROM user_notifications
+                WHERE id = ? AND user_id IS NULL
+                """,
+                (reader, notification_id),
+            )
+
+    def mark_all_as_read(self, user_id=None) -> None:
+        """Marca como lidas todas as notificações ativas do usuário"""
+        reader = _reader(user_id)
+        now = time.time()
+        conn = self._connection()
+        with conn:
+            conn.execute(
+                "UPDATE user_notifications SET read = 1 "
+                "WHERE user_id = ? AND read = 0 AND expiry > ?",
+                (reader, now),
+            )
+            conn.execute(
+                """
+                INSERT OR IGNORE INTO notification_reads (notification_id, user_id)
+                SELECT id, ? FROM user_notifications
+                WHERE user_id IS NULL AND expiry > ?
+                """,
+                (reader, now),
+            )
+
+    def purge_expired(self, max_batches: Optional[int] = None) -> int:
+        """
+        Remove as notificações vencidas em lotes de ``purge_batch``.
+
+        Cada lote é uma transação curta, para não segurar o banco enquanto
+        a interface grava.
+
+        Args:
+            max_batches: Número máximo de lotes (None = até acabar)
+
+        Returns:
+            int: Número de notificações removidas
+        """
+        conn = self._connection()
+        removed = batches = 0
+        while max_batches is None or batches < max_batches:
+            with conn:
+                cursor = conn.execute(
+                    """
+                    DELETE FROM user_notifications WHERE id IN (
+                        SELECT id FROM user_notifications
+                        WHERE expiry <= ? ORDER BY expiry LIMIT ?
+                    )
+                    """,
+                    (time.time(), self.purge_batch),
+                )
+            removed += cursor.rowcount
+            batches += 1
+            if cursor.rowcount < self.purge_batch:
+                break
+        return removed
+
+    def start_purger(self, interval: float = PURGE_INTERVAL) -> None:
+        """Inicia a limpeza periódica das vencidas em uma thread daemon"""
+        if self._purger is not None and self._purger.is_alive():
+            return
+        self._stop.clear()
+        self._purger = threading.Thread(
+            target=self._purge_loop,
+            args=(interval,),
+            name="notification-purger",
+            daemon=True,
+        )
+        self._purger.start()
+
+    def _purge_loop(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            try:
+                self.purge_expired()
+            except sqlite3.Error:
+                # Banco ocupado: tenta de novo no próximo intervalo
+                pass
+
+    def stop(self) -> None:
+        """Interrompe a limpeza em segundo plano"""
+        self._stop.set()
+        if self._purger is not None:
+            self._purger.join()
+            self._purger = None
+
+
+_stores: Dict[str, NotificationStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_notification_store(db_path: str, **kwargs) -> NotificationStore:
+    """
+    Retorna o repositório de notificações do banco (único por arquivo), com a
+    limpeza em segundo plano já iniciada.
+    """
+    db_path = os.path.abspath(db_path)
+    with _stores_lock:
+        store = _stores.get(db_path)
+        if store is None:
+            store = _stores[db_path] = NotificationStore(db_path, **kwargs)
+            store.start_purger()
+        return store
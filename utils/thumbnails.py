@@ -0,0 +1,409 @@
+"""
+Cache de miniaturas endereçado pelo conteúdo dos arquivos.
+
+Cada miniatura é identificada pelo hash SHA-256 do arquivo original e pelo
+tamanho pedido (``<hash>_<largura>x<altura>.png``), então renomear ou copiar
+um arquivo não gera uma miniatura nova e alterar o conteúdo gera. As
+miniaturas ficam em um diretório em disco e são removidas da menos usada para
+a mais usada (LRU, pela data de modificação) quando o total passa do limite.
+
+A decodificação usa ``Image.draft()``, que em JPEG decodifica direto em escala
+reduzida (1/2 a 1/8) em vez de abrir a imagem inteira. ``request``/``prefetch``
+geram as miniaturas em um pool de processos (ou de threads) sem bloquear quem
+chamou; ``get`` espera pela geração.
+
+O hash de um arquivo é calculado sempre dentro do pool, nunca na thread de
+quem pediu a miniatura. O resultado fica guardado em ``digests.db``, no
+diretório das miniaturas, identificado por caminho, tamanho e data de
+modificação (``mtime_ns``): a consulta de um arquivo inalterado é só um
+``stat``, mesmo depois de reiniciar a aplicação.
+
+Este módulo usa apenas a biblioteca padrão e o Pillow (importado só ao gerar
+uma miniatura), para poder ser carregado também pela versão web (ver
+``gonetwork_web/utils/thumbnails.py``).
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_SIZE = (120, 120)
+# Espaço máximo em disco ocupado pelas miniaturas
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".bmp", ".tif", ".tiff", ".webp"}
+
+_HASH_BUFFER = 1024 * 1024
+# Banco com os hashes já calculados, dentro do diretório das miniaturas
+DIGESTS_DB = "digests.db"
+
+
+def is_image(path: str) -> bool:
+    """Indica, pela extensão, se o arquivo é uma imagem com miniatura."""
+    return os.path.splitext(path)[1].lower() in IMAGE_EXTENSIONS
+
+
+def file_digest(path: str) -> str:
+    """Calcula o SHA-256 do conteúdo do arquivo, lendo em blocos."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(_HASH_BUFFER), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def thumbnail_name(digest: str, size: Tuple[int, int]) -> str:
+    """Nome do arquivo da miniatura para um conteúdo e um tamanho."""
+    return f"{digest}_{size[0]}x{size[1]}.png"
+
+
+def render_thumbnail(source: str, target: str, size: Tuple[int, int]) -> int:
+    """
+    Gera a miniatura de ``source`` em ``target`` (PNG).
+
+    A imagem é decodificada já reduzida quando o formato permite. O arquivo é
+    escrito com outro nome e renomeado ao final, para que um leitor nunca
+    encontre uma miniatura pela metade.
+
+    Returns:
+        int: Tamanho em bytes da miniatura gerada
+    """
+    from PIL import Image
+
+    temporary = f"{target}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with Image.open(source) as image:
+        image.draft("RGB", size)
+        image.thumbnail(size)
+        if image.mode not in ("RGB", "RGBA", "L", "LA"):
+            image = image.convert("RGBA")
+        image.save(temporary, "PNG")
+    os.replace(temporary, target)
+    return os.path.getsize(target)
+
+
+def build_thumbnail(
+    source: str, directory: str, size: Tuple[int, int], digest: Optional[str] = None
+) -> Tuple[str, str, int]:
+    """
+    Garante a miniatura de ``source`` no diretório do cache.
+
+    Função de módulo para poder rodar em outro processo.
+
+    Returns:
+        tuple: (hash do conteúdo, caminho da miniatura, bytes escritos; 0 se
+        a miniatura já existia)
+    """
+    if digest is None:
+        digest = file_digest(source)
+    target = os.path.join(directory, thumbnail_name(digest, size))
+    if os.path.exists(target):
+        return digest, target, 0
+    return digest, target, render_thumbnail(source, target, size)
+
+
+class ThumbnailService:
+    """Gera, guarda e serve miniaturas de imagens"""
+
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        use_processes: bool = True,
+        max_workers: Optional[int] = None,
+    ):
+        """
+        Args:
+            directory: Diretório das miniaturas
+            max_bytes: Espaço máximo em disco; as menos usadas são removidas
+            use_processes: Gera em segundo plano com processos (True) ou threads
+            max_workers: Número máximo de processos/threads de geração
+        """
+        self.directory = os.path.abspath(directory)
+        self.max_bytes = max_bytes
+        self.use_processes = use_processes
+        self.max_workers = max_workers
+
+        self._lock = threading.RLock()
+        # Caminho -> (mtime, tamanho, hash): evita reler arquivos inalterados
+        self._digests: Dict[str, Tuple[int, int, str]] = {}
+        self._digest_db: Optional[sqlite3.Connection] = None
+        # Miniaturas em disco, da menos para a mais usada, com o tamanho
+        self._entries: Optional["OrderedDict[str, int]"] = None
+        self._total = 0
+        self._pending: Dict[Tuple[str, Tuple[int, int]], Future] = {}
+        self._executor = None
+
+    # ----- Índice em disco -----
+
+    def _load_entries(self) -> None:
+        if self._entries is not None:
+            return
+
+        os.makedirs(self.directory, exist_ok=True)
+        found = []
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.endswith(".png"):
+                    stat = entry.stat()
+                    found.append((stat.st_mtime, entry.name, stat.st_size))
+
+        self._entries = OrderedDict((name, nbytes) for _, name, nbytes in sorted(found))
+        self._total = sum(self._entries.values())
+
+    def _touch(self, name: str) -> None:
+        """Marca a miniatura como usada agora (em memória e no disco)"""
+        self._entries.move_to_end(name)
+        try:
+            os.utime(os.path.join(self.directory, name))
+        except OSError:
+            pass
+
+    def _record(self, name: str, nbytes: int) -> None:
+        if name in self._entries:
+            self._touch(name)
+            return
+        self._entries[name] = nbytes
+        self._total += nbytes
+        self._evict()
+
+    def _evict(self) -> None:
+        """Remove as miniaturas menos usadas até caber no limite"""
+        while self._total > self.max_bytes and len(self._entries) > 1:
+            name, nbytes = self._entries.popitem(last=False)
+            self._total -= nbytes
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+
+    @property
+    def total_bytes(self) -> int:
+        """Espaço em disco ocupado pelas miniaturas"""
+        with self._lock:
+            self._load_entries()
+            return self._total
+
+    # ----- Hash do conteúdo -----
+
+    def _stat_key(self, path: str) -> Tuple[int, int]:
+        stat = os.stat(path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def _open_digest_db(self) -> Optional[sqlite3.Connection]:
+        if self._digest_db is None:
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                conn = sqlite3.connect(
+                    os.path.join(self.directory, DIGESTS_DB), check_same_thread=False
+                )
+                with conn:
+                    conn.execute(
+                        """
+                        CREATE TABLE IF NOT EXISTS digests (
+                            path TEXT PRIMARY KEY,
+                            size INTEGER NOT NULL,
+                            mtime_ns INTEGER NOT NULL,
+                            digest TEXT NOT NULL
+                        )
+                        """
+                    )
+            except sqlite3.Error:
+                return None
+            self._digest_db = conn
+        return self._digest_db
+
+    def _known_digest(self, path: str, stat_key: Tuple[int, int]) -> Optional[str]:
+        """Hash já calculado para o arquivo nesse estado (sem ler o conteúdo)"""
+        cached = self._digests.get(path)
+        if cached is not None and cached[:2] == stat_key:
+            return cached[2]
+
+        conn = self._open_digest_db()
+        if conn is None:
+            return None
+        try:
+            row = conn.execute(
+                "SELECT digest FROM digests WHERE path = ? AND mtime_ns = ? AND size = ?",
+                (path, *stat_key),
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None:
+            return None
+        self._digests[path] = (*stat_key, row[0])
+        return row[0]
+
+    def _remember_digest(
+        self, path: str, stat_key: Tuple[int, int], digest: str
+    ) -> None:
+        self._digests[path] = (*stat_key, digest)
+        conn = self._open_digest_db()
+        if conn is None:
+            return
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO digests (path, mtime_ns, size, digest) "
+                    "VALUES (?, ?, ?, ?)",
+                    (path, *stat_key, digest),
+                )
+        except sqlite3.Error:
+            pass
+
+    def digest(self, path: str) -> str:
+        """Hash do conteúdo, recalculado só quando o arquivo muda"""
+        path = os.path.abspath(path)
+        stat_key = self._stat_key(path)
+        with self._lock:
+            digest = self._known_digest(path, stat_key)
+        if digest is None:
+            digest = file_digest(path)
+            with self._lock:
+                self._remember_digest(path, stat_key, digest)
+        return digest
+
+    # ----- Consulta -----
+
+    def cached_path(
+        self, path: str, size: Tuple[int, int] = DEFAULT_SIZE
+    ) -> Optional[str]:
+        """
+        Caminho da miniatura se ela já existir, sem gerá-la.
+
+        Não lê o conteúdo do arquivo: se o hash ainda não é conhecido,
+        retorna None (``request`` o calcula em segundo plano).
+        """
+        path = os.path.abspath(path)
+        try:
+            stat_key = self._stat_key(path)
+        except OSError:
+            return None
+        with self._lock:
+            digest = self._known_digest(path, stat_key)
+            if digest is None:
+                return None
+            name = thumbnail_name(digest, size)
+            self._load_entries()
+            if name not in self._entries:
+                return None
+            self._touch(name)
+        return os.path.join(self.directory, name)
+
+    def get(self, path: str, size: Tuple[int, int] = DEFAULT_SIZE) -> Optional[str]:
+        """
+        Retorna o caminho da miniatura, esperando a geração se necessário.
+
+        O hash e a miniatura são calculados no pool (``request``); quem chama
+        só espera o resultado.
+
+        Returns:
+            str: Caminho da miniatura, ou None se o arquivo não existir ou não
+            puder ser lido como imagem
+        """
+        cached = self.cached_path(path, size)
+        if cached is not None:
+            return cached
+        return self.request(path, size).result()
+
+    def request(self, path: str, size: Tuple[int, int] = DEFAULT_SIZE) -> Future:
+        """
+        Gera a miniatura em segundo plano.
+
+        Pedidos repetidos para o mesmo arquivo e tamanho compartilham a mesma
+        tarefa.
+
+        Returns:
+            Future: Resolve com o caminho da miniatura (ou None)
+        """
+        path = os.path.abspath(path)
+        key = (path, tuple(size))
+        with self._lock:
+            pending = self._pending.get(key)
+            if pending is not None:
+                return pending
+
+            result = Future()
+            try:
+                stat_key = self._stat_key(path)
+            except OSError:
+                result.set_result(None)
+                return result
+
+            self._load_entries()
+            digest = self._known_digest(path, stat_key)
+            if digest is not None:
+                name = thumbnail_name(digest, key[1])
+                if name in self._entries:
+                    self._touch(name)
+                    result.set_result(os.path.join(self.directory, name))
+                    return result
+
+            self._pending[key] = result
+            task = self._get_executor().submit(
+                build_thumbnail, path, self.directory, key[1], digest
+            )
+
+        task.add_done_callback(lambda done: self._finish(key, stat_key, done, result))
+        return result
+
+    def prefetch(
+        self, paths: Iterable[str], size: Tuple[int, int] = DEFAULT_SIZE
+    ) -> List[Future]:
+        """Agenda as miniaturas de vários arquivos de imagem"""
+        return [self.request(path, size) for path in paths if is_image(path)]
+
+    def _finish(self, key, stat_key, task: Future, result: Future) -> None:
+        path = key[0]
+        target = None
+        try:
+            digest, target, nbytes = task.result()
+        except Exception:
+            pass
+        else:
+            with self._lock:
+                self._remember_digest(path, stat_key, digest)
+                self._record(
+                    os.path.basename(target), nbytes or os.path.getsize(target)
+                )
+
+        with self._lock:
+            self._pending.pop(key, None)
+        result.set_result(target)
+
+    def _get_executor(self):
+        if self._executor is None:
+            os.makedirs(self.directory, exist_ok=True)
+            executor_class = (
+                ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
+            )
+            self._executor = executor_class(max_workers=self.max_workers)
+        return self._executor
+
+    def shutdown(self) -> None:
+        """Encerra o pool de geração (as tarefas em andamento são concluídas)"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        with self._lock:
+            if self._digest_db is not None:
+                self._digest_db.close()
+                self._digest_db = None
+
+
+_services: Dict[str, ThumbnailService] = {}
+_services_lock = threading.Lock()
+
+
+def get_thumbnail_service(directory: str, **kwargs) -> ThumbnailService:
+    """Retorna o serviço de miniaturas (único por diretório)."""
+    directory = os.path.abspath(directory)
+    with _services_lock:
+        service = _services.get(directory)
+        if service is None:
+            service = _services[directory] = ThumbnailService(directory, **kwargs)
+        return service
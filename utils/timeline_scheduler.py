@@ -0,0 +1,364 @@
+"""
+Entrega das notificações da timeline (``timeline_notifications``) na hora.
+
+O agendador mantém em memória um heap só com as notificações não enviadas que
+vencem na próxima janela (``WINDOW`` segundos), lidas pelo índice
+``(sent, notification_time)`` — a tabela inteira nunca é percorrida. Uma
+thread dorme até a próxima notificação do heap e, ao acordar, dispara todas
+as vencidas em lotes de ``BATCH_SIZE``: cada lote é marcado como enviado em
+uma única transação e só então repassado à função de entrega.
+
+Notificações novas chegam ao heap de duas formas:
+
+- ``schedule_notification`` (chamado por ``TimelineRepository.add_notification``)
+  coloca a notificação no heap e acorda a thread, sem consultar o banco;
+- gravações de outros processos são percebidas pelo ``PRAGMA data_version``,
+  conferido a cada ``CHECK_INTERVAL`` segundos, que só então relê a janela.
+
+A marcação é feita antes da entrega (no máximo uma entrega por notificação):
+se dois processos disputarem a mesma notificação, só quem a marcou entrega.
+
+Os horários são comparados como texto ISO 8601 (``datetime.isoformat()``, o
+formato gravado pelo repositório).
+"""
+
+import heapq
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from utils.logger import get_logger
+
+# Segundos à frente carregados do banco a cada leitura da janela
+WINDOW = 300.0
+# Notificações marcadas e entregues por transação
+BATCH_SIZE = 500
+# Máximo de notificações lidas por leitura da janela
+WINDOW_LIMIT = 10000
+# Intervalo (s) entre as verificações de gravações de outros processos
+CHECK_INTERVAL = 1.0
+
+# Nível da notificação da interface para cada tipo da timeline
+NOTIFICATION_LEVELS = {
+    "Lembrete": "info",
+    "Alerta": "warning",
+    "Emergência": "error",
+}
+
+_DUE_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_timeline_notifications_due
+    ON timeline_notifications (sent, notification_time)
+"""
+
+_WINDOW_QUERY = """
+SELECT id, timeline_item_id, notification_time, notification_type, message
+FROM timeline_notifications
+WHERE sent = 0 AND notification_time <= ?
+ORDER BY notification_time
+LIMIT ?
+"""
+
+_FIELDS = (
+    "id",
+    "timeline_item_id",
+    "notification_time",
+    "notification_type",
+    "message",
+)
+
+
+def _timestamp(value) -> Optional[float]:
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def _iso(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp).isoformat()
+
+
+class NotificationScheduler:
+    """Heap das notificações da próxima janela, disparadas em lotes"""
+
+    def __init__(
+        self,
+        db_path: str,
+        deliver: Callable[[List[Dict]], None],
+        window: float = WINDOW,
+        batch_size: int = BATCH_SIZE,
+        check_interval: float = CHECK_INTERVAL,
+    ):
+        """
+        Args:
+            db_path: Caminho do banco com a tabela ``timeline_notifications``
+            deliver: Recebe cada lote de notificações (dicionários com id,
+                timeline_item_id, notification_time, notification_type e
+                message) já marcado como enviado
+            window: Segundos à frente carregados a cada leitura do banco
+            batch_size: Notificações por transação
+            check_interval: Intervalo (s) entre as verificações do banco
+
+        Raises:
+            sqlite3.Error: Se a tabela não existir
+        """
+        self.db_path = db_path
+        self.deliver = deliver
+        self.window = window
+        self.batch_size = batch_size
+        self.check_interval = check_interval
+        self.logger = get_logger("timeline_scheduler")
+
+        self._heap = []  # (vencimento, id)
+        self._pending: Dict[str, Dict] = {}
+        self._horizon = float("-inf")
+        self._data_version = None
+        self._next_check = 0.0
+        self._condition = threading.Condition()
+        self._db_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+
+        self._conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._conn:
+            self._conn.execute(_DUE_INDEX)
+
+    def schedule(self, notification: Dict) -> None:
+        """
+        Agenda uma notificação recém-gravada, sem consultar o banco.
+
+        Notificações além da janela atual são ignoradas: entram no heap na
+        próxima leitura da janela.
+        """
+        due = _timestamp(notification.get("notification_time"))
+        if due is None:
+            return
+        with self._condition:
+            if due > self._horizon or notification["id"] in self._pending:
+                return
+            self._push(due, {field: notification.get(field) for field in _FIELDS})
+            self._condition.notify()
+
+    def _push(self, due: float, notification: Dict) -> None:
+        self._pending[notification["id"]] = notification
+        heapq.heappush(self._heap, (due, notification["id"]))
+
+    def _load_window(self, now: float) -> None:
+        horizon = now + self.window
+        with self._db_lock:
+            rows = self._conn.execute(
+                _WINDOW_QUERY, (_iso(horizon), WINDOW_LIMIT)
+            ).fetchall()
+
+        with self._condition:
+            for row in rows:
+                due = _timestamp(row["notification_time"])
+                if due is not None and row["id"] not in self._pending:
+                    self._push(due, dict(row))
+            if len(rows) == WINDOW_LIMIT:
+                # Janela cheia: a próxima leitura começa na última carregada
+                horizon = _timestamp(rows[-1]["notification_time"]) or now
+            self._horizon = horizon
+
+    def _changed_elsewhere(self) -> bool:
+        # data_version muda quando outra conexão grava no banco
+        with self._db_lock:
+            version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        changed = version != self._data_version
+        self._data_version = version
+        return changed
+
+    def _pop_due(self, now: float) -> List[Dict]:
+        batch = []
+        with self._condition:
+            while (
+                self._heap and self._heap[0][0] <= now and len(batch) < self.batch_size
+            ):
+                _, notification_id = heapq.heappop(self._heap)
+                notification = self._pending.pop(notification_id, None)
+                if notification is not None:
+                    batch.append(notification)
+        return batch
+
+    def _claim(self, batch: List[Dict]) -> List[Dict]:
+        """Marca o lote como enviado (uma transação) e retorna o que foi marcado"""
+        ids = [notification["id"] for notification in batch]
+        placeholders = ", ".join("?" * len(ids))
+        with self._db_lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                claimed = {
+                    row[0]
+                    for row in self._conn.execute(
+                        f"SELECT id FROM timeline_notifications "
+                        f"WHERE sent = 0 AND id IN ({placeholders})",
+                        ids,
+                    )
+                }
+                self._conn.execute(
+                    f"UPDATE timeline_notifications SET sent = 1 "
+                    f"WHERE sent = 0 AND id IN ({placeholders})",
+                    ids,
+                )
+                self._conn.execute("COMMIT")
+            except sqlite3.Error:
+                self._conn.execute("ROLLBACK")
+                raise
+        return [notification for notification in batch if notification["id"] in claimed]
+
+    def fire_due(self, now: Optional[float] = None) -> int:
+        """
+        Dispara as notificações vencidas até ``now``.
+
+        Returns:
+            int: Número de notificações entregues
+        """
+        now = time.time() if now is None else now
+        delivered = 0
+        while True:
+            batch = self._pop_due(now)
+            if not batch:
+                return delivered
+            try:
+                claimed = self._claim(batch)
+            except sqlite3.Error as e:
+                # Banco ocupado: o lote volta para o heap
+                self.logger.error(f"Erro ao marcar notificações como enviadas: {e}")
+                with self._condition:
+                    for notification in batch:
+                        self._push(now + self.check_interval, notification)
+                return delivered
+            if not claimed:
+                continue
+            try:
+                self.deliver(claimed)
+            except Exception as e:
+                self.logger.error(f"Erro ao entregar notificações da timeline: {e}")
+            delivered += len(claimed)
+
+    def tick(self, now: Optional[float] = None) -> float:
+        """
+        Relê a janela se necessário e dispara as vencidas.
+
+        Returns:
+            float: Próximo instante em que o agendador precisa acordar
+        """
+        now = time.time() if now is None else now
+        if now >= self._next_check:
+            self._next_check = now + self.check_interval
+            if self._changed_elsewhere() or now >= self._horizon:
+                self._load_window(now)
+        self.fire_due(now)
+
+        with self._condition:
+            wake = min(self._horizon, self._next_check)
+            if self._heap:
+                wake = min(wake, self._heap[0][0])
+        return wake
+
+    def start(self) -> None:
+        """Inicia a thread de entrega"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopping = False
+        self._thread = threading.Thread(
+            target=self._run, name="timeline-notifications", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            try:
+                wake = self.tick()
+            except sqlite3.Error as e:
+                self.logger.error(f"Erro no agendador de notificações: {e}")
+                wake = time.time() + self.check_interval
+            with self._condition:
+                if self._stopping:
+                    return
+                timeout = wake - time.time()
+                if timeout > 0:
+                    # schedule() acorda a thread antes do prazo
+                    self._condition.wait(timeout)
+                if self._stopping:
+                    return
+
+    def stop(self) -> None:
+        """Interrompe a thread de entrega"""
+        with self._condition:
+            self._stopping = True
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def pending_count(self) -> int:
+        """Notificações da janela atual ainda não disparadas"""
+        with self._condition:
+            return len(self._pending)
+
+
+def deliver_to_store(store, expiry_minutes: float = 60) -> Callable[[List[Dict]], None]:
+    """
+    Função de entrega que grava cada lote no repositório de notificações
+    (``utils/notifications.py``) como notificações gerais.
+    """
+
+    def deliver(notifications: List[Dict]) -> None:
+        store.add_many(
+            [
+                (
+                    notification["message"],
+                    NOTIFICATION_LEVELS.get(notification["notification_type"], "info"),
+                )
+                for notification in notifications
+            ],
+            expiry_minutes,
+        )
+
+    return deliver
+
+
+_schedulers: Dict[str, NotificationScheduler] = {}
+_schedulers_lock = threading.Lock()
+
+
+def start_scheduler(
+    db_path: str, deliver: Callable[[List[Dict]], None], **kwargs
+) -> Optional[NotificationScheduler]:
+    """
+    Inicia o agendador do banco (único por arquivo).
+
+    Returns:
+        NotificationScheduler, ou None se a tabela da timeline não existir
+    """
+    db_path = os.path.abspath(db_path)
+    with _schedulers_lock:
+        scheduler = _schedulers.get(db_path)
+        if scheduler is None:
+            try:
+                scheduler = NotificationScheduler(db_path, deliver, **kwargs)
+            except sqlite3.Error as e:
+                get_logger("timeline_scheduler").warning(
+                    f"Agendador de notificações desativado: {e}"
+                )
+                return None
+            _schedulers[db_path] = scheduler
+        scheduler.start()
+        return scheduler
+
+
+def get_scheduler(db_path: str) -> Optional[NotificationScheduler]:
+    """Agendador já iniciado para o banco, se houver"""
+    return _schedulers.get(os.path.abspath(db_path))
+
+
+def schedule_notification(db_path: str, notification: Dict) -> None:
+    """Avisa o agendador do banco (se houver) de uma notificação nova"""
+    scheduler = get_scheduler(db_path)
+    if scheduler is not None:
+        scheduler.schedule(notification)